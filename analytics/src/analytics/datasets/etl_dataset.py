@@ -5,9 +5,11 @@ This is a sub-class of BaseDataset that models
 quad, deliverable, epic, issue, and sprint data.
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Self
 
+import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
 
@@ -62,6 +64,16 @@ class EtlDataset(BaseDataset):
         "quad_end": "quad_end",
     }
 
+    def __init__(self, df: pd.DataFrame) -> None:
+        """Instantiate the dataset and index the rows of each entity type."""
+        super().__init__(df)
+        # built once, so the getters don't have to scan the DataFrame for each ghid
+        self._entity_index = {
+            entity_type: _EntityIndex.build(df, f"{entity_type.value}_ghid")
+            for entity_type in EtlEntityType
+            if f"{entity_type.value}_ghid" in df.columns
+        }
+
     @classmethod
     def load_from_json_file(cls, file_path: str) -> Self:
         """
@@ -127,12 +139,32 @@ class EtlDataset(BaseDataset):
 
         return df
 
+    # Bulk getters
+
+    def get_first_rows(self, entity_type: EtlEntityType) -> pd.DataFrame:
+        """
+        Fetch the first row for each non-null ghid of an entity type.
+
+        These are the rows the get_<entity>() getters return, in the order
+        their ghids first appear.
+        """
+        return self._entity_index[entity_type].first_rows
+
+    def get_issue_rows(self) -> pd.DataFrame:
+        """
+        Fetch the last row for each issue in each project.
+
+        An issue has a row per project it's in, and where it has several rows
+        for the same project, each row updates the one before it.
+        """
+        df = self.df[self.df.issue_ghid.notna()]
+        return df.drop_duplicates(["issue_ghid", "project_ghid"], keep="last")
+
     # QUAD getters
 
     def get_quad(self, quad_ghid: str) -> pd.Series:
         """Fetch data about a given quad."""
-        query_string = f"quad_ghid == '{quad_ghid}'"
-        return self.df.query(query_string).iloc[0]
+        return self._entity_index[EtlEntityType.QUAD].get_first_row(quad_ghid)
 
     def get_quad_ghids(self) -> NDArray[Any]:
         """Fetch an array of unique non-null quad ghids."""
@@ -143,8 +175,9 @@ class EtlDataset(BaseDataset):
 
     def get_deliverable(self, deliverable_ghid: str) -> pd.Series:
         """Fetch data about a given deliverable."""
-        query_string = f"deliverable_ghid == '{deliverable_ghid}'"
-        return self.df.query(query_string).iloc[0]
+        return self._entity_index[EtlEntityType.DELIVERABLE].get_first_row(
+            deliverable_ghid,
+        )
 
     def get_deliverable_ghids(self) -> NDArray[Any]:
         """Fetch an array of unique non-null deliverable ghids."""
@@ -155,8 +188,7 @@ class EtlDataset(BaseDataset):
 
     def get_sprint(self, sprint_ghid: str) -> pd.Series:
         """Fetch data about a given sprint."""
-        query_string = f"sprint_ghid == '{sprint_ghid}'"
-        return self.df.query(query_string).iloc[0]
+        return self._entity_index[EtlEntityType.SPRINT].get_first_row(sprint_ghid)
 
     def get_sprint_ghids(self) -> NDArray[Any]:
         """Fetch an array of unique non-null sprint ghids."""
@@ -167,8 +199,7 @@ class EtlDataset(BaseDataset):
 
     def get_epic(self, epic_ghid: str) -> pd.Series:
         """Fetch data about a given epic."""
-        query_string = f"epic_ghid == '{epic_ghid}'"
-        return self.df.query(query_string).iloc[0]
+        return self._entity_index[EtlEntityType.EPIC].get_first_row(epic_ghid)
 
     def get_epic_ghids(self) -> NDArray[Any]:
         """Fetch an array of unique non-null epic ghids."""
@@ -179,13 +210,11 @@ class EtlDataset(BaseDataset):
 
     def get_issue(self, issue_ghid: str) -> pd.Series:
         """Fetch data about a given issue."""
-        query_string = f"issue_ghid == '{issue_ghid}'"
-        return self.df.query(query_string).iloc[0]
+        return self._entity_index[EtlEntityType.ISSUE].get_first_row(issue_ghid)
 
     def get_issues(self, issue_ghid: str) -> pd.DataFrame:
         """Fetch data about a given issue."""
-        query_string = f"issue_ghid == '{issue_ghid}'"
-        return self.df.query(query_string)
+        return self._entity_index[EtlEntityType.ISSUE].get_rows(issue_ghid)
 
     def get_issue_ghids(self) -> NDArray[Any]:
         """Fetch an array of unique non-null issue ghids."""
@@ -196,10 +225,64 @@ class EtlDataset(BaseDataset):
 
     def get_project(self, project_ghid: int) -> pd.Series:
         """Fetch data about a given project."""
-        query_string = f"project_ghid == {project_ghid}"
-        return self.df.query(query_string).iloc[0]
+        return self._entity_index[EtlEntityType.PROJECT].get_first_row(project_ghid)
 
     def get_project_ghids(self) -> NDArray[Any]:
         """Fetch an array of unique non-null project ghids."""
         df = self.df[self.df.project_ghid.notna()]
         return df.project_ghid.unique()
+
+
+@dataclass(frozen=True)
+class _EntityIndex:
+    """Index the rows of a DataFrame by the ghid of an entity type."""
+
+    # the rows with a ghid, (stably) sorted by it
+    rows: pd.DataFrame
+    # map of ghid to the slice of its rows in the sorted rows
+    slices: dict[str | int, slice]
+    # the first row for each ghid, in the order their ghids first appear
+    first_rows: pd.DataFrame
+    # the first rows transposed, as fetching a column is much quicker than a row
+    first_rows_by_column: pd.DataFrame
+    # map of ghid to its column in the transposed first rows
+    first_row_columns: dict[str | int, int]
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, column: str) -> Self:
+        """Sort the rows with a ghid by it, and note where each ghid's rows are."""
+        positions = np.flatnonzero(df[column].notna().to_numpy())
+        order = np.argsort(df[column].to_numpy()[positions], kind="stable")
+        sorted_positions = positions[order]
+        values = df[column].to_numpy()[sorted_positions]
+
+        # each ghid's rows start where the (sorted) ghid changes
+        is_start = np.ones(len(values), dtype=bool)
+        is_start[1:] = values[1:] != values[:-1]
+        starts = np.flatnonzero(is_start)
+        stops = np.append(starts[1:], len(values)) if len(values) else starts
+        first_rows = df.iloc[np.sort(sorted_positions[starts])]
+
+        return cls(
+            rows=df.iloc[sorted_positions],
+            slices={
+                values[start]: slice(start, stop)
+                for start, stop in zip(starts, stops, strict=True)
+            },
+            first_rows=first_rows,
+            first_rows_by_column=first_rows.T,
+            first_row_columns={
+                ghid: i for i, ghid in enumerate(first_rows[column].to_numpy())
+            },
+        )
+
+    def get_rows(self, ghid: str | int) -> pd.DataFrame:
+        """Fetch the rows for a ghid, in their original order."""
+        return self.rows.iloc[self.slices.get(ghid, slice(0, 0))]
+
+    def get_first_row(self, ghid: str | int) -> pd.Series:
+        """Fetch the first row for a ghid, raising an IndexError if it has none."""
+        if ghid not in self.first_row_columns:
+            message = f"No rows found for {ghid}"
+            raise IndexError(message)
+        return self.first_rows_by_column.iloc[:, self.first_row_columns[ghid]]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -15,7 +17,7 @@ from analytics.datasets.issues import (
     IssueMetadata,
     IssueType,
 )
-from analytics.datasets.utils import load_json_file
+from analytics.datasets.utils import dump_to_json, load_json_file
 from analytics.integrations import github
 
 logger = logging.getLogger(__name__)
@@ -34,12 +36,27 @@ class InputFiles:
 
 
 class GitHubProjectConfig(BaseModel):
-    """Configurations for GitHub projects ETL."""
+    """
+    Configurations for GitHub projects ETL.
+
+    Attributes
+    ----------
+    max_workers
+        The number of projects to export from GitHub at the same time.
+    cache_dir
+        An optional directory to cache exported project items in. A project
+        is only exported again if its updatedAt timestamp has changed since
+        it was cached. GitHub doesn't always bump a project's updatedAt when
+        the content of an issue in it changes, so this is off by default.
+
+    """
 
     roadmap_project: RoadmapConfig
     sprint_projects: list[SprintBoardConfig]
     temp_dir: str = "data"
     output_file: str = "data/delivery-data.json"
+    max_workers: int = 4
+    cache_dir: str | None = None
 
 
 class RoadmapConfig(BaseModel):
@@ -118,10 +135,12 @@ class GitHubProjectETL:
         # Export the roadmap data
         roadmap_file_path = str(temp_dir / "roadmap-data.json")
         roadmap = self.config.roadmap_project
-        self._export_roadmap_data_to_file(
-            roadmap=roadmap,
-            output_file_path=roadmap_file_path,
-        )
+        exports: list[Callable[[], None]] = [
+            lambda: self._export_roadmap_data_to_file(
+                roadmap=roadmap,
+                output_file_path=roadmap_file_path,
+            ),
+        ]
 
         # Export sprint data for each GitHub project that the scrum teams use
         # to manage their sprints, e.g. HHS/17 and HHS/13
@@ -129,9 +148,13 @@ class GitHubProjectETL:
         for sprint_board in self.config.sprint_projects:
             n = sprint_board.project_number
             sprint_file_path = str(temp_dir / f"sprint-data-{n}.json")
-            self._export_sprint_data_to_file(
-                sprint_board=sprint_board,
-                output_file_path=sprint_file_path,
+            exports.append(
+                lambda board=sprint_board, path=sprint_file_path: (
+                    self._export_sprint_data_to_file(
+                        sprint_board=board,
+                        output_file_path=path,
+                    )
+                ),
             )
             # Add to file list
             input_files.append(
@@ -140,6 +163,10 @@ class GitHubProjectETL:
                     sprint=sprint_file_path,
                 ),
             )
+
+        # The projects don't depend on each other, so export them in parallel
+        self._run_in_parallel(exports)
+
         # store transient files for re-use during the transform step
         self._transient_files = input_files
 
@@ -199,15 +226,38 @@ class GitHubProjectETL:
         self,
     ) -> tuple[list[dict], AcceptanceCriteriaDataset | None]:
         """Export from GitHub and transform to JSON."""
-        # export roadmap data
+        # export roadmap and sprint data in parallel
         roadmap = self.config.roadmap_project
-        roadmap_json = github.export_roadmap_data_to_object(
-            client=self.client,
-            owner=roadmap.owner,
-            project=roadmap.project_number,
-            quad_field=roadmap.quad_field,
-            pillar_field=roadmap.pillar_field,
+        exports: list[Callable[[], list[dict]]] = [
+            lambda: self._export_with_cache(
+                kind="roadmap",
+                owner=roadmap.owner,
+                project=roadmap.project_number,
+                export=lambda: github.export_roadmap_data_to_object(
+                    client=self.client,
+                    owner=roadmap.owner,
+                    project=roadmap.project_number,
+                    quad_field=roadmap.quad_field,
+                    pillar_field=roadmap.pillar_field,
+                ),
+            ),
+        ]
+        exports.extend(
+            lambda board=sprint_board: self._export_with_cache(
+                kind="sprint",
+                owner=board.owner,
+                project=board.project_number,
+                export=lambda: github.export_sprint_data_to_object(
+                    client=self.client,
+                    owner=board.owner,
+                    project=board.project_number,
+                    sprint_field=board.sprint_field,
+                    points_field=board.points_field,
+                ),
+            )
+            for sprint_board in self.config.sprint_projects
         )
+        roadmap_json, *sprint_jsons = self._run_in_parallel(exports)
 
         # extract acceptance criteria from roadmap json
         deliverable_json = [d for d in roadmap_json if d["issue_type"] == "Deliverable"]
@@ -217,17 +267,8 @@ class GitHubProjectETL:
             else None
         )
 
-        # export sprint data
         issues = []
-        for sprint_board in self.config.sprint_projects:
-            sprint_json = github.export_sprint_data_to_object(
-                client=self.client,
-                owner=sprint_board.owner,
-                project=sprint_board.project_number,
-                sprint_field=sprint_board.sprint_field,
-                points_field=sprint_board.points_field,
-            )
-
+        for sprint_json in sprint_jsons:
             # flatten sprint and roadmap data into issue data
             issues.extend(
                 run_transformation_pipeline_on_json(
@@ -242,6 +283,42 @@ class GitHubProjectETL:
         # dump issue dataset to JSON
         return dataset.to_dict(), acceptance_criteria
 
+    def _run_in_parallel[T](self, exports: list[Callable[[], T]]) -> list[T]:
+        """Run each export on a thread pool, returning results in order."""
+        # The threads share the client's session, so each export reuses the
+        # keep-alive connections in its pool rather than opening its own
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = [executor.submit(export) for export in exports]
+            return [future.result() for future in futures]
+
+    def _export_with_cache(
+        self,
+        kind: str,
+        owner: str,
+        project: int,
+        export: Callable[[], list[dict]],
+    ) -> list[dict]:
+        """Skip the export if the project hasn't changed since it was cached."""
+        if not self.config.cache_dir:
+            return export()
+
+        cache_path = Path(self.config.cache_dir) / f"{kind}-{owner}-{project}.json"
+        updated_at = github.get_project_updated_at(
+            client=self.client,
+            owner=owner,
+            project=project,
+        )
+        if cache_path.exists():
+            cached = load_json_file(str(cache_path))
+            if cached and cached[0].get("updated_at") == updated_at:
+                logger.info("Using cached %s data for %s/%d", kind, owner, project)
+                return cached[0]["items"]
+
+        items = export()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        dump_to_json(str(cache_path), [{"updated_at": updated_at, "items": items}])
+        return items
+
 
 # ===============================================================
 # Transformation helper functions
@@ -0,0 +1,397 @@
+"""Define EtlBulkSync class to sync each entity type with set-based db operations."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from psycopg.errors import InsufficientPrivilege
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from analytics.datasets.acceptance_criteria import (
+    AcceptanceCriteriaDataset,
+    AcceptanceCriteriaNestLevel,
+    AcceptanceCriteriaTotal,
+)
+from analytics.datasets.etl_dataset import EtlDataset, EtlEntityType
+from analytics.integrations.etldb.etldb import EtlDb
+
+
+class EtlBulkSync:
+    """
+    Encapsulate set-based CRUD operations for every entity type.
+
+    Rather than a round trip (and commit) per row, the rows of an entity type
+    are COPY'd into a temp table, from which the dimensions and facts are
+    upserted with one statement each, and the map of ghid to row id is read
+    back with one more. Each entity type is synced in a single transaction.
+
+    Where a dataset has several rows for an entity, the first row is used, see
+    EtlDataset.get_first_rows(), except for issues where the last row for each
+    project is used, see EtlDataset.get_issue_rows().
+    """
+
+    def __init__(self, dbh: EtlDb) -> None:
+        """Instantiate a class instance."""
+        self.dbh = dbh
+
+    def sync_projects(self, dataset: EtlDataset) -> dict:
+        """Write project data to etl database and return a map of row ids."""
+        df = dataset.get_first_rows(EtlEntityType.PROJECT)
+        rows = pd.DataFrame(
+            {
+                "ghid": df["project_ghid"],
+                "name": df["project_name"],
+            },
+        )
+        return self._sync(
+            EtlEntityType.PROJECT,
+            rows,
+            staging_columns="ghid numeric, name text",
+            statements=[
+                (
+                    "insert into gh_project (ghid, name) "
+                    "select ghid::integer, name from tmp_gh_project "
+                    "on conflict(ghid) do update "
+                    "set name = excluded.name, t_modified = current_timestamp "
+                    "where gh_project.name is distinct from excluded.name"
+                ),
+            ],
+            ghid_cast="::integer",
+        )
+
+    def sync_quads(self, dataset: EtlDataset) -> dict:
+        """Write quad data to etl database and return a map of row ids."""
+        df = dataset.get_first_rows(EtlEntityType.QUAD)
+        rows = pd.DataFrame(
+            {
+                "ghid": df["quad_ghid"],
+                "name": df["quad_name"],
+                "start_date": df["quad_start"],
+                "end_date": df["quad_end"],
+                "duration": df["quad_length"],
+            },
+        )
+        return self._sync(
+            EtlEntityType.QUAD,
+            rows,
+            staging_columns=(
+                "ghid text, name text, start_date date, end_date date, duration numeric"
+            ),
+            statements=[
+                (
+                    "insert into gh_quad (ghid, name, start_date, end_date, duration) "
+                    "select ghid, name, start_date, end_date, duration::integer "
+                    "from tmp_gh_quad "
+                    "on conflict(ghid) do update "
+                    "set (name, start_date, end_date, duration, t_modified) = "
+                    "(excluded.name, excluded.start_date, excluded.end_date, "
+                    "excluded.duration, current_timestamp) "
+                    "where (gh_quad.name, gh_quad.start_date, gh_quad.end_date, gh_quad.duration) "
+                    "is distinct from "
+                    "(excluded.name, excluded.start_date, excluded.end_date, excluded.duration)"
+                ),
+            ],
+        )
+
+    def sync_deliverables(
+        self,
+        dataset: EtlDataset,
+        ghid_map: dict,
+        ac: AcceptanceCriteriaDataset | None,
+    ) -> dict:
+        """Write deliverable data to etl database and return a map of row ids."""
+        df = dataset.get_first_rows(EtlEntityType.DELIVERABLE)
+        ac_totals = [
+            (
+                ac.get_totals(ghid, AcceptanceCriteriaNestLevel.ALL)
+                if ac is not None
+                else AcceptanceCriteriaTotal()
+            )
+            for ghid in df["deliverable_ghid"]
+        ]
+        rows = pd.DataFrame(
+            {
+                "ghid": df["deliverable_ghid"],
+                "title": df["deliverable_title"],
+                "pillar": df["deliverable_pillar"],
+                "status": df["deliverable_status"],
+                "quad_id": df["quad_ghid"].map(ghid_map[EtlEntityType.QUAD]),
+                "criteria_total": [t.criteria_total for t in ac_totals],
+                "criteria_done": [t.criteria_done for t in ac_totals],
+                "metrics_total": [t.metrics_total for t in ac_totals],
+                "metrics_done": [t.metrics_done for t in ac_totals],
+            },
+        )
+        return self._sync(
+            EtlEntityType.DELIVERABLE,
+            rows,
+            staging_columns=(
+                "ghid text, title text, pillar text, status text, quad_id numeric, "
+                "criteria_total numeric, criteria_done numeric, "
+                "metrics_total numeric, metrics_done numeric"
+            ),
+            statements=[
+                (
+                    "insert into gh_deliverable (ghid, title, pillar) "
+                    "select ghid, title, pillar from tmp_gh_deliverable "
+                    "on conflict(ghid) do update "
+                    "set (title, pillar, t_modified) = "
+                    "(excluded.title, excluded.pillar, current_timestamp) "
+                    "where (gh_deliverable.title, gh_deliverable.pillar) "
+                    "is distinct from (excluded.title, excluded.pillar)"
+                ),
+                (
+                    "insert into gh_deliverable_quad_map (deliverable_id, quad_id, d_effective) "
+                    "select d.id, t.quad_id::integer, cast(:effective as date) "
+                    "from tmp_gh_deliverable t join gh_deliverable d on d.ghid = t.ghid "
+                    "on conflict(deliverable_id, d_effective) do update "
+                    "set (quad_id, t_modified) = (excluded.quad_id, current_timestamp)"
+                ),
+                (
+                    "insert into gh_deliverable_history "
+                    "(deliverable_id, status, d_effective, "
+                    "accept_criteria_total, accept_criteria_done, "
+                    "accept_metrics_total, accept_metrics_done) "
+                    "select d.id, t.status, cast(:effective as date), "
+                    "t.criteria_total::integer, t.criteria_done::integer, "
+                    "t.metrics_total::integer, t.metrics_done::integer "
+                    "from tmp_gh_deliverable t join gh_deliverable d on d.ghid = t.ghid "
+                    "on conflict(deliverable_id, d_effective) "
+                    "do update set (status, t_modified, "
+                    "accept_criteria_total, accept_criteria_done, "
+                    "accept_metrics_total, accept_metrics_done) = "
+                    "(excluded.status, current_timestamp, "
+                    "excluded.accept_criteria_total, excluded.accept_criteria_done, "
+                    "excluded.accept_metrics_total, excluded.accept_metrics_done)"
+                ),
+            ],
+        )
+
+    def sync_sprints(self, dataset: EtlDataset, ghid_map: dict) -> dict:
+        """Write sprint data to etl database and return a map of row ids."""
+        df = dataset.get_first_rows(EtlEntityType.SPRINT)
+        rows = pd.DataFrame(
+            {
+                "ghid": df["sprint_ghid"],
+                "name": df["sprint_name"],
+                "start_date": df["sprint_start"],
+                "end_date": df["sprint_end"],
+                "duration": df["sprint_length"],
+                "quad_id": df["quad_ghid"].map(ghid_map[EtlEntityType.QUAD]),
+                "project_id": df["project_ghid"].map(ghid_map[EtlEntityType.PROJECT]),
+            },
+        )
+        return self._sync(
+            EtlEntityType.SPRINT,
+            rows,
+            staging_columns=(
+                "ghid text, name text, start_date date, end_date date, "
+                "duration numeric, quad_id numeric, project_id numeric"
+            ),
+            statements=[
+                (
+                    "insert into gh_sprint "
+                    "(ghid, name, start_date, end_date, duration, quad_id, project_id) "
+                    "select ghid, name, start_date, end_date, duration::integer, "
+                    "quad_id::integer, project_id::integer from tmp_gh_sprint "
+                    "on conflict(ghid) do update "
+                    "set (name, start_date, end_date, duration, quad_id, project_id, "
+                    "t_modified) = "
+                    "(excluded.name, excluded.start_date, excluded.end_date, "
+                    "excluded.duration, excluded.quad_id, excluded.project_id, "
+                    "current_timestamp) "
+                    "where (gh_sprint.name, gh_sprint.start_date, gh_sprint.end_date, "
+                    "gh_sprint.duration, gh_sprint.quad_id, gh_sprint.project_id) "
+                    "is distinct from "
+                    "(excluded.name, excluded.start_date, excluded.end_date, "
+                    "excluded.duration, excluded.quad_id, excluded.project_id)"
+                ),
+            ],
+        )
+
+    def sync_epics(self, dataset: EtlDataset, ghid_map: dict) -> dict:
+        """Write epic data to etl database and return a map of row ids."""
+        df = dataset.get_first_rows(EtlEntityType.EPIC)
+        rows = pd.DataFrame(
+            {
+                "ghid": df["epic_ghid"],
+                "title": df["epic_title"],
+                "deliverable_id": df["deliverable_ghid"].map(
+                    ghid_map[EtlEntityType.DELIVERABLE],
+                ),
+            },
+        )
+        return self._sync(
+            EtlEntityType.EPIC,
+            rows,
+            staging_columns="ghid text, title text, deliverable_id numeric",
+            statements=[
+                (
+                    "insert into gh_epic (ghid, title) "
+                    "select ghid, title from tmp_gh_epic "
+                    "on conflict(ghid) do update "
+                    "set title = excluded.title, t_modified = current_timestamp "
+                    "where gh_epic.title is distinct from excluded.title"
+                ),
+                (
+                    "insert into gh_epic_deliverable_map (epic_id, deliverable_id, d_effective) "
+                    "select e.id, t.deliverable_id::integer, cast(:effective as date) "
+                    "from tmp_gh_epic t join gh_epic e on e.ghid = t.ghid "
+                    "on conflict(epic_id, d_effective) do update "
+                    "set (deliverable_id, t_modified) = "
+                    "(excluded.deliverable_id, current_timestamp)"
+                ),
+            ],
+        )
+
+    def sync_issues(self, dataset: EtlDataset, ghid_map: dict) -> dict:
+        """Write issue data to etl database and return a map of row ids."""
+        df = dataset.get_issue_rows()
+        issue_type = df["issue_type"]
+        facts_df = df.fillna(0)
+        rows = pd.DataFrame(
+            {
+                "seq": range(len(df)),
+                "ghid": df["issue_ghid"],
+                "title": df["issue_title"],
+                "type": issue_type.where(
+                    issue_type.notna() & (issue_type != ""),
+                    "None",
+                ),
+                "opened_date": df["issue_opened_at"],
+                "closed_date": df["issue_closed_at"],
+                "parent_issue_ghid": df["issue_parent"],
+                "epic_id": df["epic_ghid"].map(ghid_map[EtlEntityType.EPIC]),
+                "status": facts_df["issue_status"],
+                "is_closed": facts_df["issue_is_closed"].astype(int),
+                "points": facts_df["issue_points"],
+                "sprint_id": facts_df["sprint_ghid"].map(
+                    ghid_map[EtlEntityType.SPRINT],
+                ),
+                "project_id": facts_df["project_ghid"].map(
+                    ghid_map[EtlEntityType.PROJECT],
+                ),
+            },
+        )
+        return self._sync(
+            EtlEntityType.ISSUE,
+            rows,
+            staging_columns=(
+                "seq integer, ghid text, title text, type text, "
+                "opened_date date, closed_date date, parent_issue_ghid text, "
+                "epic_id numeric, status text, is_closed integer, points numeric, "
+                "sprint_id numeric, project_id numeric"
+            ),
+            # the dimensions and sprint map take the last row of each issue
+            statements=[
+                (
+                    "insert into gh_issue "
+                    "(ghid, title, type, opened_date, closed_date, parent_issue_ghid, epic_id) "
+                    "select ghid, title, type, opened_date, closed_date, parent_issue_ghid, "
+                    "epic_id::integer from "
+                    "(select distinct on (ghid) * from tmp_gh_issue order by ghid, seq desc) t "
+                    "on conflict(ghid) do update "
+                    "set (title, type, opened_date, closed_date, parent_issue_ghid, epic_id, "
+                    "t_modified) = "
+                    "(excluded.title, excluded.type, excluded.opened_date, "
+                    "excluded.closed_date, excluded.parent_issue_ghid, excluded.epic_id, "
+                    "current_timestamp) "
+                    "where (gh_issue.title, gh_issue.type, gh_issue.opened_date, "
+                    "gh_issue.closed_date, gh_issue.parent_issue_ghid, gh_issue.epic_id) "
+                    "is distinct from "
+                    "(excluded.title, excluded.type, excluded.opened_date, "
+                    "excluded.closed_date, excluded.parent_issue_ghid, excluded.epic_id)"
+                ),
+                (
+                    "insert into gh_issue_history "
+                    "(issue_id, status, is_closed, points, d_effective, project_id, sprint_id) "
+                    "select i.id, t.status, t.is_closed, t.points::integer, "
+                    "cast(:effective as date), "
+                    "t.project_id::integer, t.sprint_id::integer "
+                    "from tmp_gh_issue t join gh_issue i on i.ghid = t.ghid "
+                    "on conflict (issue_id, project_id, d_effective) "
+                    "do update set (status, is_closed, points, t_modified, sprint_id) = "
+                    "(excluded.status, excluded.is_closed, excluded.points, "
+                    "current_timestamp, excluded.sprint_id)"
+                ),
+                # note: issue_sprint_map will be removed after validating changes to issue_history
+                (
+                    "insert into gh_issue_sprint_map (issue_id, sprint_id, d_effective) "
+                    "select i.id, t.sprint_id::integer, cast(:effective as date) "
+                    "from "
+                    "(select distinct on (ghid) * from tmp_gh_issue order by ghid, seq desc) t "
+                    "join gh_issue i on i.ghid = t.ghid "
+                    "on conflict (issue_id, d_effective) "
+                    "do update set (sprint_id, t_modified) = "
+                    "(excluded.sprint_id, current_timestamp)"
+                ),
+            ],
+        )
+
+    def _sync(
+        self,
+        entity_type: EtlEntityType,
+        rows: pd.DataFrame,
+        staging_columns: str,
+        statements: list[str],
+        ghid_cast: str = "",
+    ) -> dict:
+        """Stage rows in a temp table, run the upserts, and map ghid to row id."""
+        table = f"gh_{entity_type.value}"
+        staging_table = f"tmp_{table}"
+
+        try:
+            cursor = self.dbh.connection()
+            cursor.execute(
+                text(
+                    f"create temp table {staging_table} ({staging_columns}) "
+                    "on commit drop",
+                ),
+            )
+            _copy_rows(cursor, staging_table, rows)
+
+            for statement in statements:
+                cursor.execute(
+                    text(statement),
+                    {"effective": self.dbh.effective_date},
+                )
+
+            result = cursor.execute(
+                text(
+                    f"select ghid, id from {table} where ghid in "  # noqa: S608
+                    f"(select ghid{ghid_cast} from {staging_table})",
+                ),
+            )
+            ghid_map = {row[0]: row[1] for row in result}
+
+            # commit, which also drops the temp table
+            self.dbh.commit(cursor)
+        except (
+            InsufficientPrivilege,
+            OperationalError,
+            ProgrammingError,
+            RuntimeError,
+        ) as e:
+            message = f"FATAL: Failed to sync {entity_type.value} data: {e}"
+            raise RuntimeError(message) from e
+
+        return ghid_map
+
+
+def _copy_rows(connection: Connection, table: str, rows: pd.DataFrame) -> None:
+    """COPY rows into a table within the connection's open transaction."""
+    columns = ", ".join(rows.columns)
+    dbapi_cursor = connection.connection.cursor()
+    with dbapi_cursor.copy(f"copy {table} ({columns}) from stdin") as copy:
+        for row in rows.itertuples(index=False, name=None):
+            copy.write_row([_to_db_value(value) for value in row])
+
+
+def _to_db_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert a pandas/numpy value to a python value psycopg can COPY."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -1,7 +1,6 @@
 """Define EtlDb as an abstraction layer for database connections."""
 
 import logging
-from enum import Enum
 
 from sqlalchemy import Connection, text
 
@@ -120,11 +119,3 @@ class EtlDb:
         )
         row = result.fetchone()
         return bool(row and row[0] == "schema_version")
-
-
-class EtlChangeType(Enum):
-    """An enum to describe ETL change types."""
-
-    NONE = 0
-    INSERT = 1
-    UPDATE = 2
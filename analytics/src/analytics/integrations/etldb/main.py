@@ -7,19 +7,10 @@ from pathlib import Path
 
 from sqlalchemy import text
 
-from analytics.datasets.acceptance_criteria import (
-    AcceptanceCriteriaDataset,
-    AcceptanceCriteriaNestLevel,
-    AcceptanceCriteriaTotal,
-)
+from analytics.datasets.acceptance_criteria import AcceptanceCriteriaDataset
 from analytics.datasets.etl_dataset import EtlDataset, EtlEntityType
-from analytics.integrations.etldb.deliverable_model import EtlDeliverableModel
-from analytics.integrations.etldb.epic_model import EtlEpicModel
+from analytics.integrations.etldb.bulk_sync import EtlBulkSync
 from analytics.integrations.etldb.etldb import EtlDb
-from analytics.integrations.etldb.issue_model import EtlIssueModel
-from analytics.integrations.etldb.project_model import EtlProjectModel
-from analytics.integrations.etldb.quad_model import EtlQuadModel
-from analytics.integrations.etldb.sprint_model import EtlSprintModel
 
 VERBOSE = False
 
@@ -165,92 +156,55 @@ def sync_deliverables(
     ac: AcceptanceCriteriaDataset | None,
 ) -> dict:
     """Insert or update (if necessary) a row for each deliverable and return a map of row ids."""
-    result = {}
-    model = EtlDeliverableModel(db)
-    for ghid in dataset.get_deliverable_ghids():
-        deliverable_df = dataset.get_deliverable(ghid)
-        ac_total = (
-            ac.get_totals(
-                ghid,
-                AcceptanceCriteriaNestLevel.ALL,
-            )
-            if ac is not None
-            else AcceptanceCriteriaTotal()
-        )
-        result[ghid], _ = model.sync_deliverable(deliverable_df, ghid_map, ac_total)
-        if VERBOSE:
-            m = f"DELIVERABLE '{ghid}' row_id = {result[ghid]}"
-            logger.info(m)
+    result = EtlBulkSync(db).sync_deliverables(dataset, ghid_map, ac)
+    if VERBOSE:
+        m = f"DELIVERABLE row_ids = {result}"
+        logger.info(m)
     return result
 
 
 def sync_epics(db: EtlDb, dataset: EtlDataset, ghid_map: dict) -> dict:
     """Insert or update (if necessary) a row for each epic and return a map of row ids."""
-    result = {}
-    model = EtlEpicModel(db)
-    for ghid in dataset.get_epic_ghids():
-        epic_df = dataset.get_epic(ghid)
-        result[ghid], _ = model.sync_epic(epic_df, ghid_map)
-        if VERBOSE:
-            m = f"EPIC '{ghid}' row_id = {result[ghid]}"
-            logger.info(m)
+    result = EtlBulkSync(db).sync_epics(dataset, ghid_map)
+    if VERBOSE:
+        m = f"EPIC row_ids = {result}"
+        logger.info(m)
     return result
 
 
 def sync_issues(db: EtlDb, dataset: EtlDataset, ghid_map: dict) -> dict:
     """Insert or update (if necessary) a row for each issue and return a map of row ids."""
-    result = {}
-    model = EtlIssueModel(db)
-    for ghid in dataset.get_issue_ghids():
-        all_rows = dataset.get_issues(ghid)
-        for _, issue_df in all_rows.iterrows():
-            result[ghid], _ = model.sync_issue(issue_df, ghid_map)
-            if VERBOSE:
-                m = f"ISSUE '{ghid}' issue_id = {result[ghid]}"
-                logger.info(m)
+    result = EtlBulkSync(db).sync_issues(dataset, ghid_map)
+    if VERBOSE:
+        m = f"ISSUE issue_ids = {result}"
+        logger.info(m)
     return result
 
 
 def sync_projects(db: EtlDb, dataset: EtlDataset) -> dict:
     """Insert or update (if necessary) a row for each project and return a map of row ids."""
-    result = {}
-    model = EtlProjectModel(db)
-    for ghid in dataset.get_project_ghids():
-        project_df = dataset.get_project(ghid)
-        result[ghid], _ = model.sync_project(project_df)
-        if VERBOSE:
-            m = (
-                f"PROJECT '{ghid}' title = '{project_df['project_name']}', row_id = {result[ghid]}",
-            )
-            logger.info(m)
+    result = EtlBulkSync(db).sync_projects(dataset)
+    if VERBOSE:
+        m = f"PROJECT row_ids = {result}"
+        logger.info(m)
     return result
 
 
 def sync_sprints(db: EtlDb, dataset: EtlDataset, ghid_map: dict) -> dict:
     """Insert or update (if necessary) a row for each sprint and return a map of row ids."""
-    result = {}
-    model = EtlSprintModel(db)
-    for ghid in dataset.get_sprint_ghids():
-        sprint_df = dataset.get_sprint(ghid)
-        result[ghid], _ = model.sync_sprint(sprint_df, ghid_map)
-        if VERBOSE:
-            m = f"SPRINT '{ghid}' row_id = {result[ghid]}"
-            logger.info(m)
+    result = EtlBulkSync(db).sync_sprints(dataset, ghid_map)
+    if VERBOSE:
+        m = f"SPRINT row_ids = {result}"
+        logger.info(m)
     return result
 
 
 def sync_quads(db: EtlDb, dataset: EtlDataset) -> dict:
     """Insert or update (if necessary) a row for each quad and return a map of row ids."""
-    result = {}
-    model = EtlQuadModel(db)
-    for ghid in dataset.get_quad_ghids():
-        quad_df = dataset.get_quad(ghid)
-        result[ghid], _ = model.sync_quad(quad_df)
-        if VERBOSE:
-            m = (
-                f"QUAD '{ghid}' title = '{quad_df['quad_name']}', row_id = {result[ghid]}",
-            )
-            logger.info(m)
+    result = EtlBulkSync(db).sync_quads(dataset)
+    if VERBOSE:
+        m = f"QUAD row_ids = {result}"
+        logger.info(m)
     return result
 
 
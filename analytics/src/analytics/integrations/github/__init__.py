@@ -6,6 +6,7 @@ __all__ = [
     "export_roadmap_data_to_object",
     "export_sprint_data_to_file",
     "export_sprint_data_to_object",
+    "get_project_updated_at",
 ]
 
 from analytics.integrations.github.client import GitHubGraphqlClient
@@ -14,4 +15,5 @@ from analytics.integrations.github.main import (
     export_roadmap_data_to_object,
     export_sprint_data_to_file,
     export_sprint_data_to_object,
+    get_project_updated_at,
 )
@@ -1,14 +1,27 @@
 """Expose a client for making calls to GitHub's GraphQL API."""
 
 import logging
+import time
+from collections.abc import Callable, Iterator
+from http import HTTPStatus
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from analytics.config import get_db_settings
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying, GitHub returns a 429 (or a 403 with rate limit
+# headers) when a rate limit is hit and the 5xx statuses on gateway errors
+RETRY_STATUS_CODES = {
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+}
+
 
 class GraphqlError(Exception):
     """
@@ -34,21 +47,37 @@ class GitHubGraphqlClient:
     """
     A client to interact with GitHub's GraphQL API.
 
+    Requests are made over a shared session, so connections are kept alive
+    and reused across requests (and threads), and requests that hit a rate
+    limit or a transient error are retried after backing off.
+
     Methods
     -------
     execute_paginated_query(query, variables, data_path, batch_size=100)
         Executes a paginated GraphQL query and returns all results.
+    iter_paginated_query(query, variables, data_path, batch_size=100)
+        Executes a paginated GraphQL query and yields results a page at a time.
 
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_retries: int = 5,
+        max_connections: int = 10,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
         """
         Initialize the GitHubClient.
 
         Parameters
         ----------
-        token : str
-            GitHub personal access token for authentication.
+        max_retries : int, optional
+            The number of times to retry a rate limited or failed request.
+        max_connections : int, optional
+            The number of connections to keep open to the API, which should be
+            at least the number of threads making requests with the client.
+        sleep : callable, optional
+            The function used to wait before retrying a request.
 
         """
         settings = get_db_settings()
@@ -58,6 +87,15 @@ class GitHubGraphqlClient:
             "Content-Type": "application/json",
             "GraphQL-Features": "sub_issues,issue_types",
         }
+        self.max_retries = max_retries
+        self._sleep = sleep
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=max_connections),
+        )
 
     def execute_query(self, query: str, variables: dict[str, str | int]) -> dict:
         """
@@ -76,17 +114,48 @@ class GitHubGraphqlClient:
             The JSON response from the API.
 
         """
-        response = requests.post(
-            self.endpoint,
-            headers=self.headers,
-            json={"query": query, "variables": variables},
-            timeout=60,
-        )
-        response.raise_for_status()
-        result = response.json()
-        if "errors" in result:
-            raise GraphqlError(result["errors"])
-        return result
+        attempt = 0
+        while True:
+            response = self.session.post(
+                self.endpoint,
+                json={"query": query, "variables": variables},
+                timeout=60,
+            )
+            if attempt < self.max_retries and _should_retry(response):
+                wait_sec = _get_retry_wait(response, attempt)
+                logger.info(
+                    "GitHub API returned %s, retrying in %.1f seconds",
+                    response.status_code,
+                    wait_sec,
+                )
+                self._sleep(wait_sec)
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            result = response.json()
+            if "errors" in result:
+                if attempt < self.max_retries and _is_rate_limited_result(result):
+                    wait_sec = _get_retry_wait(response, attempt)
+                    logger.info(
+                        "GitHub API rate limit hit, retrying in %.1f seconds",
+                        wait_sec,
+                    )
+                    self._sleep(wait_sec)
+                    attempt += 1
+                    continue
+                raise GraphqlError(result["errors"])
+
+            # Wait out the rest of the window rather than have the next request fail
+            if response.headers.get("x-ratelimit-remaining") == "0":
+                wait_sec = _get_retry_wait(response, attempt)
+                logger.info(
+                    "GitHub API rate limit used up, waiting %.1f seconds",
+                    wait_sec,
+                )
+                self._sleep(wait_sec)
+
+            return result
 
     def execute_paginated_query(
         self,
@@ -116,10 +185,26 @@ class GitHubGraphqlClient:
             The combined results from all paginated responses.
 
         """
-        all_data = []
+        return list(
+            self.iter_paginated_query(query, variables, path_to_nodes, batch_size),
+        )
+
+    def iter_paginated_query(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        path_to_nodes: list[str],
+        batch_size: int = 100,
+    ) -> Iterator[dict]:
+        """
+        Execute a paginated GraphQL query, yielding nodes as each page arrives.
+
+        The parameters are the same as execute_paginated_query(), the next page
+        is only requested once the nodes of the current page have been consumed.
+        """
+        # Copy the variables, so the caller's dict is never modified
+        variables = {**variables, "batch": batch_size, "endCursor": None}
         has_next_page = True
-        variables["batch"] = batch_size
-        variables["endCursor"] = None
 
         while has_next_page:
             response = self.execute_query(query, variables)
@@ -129,11 +214,48 @@ class GitHubGraphqlClient:
             for key in path_to_nodes:
                 data = data[key]
 
-            all_data.extend(data["nodes"])
+            yield from data["nodes"]
 
             # Handle pagination
             page_info = data["pageInfo"]
             has_next_page = page_info["hasNextPage"]
-            variables["endCursor"] = page_info["endCursor"]
+            variables = {**variables, "endCursor": page_info["endCursor"]}
+
+
+def _should_retry(response: requests.Response) -> bool:
+    """Whether a request should be retried given its response."""
+    return response.status_code in RETRY_STATUS_CODES or (
+        response.status_code == HTTPStatus.FORBIDDEN and _is_rate_limited(response)
+    )
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """Whether a response says we're (about to be) rate limited."""
+    return (
+        response.headers.get("retry-after") is not None
+        or response.headers.get("x-ratelimit-remaining") == "0"
+    )
+
+
+def _is_rate_limited_result(result: dict) -> bool:
+    """Whether the errors of a GraphQL result are from a rate limit."""
+    return any(error.get("type") == "RATE_LIMITED" for error in result["errors"])
+
+
+def _get_retry_wait(response: requests.Response, attempt: int) -> float:
+    """
+    Get how long to wait before retrying a request.
+
+    This uses GitHub's rate limit headers where they are set, see
+    https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
+    and otherwise backs off exponentially with each attempt.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+
+    reset = response.headers.get("x-ratelimit-reset")
+    if response.headers.get("x-ratelimit-remaining") == "0" and reset is not None:
+        return max(float(reset) - time.time(), 0) + 1
 
-        return all_data
+    return float(min(2**attempt, 60))
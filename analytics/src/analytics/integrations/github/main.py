@@ -7,6 +7,7 @@ we disable writing to disk in https://github.com/HHS/simpler-grants-gov/issues/3
 
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -20,12 +21,17 @@ PARENT_DIR = Path(__file__).resolve().parent
 
 
 def transform_project_data(
-    raw_data: list[dict],
+    raw_data: Iterable[dict],
     owner: str,
     project: int,
     excluded_types: tuple = (),  # By default include everything
 ) -> list[dict]:
-    """Pluck and reformat relevant fields for each item in the raw data."""
+    """
+    Pluck and reformat relevant fields for each item in the raw data.
+
+    The raw data can be an iterator of items, so they are validated and
+    transformed as they arrive rather than after all of them are fetched.
+    """
     transformed_data = []
     count = 0
     fail = 0
@@ -141,7 +147,7 @@ def export_sprint_data_to_object(
     }
 
     # Execute query
-    data = client.execute_paginated_query(
+    data = client.iter_paginated_query(
         query,
         variables,
         ["organization", "projectV2", "items"],
@@ -202,7 +208,7 @@ def export_roadmap_data_to_object(
     }
 
     # Execute query
-    data = client.execute_paginated_query(
+    data = client.iter_paginated_query(
         query,
         variables,
         ["organization", "projectV2", "items"],
@@ -210,3 +216,19 @@ def export_roadmap_data_to_object(
 
     # Transform data
     return transform_project_data(data, owner, project)
+
+
+def get_project_updated_at(
+    client: GitHubGraphqlClient,
+    owner: str,
+    project: int,
+) -> str:
+    """Get when a project was last updated, as an ISO 8601 timestamp."""
+    # Load query
+    query_path = PARENT_DIR / "getProjectUpdatedAt.graphql"
+    with open(query_path) as f:
+        query = f.read()
+
+    # Execute query
+    response = client.execute_query(query, {"login": owner, "project": project})
+    return response["data"]["organization"]["projectV2"]["updatedAt"]
@@ -1,6 +1,57 @@
 """Tests the code in datasets/etl_dataset.py."""
 
-from analytics.datasets.etl_dataset import EtlDataset
+import logging
+import time
+
+import pytest
+from analytics.datasets.etl_dataset import EtlDataset, EtlEntityType
+
+logger = logging.getLogger(__name__)
+
+
+def _synthetic_export(row_count: int) -> list[dict]:
+    """Build a GitHub export with two rows (one per project) for each issue."""
+    rows = []
+    for i in range(row_count):
+        issue_number = i // 2
+        epic_number = issue_number // 10
+        deliverable_number = epic_number // 10
+        sprint_number = issue_number // 100
+        quad_number = sprint_number // 10
+        rows.append(
+            {
+                "project_owner": "HHS",
+                "project_number": 13 + i % 2,
+                "issue_title": f"Issue {issue_number}",
+                "issue_url": f"https://github.com/HHS/repo/issues/{issue_number}",
+                "issue_parent": f"https://github.com/HHS/repo/epics/{epic_number}",
+                "issue_type": "Task",
+                "issue_is_closed": False,
+                "issue_opened_at": "2024-11-07",
+                "issue_closed_at": None,
+                "issue_points": 2.0,
+                "issue_status": "In Progress",
+                "sprint_id": f"sprint{sprint_number}",
+                "sprint_name": f"Sprint {sprint_number}",
+                "sprint_start": "2024-10-30",
+                "sprint_length": 14.0,
+                "sprint_end": "2024-11-13",
+                "quad_id": f"quad{quad_number}",
+                "quad_name": f"Quad {quad_number}",
+                "quad_start": "2024-09-09",
+                "quad_length": 122.0,
+                "quad_end": "2025-01-09",
+                "deliverable_pillar": "SimplerFind",
+                "deliverable_url": (
+                    f"https://github.com/HHS/repo/deliverables/{deliverable_number}"
+                ),
+                "deliverable_title": f"Deliverable {deliverable_number}",
+                "deliverable_status": "In Progress",
+                "epic_url": f"https://github.com/HHS/repo/epics/{epic_number}",
+                "epic_title": f"Epic {epic_number}",
+            },
+        )
+    return rows
 
 
 class TestEtlDataset:
@@ -97,3 +148,119 @@ class TestEtlDataset:
 
         project = dataset.get_project(ghid)
         assert project["project_name"] == "HHS"
+
+    def test_missing_ghid(self):
+        """Fetchers should behave like an empty query for an unknown ghid."""
+        dataset = EtlDataset.load_from_json_file(self.TEST_FILE_1)
+
+        assert len(dataset.get_issues("not-a-ghid")) == 0
+        with pytest.raises(IndexError):
+            dataset.get_issue("not-a-ghid")
+
+
+class TestEtlDatasetBulkGetters:
+    """Test the EtlDataset getters used to prepare a sync."""
+
+    TEST_FILE_1 = "./tests/etldb_test_01.json"
+    ROW_COUNT = 50_000
+
+    @pytest.mark.parametrize(
+        "entity_type",
+        [
+            EtlEntityType.DELIVERABLE,
+            EtlEntityType.EPIC,
+            EtlEntityType.ISSUE,
+            EtlEntityType.PROJECT,
+            EtlEntityType.QUAD,
+            EtlEntityType.SPRINT,
+        ],
+    )
+    def test_first_rows_match_getters(self, entity_type: EtlEntityType):
+        """There should be a row per ghid, the same row its getter returns."""
+        dataset = EtlDataset.load_from_json_file(self.TEST_FILE_1)
+        get_ghids = getattr(dataset, f"get_{entity_type.value}_ghids")
+        get_entity = getattr(dataset, f"get_{entity_type.value}")
+
+        rows = dataset.get_first_rows(entity_type)
+
+        ghids = list(get_ghids())
+        assert list(rows[f"{entity_type.value}_ghid"]) == ghids
+        for ghid, (_, row) in zip(ghids, rows.iterrows(), strict=True):
+            assert row.equals(get_entity(ghid))
+
+    def test_issue_rows_match_getters(self):
+        """There should be a row per issue per project, the last of its rows."""
+        dataset = EtlDataset.load_from_json_file(self.TEST_FILE_1)
+
+        rows = dataset.get_issue_rows()
+
+        for ghid in dataset.get_issue_ghids():
+            expected = dataset.get_issues(ghid).drop_duplicates(
+                "project_ghid",
+                keep="last",
+            )
+            assert rows[rows.issue_ghid == ghid].equals(expected)
+
+    @pytest.mark.parametrize("entity_type", list(EtlEntityType))
+    def test_getters_match_a_query(self, entity_type: EtlEntityType):
+        """The indexed getters should return the rows a query of the DataFrame does."""
+        dataset = EtlDataset.load_from_json_file(self.TEST_FILE_1)
+        column = f"{entity_type.value}_ghid"
+        get_ghids = getattr(dataset, f"get_{entity_type.value}_ghids")
+        get_entity = getattr(dataset, f"get_{entity_type.value}")
+
+        for ghid in get_ghids():
+            expected = dataset.df[dataset.df[column] == ghid]
+            entity = get_entity(ghid)
+            assert entity.equals(expected.iloc[0])
+            assert entity.name == expected.index[0]
+            if entity_type == EtlEntityType.ISSUE:
+                assert dataset.get_issues(ghid).equals(expected)
+
+
+class TestEtlDatasetBenchmark:
+    """Benchmark preparing a sync of a large export."""
+
+    ROW_COUNT = 50_000
+    # generous so the test isn't flaky, a scan of the DataFrame per
+    # ghid takes minutes at this size
+    MAX_SECONDS = 30
+
+    def test_sync_preparation_time(self):
+        """Loading and fetching every entity of a 50k row export should be fast."""
+        export = _synthetic_export(self.ROW_COUNT)
+
+        start = time.perf_counter()
+        dataset = EtlDataset.load_from_json_object(export)
+        entity_counts = {}
+        for entity_type in EtlEntityType:
+            get_ghids = getattr(dataset, f"get_{entity_type.value}_ghids")
+            get_entity = getattr(dataset, f"get_{entity_type.value}")
+            ghids = get_ghids()
+            for ghid in ghids:
+                get_entity(ghid)
+            entity_counts[entity_type] = len(dataset.get_first_rows(entity_type))
+        issue_row_count = sum(
+            len(dataset.get_issues(ghid)) for ghid in dataset.get_issue_ghids()
+        )
+        issue_rows = dataset.get_issue_rows()
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            "prepared sync of %s rows in %.2f seconds",
+            self.ROW_COUNT,
+            elapsed,
+        )
+        assert elapsed < self.MAX_SECONDS
+
+        # two rows (one per project) for each issue
+        assert issue_row_count == self.ROW_COUNT
+        assert len(issue_rows) == self.ROW_COUNT
+        assert entity_counts == {
+            EtlEntityType.DELIVERABLE: self.ROW_COUNT // 200,
+            EtlEntityType.EPIC: self.ROW_COUNT // 20,
+            EtlEntityType.ISSUE: self.ROW_COUNT // 2,
+            EtlEntityType.PROJECT: 2,
+            EtlEntityType.QUAD: self.ROW_COUNT // 2000,
+            EtlEntityType.SPRINT: self.ROW_COUNT // 200,
+        }
@@ -209,6 +209,48 @@ class TestGitHubProjectETL:
         assert etl._transient_files == files_wanted
         assert etl.dataset.to_dict() == dataset_wanted
 
+    def test_extract_in_memory_uses_cache_for_unchanged_projects(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        config: GitHubProjectConfig,
+        tmp_path: Path,
+    ):
+        """Only export projects again when their updatedAt has changed."""
+        # Arrange - Mock the exports and the project updatedAt timestamps
+        roadmap_data = [
+            issue(issue=3, kind=IssueType.EPIC).model_dump(),
+        ]
+        sprint_data = [
+            issue(issue=1, kind=IssueType.TASK, parent="Epic3").model_dump(),
+        ]
+        mock_export_roadmap = MagicMock(return_value=roadmap_data)
+        mock_export_sprint = MagicMock(return_value=sprint_data)
+        updated_at = {1: "2025-01-01T00:00:00Z", 2: "2025-01-01T00:00:00Z"}
+        monkeypatch.setattr(
+            github,
+            "export_roadmap_data_to_object",
+            mock_export_roadmap,
+        )
+        monkeypatch.setattr(github, "export_sprint_data_to_object", mock_export_sprint)
+        monkeypatch.setattr(
+            github,
+            "get_project_updated_at",
+            lambda client, owner, project: updated_at[project],  # noqa: ARG005
+        )
+        config.cache_dir = str(tmp_path / "cache")
+        etl = GitHubProjectETL(config)
+
+        # Act - Export the projects, then again with only the sprint board changed
+        first_result, _ = etl.extract_and_transform_in_memory()
+        updated_at[2] = "2025-01-02T00:00:00Z"
+        second_result, _ = etl.extract_and_transform_in_memory()
+
+        # Assert
+        assert mock_export_roadmap.call_count == 1
+        assert mock_export_sprint.call_count == 2
+        assert second_result == first_result
+        assert second_result[0]["epic_url"] == roadmap_data[0]["issue_url"]
+
 
 # ===========================================================
 # Test ETL helper functions
@@ -32,14 +32,14 @@ def mock_query() -> str:
     """
 
 
-@patch("requests.post")  # Mocks the requests.post() method
+@patch("requests.Session.post")  # Mocks the session.post() method
 def test_paginated_query_success(
     mock_post: Mock,
     client: GitHubGraphqlClient,
     sample_query: str,
 ) -> None:
     """Test successfully making a paginated call and extracting data."""
-    # Arrange - Mock the response from requests.post()
+    # Arrange - Mock the response from session.post()
     mock_response = {
         "data": {
             "user": {
@@ -67,14 +67,14 @@ def test_paginated_query_success(
     assert result == [{"name": "repo1"}]
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_invalid_path_to_nodes(
     mock_post: Mock,
     client: GitHubGraphqlClient,
     sample_query: str,
 ) -> None:
     """Test catching an error if the path_to_nodes is incorrect."""
-    # Arrange - Mock the response from requests.post()
+    # Arrange - Mock the response from session.post()
     mock_response = {
         "data": {
             "user": {
@@ -99,14 +99,14 @@ def test_invalid_path_to_nodes(
         client.execute_paginated_query(sample_query, variables, path_to_nodes)
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_graphql_error(
     mock_post: Mock,
     client: GitHubGraphqlClient,
     sample_query: str,
 ) -> None:
     """Test raising a GraphqlError if errors are present in the response."""
-    # Arrange - Mock the response from requests.post() to include an error
+    # Arrange - Mock the response from session.post() to include an error
     mock_post.return_value = Mock(
         status_code=200,
         json=Mock(return_value={"errors": [{"message": "Test GitHub error"}]}),
@@ -122,3 +122,91 @@ def test_graphql_error(
 
     # Assert - Check that it contains the error message from the mock response
     assert "Test GitHub error" in str(excinfo.value)
+
+
+@patch("requests.Session.post")
+def test_paginated_query_multiple_pages(
+    mock_post: Mock,
+    client: GitHubGraphqlClient,
+    sample_query: str,
+) -> None:
+    """Test yielding the nodes of each page while following the cursor."""
+    # Arrange - Mock two pages of results
+    pages = [
+        {
+            "data": {
+                "user": {
+                    "repositories": {
+                        "nodes": [{"name": "repo1"}, {"name": "repo2"}],
+                        "pageInfo": {"hasNextPage": True, "endCursor": "abc"},
+                    },
+                },
+            },
+        },
+        {
+            "data": {
+                "user": {
+                    "repositories": {
+                        "nodes": [{"name": "repo3"}],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    },
+                },
+            },
+        },
+    ]
+    mock_post.side_effect = [
+        Mock(status_code=200, headers={}, json=Mock(return_value=page))
+        for page in pages
+    ]
+
+    # Act
+    variables: dict[str, str] = {"login": "octocat"}
+    result = client.iter_paginated_query(
+        sample_query,
+        variables,
+        ["user", "repositories"],
+    )
+
+    # Assert - Check the second page is only requested once it's needed
+    assert next(result) == {"name": "repo1"}
+    assert mock_post.call_count == 1
+    assert list(result) == [{"name": "repo2"}, {"name": "repo3"}]
+    assert mock_post.call_count == 2
+    cursors = [c.kwargs["json"]["variables"]["endCursor"] for c in mock_post.mock_calls]
+    assert cursors == [None, "abc"]
+    # Assert - Check the variables passed in weren't modified
+    assert variables == {"login": "octocat"}
+
+
+@patch("requests.Session.post")
+def test_retry_when_rate_limited(mock_post: Mock, sample_query: str) -> None:
+    """Test waiting for the Retry-After header before retrying a request."""
+    # Arrange - Mock a rate limited response followed by a successful one
+    mock_response = {
+        "data": {
+            "user": {
+                "repositories": {
+                    "nodes": [{"name": "repo1"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                },
+            },
+        },
+    }
+    mock_post.side_effect = [
+        Mock(status_code=429, headers={"retry-after": "3"}),
+        Mock(status_code=200, headers={}, json=Mock(return_value=mock_response)),
+    ]
+    mock_sleep = Mock()
+    client = GitHubGraphqlClient(sleep=mock_sleep)
+
+    # Act
+    result = client.execute_paginated_query(
+        sample_query,
+        {"login": "octocat"},
+        ["user", "repositories"],
+    )
+
+    # Assert
+    assert result == [{"name": "repo1"}]
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(3.0)
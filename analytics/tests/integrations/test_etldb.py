@@ -1,7 +1,10 @@
 """Tests the code in integrations/etldb.py."""
 
 import sqlalchemy
+from analytics.datasets.etl_dataset import EtlDataset, EtlEntityType
+from analytics.integrations.etldb.bulk_sync import EtlBulkSync
 from analytics.integrations.etldb.etldb import EtlDb
+from analytics.integrations.etldb.main import migrate_database
 
 
 class TestEtlDb:
@@ -91,3 +94,59 @@ class TestEtlDb:
 
         assert result is False
         assert etldb.get_schema_version() == original_version
+
+
+class TestEtlBulkSync:
+    """Test EtlBulkSync methods."""
+
+    TEST_FILE_1 = "./tests/etldb_test_01.json"
+    EFFECTIVE_DATE = "2024-10-07"
+
+    def _sync_all(self, bulk_sync: EtlBulkSync, dataset: EtlDataset) -> dict:
+        ghid_map: dict = {}
+        ghid_map[EtlEntityType.PROJECT] = bulk_sync.sync_projects(dataset)
+        ghid_map[EtlEntityType.QUAD] = bulk_sync.sync_quads(dataset)
+        ghid_map[EtlEntityType.DELIVERABLE] = bulk_sync.sync_deliverables(
+            dataset,
+            ghid_map,
+            None,
+        )
+        ghid_map[EtlEntityType.SPRINT] = bulk_sync.sync_sprints(dataset, ghid_map)
+        ghid_map[EtlEntityType.EPIC] = bulk_sync.sync_epics(dataset, ghid_map)
+        ghid_map[EtlEntityType.ISSUE] = bulk_sync.sync_issues(dataset, ghid_map)
+        return ghid_map
+
+    def test_sync_returns_a_row_id_for_every_ghid(self):
+        """Each entity type should map every ghid in the dataset to a row id."""
+        migrate_database()
+        dataset = EtlDataset.load_from_json_file(self.TEST_FILE_1)
+
+        ghid_map = self._sync_all(EtlBulkSync(EtlDb(self.EFFECTIVE_DATE)), dataset)
+
+        assert set(ghid_map[EtlEntityType.PROJECT]) == set(dataset.get_project_ghids())
+        assert set(ghid_map[EtlEntityType.QUAD]) == set(dataset.get_quad_ghids())
+        assert set(ghid_map[EtlEntityType.DELIVERABLE]) == set(
+            dataset.get_deliverable_ghids(),
+        )
+        assert set(ghid_map[EtlEntityType.SPRINT]) == set(dataset.get_sprint_ghids())
+        assert set(ghid_map[EtlEntityType.EPIC]) == set(dataset.get_epic_ghids())
+        assert set(ghid_map[EtlEntityType.ISSUE]) == set(dataset.get_issue_ghids())
+
+    def test_sync_is_idempotent(self):
+        """Syncing the same dataset again should keep the same row ids."""
+        migrate_database()
+        dataset = EtlDataset.load_from_json_file(self.TEST_FILE_1)
+        etldb = EtlDb(self.EFFECTIVE_DATE)
+
+        first_ghid_map = self._sync_all(EtlBulkSync(etldb), dataset)
+        second_ghid_map = self._sync_all(EtlBulkSync(etldb), dataset)
+
+        assert first_ghid_map == second_ghid_map
+
+        result = etldb.connection().execute(
+            sqlalchemy.text(
+                "select count(*) from gh_issue_history where d_effective = :effective",
+            ),
+            {"effective": self.EFFECTIVE_DATE},
+        )
+        assert result.scalar() >= len(first_ghid_map[EtlEntityType.ISSUE])
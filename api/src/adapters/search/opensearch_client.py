@@ -1,14 +1,16 @@
 import logging
-from collections.abc import Generator, Iterable
+import time
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
 import boto3
 import opensearchpy
 from grants_shared.logs.flask_logger import add_extra_data_to_current_request_logs
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_fixed
 
 from src.adapters.search.opensearch_config import OpensearchConfig, get_opensearch_config
-from src.adapters.search.opensearch_response import SearchResponse
+from src.adapters.search.opensearch_response import BulkItemFailure, BulkResponse, SearchResponse
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,38 @@ def _is_snapshot_in_progress_error(exception: BaseException) -> bool:
     )
 
 
+# When a node's write queue is full, OpenSearch rejects the individual bulk
+# items with a 429 rather than failing the whole request. Those items can
+# be safely resent once the cluster catches up.
+BULK_REJECTED_EXECUTION_ERROR = "es_rejected_execution_exception"
+
+
+def _is_rejected_bulk_item(item_result: dict[str, Any]) -> bool:
+    if item_result.get("status") == 429:
+        return True
+
+    error = item_result.get("error")
+    return isinstance(error, dict) and error.get("type") == BULK_REJECTED_EXECUTION_ERROR
+
+
+def _is_retryable_bulk_request_error(exception: BaseException) -> bool:
+    # Connection errors (including timeouts) and server-side errors fail the whole
+    # request. Index and delete actions are idempotent, so resending them is safe.
+    if isinstance(exception, opensearchpy.exceptions.ConnectionError):
+        return True
+
+    return (
+        isinstance(exception, opensearchpy.exceptions.TransportError)
+        and isinstance(exception.status_code, int)
+        and exception.status_code >= 500
+    )
+
+
+# The id of the document a bulk action is for,
+# and the serialized lines we send for it
+type BulkAction = tuple[Any, bytes]
+
+
 # By default, we'll override the default analyzer+tokenization
 # for a search index. You can provide your own when calling create_index
 DEFAULT_INDEX_ANALYSIS = {
@@ -54,6 +88,7 @@ class SearchClient:
 
         # See: https://opensearch.org/docs/latest/clients/python-low-level/ for more details
         self._client = opensearchpy.OpenSearch(**_get_connection_parameters(opensearch_config))
+        self._config = opensearch_config
 
     def create_index(
         self,
@@ -63,9 +98,16 @@ class SearchClient:
         replica_count: int = 1,
         analysis: dict | None = None,
         mappings: dict | None = None,
+        index_build_mode: bool = False,
     ) -> None:
         """
         Create an empty search index
+
+        If index_build_mode is set, the index is created without replicas and
+        without periodic refreshes, which makes bulk loading it much cheaper. This
+        should only be used for an index nobody queries until it's loaded, and the
+        index must be passed to finalize_index_build (or swap_alias_index with an
+        index_build_replica_count) once loaded.
         """
 
         # Allow the user to adjust how the index analyzer + tokenization works
@@ -73,9 +115,17 @@ class SearchClient:
         if analysis is None:
             analysis = DEFAULT_INDEX_ANALYSIS
 
+        index_settings: dict[str, Any] = {
+            "number_of_shards": shard_count,
+            "number_of_replicas": replica_count,
+        }
+        if index_build_mode:
+            index_settings["number_of_replicas"] = 0
+            index_settings["refresh_interval"] = "-1"
+
         body = {
             "settings": {
-                "index": {"number_of_shards": shard_count, "number_of_replicas": replica_count},
+                "index": index_settings,
                 "analysis": analysis,
             },
         }
@@ -85,9 +135,59 @@ class SearchClient:
         if mappings:
             body["mappings"] = mappings
 
-        logger.info("Creating search index %s", index_name, extra={"index_name": index_name})
+        logger.info(
+            "Creating search index %s",
+            index_name,
+            extra={"index_name": index_name, "index_build_mode": index_build_mode},
+        )
         self._client.indices.create(index_name, body=body)
 
+    def finalize_index_build(self, index_name: str, replica_count: int) -> None:
+        """
+        Make an index created with index_build_mode ready to be queried.
+
+        Refreshes the index and merges it down to a single segment, then adds the replicas
+        back so they copy the already merged segments. Waits for the replicas to be
+        allocated before returning.
+        """
+        extra = {"index_name": index_name, "replica_count": replica_count}
+        timeout = self._config.search_index_build_timeout_sec
+
+        logger.info("Finalizing search index build", extra=extra)
+        self._client.indices.refresh(index=index_name)
+
+        # The index won't be written to again, merging down
+        # to one segment makes it faster to search.
+        self._client.indices.forcemerge(
+            index=index_name, max_num_segments=1, request_timeout=timeout
+        )
+
+        self._client.indices.put_settings(
+            index=index_name,
+            # A null refresh interval resets it to the default
+            body={"index": {"number_of_replicas": replica_count, "refresh_interval": None}},
+        )
+
+        # OpenSearch responds with a 408 if the status isn't reached within the timeout
+        health = self._client.cluster.health(
+            index=index_name,
+            wait_for_status=self._config.search_index_build_wait_for_status,
+            timeout=f"{timeout}s",
+            request_timeout=timeout + 30,
+            ignore=408,
+        )
+        if health.get("timed_out"):
+            # The primaries are fully loaded so the index is usable,
+            # the replicas will continue to be allocated in the background.
+            logger.warning(
+                "Timed out waiting for search index health",
+                extra=extra | {"index_health": health.get("status")},
+            )
+        else:
+            logger.info(
+                "Finalized search index build", extra=extra | {"index_health": health.get("status")}
+            )
+
     def delete_index(self, index_name: str) -> None:
         """
         Delete an index. Can also delete all indexes via a prefix.
@@ -124,39 +224,196 @@ class SearchClient:
         primary_key_field: str,
         *,
         refresh: bool = True,
-    ) -> None:
+    ) -> BulkResponse:
         """
         Bulk upsert records to an index
 
         See: https://opensearch.org/docs/latest/api-reference/document-apis/bulk/ for details
         In this method we only use the "index" operation which creates or updates a record
         based on the id value.
-        """
-
-        bulk_operations = []
-
-        for record in records:
-            # For each record, we create two entries in the bulk operation list
-            # which include the unique ID + the actual record on separate lines
-            # When this is sent to the search index, this will send two lines like:
-            #
-            # {"index": {"_id": 123}}
-            # {"opportunity_id": 123, "opportunity_title": "example title", ...}
-            bulk_operations.append({"index": {"_id": record[primary_key_field]}})
-            bulk_operations.append(record)
 
+        The records can be any iterable, including a generator. They are consumed
+        lazily and sent in several requests, see bulk_index_stream for details.
+        """
         logger.info(
             "Upserting records to %s",
             index_name,
+            extra={"index_name": index_name, "operation": "update"},
+        )
+        response = self.bulk_index_stream(
+            index_name,
+            (
+                # For each record, we create two entries in the bulk operation
+                # which include the unique ID + the actual record on separate lines
+                # When this is sent to the search index, this will send two lines like:
+                #
+                # {"index": {"_id": 123}}
+                # {"opportunity_id": 123, "opportunity_title": "example title", ...}
+                (record[primary_key_field], {"index": {"_id": record[primary_key_field]}}, record)
+                for record in records
+            ),
+            refresh=refresh,
+        )
+
+        logger.info(
+            "Upserted records to %s",
+            index_name,
             extra={
                 "index_name": index_name,
-                "record_count": int(len(bulk_operations) / 2),
+                "record_count": response.success_count,
+                "failure_count": response.failure_count,
+                "request_count": response.request_count,
+                "retried_item_count": response.retried_item_count,
                 "operation": "update",
             },
         )
-        bulk_args = {"index": index_name, "body": bulk_operations, "refresh": refresh}
+        return response
 
-        self._client.bulk(**bulk_args)
+    def bulk_index_stream(
+        self,
+        index_name: str,
+        actions: Iterable[tuple[Any, dict[str, Any], dict[str, Any] | None]],
+        *,
+        refresh: bool = False,
+    ) -> BulkResponse:
+        """
+        Send a stream of bulk actions to an index.
+
+        Each action is a tuple of (document id, action line, source line or None). The
+        actions are consumed lazily and split into requests that are bounded by both
+        document count and size. Several requests are in flight at once over the client's
+        connection pool, but only a few chunks are ever held in memory.
+
+        Items the cluster rejects because it is overloaded are resent with backoff,
+        all other per-item errors are collected on the returned response.
+
+        If refresh is set, the index is refreshed once after all actions are sent
+        rather than for every request.
+        """
+        bulk_response = BulkResponse()
+
+        thread_count = max(self._config.search_bulk_thread_count, 1)
+        # Bound how far ahead of the requests we read so memory stays flat
+        max_pending = thread_count * 2
+
+        with ThreadPoolExecutor(
+            max_workers=thread_count, thread_name_prefix="search-bulk"
+        ) as executor:
+            pending: set[Future[BulkResponse]] = set()
+
+            for chunk in self._chunk_bulk_actions(actions):
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _merge_bulk_responses(bulk_response, future.result())
+
+                pending.add(executor.submit(self._send_bulk_chunk, index_name, chunk))
+
+            for future in pending:
+                _merge_bulk_responses(bulk_response, future.result())
+
+        if refresh:
+            self._client.indices.refresh(index=index_name)
+
+        for failure in bulk_response.failures[:10]:
+            logger.warning(
+                "Bulk operation failed for a record",
+                extra={
+                    "index_name": index_name,
+                    "record_id": failure.id,
+                    "status": failure.status,
+                    "error": str(failure.error),
+                },
+            )
+
+        return bulk_response
+
+    def _chunk_bulk_actions(
+        self, actions: Iterable[tuple[Any, dict[str, Any], dict[str, Any] | None]]
+    ) -> Iterator[list[BulkAction]]:
+        serializer = self._client.transport.serializer
+        max_chunk_size = self._config.search_bulk_chunk_size
+        max_chunk_bytes = self._config.search_bulk_max_chunk_bytes
+
+        chunk: list[BulkAction] = []
+        chunk_bytes = 0
+
+        for doc_id, action, source in actions:
+            lines = serializer.dumps(action) + "\n"
+            if source is not None:
+                lines += serializer.dumps(source) + "\n"
+            data = lines.encode("utf-8")
+
+            # Start a new chunk if this action would put us over either limit
+            if chunk and (
+                len(chunk) >= max_chunk_size or chunk_bytes + len(data) > max_chunk_bytes
+            ):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+
+            chunk.append((doc_id, data))
+            chunk_bytes += len(data)
+
+        if chunk:
+            yield chunk
+
+    def _send_bulk_chunk(self, index_name: str, chunk: list[BulkAction]) -> BulkResponse:
+        bulk_response = BulkResponse()
+
+        attempt = 0
+        while True:
+            request_start = time.monotonic()
+            raw_response = self._send_bulk_request(index_name, b"".join(data for _, data in chunk))
+            bulk_response.request_duration_sec += time.monotonic() - request_start
+            bulk_response.request_count += 1
+
+            rejected: list[BulkAction] = []
+            # Items in the response are in the same order as the request
+            for (doc_id, data), item in zip(chunk, raw_response["items"], strict=True):
+                # Each item is keyed by its operation, eg. {"index": {"status": 201, ...}}
+                item_result = next(iter(item.values()))
+                status = item_result.get("status", 500)
+
+                if status < 300:
+                    bulk_response.success_count += 1
+                elif (
+                    _is_rejected_bulk_item(item_result)
+                    and attempt < self._config.search_bulk_max_retries
+                ):
+                    rejected.append((doc_id, data))
+                else:
+                    bulk_response.failures.append(
+                        BulkItemFailure(id=doc_id, status=status, error=item_result.get("error"))
+                    )
+
+            if not rejected:
+                return bulk_response
+
+            bulk_response.retried_item_count += len(rejected)
+            backoff = self._config.search_bulk_initial_backoff_sec * (2**attempt)
+            logger.info(
+                "Bulk items were rejected by the cluster, retrying",
+                extra={
+                    "index_name": index_name,
+                    "rejected_count": len(rejected),
+                    "attempt": attempt + 1,
+                    "backoff_sec": backoff,
+                },
+            )
+            time.sleep(backoff)
+
+            attempt += 1
+            chunk = rejected
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=2),
+        retry=retry_if_exception(_is_retryable_bulk_request_error),
+        reraise=True,
+    )
+    def _send_bulk_request(self, index_name: str, body: bytes) -> dict[str, Any]:
+        return self._client.bulk(index=index_name, body=body)
 
     def bulk_delete(self, index_name: str, ids: Iterable[Any], *, refresh: bool = True) -> None:
         """
@@ -208,13 +465,25 @@ class SearchClient:
         for index in old_indexes:
             self.delete_index(index)
 
-    def swap_alias_index(self, index_name: str | None, alias_name: str) -> None:
+    def swap_alias_index(
+        self,
+        index_name: str | None,
+        alias_name: str,
+        *,
+        index_build_replica_count: int | None = None,
+    ) -> None:
         """
         For a given index, set it to the given alias. If any existing index(es) are
         attached to the alias, remove them from the alias.
 
         This operation is done atomically.
+
+        If the index was created with index_build_mode, pass the replica count it should
+        have, and it will be finalized before any queries are pointed at it.
         """
+        if index_name is not None and index_build_replica_count is not None:
+            self.finalize_index_build(index_name, index_build_replica_count)
+
         extra = {"index_name": index_name, "index_alias": alias_name}
         logger.info("Swapping index that backs alias %s", alias_name, extra=extra)
 
@@ -279,6 +548,61 @@ class SearchClient:
 
         return response
 
+    def msearch(
+        self,
+        index_name: str,
+        search_queries: Sequence[dict],
+        include_scores: bool = True,
+    ) -> list[SearchResponse | None]:
+        """
+        Run several searches against an index in a single request.
+
+        Returns a response for each query in the same order the queries were given. If
+        an individual query errors, None is returned in its place rather than failing
+        every query in the request.
+
+        See: https://opensearch.org/docs/latest/api-reference/multi-search/
+        """
+        if not search_queries:
+            return []
+
+        body: list[dict] = []
+        for search_query in search_queries:
+            # Each search is a header line followed by the query itself
+            # {"index": "my-index"}
+            # {"query": {...}, "size": 25}
+            body.append({"index": index_name})
+            body.append(search_query)
+
+        raw_response = self._client.msearch(body=body)
+
+        responses: list[SearchResponse | None] = []
+        for raw_item in raw_response["responses"]:
+            if "error" in raw_item:
+                logger.warning(
+                    "Search failed in multi-search request",
+                    extra={
+                        "index_name": index_name,
+                        "status": raw_item.get("status"),
+                        "error": str(raw_item["error"]),
+                    },
+                )
+                responses.append(None)
+                continue
+
+            responses.append(SearchResponse.from_opensearch_response(raw_item, include_scores))
+
+        logger.info(
+            "Ran multi-search request",
+            extra={
+                "index_name": index_name,
+                "search_count": len(search_queries),
+                "failed_search_count": responses.count(None),
+                "took_ms": raw_response.get("took"),
+            },
+        )
+        return responses
+
     def scroll(
         self,
         index_name: str,
@@ -345,6 +669,14 @@ class SearchClient:
         return raw_result.get("_source", None)
 
 
+def _merge_bulk_responses(into: BulkResponse, other: BulkResponse) -> None:
+    into.success_count += other.success_count
+    into.failures.extend(other.failures)
+    into.request_count += other.request_count
+    into.retried_item_count += other.retried_item_count
+    into.request_duration_sec += other.request_duration_sec
+
+
 def _get_connection_parameters(opensearch_config: OpensearchConfig) -> dict[str, Any]:
     # See: https://opensearch.org/docs/latest/clients/python-low-level/#connecting-to-opensearch
     # for further details on configuring the connection to OpenSearch
@@ -16,6 +16,26 @@ class OpensearchConfig(PydanticBaseEnvConfig):
     search_verify_certs: bool = Field(default=True)  # SEARCH_VERIFY_CERTS
     search_connection_pool_size: int = Field(default=10)  # SEARCH_CONNECTION_POOL_SIZE
 
+    # Bulk indexing splits documents into requests bounded by both
+    # document count and size, and sends several of them at once.
+    # The thread count should not exceed the connection pool size.
+    search_bulk_chunk_size: int = Field(default=500)  # SEARCH_BULK_CHUNK_SIZE
+    search_bulk_max_chunk_bytes: int = Field(default=5 * 1024 * 1024)  # SEARCH_BULK_MAX_CHUNK_BYTES
+    search_bulk_thread_count: int = Field(default=4)  # SEARCH_BULK_THREAD_COUNT
+    # Items the cluster rejects because it is overloaded (HTTP 429) are retried
+    # with an exponential backoff starting at the initial backoff.
+    search_bulk_max_retries: int = Field(default=3)  # SEARCH_BULK_MAX_RETRIES
+    search_bulk_initial_backoff_sec: float = Field(default=2)  # SEARCH_BULK_INITIAL_BACKOFF_SEC
+
+    # After building an index, we wait for it to reach this health before
+    # pointing an alias at it. A single node cluster (eg. locally) can never
+    # allocate replicas, so it can only ever reach yellow.
+    search_index_build_wait_for_status: str = Field(
+        default="green"
+    )  # SEARCH_INDEX_BUILD_WAIT_FOR_STATUS
+    # How long to wait for the force merge and for the index health
+    search_index_build_timeout_sec: int = Field(default=600)  # SEARCH_INDEX_BUILD_TIMEOUT_SEC
+
     # AWS region - when set, IAM (SigV4) authentication is used
     # This requires the ECS task role to have the appropriate OpenSearch permissions
     aws_region: str | None = Field(default=None)  # AWS_REGION
@@ -38,6 +58,8 @@ def get_opensearch_config() -> OpensearchConfig:
             "search_use_ssl": opensearch_config.search_use_ssl,
             "search_verify_certs": opensearch_config.search_verify_certs,
             "search_connection_pool_size": opensearch_config.search_connection_pool_size,
+            "search_bulk_chunk_size": opensearch_config.search_bulk_chunk_size,
+            "search_bulk_thread_count": opensearch_config.search_bulk_thread_count,
             "aws_region": opensearch_config.aws_region,
             "opensearch_explain_enabled": opensearch_config.opensearch_explain_enabled,
         },
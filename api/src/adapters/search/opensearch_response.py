@@ -206,3 +206,43 @@ def _compute_score_stats(records: list[dict]) -> dict:
         "search.score_mean": None,
         "search.score_stdev": None,
     }
+
+
+@dataclasses.dataclass
+class BulkItemFailure:
+    # The _id of the document that failed
+    id: typing.Any
+
+    status: int
+
+    # The error object OpenSearch returned for the item, eg.
+    # {"type": "mapper_parsing_exception", "reason": "failed to parse field [x]"}
+    error: dict[str, typing.Any] | str | None
+
+
+@dataclasses.dataclass
+class BulkResponse:
+    """
+    The aggregated result of a bulk operation that may have
+    been split across many separate bulk requests.
+    """
+
+    success_count: int = 0
+
+    # Items that failed, including any that were still
+    # being rejected after all retries were used up.
+    failures: list[BulkItemFailure] = dataclasses.field(default_factory=list)
+
+    request_count: int = 0
+    retried_item_count: int = 0
+
+    # Total time spent waiting on bulk requests, summed across all threads
+    request_duration_sec: float = 0
+
+    @property
+    def failure_count(self) -> int:
+        return len(self.failures)
+
+    @property
+    def has_failures(self) -> bool:
+        return len(self.failures) > 0
@@ -17,6 +17,7 @@ from src.services.xml_generation.validation.test_cases import (
 )
 from src.services.xml_generation.validation.test_runner import ValidationTestRunner
 from src.services.xml_generation.validation.xsd_fetcher import XSDFetcher
+from src.services.xml_generation.validation.xsd_validator import precompile_schemas
 from src.task.task_blueprint import task_blueprint
 
 
@@ -416,3 +417,37 @@ def fetch_xsds_command(
         logger.error(f"Fetch failed: {e}", exc_info=verbose)
         click.echo(f"Error: Fetch failed: {e}", err=True)
         sys.exit(1)
+
+
+@task_blueprint.cli.command("precompile-xsds")
+@click.option(
+    "--xsd-dir",
+    type=click.Path(),
+    help="Directory containing XSD files (default: ../services/xml_generation/xsds). Run 'flask task fetch-xsds' first.",
+)
+def precompile_xsds_command(xsd_dir: str | None) -> None:
+    """Compile the XSD schema of every form and store them in the XSD directory.
+
+    XSD validation loads the stored schemas instead of compiling each schema in
+    every process. Schemas are compiled as usual if the XSD files change after
+    this is run, so run it at build time, after fetching the XSD files.
+
+    Examples:
+        flask task precompile-xsds
+
+        flask task precompile-xsds --xsd-dir ../services/xml_generation/xsds
+    """
+    # Use default XSD directory if not specified
+    if not xsd_dir:
+        xsd_dir = str(Path(__file__).resolve().parents[2] / "src/services/xml_generation/xsds")
+
+    init_form_registry()
+    xsd_filenames = {xsd_url.split("/")[-1] for xsd_url in _build_xml_form_xsd_url_map().values()}
+
+    try:
+        compiled_schemas_path = precompile_schemas(Path(xsd_dir), xsd_filenames)
+    except Exception as e:
+        click.echo(f"Error: Failed to precompile XSD schemas: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Compiled {len(xsd_filenames)} XSD schemas to: {compiled_schemas_path}")
@@ -134,6 +134,8 @@ class AgencySubmissionNotificationSetting(StrEnum):
 class ExtractType(StrEnum):
     OPPORTUNITIES_JSON = "opportunities_json"
     OPPORTUNITIES_CSV = "opportunities_csv"
+    OPPORTUNITIES_JSON_GZIP = "opportunities_json_gzip"
+    OPPORTUNITIES_CSV_GZIP = "opportunities_csv_gzip"
 
 
 class ExternalUserType(StrEnum):
@@ -35,6 +35,20 @@ logger = logging.getLogger(__name__)
     "--insert-chunk-size", default=800, help="chunk size for load inserts", show_default=True
 )
 @click.option("--tables-to-load", "-t", help="table to load", multiple=True)
+@click.option(
+    "--keyset/--no-keyset",
+    default=False,
+    help="load new and updated rows by primary key range within the database",
+)
+@click.option(
+    "--key-range-size",
+    default=10000,
+    help="number of primary keys per range for keyset loads",
+    show_default=True,
+)
+@click.option(
+    "--table-workers", default=1, help="number of tables to load at once", show_default=True
+)
 @click.option(
     "--store-version/--no-store-version", default=False, help="run StoreOpportunityVersionTask"
 )
@@ -48,6 +62,9 @@ def load_transform(
     store_version: bool,
     insert_chunk_size: int,
     tables_to_load: list[str],
+    keyset: bool,
+    key_range_size: int,
+    table_workers: int,
 ) -> None:
     logger.info("load and transform start")
 
@@ -57,7 +74,14 @@ def load_transform(
     with TaskJobLock(db_session, job_type=JobType.LOAD_TRANSFORM, lock_duration_minutes=90):
         if load:
             LoadOracleDataTask(
-                db_session, foreign_tables, staging_tables, tables_to_load, insert_chunk_size
+                db_session,
+                foreign_tables,
+                staging_tables,
+                tables_to_load,
+                insert_chunk_size,
+                keyset_enabled=keyset,
+                key_range_size=key_range_size,
+                table_worker_count=table_workers,
             ).run()
         if transform:
             TransformOracleDataTask(db_session).run()
@@ -3,7 +3,10 @@
 #
 import itertools
 import logging
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import sqlalchemy
@@ -63,6 +66,9 @@ class LoadOracleDataTask(src.task.task.Task):
         staging_tables: dict[str, sqlalchemy.Table],
         tables_to_load: list[str] | None = None,
         insert_chunk_size: int = 800,
+        keyset_enabled: bool = False,
+        key_range_size: int = 10000,
+        table_worker_count: int = 1,
     ) -> None:
 
         if tables_to_load is None or len(tables_to_load) == 0:
@@ -83,6 +89,14 @@ class LoadOracleDataTask(src.task.task.Task):
         self.foreign_tables = foreign_tables
         self.staging_tables = staging_tables
         self.insert_chunk_size = insert_chunk_size
+        # When enabled, new and updated rows are copied a range of primary keys at a time
+        # entirely within the DB, rather than fetching every primary key to copy first.
+        self.keyset_enabled = keyset_enabled
+        self.key_range_size = key_range_size
+        # Number of tables to load at once, each on its own connection
+        self.table_worker_count = table_worker_count
+        # Re-entrant as increment() calls itself again when given a prefix
+        self._metrics_lock = threading.RLock()
         # Strip tzinfo so the cutoff is a naive datetime with EST wall-clock values.
         # The Oracle foreign data stores EST timestamps but Postgres treats them as UTC, so a
         # tz-aware cutoff is converted to UTC for comparison and ends up 4-5h ahead of the source.
@@ -123,25 +137,62 @@ class LoadOracleDataTask(src.task.task.Task):
             },
         )
 
+    def increment(self, name: str, value: int | float = 1, prefix: str | None = None) -> None:
+        # Tables can be loaded from several threads at once
+        with self._metrics_lock:
+            super().increment(name, value, prefix)
+
     def load_data(self) -> None:
         """Load the data for all tables defined in the mapping."""
+        if self.table_worker_count > 1:
+            self.load_data_in_parallel()
+            return
+
         for table_name in self.foreign_tables:
             try:
-                self.load_data_for_table(table_name)
+                self.load_data_for_table(self.db_session, table_name)
             except Exception:
                 logger.exception("table load error", extra={"table": table_name})
 
-    def load_data_for_table(self, table_name: str) -> None:
+    def load_data_in_parallel(self) -> None:
+        """Load the data for all tables, several tables at a time."""
+        bind = self.db_session.get_bind()
+
+        with ThreadPoolExecutor(
+            max_workers=self.table_worker_count, thread_name_prefix="load-oracle-data"
+        ) as executor:
+            futures = {
+                table_name: executor.submit(self.load_data_for_table_with_session, bind, table_name)
+                for table_name in self.foreign_tables
+            }
+
+            for table_name, future in futures.items():
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception("table load error", extra={"table": table_name})
+
+    def load_data_for_table_with_session(self, bind: sqlalchemy.Engine, table_name: str) -> None:
+        # Runs on a worker thread. Sessions can't be shared across threads,
+        # so each table is loaded with its own session and connection.
+        with db.Session(bind=bind) as worker_session:
+            self.load_data_for_table(worker_session, table_name)
+
+    def load_data_for_table(self, db_session: db.Session, table_name: str) -> None:
         """Load new and updated rows for a single table from the foreign table to the staging table."""
         logger.info("process table", extra={"table": table_name})
         foreign_table = self.foreign_tables[table_name]
         staging_table = self.staging_tables[table_name]
 
-        self.log_row_count("before", foreign_table, staging_table)
+        self.log_row_count(db_session, "before", foreign_table, staging_table)
 
-        update_result = self.do_update(foreign_table, staging_table)
-        insert_result = self.do_insert(foreign_table, staging_table)
-        delete_result = self.do_mark_deleted(foreign_table, staging_table)
+        if self.keyset_enabled:
+            update_result = self.do_keyset_update(db_session, foreign_table, staging_table)
+            insert_result = self.do_keyset_insert(db_session, foreign_table, staging_table)
+        else:
+            update_result = self.do_update(db_session, foreign_table, staging_table)
+            insert_result = self.do_insert(db_session, foreign_table, staging_table)
+        delete_result = self.do_mark_deleted(db_session, foreign_table, staging_table)
 
         processing_time = round(
             update_result.total_time + insert_result.total_time + delete_result.total_time, 3
@@ -154,10 +205,13 @@ class LoadOracleDataTask(src.task.task.Task):
             },
         )
 
-        self.log_row_count("after", staging_table)
+        self.log_row_count(db_session, "after", staging_table)
 
     def do_insert(
-        self, foreign_table: sqlalchemy.Table, staging_table: sqlalchemy.Table
+        self,
+        db_session: db.Session,
+        foreign_table: sqlalchemy.Table,
+        staging_table: sqlalchemy.Table,
     ) -> LoadResult:
         """Determine new rows by primary key, and copy them into the staging table."""
         log_extra: dict = {"table": foreign_table.name}
@@ -172,8 +226,8 @@ class LoadOracleDataTask(src.task.task.Task):
         logger.info("Fetching records to be inserted", extra=log_extra)
         select_sql = sql.build_select_new_rows_sql(foreign_table, staging_table, self.batch_cutoff)
         fetch_t0 = time.monotonic()
-        with self.db_session.begin():
-            new_ids = self.db_session.execute(select_sql).all()
+        with db_session.begin():
+            new_ids = db_session.execute(select_sql).all()
         fetch_time = round(time.monotonic() - fetch_t0, 3)
 
         t0 = time.monotonic()
@@ -185,8 +239,8 @@ class LoadOracleDataTask(src.task.task.Task):
             )
 
             # Execute the INSERT.
-            with self.db_session.begin():
-                self.db_session.execute(insert_from_select_sql)
+            with db_session.begin():
+                db_session.execute(insert_from_select_sql)
 
             insert_chunk_count.append(len(batch_of_new_ids))
             logger.info(
@@ -216,7 +270,10 @@ class LoadOracleDataTask(src.task.task.Task):
         return LoadResult(count=total_insert_count, fetch_time=fetch_time, copy_time=copy_time)
 
     def do_update(
-        self, foreign_table: sqlalchemy.Table, staging_table: sqlalchemy.Table
+        self,
+        db_session: db.Session,
+        foreign_table: sqlalchemy.Table,
+        staging_table: sqlalchemy.Table,
     ) -> LoadResult:
         """Find updated rows using last_upd_date, copy them, and reset transformed_at to NULL."""
         log_extra: dict = {"table": foreign_table.name}
@@ -233,8 +290,8 @@ class LoadOracleDataTask(src.task.task.Task):
             foreign_table, staging_table, self.batch_cutoff
         )
         fetch_t0 = time.monotonic()
-        with self.db_session.begin():
-            update_ids = self.db_session.execute(select_sql).all()
+        with db_session.begin():
+            update_ids = db_session.execute(select_sql).all()
         fetch_time = round(time.monotonic() - fetch_t0, 3)
 
         t0 = time.monotonic()
@@ -254,8 +311,8 @@ class LoadOracleDataTask(src.task.task.Task):
                 deleted_at=None,
             )
 
-            with self.db_session.begin():
-                self.db_session.execute(update_sql)
+            with db_session.begin():
+                db_session.execute(update_sql)
 
             update_chunk_count.append(len(batch_of_update_ids))
             logger.info(
@@ -280,22 +337,185 @@ class LoadOracleDataTask(src.task.task.Task):
 
         return LoadResult(count=total_update_count, fetch_time=fetch_time, copy_time=copy_time)
 
+    def iter_key_ranges(
+        self, db_session: db.Session, foreign_table: sqlalchemy.Table, load_result: LoadResult
+    ) -> Iterator[tuple[sqlalchemy.Row | None, sqlalchemy.Row]]:
+        """Page through the primary keys of the foreign table, yielding the (exclusive) start
+        and (inclusive) end of each range of keys. Only the end of each range is fetched.
+        """
+        range_start = None
+        while True:
+            fetch_t0 = time.monotonic()
+            with db_session.begin():
+                range_end = db_session.execute(
+                    sql.build_select_key_range_end_sql(
+                        foreign_table, range_start, self.key_range_size
+                    )
+                ).one_or_none()
+            load_result.fetch_time += time.monotonic() - fetch_t0
+
+            if range_end is None:
+                return
+
+            yield range_start, range_end
+            range_start = range_end
+
+    def do_keyset_insert(
+        self,
+        db_session: db.Session,
+        foreign_table: sqlalchemy.Table,
+        staging_table: sqlalchemy.Table,
+    ) -> LoadResult:
+        """Copy new rows into the staging table, a range of primary keys at a time."""
+        log_extra: dict = {"table": foreign_table.name}
+
+        excluded_columns = self.columns_to_exclude.get(foreign_table.name, [])
+        if excluded_columns:
+            logger.info(
+                "Excluding columns during insert",
+                extra=log_extra | {"excluded_columns": excluded_columns},
+            )
+
+        logger.info("Inserting new records by key range", extra=log_extra)
+        result = LoadResult()
+        range_count = 0
+        for range_start, range_end in self.iter_key_ranges(db_session, foreign_table, result):
+            insert_sql = sql.build_insert_new_rows_in_range_sql(
+                foreign_table,
+                staging_table,
+                range_start,
+                range_end,
+                self.batch_cutoff,
+                excluded_columns,
+            )
+
+            t0 = time.monotonic()
+            with db_session.begin():
+                insert_count = db_session.execute(insert_sql).rowcount  # type: ignore[attr-defined]
+            result.copy_time += time.monotonic() - t0
+
+            result.count += insert_count
+            range_count += 1
+            logger.info(
+                "insert key range done",
+                extra=log_extra | {"count": result.count, "range_count": range_count},
+            )
+
+        return self._finish_keyset_result(
+            "insert",
+            staging_table,
+            result,
+            range_count,
+            "Processed records to be inserted",
+            log_extra,
+        )
+
+    def do_keyset_update(
+        self,
+        db_session: db.Session,
+        foreign_table: sqlalchemy.Table,
+        staging_table: sqlalchemy.Table,
+    ) -> LoadResult:
+        """Copy updated rows into the staging table, a range of primary keys at a time,
+        and reset transformed_at to NULL."""
+        log_extra: dict = {"table": foreign_table.name}
+
+        excluded_columns = self.columns_to_exclude.get(foreign_table.name, [])
+        if excluded_columns:
+            logger.info(
+                "Excluding columns during update",
+                extra=log_extra | {"excluded_columns": excluded_columns},
+            )
+
+        logger.info("Updating records by key range", extra=log_extra)
+        result = LoadResult()
+        range_count = 0
+        for range_start, range_end in self.iter_key_ranges(db_session, foreign_table, result):
+            update_sql = sql.build_update_rows_in_range_sql(
+                foreign_table,
+                staging_table,
+                range_start,
+                range_end,
+                self.batch_cutoff,
+                excluded_columns,
+            ).values(
+                transformed_at=None,
+                # See do_update
+                is_deleted=False,
+                deleted_at=None,
+            )
+
+            t0 = time.monotonic()
+            with db_session.begin():
+                update_count = db_session.execute(update_sql).rowcount  # type: ignore[attr-defined]
+            result.copy_time += time.monotonic() - t0
+
+            result.count += update_count
+            range_count += 1
+            logger.info(
+                "update key range done",
+                extra=log_extra | {"count": result.count, "range_count": range_count},
+            )
+
+        return self._finish_keyset_result(
+            "update",
+            staging_table,
+            result,
+            range_count,
+            "Processed records to be updated",
+            log_extra,
+        )
+
+    def _finish_keyset_result(
+        self,
+        operation: str,
+        staging_table: sqlalchemy.Table,
+        result: LoadResult,
+        range_count: int,
+        message: str,
+        log_extra: dict,
+    ) -> LoadResult:
+        result.fetch_time = round(result.fetch_time, 3)
+        result.copy_time = round(result.copy_time, 3)
+
+        self.increment(f"count.{operation}.total", result.count)
+        self.increment(f"time.{operation}.total", result.copy_time)
+        self.increment(f"time.{operation}_fetch.total", result.fetch_time)
+
+        log_extra |= {
+            f"count.{operation}.{staging_table.name}": result.count,
+            f"count.{operation}.ranges.{staging_table.name}": range_count,
+            f"time.{operation}.{staging_table.name}": result.copy_time,
+            f"time.{operation}_fetch.{staging_table.name}": result.fetch_time,
+        }
+        logger.info(message, extra=log_extra)
+
+        return result
+
     def do_mark_deleted(
-        self, foreign_table: sqlalchemy.Table, staging_table: sqlalchemy.Table
+        self,
+        db_session: db.Session,
+        foreign_table: sqlalchemy.Table,
+        staging_table: sqlalchemy.Table,
     ) -> LoadResult:
         """Find deleted rows, set is_deleted=TRUE, and reset transformed_at to NULL."""
         log_extra: dict = {"table": foreign_table.name}
 
         logger.info("Fetching records to be deleted", extra=log_extra)
-        update_sql = sql.build_mark_deleted_sql(foreign_table, staging_table).values(
+        build_mark_deleted_sql = (
+            sql.build_mark_deleted_not_exists_sql
+            if self.keyset_enabled
+            else sql.build_mark_deleted_sql
+        )
+        update_sql = build_mark_deleted_sql(foreign_table, staging_table).values(
             transformed_at=None,
             deleted_at=datetime_util.utcnow(),
         )
 
         t0 = time.monotonic()
         logger.info("Fetched records to be deleted", extra=log_extra)
-        with self.db_session.begin():
-            result = self.db_session.execute(update_sql)
+        with db_session.begin():
+            result = db_session.execute(update_sql)
         t1 = time.monotonic()
         delete_time = round(t1 - t0, 3)
         delete_count = result.rowcount  # type: ignore[attr-defined]
@@ -312,12 +532,14 @@ class LoadOracleDataTask(src.task.task.Task):
 
         return LoadResult(count=delete_count, copy_time=delete_time)
 
-    def log_row_count(self, message: str, *tables: sqlalchemy.Table) -> None:
+    def log_row_count(
+        self, db_session: db.Session, message: str, *tables: sqlalchemy.Table
+    ) -> None:
         """Log the number of rows in each of the tables using SQL COUNT()."""
         extra: dict = {}
-        with self.db_session.begin():
+        with db_session.begin():
             for table in tables:
-                count = self.db_session.query(table).count()
+                count = db_session.query(table).count()
                 extra["table"] = table.name
                 extra[f"count.{table.schema}.{table.name}"] = count
         logger.info(f"row count {message}", extra=extra, stacklevel=2)
@@ -151,3 +151,163 @@ def build_mark_deleted_sql(
             ),
         )
     )
+
+
+#
+# Keyset load
+#
+# Rather than fetching the primary keys of every new or updated row, the keyset load walks
+# the source table a range of keys at a time, only fetching the last key of each range. The
+# new and updated rows in each range are then copied with a single INSERT/UPDATE statement.
+#
+
+
+def build_select_key_range_end_sql(
+    source_table: sqlalchemy.Table,
+    range_start: tuple | sqlalchemy.Row | None,
+    range_size: int,
+) -> sqlalchemy.Select:
+    """Build a query for the primary key that ends the next range of `range_size` rows after `range_start`."""
+
+    # `SELECT id1, id2, ... FROM <source_table> WHERE (id1, id2, ...) > (...)
+    #  ORDER BY id1, id2, ... LIMIT <range_size>`    (subquery)
+    range_keys = sqlalchemy.select(*source_table.primary_key.columns)
+    if range_start is not None:
+        range_keys = range_keys.where(
+            sqlalchemy.tuple_(*source_table.primary_key.columns) > sqlalchemy.tuple_(*range_start)
+        )
+    range_keys_subquery = (
+        range_keys.order_by(*source_table.primary_key.columns).limit(range_size).subquery()
+    )
+
+    # `SELECT id1, id2, ... FROM (...) ORDER BY id1 DESC, id2 DESC, ... LIMIT 1`
+    return (
+        sqlalchemy.select(*range_keys_subquery.c)
+        .order_by(*(column.desc() for column in range_keys_subquery.c))
+        .limit(1)
+    )
+
+
+def build_key_range_clause(
+    table: sqlalchemy.Table,
+    range_start: tuple | sqlalchemy.Row | None,
+    range_end: tuple | sqlalchemy.Row,
+) -> sqlalchemy.ColumnElement[bool]:
+    """Build a `(id1, id2, ...) > (start) AND (id1, id2, ...) <= (end)` clause for a range of keys."""
+    primary_key = sqlalchemy.tuple_(*table.primary_key.columns)
+
+    clause = primary_key <= sqlalchemy.tuple_(*range_end)
+    if range_start is not None:
+        clause = sqlalchemy.and_(primary_key > sqlalchemy.tuple_(*range_start), clause)
+
+    return clause
+
+
+def build_insert_new_rows_in_range_sql(
+    source_table: sqlalchemy.Table,
+    destination_table: sqlalchemy.Table,
+    range_start: tuple | sqlalchemy.Row | None,
+    range_end: tuple | sqlalchemy.Row,
+    cutoff: datetime | None = None,
+    excluded_columns: list[str] | None = None,
+) -> sqlalchemy.Insert:
+    """Build an `INSERT INTO ... SELECT ... FROM ... WHERE NOT EXISTS ...` query for the new rows in a key range."""
+
+    if excluded_columns is None:
+        excluded_columns = []
+
+    columns_to_include = [c for c in source_table.columns if c.name not in excluded_columns]
+    column_names = tuple(c.name for c in columns_to_include)
+
+    # `SELECT col1, col2, ..., FALSE AS is_deleted FROM <source_table>`
+    select_sql = sqlalchemy.select(
+        *columns_to_include, sqlalchemy.literal_column("FALSE").label("is_deleted")
+    ).where(
+        # `WHERE (id1, id2, ...) > (...) AND (id1, id2, ...) <= (...)`
+        build_key_range_clause(source_table, range_start, range_end),
+        # `AND NOT EXISTS (SELECT * FROM <destination_table>
+        #  WHERE (id1, id2, ...) = (id1, id2, ...))`
+        ~sqlalchemy.exists().where(
+            sqlalchemy.tuple_(*destination_table.primary_key.columns)
+            == sqlalchemy.tuple_(*source_table.primary_key.columns)
+        ),
+    )
+
+    if cutoff is not None:
+        select_sql = select_sql.where(
+            sqlalchemy.or_(
+                source_table.c.created_date.is_(None),
+                source_table.c.created_date <= cutoff,
+            )
+        )
+
+    # `INSERT INTO <destination_table> (col1, col2, ..., is_deleted) SELECT ...`
+    return sqlalchemy.insert(destination_table).from_select(
+        column_names + (destination_table.c.is_deleted.name,), select_sql
+    )
+
+
+def build_update_rows_in_range_sql(
+    source_table: sqlalchemy.Table,
+    destination_table: sqlalchemy.Table,
+    range_start: tuple | sqlalchemy.Row | None,
+    range_end: tuple | sqlalchemy.Row,
+    cutoff: datetime | None = None,
+    excluded_columns: list[str] | None = None,
+) -> sqlalchemy.Update:
+    """Build an `UPDATE ... SET ... FROM ... WHERE ...` statement for the updated rows in a key range."""
+
+    if excluded_columns is None:
+        excluded_columns = []
+
+    update_columns = {
+        col.name: source_table.c[col.name]
+        for col in source_table.columns
+        if col.name not in excluded_columns
+    }
+
+    update_sql = (
+        # `UPDATE <destination_table>`
+        sqlalchemy.update(destination_table)
+        # `SET col1=source_table.col1, col2=source_table.col2, ...`
+        .values(update_columns)
+        # `WHERE ...`
+        .where(
+            sqlalchemy.tuple_(*destination_table.primary_key.columns)
+            == sqlalchemy.tuple_(*source_table.primary_key.columns),
+            build_key_range_clause(source_table, range_start, range_end),
+            # See build_select_updated_rows_sql for why this falls back to the created_date
+            sqlalchemy.func.coalesce(
+                destination_table.c.last_upd_date, destination_table.c.created_date
+            )
+            < source_table.c.last_upd_date,
+        )
+    )
+
+    if cutoff is not None:
+        update_sql = update_sql.where(source_table.c.last_upd_date <= cutoff)
+
+    return update_sql
+
+
+def build_mark_deleted_not_exists_sql(
+    source_table: sqlalchemy.Table, destination_table: sqlalchemy.Table
+) -> sqlalchemy.Update:
+    """Build an `UPDATE ... SET is_deleted = TRUE WHERE NOT EXISTS ...` statement for deleted rows."""
+    return (
+        # `UPDATE <destination_table>`
+        sqlalchemy.update(destination_table)
+        # `SET is_deleted = TRUE`
+        .values(is_deleted=True)
+        # `WHERE`
+        .where(
+            # `is_deleted == FALSE`
+            destination_table.c.is_deleted == False,  # ruff: ignore[true-false-comparison]
+            # `AND NOT EXISTS (SELECT * FROM <source_table>
+            #  WHERE (id1, id2, ...) = (id1, id2, ...))`
+            ~sqlalchemy.exists().where(
+                sqlalchemy.tuple_(*source_table.primary_key.columns)
+                == sqlalchemy.tuple_(*destination_table.primary_key.columns)
+            ),
+        )
+    )
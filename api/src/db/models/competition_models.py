@@ -8,7 +8,7 @@ from grants_shared.adapters.db.type_decorators.postgres_type_decorators import L
 from grants_shared.db.models.base import TimestampMixin
 from grants_shared.util.datetime_util import get_now_us_eastern_date
 from grants_shared.util.file_util import pre_sign_file_location, presign_or_s3_cdnify_url
-from sqlalchemy import BigInteger, ForeignKey, Sequence, UniqueConstraint, and_
+from sqlalchemy import BigInteger, ForeignKey, Index, Sequence, UniqueConstraint, and_
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -408,12 +408,25 @@ class ApplicationAttachment(ApiSchemaTable, TimestampMixin):
 class ApplicationSubmission(ApiSchemaTable, TimestampMixin):
     __tablename__ = "application_submission"
 
+    # The legacy SOAP GetSubmissionList endpoints page through submissions
+    # in (created_at, application_submission_id) order, the included columns
+    # let the join to application and tracking number filter use the index alone.
+    __table_args__ = (
+        Index(
+            "application_submission_created_at_application_submission_id_idx",
+            "created_at",
+            "application_submission_id",
+            postgresql_include=["application_id", "legacy_tracking_number"],
+        ),
+        ApiSchemaTable.__table_args__,
+    )
+
     application_submission_id: Mapped[uuid.UUID] = mapped_column(
         UUID, primary_key=True, default=uuid.uuid4
     )
 
     application_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey(Application.application_id), nullable=False
+        UUID, ForeignKey(Application.application_id), nullable=False, index=True
     )
     application: Mapped[Application] = relationship(
         Application, back_populates="application_submissions"
@@ -433,6 +446,7 @@ class ApplicationSubmission(ApiSchemaTable, TimestampMixin):
         BigInteger,
         legacy_tracking_number_seq,
         server_default=legacy_tracking_number_seq.next_value(),
+        index=True,
     )
 
     application_submission_number: Mapped[str | None]
@@ -484,7 +498,7 @@ class ApplicationSubmissionRetrieved(ApiSchemaTable, TimestampMixin):
         UUID, primary_key=True, default=uuid.uuid4
     )
     application_submission_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey(ApplicationSubmission.application_submission_id)
+        UUID, ForeignKey(ApplicationSubmission.application_submission_id), index=True
     )
     created_by_user_id: Mapped[uuid.UUID] = mapped_column(UUID, ForeignKey("api.user.user_id"))
     modified_by_user_id: Mapped[uuid.UUID] = mapped_column(UUID, ForeignKey("api.user.user_id"))
@@ -554,7 +568,7 @@ class ApplicationSubmissionTrackingNumber(ApiSchemaTable, TimestampMixin):
     )
 
     application_submission_id: Mapped[uuid.UUID] = mapped_column(
-        UUID, ForeignKey(ApplicationSubmission.application_submission_id)
+        UUID, ForeignKey(ApplicationSubmission.application_submission_id), index=True
     )
 
     application_submission: Mapped[ApplicationSubmission] = relationship(
@@ -172,6 +172,8 @@ EXTRACT_TYPE_CONFIG: LookupConfig[ExtractType] = LookupConfig(
     [
         LookupStr(ExtractType.OPPORTUNITIES_JSON, 1),
         LookupStr(ExtractType.OPPORTUNITIES_CSV, 2),
+        LookupStr(ExtractType.OPPORTUNITIES_JSON_GZIP, 3),
+        LookupStr(ExtractType.OPPORTUNITIES_CSV_GZIP, 4),
     ]
 )
 
@@ -5,10 +5,21 @@ from typing import TYPE_CHECKING
 from grants_shared.adapters.db.type_decorators.postgres_type_decorators import LookupColumn
 from grants_shared.db.models.base import TimestampMixin
 from grants_shared.util.file_util import presign_or_s3_cdnify_url
-from sqlalchemy import BigInteger, ForeignKey, Index, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    BigInteger,
+    Connection,
+    ForeignKey,
+    Index,
+    Select,
+    UniqueConstraint,
+    event,
+    func,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Mapper, mapped_column, relationship
 
 from src.constants.lookup_constants import (
     ApplicantType,
@@ -539,10 +550,12 @@ class OpportunityChangeAudit(ApiSchemaTable, TimestampMixin):
 
 
 class OpportunityIndexDeleteQueue(ApiSchemaTable, TimestampMixin):
-    """Opportunities that were deleted and still need to be removed from the search index.
+    """Opportunities that had a record deleted and may need to be removed from the search index.
 
-    Rows are inserted in the same transaction that deletes the opportunity, so there is
-    deliberately no foreign key to opportunity - the referenced row is gone by commit time.
+    Rows are inserted in the same transaction that deletes the opportunity, or one of the
+    records its search document is built from, so there is deliberately no foreign key
+    to opportunity - the referenced row may be gone by commit time. The search sync
+    reloads any queued opportunity that is still loadable and removes the rest.
     """
 
     __tablename__ = "opportunity_index_delete_queue"
@@ -550,6 +563,70 @@ class OpportunityIndexDeleteQueue(ApiSchemaTable, TimestampMixin):
     opportunity_id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True)
 
 
+def _queue_for_index_delete(connection: Connection, opportunity_id_select: Select) -> None:
+    connection.execute(
+        insert(OpportunityIndexDeleteQueue)
+        .from_select(["opportunity_id"], opportunity_id_select)
+        .on_conflict_do_update(
+            index_elements=[OpportunityIndexDeleteQueue.opportunity_id],
+            set_={"updated_at": func.now()},
+        )
+    )
+
+
+# The opportunity_change_audit triggers only fire on insert and update, and the audit
+# record is itself deleted along with its opportunity, so deletes made through the ORM
+# are queued here instead. Bulk delete statements bypass these events and are only
+# picked up by the next full refresh.
+def _queue_deleted_opportunity_record(
+    mapper: Mapper,
+    connection: Connection,
+    target: (
+        Opportunity
+        | OpportunitySummary
+        | CurrentOpportunitySummary
+        | OpportunityAssistanceListing
+        | OpportunityAttachment
+    ),
+) -> None:
+    _queue_for_index_delete(connection, select(literal(target.opportunity_id, UUID)))
+
+
+def _queue_deleted_opportunity_summary_link(
+    mapper: Mapper,
+    connection: Connection,
+    target: (
+        LinkOpportunitySummaryFundingInstrument
+        | LinkOpportunitySummaryFundingCategory
+        | LinkOpportunitySummaryApplicantType
+    ),
+) -> None:
+    # Link records are deleted before their summary, so the summary still exists here
+    _queue_for_index_delete(
+        connection,
+        select(OpportunitySummary.opportunity_id).where(
+            OpportunitySummary.opportunity_summary_id == target.opportunity_summary_id
+        ),
+    )
+
+
+for _model in [
+    Opportunity,
+    OpportunitySummary,
+    CurrentOpportunitySummary,
+    OpportunityAssistanceListing,
+    OpportunityAttachment,
+]:
+    event.listen(_model, "after_delete", _queue_deleted_opportunity_record)
+
+for _model in [
+    LinkOpportunitySummaryFundingInstrument,
+    LinkOpportunitySummaryFundingCategory,
+    LinkOpportunitySummaryApplicantType,
+]:
+    event.listen(_model, "after_delete", _queue_deleted_opportunity_summary_link)
+
+
 class ReferencedOpportunity(ApiSchemaTable, TimestampMixin):
     __tablename__ = "referenced_opportunity"
 
@@ -588,6 +665,16 @@ class ReferencedOpportunity(ApiSchemaTable, TimestampMixin):
 class OpportunityVersion(ApiSchemaTable, TimestampMixin):
     __tablename__ = "opportunity_version"
 
+    # Supports fetching only the latest version of each opportunity
+    __table_args__ = (
+        Index(
+            "opportunity_version_opportunity_id_created_at_idx",
+            "opportunity_id",
+            "created_at",
+        ),
+        ApiSchemaTable.__table_args__,
+    )
+
     opportunity_version_id: Mapped[uuid.UUID] = mapped_column(
         UUID, primary_key=True, default=uuid.uuid4
     )
@@ -598,6 +685,10 @@ class OpportunityVersion(ApiSchemaTable, TimestampMixin):
     opportunity: Mapped[Opportunity] = relationship(Opportunity, back_populates="versions")
 
     opportunity_data: Mapped[dict] = mapped_column(JSONB)
+    # A hash of opportunity_data, letting us check whether an opportunity
+    # has changed without loading the data of its prior versions.
+    # Versions created before this was added won't have one.
+    opportunity_data_hash: Mapped[str | None]
 
 
 class OpportunityAudit(ApiSchemaTable, TimestampMixin):
@@ -226,6 +226,8 @@ class UserSavedSearch(ApiSchemaTable, TimestampMixin):
     user: Mapped[User] = relationship(User, back_populates="saved_searches")
 
     search_query: Mapped[dict] = mapped_column(JSONB)
+    # Hash of the canonicalized search query, equivalent queries share a fingerprint
+    search_query_fingerprint: Mapped[str | None] = mapped_column(index=True)
 
     name: Mapped[str]
 
@@ -4,8 +4,11 @@ import typing
 import jsonschema
 from grants_shared.api.response import ValidationErrorDetail
 
+import src.form_schema.registry.form_template_registry as form_template_registry_module
 from src.constants.lookup_constants import FormType
-from src.db.models.competition_models import Form
+
+if typing.TYPE_CHECKING:
+    from src.db.models.competition_models import Form
 
 logger = logging.getLogger(__name__)
 
@@ -130,14 +133,28 @@ def _get_validator(
     return validator
 
 
+def get_validator_for_form(form: Form) -> jsonschema.Draft202012Validator:
+    """Build a validator for the json schema of a given form
+
+    Building a validator checks the schema against the meta-schema, so
+    prefer FormTemplateRegistry.get_validator which reuses the validators
+    it built when each form was registered.
+    """
+    return _get_validator(form.form_json_schema, _get_validator_class(form))
+
+
 def validate_json_schema(
     data: dict,
     json_schema: dict,
     validator_class: type[jsonschema.Draft202012Validator] = OUR_VALIDATOR,
 ) -> list[ValidationErrorDetail]:
     """Validate data against a given json schema"""
-    validator = _get_validator(json_schema, validator_class)
+    return _validate_with_validator(data, _get_validator(json_schema, validator_class))
+
 
+def _validate_with_validator(
+    data: dict, validator: jsonschema.Draft202012Validator
+) -> list[ValidationErrorDetail]:
     validation_issues = []
 
     for e in validator.iter_errors(data):
@@ -150,4 +167,5 @@ def validate_json_schema(
 
 def validate_json_schema_for_form(data: dict, form: Form) -> list[ValidationErrorDetail]:
     """Validate data against json schema from a given form"""
-    return validate_json_schema(data, form.form_json_schema, _get_validator_class(form))
+    validator = form_template_registry_module.form_template_registry.get_validator(form)
+    return _validate_with_validator(data, validator)
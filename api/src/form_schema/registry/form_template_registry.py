@@ -1,6 +1,9 @@
 import uuid
 from typing import TYPE_CHECKING, NamedTuple
 
+import jsonschema
+
+import src.form_schema.jsonschema_validator as jsonschema_validator
 from src.form_schema.jsonschema_resolver import resolve_jsonschema
 
 if TYPE_CHECKING:
@@ -20,12 +23,17 @@ class FormTemplateRegistry:
     inlined schemas. Raises immediately on any invalid input or broken $ref so the
     application fails fast rather than serving partial data.
 
+    Each form's JSON schema validator is also built once at registration, as checking
+    the schema and building the validator costs far more than validating a form. The
+    validators are never modified after being built, so they are shared across threads.
+
     The module-level `form_template_registry` singleton is the production instance.
     Tests that need isolation should instantiate FormTemplateRegistry() directly.
     """
 
     def __init__(self) -> None:
         self._registry: dict[FormTemplateKey, Form] = {}
+        self._validators: dict[FormTemplateKey, jsonschema.Draft202012Validator] = {}
 
     def register(self, form: Form, major_version: int) -> None:
         """Register a form at the given major version.
@@ -38,6 +46,7 @@ class FormTemplateRegistry:
                         positive integer, or the (form_id, major_version) pair is already
                         registered.
             jsonref.JsonRefError: if $ref resolution of form_json_schema fails.
+            jsonschema.exceptions.SchemaError: if form_json_schema is not a valid schema.
         """
         if not isinstance(form.form_id, uuid.UUID):
             raise ValueError(
@@ -60,6 +69,7 @@ class FormTemplateRegistry:
         # it does not modify the original schema. Raises jsonref.JsonRefError on failure.
         form.form_json_schema = resolve_jsonschema(form.form_json_schema)
 
+        self._validators[key] = jsonschema_validator.get_validator_for_form(form)
         self._registry[key] = form
 
     def get_by_id_and_major_version(self, form_key: FormTemplateKey) -> Form:
@@ -75,6 +85,18 @@ class FormTemplateRegistry:
             )
         return form
 
+    def get_validator(self, form: Form, major_version: int = 1) -> jsonschema.Draft202012Validator:
+        """Return the JSON schema validator for the given form.
+
+        The validator built at registration is returned if the form's schema is the
+        one it was registered with. Otherwise, for example for forms that were never
+        registered, a new validator is built for the form.
+        """
+        validator = self._validators.get(FormTemplateKey(form.form_id, major_version))
+        if validator is None or validator.schema is not form.form_json_schema:
+            return jsonschema_validator.get_validator_for_form(form)
+        return validator
+
     def get_all(self) -> list[Form]:
         """Return all registered forms."""
         return list(self._registry.values())
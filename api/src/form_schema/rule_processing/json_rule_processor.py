@@ -1,5 +1,7 @@
 import logging
+import uuid
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from grants_shared.util.dict_util import get_nested_value
 
@@ -25,87 +27,165 @@ def handle_post_population(context: JsonRuleContext, json_rule: JsonRule) -> Non
         handle_field_population(context, json_rule, POST_POPULATION_MAPPER)
 
 
-handlers: dict[str, Callable[[JsonRuleContext, JsonRule], None]] = {
+type RuleHandler = Callable[[JsonRuleContext, JsonRule], None]
+
+handlers: dict[str, RuleHandler] = {
     "gg_pre_population": handle_pre_population,
     "gg_post_population": handle_post_population,
     "gg_validation": handle_validation,
 }
 
 
+@dataclass(frozen=True)
+class RulePlanStep:
+    """A rule to run, with its handler already looked up
+
+    The path is relative to the array item the rule is in, or
+    to the root of the JSON data if it isn't in an array.
+    """
+
+    handler: str
+    handle: RuleHandler
+    rule: dict
+    path: list[str]
+    order: int
+
+
+@dataclass(frozen=True)
+class ArrayPlanStep:
+    """An array field, whose steps run once for every item of the array in the data"""
+
+    path: list[str]
+    steps: list[RulePlanStep | ArrayPlanStep]
+
+
+type RulePlan = list[RulePlanStep | ArrayPlanStep]
+
+# Compiled rule plans keyed by form ID, along with the rule schema each was
+# compiled from, so a form's rule schema is only walked the first time it's used
+_rule_plans: dict[uuid.UUID, tuple[dict, RulePlan]] = {}
+
+
 def process_rule_schema_for_context(context: JsonRuleContext) -> None:
     """Process a rule schema for a given json rule context"""
     # If there is no rule schema configured, return
-    rule_schema = context.application_form.form.form_rule_schema
+    form = context.application_form.form
+    rule_schema = form.form_rule_schema
     if rule_schema is None:
         return
 
-    # Build the rules
-    _build_rules(context, rule_schema, [])
-    context.rules.sort(key=lambda r: r.order)
+    # Build the rules from the compiled plan for the form
+    rule_plan = get_rule_plan(form.form_id, rule_schema)
+    planned_rules: list[tuple[JsonRule, RuleHandler]] = []
+    _build_rules(context, rule_plan, [], planned_rules)
+    planned_rules.sort(key=lambda r: r[0].order)
 
     # Run the rules in order
-    for rule in context.rules:
-        handlers[rule.handler](context, rule)
+    for rule, handle in planned_rules:
+        context.rules.append(rule)
+        handle(context, rule)
 
 
-def _build_rules(context: JsonRuleContext, rule_schema: dict, path: list[str]) -> None:
-    """Recursively iterate over the rule schema definition and construct
-    the rules that we want to run.
+def get_rule_plan(form_id: uuid.UUID, rule_schema: dict) -> RulePlan:
+    """Get the compiled plan for a form's rule schema, compiling it
+    the first time it's used or if the rule schema has been replaced.
 
-    If a field is marked as an array field, we'll add a rule for each
-    value within the defined value, if the
+    A plan is never modified after it's compiled, so it can be
+    shared by every request processing the form.
+    """
+    cached = _rule_plans.get(form_id)
+    if cached is not None and cached[0] is rule_schema:
+        return cached[1]
+
+    rule_plan = _compile_rule_plan(rule_schema, [])
+    _rule_plans[form_id] = (rule_schema, rule_plan)
+    return rule_plan
+
+
+def _compile_rule_plan(rule_schema: dict, path: list[str]) -> RulePlan:
+    """Recursively iterate over the rule schema definition and compile
+    the rules that we want to run into a plan.
+
+    If a field is marked as an array field, we add a step whose rules
+    get run for each value within the array, as the number of values
+    can only be known from the data the plan is run against.
     """
 
     # If the field is marked as an array, we'll need to process it a little
     # different because we need to build paths for every possible value.
     if rule_schema.get("gg_type", None) == "array":
-        # To know what indexes we need for an array, we have to look at the data
-        value = get_nested_value(context.json_data, path)
-
-        # If the value doesn't yet exist, we won't process any rules
-        # we only run rules on array fields that exist, we won't create
-        # array items, only adjust values in them.
-        if value is None:
-            return
-        # If the value isn't a list, something is misconfigured
-        if not isinstance(value, list):
-            logger.error(
-                "Field marked as array in rule schema has non-array type",
-                extra={"field_type": str(type(value)), "path": build_path_str(path)},
-            )
-            return
-
         # Make a copy of the rule schema and remove gg_type so when it
         # continues to recurse/iterate, it doesn't keep hitting this case.
         sub_rule_schema = rule_schema.copy()
         sub_rule_schema.pop("gg_type")
 
-        # For each value, we build the rules for that index, if we had an array
-        # with 3 values, we would setup 3 paths like "my_field[0]", "my_field[1]", and "my_field[2]"
-        for i in range(len(value)):
-            subpath = path.copy()
-            subpath[-1] = subpath[-1] + f"[{i}]"
-            _build_rules(context=context, rule_schema=sub_rule_schema, path=subpath)
-
-        return
+        # The paths of the steps for the array are relative to each item
+        return [ArrayPlanStep(path=path, steps=_compile_rule_plan(sub_rule_schema, []))]
 
     # If not an array field (or already recursively handling array case)
     # Iterate over this layer of the rule schema
+    rule_plan: RulePlan = []
     for k, v in rule_schema.items():
         if k in handlers:
             if not isinstance(v, dict):
                 logger.error(
                     "Misconfigured rule schema, is not a dict", extra={"path": build_path_str(path)}
                 )
-                return
+                return rule_plan
 
             order = v.get(
                 "order", 1
             )  # Most rules won't have an order configured, default them to 1
-            context.rules.append(JsonRule(handler=k, rule=v, path=path, order=order))
+            rule_plan.append(
+                RulePlanStep(handler=k, handle=handlers[k], rule=v, path=path, order=order)
+            )
 
         # If the value is a dict, recursively iterate down, extending the path
         elif isinstance(v, dict):
-            _build_rules(context=context, rule_schema=v, path=path + [k])
+            rule_plan.extend(_compile_rule_plan(rule_schema=v, path=path + [k]))
 
         # Anything else, do nothing
+
+    return rule_plan
+
+
+def _build_rules(
+    context: JsonRuleContext,
+    rule_plan: RulePlan,
+    path: list[str],
+    planned_rules: list[tuple[JsonRule, RuleHandler]],
+) -> None:
+    """Construct the rules that we want to run from a compiled plan,
+    adding a rule for each value within any array fields.
+    """
+    for step in rule_plan:
+        if isinstance(step, RulePlanStep):
+            rule = JsonRule(
+                handler=step.handler, rule=step.rule, path=path + step.path, order=step.order
+            )
+            planned_rules.append((rule, step.handle))
+            continue
+
+        # To know what indexes we need for an array, we have to look at the data
+        array_path = path + step.path
+        value = get_nested_value(context.json_data, array_path)
+
+        # If the value doesn't yet exist, we won't process any rules
+        # we only run rules on array fields that exist, we won't create
+        # array items, only adjust values in them.
+        if value is None:
+            continue
+        # If the value isn't a list, something is misconfigured
+        if not isinstance(value, list):
+            logger.error(
+                "Field marked as array in rule schema has non-array type",
+                extra={"field_type": str(type(value)), "path": build_path_str(array_path)},
+            )
+            continue
+
+        # For each value, we build the rules for that index, if we had an array
+        # with 3 values, we would setup 3 paths like "my_field[0]", "my_field[1]", and "my_field[2]"
+        for i in range(len(value)):
+            subpath = array_path.copy()
+            subpath[-1] = subpath[-1] + f"[{i}]"
+            _build_rules(context, step.steps, subpath, planned_rules)
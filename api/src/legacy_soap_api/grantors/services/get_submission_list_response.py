@@ -1,13 +1,12 @@
 import logging
-from collections.abc import Generator, Iterator
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
 import grants_shared.adapters.db as db
-import xmltodict
 from grants_shared.util.datetime_util import adjust_timezone
 from lxml import etree
 from pydantic import ValidationError as PydanticValidationError
-from sqlalchemy import or_, select
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import Select
 
@@ -22,10 +21,11 @@ from src.legacy_soap_api.grantors.statuses import (
     RECEIVED_BY_AGENCY_STATUS,
 )
 from src.legacy_soap_api.legacy_soap_api_auth import validate_certificate, verify_certificate_access
-from src.legacy_soap_api.legacy_soap_api_config import SOAPOperationConfig
+from src.legacy_soap_api.legacy_soap_api_config import SOAPOperationConfig, get_soap_config
 from src.legacy_soap_api.legacy_soap_api_schemas import SOAPResponse
 from src.legacy_soap_api.legacy_soap_api_schemas.base import SOAPRequest
 from src.legacy_soap_api.legacy_soap_api_utils import convert_bool_to_yes_no
+from src.legacy_soap_api.soap_payload_handler import iter_soap_envelope_chunks, soap_element_to_dict
 
 logger = logging.getLogger(__name__)
 GRANTS_APPLICATION_STATUSES = {
@@ -113,7 +113,12 @@ def get_submissions(
     request: schemas.GetSubmissionListRequest,
     soap_request: SOAPRequest,
     soap_config: SOAPOperationConfig,
-) -> list[ApplicationSubmission]:
+) -> Iterator[list[ApplicationSubmission]]:
+    """Fetch the submissions the request's certificate can see, a page at a time.
+
+    The filters and certificate access are checked up front, the submissions
+    themselves are only queried as the returned pages are iterated.
+    """
     stmt = (
         select(ApplicationSubmission)
         .join(ApplicationSubmission.application)
@@ -142,7 +147,7 @@ def get_submissions(
         status = get_filter_values(submission_filters, GetSubmissionListFilter.STATUS)
         if status:
             if len(status) > 1:
-                return []
+                return iter([])
             status_value = str(status[0])
             # GrantsGovTrackingNumber comes from three different places with a hierarchy
             # A submissions is in "Agency Tracking Number Assigned Status" IF it has any rows on application_submission_tracking_numbers table
@@ -228,7 +233,61 @@ def get_submissions(
     verify_certificate_access(certificate, soap_config, certificate.agency)
     stmt = _apply_agency_filter(stmt, certificate.agency)
 
-    return list(db_session.execute(stmt).scalars().all())
+    return _iter_submission_pages(db_session, stmt)
+
+
+def _iter_submission_pages(
+    db_session: db.Session, stmt: Select
+) -> Iterator[list[ApplicationSubmission]]:
+    """Page through the submissions of a query, newest first, with a keyset on (created_at, id).
+
+    Each page is its own query (and set of selectinload queries), so only one
+    page of submissions and their relationships needs to be held at a time.
+    Paging newest first means the most recent submissions are the ones kept
+    when the max number of rows is reached.
+    """
+    config = get_soap_config()
+    page_size = config.soap_submission_list_page_size
+    max_rows = config.soap_submission_list_max_rows
+
+    stmt = stmt.order_by(
+        ApplicationSubmission.created_at.desc(),
+        ApplicationSubmission.application_submission_id.desc(),
+    )
+
+    row_count = 0
+    last_submission: ApplicationSubmission | None = None
+    while True:
+        limit = page_size if max_rows is None else min(page_size, max_rows - row_count)
+
+        # Fetch a row past the page, to tell whether there are more submissions after it
+        page_stmt = stmt.limit(limit + 1)
+        if last_submission is not None:
+            page_stmt = page_stmt.where(
+                tuple_(
+                    ApplicationSubmission.created_at,
+                    ApplicationSubmission.application_submission_id,
+                )
+                < tuple_(last_submission.created_at, last_submission.application_submission_id)
+            )
+
+        submissions = list(db_session.execute(page_stmt).scalars().all())
+        page = submissions[:limit]
+        if page:
+            row_count += len(page)
+            yield page
+
+        if len(submissions) <= limit:
+            return
+
+        if max_rows is not None and row_count >= max_rows:
+            logger.warning(
+                "GetSubmissionList reached the max number of submissions to return",
+                extra={"soap_submission_list_max_rows": max_rows},
+            )
+            return
+
+        last_submission = page[-1]
 
 
 def _apply_agency_filter(stmt: Select, agency: Agency | None) -> Select:
@@ -266,8 +325,14 @@ def get_submission_list(
         schema = schemas.SubmissionInfoExpanded
     else:
         schema = schemas.SubmissionInfo
-    submissions = get_submissions(db_session, request, soap_request, soap_config)
-    return [schema(**transform_submission(submission)) for submission in submissions]
+    submission_pages = get_submissions(db_session, request, soap_request, soap_config)
+    # Transform each page as it's fetched, so the DB records of a page
+    # can be let go of before the next one is loaded.
+    return [
+        schema(**transform_submission(submission))
+        for page in submission_pages
+        for submission in page
+    ]
 
 
 def get_submission_list_response(
@@ -297,33 +362,20 @@ def get_submission_list_response(
 def parse_submissions_from_proxy(
     proxy_response: SOAPResponse,
 ) -> list[schemas.SubmissionInfoExpanded]:
-    xml_bytes = b"".join(clean_mtom_generator(proxy_response.stream()))
+    # Pull parse the response as it streams in, and let go of each
+    # SubmissionInfo once we have it, rather than holding the whole document.
+    parser = etree.XMLPullParser(events=("end",), tag="{*}SubmissionInfo", recover=True)
     info = []
-    if xml_bytes:
-        parser = etree.XMLParser(recover=True)
-        root = etree.fromstring(xml_bytes, parser=parser)
-        for element in root.iter("{*}SubmissionInfo"):
+    for chunk in iter_soap_envelope_chunks(proxy_response.stream()):
+        parser.feed(chunk)
+        for _, element in parser.read_events():
             try:
-                element_bytes = etree.tostring(element)
-                submission_info_dict = xmltodict.parse(element_bytes).get("ns2:SubmissionInfo")
+                submission_info_dict = soap_element_to_dict(element, keep_prefixes=True)
                 info.append(schemas.SubmissionInfoExpanded(**submission_info_dict))
             except PydanticValidationError:
                 logger.exception("Skipping invalid submission due to validation error")
-                continue
+            finally:
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
     return info
-
-
-def clean_mtom_generator(byte_gen: Iterator[bytes] | list[bytes]) -> Generator[bytes]:
-    """
-    This will take the bytes of an MTOM messages and remove the header
-    to prevent errors when processing the xml
-    """
-    found_xml = False
-    for chunk in byte_gen:
-        if not found_xml:
-            start_idx = chunk.find(b"<soap:Envelope")
-            if start_idx != -1:
-                found_xml = True
-                yield chunk[start_idx:]
-        else:
-            yield chunk
@@ -1,6 +1,8 @@
 import logging
 import uuid
 from collections.abc import Iterator
+from concurrent.futures import Future
+from functools import partial
 from typing import Any, BinaryIO
 
 import grants_shared.adapters.db as db
@@ -18,8 +20,8 @@ from src.legacy_soap_api.grantors.services import (
     get_update_application_info_response,
     update_application_info,
 )
-from src.legacy_soap_api.legacy_soap_api_config import SimplerSoapAPI
-from src.legacy_soap_api.legacy_soap_api_constants import LegacySoapApiEvent
+from src.legacy_soap_api.legacy_soap_api_config import SimplerSoapAPI, get_soap_config
+from src.legacy_soap_api.legacy_soap_api_constants import LegacySoapApiEvent, SimplerRequests
 from src.legacy_soap_api.legacy_soap_api_schemas import SOAPResponse
 from src.legacy_soap_api.legacy_soap_api_schemas.base import SOAPRequest
 from src.legacy_soap_api.legacy_soap_api_utils import (
@@ -31,8 +33,8 @@ from src.legacy_soap_api.legacy_soap_api_utils import (
     wrap_envelope_dict,
     xml_formatter,
 )
+from src.legacy_soap_api.soap_diff_worker import get_soap_diff_worker
 from src.legacy_soap_api.soap_payload_handler import (
-    SOAPPayload,
     build_mtom_response_from_dict,
     build_xml_from_dict,
     get_envelope_dict,
@@ -50,7 +52,7 @@ class BaseSOAPClient:
 
     def get_soap_request_dict(self) -> dict:
         return get_soap_operation_dict(
-            self.soap_request.data.head().decode(), self.operation_config.request_operation_name
+            self.soap_request.data.head(), self.operation_config.request_operation_name
         )
 
     def get_soap_response_dict(self, proxy_response: SOAPResponse | None = None) -> dict:
@@ -101,25 +103,22 @@ class BaseSOAPClient:
             return proxy_response_schema_data
 
         try:
-            proxy_response_payload = SOAPPayload(
-                proxy_response.to_bytes().decode(errors="replace"),
-                operation_name=self.operation_config.response_operation_name,
+            # The XML dict that includes namespaces and other attributes prior to normalization and schema validation.
+            # The bytes are read (and kept) in full as the proxy response may still be returned.
+            proxy_operation_dict = get_soap_operation_dict(
+                proxy_response.to_bytes(),
+                self.operation_config.response_operation_name,
                 force_list_attributes=self.operation_config.force_list_attributes,
             )
-
-            # The XML dict that includes namespaces and other attributes prior to normalization and schema validation.
-            proxy_response_dict = proxy_response_payload.to_dict()
             log_local(
                 msg="proxy response dict pre-validation",
-                data=proxy_response_dict,
+                data=proxy_operation_dict,
                 formatter=json_formatter,
             )
 
             # Validated/normalized dict from pydantic schema.
             proxy_response_schema_dict = self._get_simpler_soap_response_schema()(
-                **get_envelope_dict(
-                    proxy_response_dict, self.operation_config.response_operation_name
-                )
+                **proxy_operation_dict
             )  # type: ignore[misc]
             return proxy_response_schema_dict.to_soap_envelope_dict(
                 self.operation_config.response_operation_name
@@ -190,20 +189,42 @@ class BaseSOAPClient:
         )
         log_local(msg="simpler response XML", data=simpler_response_xml, formatter=xml_formatter)
         if self.operation_config.compare_endpoints:
-            proxy_response_soap_dict = self.get_proxy_soap_response_dict(proxy_response)
-            log_local(
-                msg="proxy response validated dict",
-                data=proxy_response_soap_dict,
-                formatter=json_formatter,
-            )
-            # We will only run diffs for responses that do not match.
-            if proxy_response_soap_dict == simpler_response_soap_dict:
-                logger.info("soap_api_diff responses match", extra={"soap_responses_match": True})
+            if get_soap_config().soap_shadow_concurrency_enabled:
+                # Read the proxy response in now, as it's still returned
+                # to the caller while the diff runs in the background.
+                proxy_response.to_bytes()
+                get_soap_diff_worker().submit(
+                    partial(self.compare_responses, proxy_response, simpler_response_soap_dict)
+                )
             else:
-                self.log_diffs(proxy_response_soap_dict, simpler_response_soap_dict)
+                self.compare_responses(proxy_response, simpler_response_soap_dict)
 
         return get_soap_response(data=simpler_response_xml)
 
+    def compare_responses(
+        self, proxy_response: SOAPResponse, simpler_response_soap_dict: dict
+    ) -> None:
+        proxy_response_soap_dict = self.get_proxy_soap_response_dict(proxy_response)
+        log_local(
+            msg="proxy response validated dict",
+            data=proxy_response_soap_dict,
+            formatter=json_formatter,
+        )
+        # We will only run diffs for responses that do not match.
+        if proxy_response_soap_dict == simpler_response_soap_dict:
+            logger.info("soap_api_diff responses match", extra={"soap_responses_match": True})
+        else:
+            self.log_diffs(proxy_response_soap_dict, simpler_response_soap_dict)
+
+    def prefetch_simpler_data(self) -> None:
+        """Fetch any data the Simpler response needs that doesn't depend on the proxy response
+
+        This is called while the proxy request is still in flight, so that
+        building the Simpler response afterwards doesn't wait on both in turn.
+        Operations that build their response entirely from the proxy response
+        or entirely from Simpler don't need to prefetch anything.
+        """
+
     def _get_simpler_soap_response_schema(self) -> Any | None:
         if self.soap_request.api_name == SimplerSoapAPI.APPLICANTS:
             return getattr(applicants_schemas, self.operation_config.response_operation_name)
@@ -262,34 +283,65 @@ class SimplerGrantorsS2SClient(BaseSOAPClient):
             grants_gov_tracking_number=tracking_number,
         )
 
-    def get_submission_list_request(
-        self, proxy_response: SOAPResponse
-    ) -> grantors_schemas.GetSubmissionListResponse:
+    def __init__(self, soap_request: SOAPRequest, db_session: db.Session) -> None:
+        super().__init__(soap_request, db_session)
+        self._prefetched_submissions: (
+            Future[
+                list[grantors_schemas.SubmissionInfo]
+                | list[grantors_schemas.SubmissionInfoExpanded]
+            ]
+            | None
+        ) = None
+
+    def prefetch_simpler_data(self) -> None:
+        operation_name = self.operation_config.request_operation_name
+        if operation_name not in (
+            SimplerRequests.GET_SUBMISSION_LIST_REQUEST,
+            SimplerRequests.GET_SUBMISSION_LIST_EXPANDED_REQUEST,
+        ):
+            return
+
+        # Any error is held on to and raised when the response is built,
+        # so it gets handled the same as if we hadn't prefetched.
+        self._prefetched_submissions = Future()
+        try:
+            self._prefetched_submissions.set_result(
+                self._get_simpler_submissions(
+                    is_expanded=operation_name
+                    == SimplerRequests.GET_SUBMISSION_LIST_EXPANDED_REQUEST
+                )
+            )
+        except Exception as e:
+            self._prefetched_submissions.set_exception(e)
+
+    def _get_simpler_submissions(
+        self, is_expanded: bool = False
+    ) -> list[grantors_schemas.SubmissionInfo] | list[grantors_schemas.SubmissionInfoExpanded]:
+        if self._prefetched_submissions is not None:
+            return self._prefetched_submissions.result()
+
         soap_request_dict = self.get_soap_request_dict() or {}
-        simpler_submissions = get_submission_list(
+        return get_submission_list(
             db_session=self.db_session,
             soap_request=self.soap_request,
             request=grantors_schemas.GetSubmissionListRequest(**soap_request_dict),
             soap_config=self.operation_config,
+            is_expanded=is_expanded,
         )
+
+    def get_submission_list_request(
+        self, proxy_response: SOAPResponse
+    ) -> grantors_schemas.GetSubmissionListResponse:
         return get_submission_list_response(
-            simpler_submissions=simpler_submissions,
+            simpler_submissions=self._get_simpler_submissions(),
             proxy_response=proxy_response,
         )
 
     def get_submission_list_expanded_request(
         self, proxy_response: SOAPResponse
     ) -> grantors_schemas.GetSubmissionListResponse:
-        soap_request_dict = self.get_soap_request_dict() or {}
-        simpler_submissions = get_submission_list(
-            db_session=self.db_session,
-            soap_request=self.soap_request,
-            request=grantors_schemas.GetSubmissionListRequest(**soap_request_dict),
-            soap_config=self.operation_config,
-            is_expanded=True,
-        )
         return get_submission_list_response(
-            simpler_submissions=simpler_submissions,
+            simpler_submissions=self._get_simpler_submissions(is_expanded=True),
             proxy_response=proxy_response,
         )
 
@@ -46,6 +46,29 @@ class LegacySoapAPIConfig(PydanticBaseEnvConfig):
     enable_simpler_route: bool = Field(True, alias="ENABLE_SIMPLER_ROUTE")
     save_soap_messages_to_s3: bool = Field(False, alias="SAVE_SOAP_MESSAGES_TO_S3")
 
+    # Reuse connections to the same host across proxied requests, rather than
+    # opening (and handshaking) a new connection for every request.
+    soap_proxy_connection_pooling_enabled: bool = Field(
+        True, alias="SOAP_PROXY_CONNECTION_POOLING_ENABLED"
+    )
+    # The max number of connections kept open to each host
+    soap_proxy_pool_maxsize: int = Field(10, alias="SOAP_PROXY_POOL_MAXSIZE")
+
+    # Call the legacy proxy on a background thread while the Simpler response is
+    # built on the request thread, and diff the two responses off the request path.
+    soap_shadow_concurrency_enabled: bool = Field(False, alias="SOAP_SHADOW_CONCURRENCY_ENABLED")
+    # The max number of legacy proxy calls in flight on background threads
+    soap_shadow_max_workers: int = Field(10, alias="SOAP_SHADOW_MAX_WORKERS")
+    # The max number of response diffs waiting to run, past which diffs are dropped
+    soap_diff_queue_size: int = Field(100, alias="SOAP_DIFF_QUEUE_SIZE")
+
+    # GetSubmissionList(Expanded) reads submissions from the DB in keyset pages of
+    # this size, rather than loading every submission for an agency at once.
+    soap_submission_list_page_size: int = Field(500, alias="SOAP_SUBMISSION_LIST_PAGE_SIZE")
+    # The max number of Simpler submissions returned by GetSubmissionList(Expanded),
+    # newest first, if unset all matching submissions are returned.
+    soap_submission_list_max_rows: int | None = Field(None, alias="SOAP_SUBMISSION_LIST_MAX_ROWS")
+
     @property
     def gg_url(self) -> str:
         # Full url including port for grants.gov S2S SOAP API.
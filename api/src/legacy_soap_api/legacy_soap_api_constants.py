@@ -14,6 +14,7 @@ class LegacySoapApiEvent(StrEnum):
     CALLING_WITH_CERT = "calling_with_cert"
     CALLING_WITH_JWT = "calling_with_jwt"
     JWT_CREATED = "jwt_created"
+    JWT_REUSED = "jwt_reused"
     USE_SIMPLER_OVERRIDE = "use_simpler_override"
 
     NO_SIMPLER_SCHEMA_DEFINED = "no_simpler_schema_defined"
@@ -26,6 +27,7 @@ class LegacySoapApiEvent(StrEnum):
     INVALID_SOAP_OPERATION_CONFIG = "invalid_soap_operation_config"
 
     SOAP_DIFF_FAILED = "soap_diff_failed"
+    SOAP_DIFF_DROPPED = "soap_diff_dropped"
 
     UNKNOWN_SOAP_API = "unknown_soap_api"
 
@@ -1,11 +1,16 @@
 import base64
 import logging
-from datetime import timedelta
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cache
 from os.path import join
 from tempfile import NamedTemporaryFile, _TemporaryFileWrapper
+from urllib.parse import urlsplit
 
 from grants_shared.util.datetime_util import utcnow
 from requests import Request, Session
+from requests.adapters import HTTPAdapter
 
 from src.legacy_soap_api.legacy_soap_api_auth import (
     LOG_LOCAL_RESPONSE_HEADER_KEY,
@@ -36,6 +41,11 @@ logger = logging.getLogger(__name__)
 # Default proxy request timeout to 1hr
 PROXY_TIMEOUT = 3600
 
+# How long the JWTs we send to the partner gateway are valid for, and how long before
+# they expire we stop reusing them so they don't expire while a request is in flight.
+SOAP_JWT_EXPIRATION = timedelta(minutes=1)
+SOAP_JWT_REFRESH_BUFFER = timedelta(seconds=15)
+
 
 def get_proxy_headers(
     soap_request: SOAPRequest,
@@ -107,23 +117,140 @@ def get_cert_file(soap_auth: SOAPAuth, config: LegacySoapAPIConfig) -> _Temporar
     return temp_cert_file
 
 
+class SoapProxyAdapterPool:
+    """
+    Process-wide set of request adapters used for proxying SOAP requests.
+
+    Each adapter holds a pool of keep-alive connections, and is keyed by the
+    target host and client certificate so connections are never shared
+    between different certificates. Adapters (and the urllib3 pools within them)
+    are thread-safe, unlike requests.Session, so a new Session is created
+    for each request and the adapter mounted to it.
+    """
+
+    def __init__(self, pool_maxsize: int):
+        self.pool_maxsize = pool_maxsize
+        self._adapters: dict[tuple[str, str | None], SessionResumptionAdapter] = {}
+        self._lock = threading.Lock()
+
+    def get_adapter(self, url: str, cert: str | None) -> tuple[SessionResumptionAdapter, bool]:
+        """Get the adapter for a URL and cert, and whether it already existed"""
+        parsed_url = urlsplit(url)
+        key = (f"{parsed_url.scheme}://{parsed_url.netloc}", cert)
+
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is not None:
+                return adapter, True
+
+            adapter = SessionResumptionAdapter(pool_maxsize=self.pool_maxsize)
+            self._adapters[key] = adapter
+            return adapter, False
+
+    def clear(self) -> None:
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+
+
+@cache
+def get_soap_proxy_adapter_pool() -> SoapProxyAdapterPool:
+    return SoapProxyAdapterPool(pool_maxsize=get_soap_config().soap_proxy_pool_maxsize)
+
+
+def get_connection_count(adapter: HTTPAdapter) -> int:
+    """Get the number of connections an adapter has ever opened"""
+    pools = adapter.poolmanager.pools
+    connection_count = 0
+    for pool_key in pools.keys():
+        # Pools could be evicted by another thread while we're counting
+        pool = pools.get(pool_key)
+        if pool is not None:
+            connection_count += pool.num_connections
+    return connection_count
+
+
 def _get_soap_response(
     req: Request, cert: str | None = None, timeout: int = PROXY_TIMEOUT
 ) -> SOAPResponse:
     session = Session()
-    session.mount("https://", SessionResumptionAdapter())
+
+    if get_soap_config().soap_proxy_connection_pooling_enabled:
+        adapter, pool_hit = get_soap_proxy_adapter_pool().get_adapter(req.url, cert)
+    else:
+        adapter, pool_hit = SessionResumptionAdapter(), False
+
+    session.mount("https://", adapter)
     prepared_request = session.prepare_request(req)
-    return get_streamed_soap_response(
+
+    connection_count = get_connection_count(adapter)
+    response = get_streamed_soap_response(
         session.send(prepared_request, stream=True, cert=cert, timeout=timeout)
     )
 
+    # A new connection means a full TCP + TLS handshake was made for this request
+    logger.info(
+        "soap_client: proxy request complete",
+        extra={
+            "soap_proxy_pool_hit": pool_hit,
+            "soap_proxy_new_connection_count": get_connection_count(adapter) - connection_count,
+        },
+    )
+    return response
+
+
+@dataclass
+class CachedSoapJwt:
+    jwt_b64: str
+    expiration_time: datetime
+
+
+class SoapJwtCache:
+    """
+    Thread-safe cache of the signed JWTs we send to the partner gateway, by cert_id
+
+    A JWT is reused until shortly before it expires, rather than signing a new one per request.
+    """
+
+    def __init__(self) -> None:
+        self._jwts: dict[str, CachedSoapJwt] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cert_id: str) -> str | None:
+        with self._lock:
+            cached_jwt = self._jwts.get(cert_id)
+
+        if cached_jwt is None or utcnow() >= cached_jwt.expiration_time - SOAP_JWT_REFRESH_BUFFER:
+            return None
+        return cached_jwt.jwt_b64
+
+    def set(self, cert_id: str, jwt_b64: str, expiration_time: datetime) -> None:
+        with self._lock:
+            self._jwts[cert_id] = CachedSoapJwt(jwt_b64=jwt_b64, expiration_time=expiration_time)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jwts.clear()
+
+
+SOAP_JWT_CACHE = SoapJwtCache()
+
 
 def get_soap_jwt_auth_jwt(
     config: LegacySoapAPIConfig,
     soap_auth_certificate: SOAPClientCertificate,
 ) -> str:
-    expiration_time = utcnow() + timedelta(minutes=1)
     if soap_auth_certificate.cert_id is not None:
+        cached_jwt_b64 = SOAP_JWT_CACHE.get(soap_auth_certificate.cert_id)
+        if cached_jwt_b64 is not None:
+            logger.info(
+                "soap_client_certificate: reused cached SOAP JWT",
+                extra={"soap_api_event": LegacySoapApiEvent.JWT_REUSED},
+            )
+            return cached_jwt_b64
+
+        expiration_time = utcnow() + SOAP_JWT_EXPIRATION
         jwt_string = generate_soap_jwt(
             soap_auth_certificate.cert_id,
             expiration_time,
@@ -134,7 +261,9 @@ def get_soap_jwt_auth_jwt(
             "soap_client_certificate: created SOAP JWT",
             extra={"soap_api_event": LegacySoapApiEvent.JWT_CREATED},
         )
-        return base64.b64encode(jwt_string.encode("utf-8")).decode("utf-8")
+        jwt_b64 = base64.b64encode(jwt_string.encode("utf-8")).decode("utf-8")
+        SOAP_JWT_CACHE.set(soap_auth_certificate.cert_id, jwt_b64, expiration_time)
+        return jwt_b64
     logger.info(
         "soap_client_certificate: No cert_id",
         extra={"soap_api_event": LegacySoapApiEvent.CALLING_WITHOUT_CERT},
@@ -1,4 +1,7 @@
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 import grants_shared.adapters.db as db
 from flask import request
@@ -16,6 +19,7 @@ from src.legacy_soap_api.legacy_soap_api_auth import (
     get_soap_auth,
 )
 from src.legacy_soap_api.legacy_soap_api_client import (
+    BaseSOAPClient,
     SimplerApplicantsS2SClient,
     SimplerGrantorsS2SClient,
 )
@@ -45,17 +49,62 @@ logger = logging.getLogger(__name__)
 GET_OPPORTUNITY_LIST_REQUEST = "GetOpportunityListRequest"
 
 
-def get_simpler_soap_response(
-    soap_request: SOAPRequest, soap_legacy_response: SOAPResponse, db_session: db.Session
-) -> SOAPResponse:
+@cache
+def get_soap_shadow_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=get_soap_config().soap_shadow_max_workers, thread_name_prefix="soap-shadow"
+    )
+
+
+def get_simpler_soap_client(soap_request: SOAPRequest, db_session: db.Session) -> BaseSOAPClient:
     simpler_soap_client_type = (
         SimplerApplicantsS2SClient
         if soap_request.api_name == SimplerSoapAPI.APPLICANTS
         else SimplerGrantorsS2SClient
     )
+    return simpler_soap_client_type(soap_request=soap_request, db_session=db_session)
+
+
+def is_use_simpler_override(soap_request: SOAPRequest) -> bool:
+    return soap_request.headers.get(USE_SIMPLER_OVERRIDE_KEY, None) == "1"
+
+
+def get_legacy_response_with_simpler_prefetch(
+    soap_request: SOAPRequest, db_session: db.Session
+) -> tuple[SOAPResponse, BaseSOAPClient | None]:
+    """Call the legacy proxy on a background thread while the Simpler data is fetched
+
+    The proxy request doesn't touch the database, so it is the part that moves
+    off of the request thread, and the db session is only ever used here. The
+    Simpler client returned has already fetched everything that doesn't need
+    the proxy response, and is None if Simpler won't be called at all.
+    """
+    # Run in a copy of the request's context so the proxy call keeps the request log context
+    legacy_response_future = get_soap_shadow_executor().submit(
+        contextvars.copy_context().run, get_legacy_response, soap_request
+    )
 
+    simpler_soap_client = None
+    if get_soap_config().use_simpler or is_use_simpler_override(soap_request):
+        try:
+            simpler_soap_client = get_simpler_soap_client(soap_request, db_session)
+            simpler_soap_client.prefetch_simpler_data()
+        except Exception:
+            # Failing to set up the client is logged and handled
+            # when the Simpler response is built, the same as without prefetching.
+            simpler_soap_client = None
+
+    return legacy_response_future.result(), simpler_soap_client
+
+
+def get_simpler_soap_response(
+    soap_request: SOAPRequest,
+    soap_legacy_response: SOAPResponse,
+    db_session: db.Session,
+    simpler_soap_client: BaseSOAPClient | None = None,
+) -> SOAPResponse:
     use_simpler = get_soap_config().use_simpler
-    if soap_request.headers.get(USE_SIMPLER_OVERRIDE_KEY, None) == "1":
+    if is_use_simpler_override(soap_request):
         use_simpler = True
         logger.info(
             "soap_client_certificate: Use-Simpler-Override flag is enabled",
@@ -63,9 +112,8 @@ def get_simpler_soap_response(
         )
 
     try:
-        simpler_soap_client = simpler_soap_client_type(
-            soap_request=soap_request, db_session=db_session
-        )
+        if simpler_soap_client is None:
+            simpler_soap_client = get_simpler_soap_client(soap_request, db_session)
         add_extra_data_to_current_request_logs(
             {
                 "soap_response_operation": simpler_soap_client.operation_config.response_operation_name,
@@ -164,6 +212,7 @@ def process_simpler_request(
             ).to_flask_response()
 
     soap_request: SOAPRequest | None = None
+    simpler_soap_client: BaseSOAPClient | None = None
     try:
         soap_request = SOAPRequest(
             api_name=api_name,
@@ -224,7 +273,12 @@ def process_simpler_request(
             ]
             and api_name == SimplerSoapAPI.GRANTORS
         ):
-            soap_legacy_response = get_legacy_response(soap_request)
+            if get_soap_config().soap_shadow_concurrency_enabled:
+                soap_legacy_response, simpler_soap_client = (
+                    get_legacy_response_with_simpler_prefetch(soap_request, db_session)
+                )
+            else:
+                soap_legacy_response = get_legacy_response(soap_request)
         # Fallback: return legacy response and don't call simpler
         else:
             logger.info(
@@ -251,7 +305,7 @@ def process_simpler_request(
                 msg="simpler_soap_api: getting simpler response",
             )
             simpler_soap_response = get_simpler_soap_response(
-                soap_request, soap_legacy_response, db_session
+                soap_request, soap_legacy_response, db_session, simpler_soap_client
             )
             # In the event where there's a successful simpler response
             # but the legacy response failed (and not just skipped
@@ -0,0 +1,76 @@
+import contextvars
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from functools import cache, partial
+
+from src.legacy_soap_api.legacy_soap_api_config import get_soap_config
+from src.legacy_soap_api.legacy_soap_api_constants import LegacySoapApiEvent
+
+logger = logging.getLogger(__name__)
+
+
+class SoapDiffWorker:
+    """
+    Runs diffs of the Simpler and legacy SOAP responses on a background
+    thread, so they don't add to the latency of the request they came from.
+
+    At most max_queue_size diffs wait to run, past that a diff is dropped
+    (and logged) rather than blocking the request or growing without bound.
+
+    Each diff runs in a copy of the context it was submitted from, so its logs
+    keep the request log context of the request it came from.
+    """
+
+    def __init__(self, max_queue_size: int):
+        self._queue: queue.Queue[Callable[[], None]] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, diff: Callable[[], None]) -> bool:
+        """Queue a diff to run, returning False if it was dropped"""
+        self._start()
+        context = contextvars.copy_context()
+        try:
+            self._queue.put_nowait(partial(context.run, diff))
+        except queue.Full:
+            logger.info(
+                "soap_api_diff dropped, diff queue is full",
+                extra={
+                    "soap_api_event": LegacySoapApiEvent.SOAP_DIFF_DROPPED,
+                    "soap_diff_queue_size": self._queue.maxsize,
+                },
+            )
+            return False
+        return True
+
+    def wait(self) -> None:
+        """Block until every queued diff has run"""
+        self._queue.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="soap-diff-worker", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            diff = self._queue.get()
+            try:
+                diff()
+            except Exception:
+                logger.exception(
+                    "soap_api_diff incomplete",
+                    extra={"soap_api_event": LegacySoapApiEvent.SOAP_DIFF_FAILED},
+                )
+            finally:
+                self._queue.task_done()
+
+
+@cache
+def get_soap_diff_worker() -> SoapDiffWorker:
+    return SoapDiffWorker(get_soap_config().soap_diff_queue_size)
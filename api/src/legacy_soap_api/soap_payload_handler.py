@@ -1,7 +1,7 @@
 import io
 import re
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -19,6 +19,9 @@ SOAP_ENV_SHORT_PATTERNS = (b"<soap:Envelope", b"</soap:Envelope>")
 SOAP_ENV_LONG_PATTERNS = (b"<soapenv:Envelope", b"</soapenv:Envelope>")
 SOAP_PATTERNS = [SOAP_ENV_SHORT_PATTERNS, SOAP_ENV_LONG_PATTERNS]
 MAX_TAG_SIZE = len(SOAP_ENV_LONG_PATTERNS[1])
+ENVELOPE_START_REGEX = re.compile(rb"<[a-zA-Z0-9]+:Envelope[\s>]")
+# Enough of the previous chunk to find an Envelope start tag split across two chunks
+ENVELOPE_START_OVERLAP_SIZE = 64
 
 
 class SOAPPayload:
@@ -279,8 +282,161 @@ def get_soap_operation_name(soap_xml: str | bytes) -> str:
     return operation_name
 
 
-def get_soap_operation_dict(soap_xml: str, operation_name: str) -> dict:
-    return get_envelope_dict(SOAPPayload(soap_xml).to_dict(), operation_name)
+def get_soap_operation_dict(
+    soap_xml: str | bytes | Iterable[bytes],
+    operation_name: str,
+    force_list_attributes: tuple | None = None,
+) -> dict:
+    """Get the operation element of a SOAP message as a dict
+
+    The dict is the same as the operation in SOAPPayload(soap_xml).to_dict(),
+    but the message is pull parsed as it is read and parsing stops at the end
+    of the operation element. The message is never decoded into a string, and
+    anything after the operation (like MTOM attachments) is never read.
+    """
+    if isinstance(soap_xml, str):
+        soap_xml = soap_xml.encode("utf-8")
+    operation_element = get_soap_operation_element(soap_xml, operation_name)
+    if operation_element is None:
+        return {}
+    return soap_element_to_dict(operation_element, force_list_attributes=force_list_attributes)
+
+
+def iter_soap_envelope_chunks(chunks: bytes | Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the chunks of a SOAP message starting from its Envelope
+
+    Anything before the Envelope, like the MIME headers of an MTOM message, is dropped.
+    """
+    chunk_iter = iter([chunks] if isinstance(chunks, bytes) else chunks)
+    tail = b""
+    for chunk in chunk_iter:
+        window = tail + chunk
+        if match := ENVELOPE_START_REGEX.search(window):
+            yield window[match.start() :]
+            yield from chunk_iter
+            return
+        tail = window[-ENVELOPE_START_OVERLAP_SIZE:]
+
+
+def get_soap_operation_element(
+    soap_xml: bytes | Iterable[bytes], operation_name: str
+) -> etree._Element | None:
+    """Pull parse a SOAP message up to the end of the operation element in its Body"""
+    parser = etree.XMLPullParser(events=("start", "end"))
+    operation_element = None
+    for chunk in iter_soap_envelope_chunks(soap_xml):
+        syntax_error = None
+        try:
+            parser.feed(chunk)
+        except etree.XMLSyntaxError as e:
+            # Anything after the Envelope, like the closing MTOM boundary, is a
+            # syntax error, which only matters if the operation wasn't parsed first.
+            syntax_error = e
+
+        for event, element in parser.read_events():
+            if event == "start":
+                if operation_element is None and is_soap_operation_element(element, operation_name):
+                    operation_element = element
+            elif element is operation_element:
+                return element
+            elif operation_element is None and is_soap_body_element(element):
+                # The Body ended without the operation in it
+                return None
+
+        if syntax_error is not None:
+            raise syntax_error
+    return None
+
+
+def get_local_name(tag: str) -> str:
+    # Tags are either {namespace}name, or prefix:name when the prefix was never declared
+    return tag.rsplit("}", 1)[-1].rsplit(XML_DICT_KEY_NAMESPACE_DELIMITER, 1)[-1]
+
+
+def is_soap_body_element(element: etree._Element) -> bool:
+    parent = element.getparent()
+    return (
+        get_local_name(element.tag) == "Body"
+        and parent is not None
+        and parent.getparent() is None
+        and get_local_name(parent.tag) == "Envelope"
+    )
+
+
+def is_soap_operation_element(element: etree._Element, operation_name: str) -> bool:
+    parent = element.getparent()
+    return (
+        parent is not None
+        and is_soap_body_element(parent)
+        and get_local_name(element.tag) == operation_name
+    )
+
+
+def soap_element_to_dict(
+    element: etree._Element,
+    force_list_attributes: tuple | None = None,
+    keep_prefixes: bool = False,
+) -> Any:
+    """Convert an element to the same value xmltodict gives it
+
+    Namespace declarations and attributes are "@" keys, repeated child elements
+    are a list, and text is stripped and put under "#text" when the element also
+    has attributes or children. Unless keep_prefixes is set, child element keys
+    drop their namespace prefix like non_namespace_or_attribute_key_modifier does.
+    """
+    result: dict[str, Any] = {}
+
+    parent = element.getparent()
+    parent_nsmap = parent.nsmap if parent is not None else {}
+    for prefix, uri in element.nsmap.items():
+        if parent_nsmap.get(prefix) != uri:
+            result["@xmlns" if prefix is None else f"@xmlns:{prefix}"] = uri
+
+    prefixes_by_uri = {uri: prefix for prefix, uri in element.nsmap.items()}
+    for name, value in element.attrib.items():
+        result[f"{XML_DICT_KEY_ATTRIBUTE_PREFIX}{_get_prefixed_name(name, prefixes_by_uri)}"] = (
+            value
+        )
+
+    has_children = False
+    text_parts = [element.text or ""]
+    for child in element:
+        text_parts.append(child.tail or "")
+        # Skip comments and processing instructions
+        if not isinstance(child.tag, str):
+            continue
+        has_children = True
+
+        key = get_local_name(child.tag)
+        if keep_prefixes and child.prefix:
+            key = f"{child.prefix}{XML_DICT_KEY_NAMESPACE_DELIMITER}{key}"
+        elif keep_prefixes:
+            # Keeps a prefix that was never declared, which is part of the tag
+            key = child.tag.rsplit("}", 1)[-1]
+        value = soap_element_to_dict(child, force_list_attributes, keep_prefixes)
+        if key in result:
+            if not isinstance(result[key], list):
+                result[key] = [result[key]]
+            result[key].append(value)
+        elif force_list_attributes and get_local_name(key) in force_list_attributes:
+            result[key] = [value]
+        else:
+            result[key] = value
+
+    text = "".join(text_parts).strip()
+    if not result and not has_children:
+        return text or None
+    if text:
+        result[XML_DICT_KEY_TEXT_VALUE_KEY] = text
+    return result
+
+
+def _get_prefixed_name(name: str, prefixes_by_uri: dict[str, str | None]) -> str:
+    if not name.startswith("{"):
+        return name
+    uri, local_name = name[1:].split("}", 1)
+    prefix = prefixes_by_uri.get(uri)
+    return f"{prefix}{XML_DICT_KEY_NAMESPACE_DELIMITER}{local_name}" if prefix else local_name
 
 
 def get_envelope_dict(soap_xml_dict: dict, operation_name: str) -> dict:
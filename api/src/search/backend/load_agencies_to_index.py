@@ -1,5 +1,5 @@
 import copy
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from enum import StrEnum
 from typing import Any
 
@@ -70,6 +70,7 @@ class LoadAgenciesToIndexConfig(PydanticBaseEnvConfig):
 class LoadAgenciesToIndex(Task):
     class Metrics(StrEnum):
         RECORDS_LOADED = "records_loaded"
+        RECORDS_FAILED = "records_failed"
 
     def __init__(
         self,
@@ -90,26 +91,33 @@ class LoadAgenciesToIndex(Task):
 
     def run_task(self) -> None:
         logger.info("Creating search index")
-        # create the index
-        self.search_client.create_index(
-            self.index_name,
-            shard_count=self.config.shard_count,
-            replica_count=self.config.replica_count,
-            analysis=AGENCY_INDEX_ANALYSIS,
-            mappings=AGENCY_INDEX_MAPPINGS,
-        )
+        # create the index, nothing queries it until it's swapped
+        # into the alias so we can skip replicas and refreshes for now
+        with self.record_duration("create_index"):
+            self.search_client.create_index(
+                self.index_name,
+                shard_count=self.config.shard_count,
+                replica_count=self.config.replica_count,
+                analysis=AGENCY_INDEX_ANALYSIS,
+                mappings=AGENCY_INDEX_MAPPINGS,
+                index_build_mode=True,
+            )
         # load the records
-        agencies = self.fetch_agencies()
-        self.load_agencies(agencies)
-
-        # handle aliasing of endpoints
-        self.search_client.swap_alias_index(
-            self.index_name,
-            self.config.alias_name,
-        )
+        with self.record_duration("load_records"):
+            agencies = self.fetch_agencies()
+            self.load_agencies(agencies)
+
+        # handle aliasing of endpoints, restoring the replicas first
+        with self.record_duration("swap_alias"):
+            self.search_client.swap_alias_index(
+                self.index_name,
+                self.config.alias_name,
+                index_build_replica_count=self.config.replica_count,
+            )
 
         # cleanup old indexes
-        self.search_client.cleanup_old_indices(self.config.index_prefix, [self.index_name])
+        with self.record_duration("cleanup_old_indices"):
+            self.search_client.cleanup_old_indices(self.config.index_prefix, [self.index_name])
 
     def fetch_agencies(self) -> Sequence[Agency]:
         """
@@ -131,13 +139,28 @@ class LoadAgenciesToIndex(Task):
     def load_agencies(self, agencies: Sequence[Agency]) -> None:
         logger.info("Loading agencies...")
 
+        # The index is refreshed when the build is finalized
+        response = self.search_client.bulk_upsert(
+            self.index_name,
+            self._serialize_agencies(agencies),
+            "agency_id",
+            refresh=False,
+        )
+
+        if response.has_failures:
+            logger.error(
+                "Failed to load some agencies to the search index",
+                extra={"index_name": self.index_name, "failure_count": response.failure_count},
+            )
+            self.increment(self.Metrics.RECORDS_FAILED, response.failure_count)
+
+    def _serialize_agencies(self, agencies: Sequence[Agency]) -> Iterator[dict]:
         # Get agencies by opportunity status
         posted_agencies = self._get_agencies_by_status(OpportunityStatus.POSTED)
         forecasted_agencies = self._get_agencies_by_status(OpportunityStatus.FORECASTED)
         closed_agencies = self._get_agencies_by_status(OpportunityStatus.CLOSED)
         archived_agencies = self._get_agencies_by_status(OpportunityStatus.ARCHIVED)
 
-        agencies_json = []
         for agency in agencies:
             logger.info(
                 "Preparing agency for upload to search index",
@@ -166,12 +189,5 @@ class LoadAgenciesToIndex(Task):
                 extra={"agency_id": agency.agency_id, "opportunity_statuses": opportunity_statuses},
             )
 
-            agencies_json.append(agency_json)
-
             self.increment(self.Metrics.RECORDS_LOADED)
-
-        self.search_client.bulk_upsert(
-            self.index_name,
-            agencies_json,
-            "agency_id",
-        )
+            yield agency_json
@@ -1,16 +1,20 @@
+import dataclasses
+import itertools
 import logging
+import time
 import uuid
-from collections.abc import Iterator, Sequence
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from enum import StrEnum
 
 import grants_shared.adapters.db as db
 from grants_shared.util.datetime_util import get_now_us_eastern_datetime, utcnow
-from opensearchpy.exceptions import ConnectionTimeout, TransportError
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+from sqlalchemy import Engine, Select, delete, select, tuple_, update
+from sqlalchemy.orm import Session, selectinload
 
 import src.adapters.search as search
 from src.api.opportunities_v1.opportunity_schemas import OpportunityV1Schema
@@ -18,6 +22,8 @@ from src.db.models.agency_models import Agency
 from src.db.models.opportunity_models import (
     CurrentOpportunitySummary,
     Opportunity,
+    OpportunityChangeAudit,
+    OpportunityIndexDeleteQueue,
     OpportunitySummary,
 )
 from src.task.task import Task
@@ -35,62 +41,253 @@ class LoadOpportunitiesToIndexConfig(PydanticBaseEnvConfig):
     alias_name: str = Field(default="opportunity-index-alias")  # LOAD_OPP_SEARCH_ALIAS_NAME
     index_prefix: str = Field(default="opportunity-index")  # LOAD_OPP_INDEX_PREFIX
 
+    # How many queued opportunities to load per batch when running incrementally
+    incremental_batch_size: int = Field(default=1000)  # LOAD_OPP_SEARCH_INCREMENTAL_BATCH_SIZE
+
+    # A full refresh fetches and serializes batches of opportunities on several
+    # worker threads, each with its own DB session, while the search client sends
+    # the serialized records. At most twice the worker count of batches are held
+    # in memory waiting to be sent.
+    pipeline_worker_count: int = Field(default=4)  # LOAD_OPP_SEARCH_PIPELINE_WORKER_COUNT
+    pipeline_batch_size: int = Field(default=500)  # LOAD_OPP_SEARCH_PIPELINE_BATCH_SIZE
+
+
+@dataclasses.dataclass
+class SerializedOpportunityBatch:
+    records: list[dict]
+    test_records_skipped: int
+    # How long the worker spent fetching + serializing the batch
+    fetch_duration_sec: float
+    serialize_duration_sec: float
+
 
 class LoadOpportunitiesToIndex(Task):
     class Metrics(StrEnum):
         RECORDS_LOADED = "records_loaded"
         TEST_RECORDS_SKIPPED = "test_records_skipped"
+        RECORDS_DELETED = "records_deleted"
+        RECORDS_FAILED = "records_failed"
+
+        # Time spent in each stage of the full refresh pipeline. Worker
+        # stages are summed across threads so can exceed the wall time.
+        ID_FETCH_DURATION_SEC = "pipeline_id_fetch_duration_sec"
+        RECORD_FETCH_DURATION_SEC = "pipeline_record_fetch_duration_sec"
+        SERIALIZE_DURATION_SEC = "pipeline_serialize_duration_sec"
+        BULK_REQUEST_DURATION_SEC = "pipeline_bulk_request_duration_sec"
 
     def __init__(
         self,
         db_session: db.Session,
         search_client: search.SearchClient,
         config: LoadOpportunitiesToIndexConfig | None = None,
+        is_full_refresh: bool = True,
     ) -> None:
         super().__init__(db_session)
 
         self.search_client = search_client
+        self.is_full_refresh = is_full_refresh
         if config is None:
             config = LoadOpportunitiesToIndexConfig()
         self.config = config
 
-        current_timestamp = get_now_us_eastern_datetime().strftime("%Y-%m-%d_%H-%M-%S")
-        self.index_name = f"{self.config.index_prefix}-{current_timestamp}"
+        if is_full_refresh:
+            current_timestamp = get_now_us_eastern_datetime().strftime("%Y-%m-%d_%H-%M-%S")
+            self.index_name = f"{self.config.index_prefix}-{current_timestamp}"
+        else:
+            # Incremental loads write directly to whatever index currently backs the alias
+            self.index_name = self.config.alias_name
         self.set_metrics({"index_name": self.index_name})
         self.start_time = utcnow()
 
     def run_task(self) -> None:
-        # NOTE:
-        # Incremental (changed-only) opportunity loading logic previously lived here.
-        # It was removed as part of PR https://github.com/HHS/simpler-grants-gov/pull/7748 during code cleanup.
-        # See that PR if incremental search support needs to be revived in the future.
-        logger.info("Running full refresh")
-        self.full_refresh()
+        if self.is_full_refresh:
+            logger.info("Running full refresh")
+            self.full_refresh()
+        elif not self.search_client.alias_exists(self.config.alias_name):
+            # Nothing to incrementally update yet, so build the index from scratch
+            logger.info(
+                "Alias does not exist, running full refresh instead of incremental load",
+                extra={"index_alias": self.config.alias_name},
+            )
+            self.is_full_refresh = True
+            current_timestamp = get_now_us_eastern_datetime().strftime("%Y-%m-%d_%H-%M-%S")
+            self.index_name = f"{self.config.index_prefix}-{current_timestamp}"
+            self.set_metrics({"index_name": self.index_name})
+            self.full_refresh()
+        else:
+            logger.info("Running incremental load")
+            self.incremental_updates_and_deletes()
 
     def full_refresh(self) -> None:
-        # create the index
-        self.search_client.create_index(
-            self.index_name,
-            shard_count=self.config.shard_count,
-            replica_count=self.config.replica_count,
+        # Anything queued before this point will be picked up by the rebuild
+        queue_cutoff = utcnow()
+
+        # create the index, nothing queries it until it's swapped
+        # into the alias so we can skip replicas and refreshes for now
+        with self.record_duration("create_index"):
+            self.search_client.create_index(
+                self.index_name,
+                shard_count=self.config.shard_count,
+                replica_count=self.config.replica_count,
+                index_build_mode=True,
+            )
+
+        # load the records, streaming every batch into the index
+        with self.record_duration("load_records"):
+            self.load_all_records()
+
+        # handle aliasing of endpoints, restoring the replicas first
+        with self.record_duration("swap_alias"):
+            self.search_client.swap_alias_index(
+                self.index_name,
+                self.config.alias_name,
+                index_build_replica_count=self.config.replica_count,
+            )
+
+        # cleanup old indexes
+        with self.record_duration("cleanup_old_indices"):
+            self.search_client.cleanup_old_indices(self.config.index_prefix, [self.index_name])
+
+        # Everything queued before we started was picked up by the rebuild,
+        # so the next incremental run doesn't need to reprocess it.
+        self.clear_queues_before(queue_cutoff)
+
+    def incremental_updates_and_deletes(self) -> None:
+        """
+        Upsert or remove only the opportunities that changed since they were last loaded.
+
+        Changes are tracked in the opportunity_change_audit table which database triggers
+        populate whenever an opportunity, its summaries, their link tables, or its
+        assistance listings are modified. Deletes of any of those records are tracked
+        in the opportunity_index_delete_queue table.
+        """
+        with self.db_session.begin():
+            # Each queued row is paired with the updated_at we saw, so a change
+            # that lands while we process it is left queued for the next run.
+            queued_changes = self.db_session.execute(
+                select(OpportunityChangeAudit.opportunity_id, OpportunityChangeAudit.updated_at)
+                .where(OpportunityChangeAudit.is_loaded_to_search.isnot(True))
+                .order_by(OpportunityChangeAudit.opportunity_id)
+            ).all()
+
+        logger.info(
+            "Found queued opportunity changes to load",
+            extra={"queued_change_count": len(queued_changes)},
         )
 
-        # load the records
-        for opp_batch in self.fetch_opportunities():
-            self.load_records(opp_batch, refresh=True)
+        for batch in itertools.batched(
+            queued_changes, self.config.incremental_batch_size, strict=False
+        ):
+            with self.db_session.begin():
+                self.process_queued_changes({row.opportunity_id: row.updated_at for row in batch})
 
-        # handle aliasing of endpoints
-        self.search_client.swap_alias_index(
-            self.index_name,
-            self.config.alias_name,
+        with self.db_session.begin():
+            queued_deletes = self.db_session.execute(
+                select(
+                    OpportunityIndexDeleteQueue.opportunity_id,
+                    OpportunityIndexDeleteQueue.updated_at,
+                ).order_by(OpportunityIndexDeleteQueue.opportunity_id)
+            ).all()
+
+        logger.info(
+            "Found queued opportunity deletes to process",
+            extra={"queued_delete_count": len(queued_deletes)},
         )
 
-        # cleanup old indexes
-        self.search_client.cleanup_old_indices(self.config.index_prefix, [self.index_name])
+        for batch in itertools.batched(
+            queued_deletes, self.config.incremental_batch_size, strict=False
+        ):
+            with self.db_session.begin():
+                self.process_delete_queue({row.opportunity_id: row.updated_at for row in batch})
 
-    def fetch_opportunities(self) -> Iterator[Sequence[Opportunity]]:
+    def process_queued_changes(self, queued_changes: dict[uuid.UUID, datetime]) -> None:
+        completed_ids = self.load_or_remove_opportunities(list(queued_changes.keys()))
+
+        # Records that failed to load stay queued so the next run tries them again
+        completed_changes = [
+            (opp_id, updated_at)
+            for opp_id, updated_at in queued_changes.items()
+            if opp_id in completed_ids
+        ]
+        if completed_changes:
+            self.db_session.execute(
+                update(OpportunityChangeAudit)
+                .where(
+                    tuple_(
+                        OpportunityChangeAudit.opportunity_id, OpportunityChangeAudit.updated_at
+                    ).in_(completed_changes)
+                )
+                .values(is_loaded_to_search=True)
+            )
+
+    def process_delete_queue(self, queued_deletes: dict[uuid.UUID, datetime]) -> None:
+        # Deleting a summary or one of its link records leaves the opportunity in
+        # place, so anything that's still loadable is reloaded rather than removed.
+        completed_ids = self.load_or_remove_opportunities(list(queued_deletes.keys()))
+
+        completed_deletes = [
+            (opp_id, updated_at)
+            for opp_id, updated_at in queued_deletes.items()
+            if opp_id in completed_ids
+        ]
+        if completed_deletes:
+            self.db_session.execute(
+                delete(OpportunityIndexDeleteQueue).where(
+                    tuple_(
+                        OpportunityIndexDeleteQueue.opportunity_id,
+                        OpportunityIndexDeleteQueue.updated_at,
+                    ).in_(completed_deletes)
+                )
+            )
+
+    def load_or_remove_opportunities(self, opportunity_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        """
+        Upsert the given opportunities into the index, removing any that no longer
+        exist or can't be loaded. Returns the IDs that were either loaded or removed.
         """
-        Fetch the opportunities in batches. The iterator returned
+        records = self.db_session.scalars(
+            self._build_opportunity_select().where(Opportunity.opportunity_id.in_(opportunity_ids))
+        ).all()
+
+        processed_ids = self.load_records(records)
+
+        # Anything queued that is no longer loadable (it was deleted, became a draft, lost
+        # its current summary, or belongs to a test agency) must not stay in the index.
+        loaded_ids = {
+            record.opportunity_id
+            for record in records
+            if not (record.agency_record and record.agency_record.is_test_agency)
+        }
+        fetched_ids = {record.opportunity_id for record in records}
+        ids_to_delete = [opp_id for opp_id in opportunity_ids if opp_id not in loaded_ids]
+        if ids_to_delete:
+            self.search_client.bulk_delete(self.index_name, ids_to_delete, refresh=False)
+            self.increment(self.Metrics.RECORDS_DELETED, len(ids_to_delete))
+
+        return {
+            opp_id
+            for opp_id in opportunity_ids
+            if opp_id in processed_ids or opp_id not in fetched_ids
+        }
+
+    def clear_queues_before(self, cutoff: datetime) -> None:
+        self.db_session.execute(
+            update(OpportunityChangeAudit)
+            .where(
+                OpportunityChangeAudit.is_loaded_to_search.isnot(True),
+                OpportunityChangeAudit.updated_at <= cutoff,
+            )
+            .values(is_loaded_to_search=True)
+        )
+        self.db_session.execute(
+            delete(OpportunityIndexDeleteQueue).where(
+                OpportunityIndexDeleteQueue.updated_at <= cutoff
+            )
+        )
+
+    def fetch_opportunity_id_batches(self) -> Iterator[Sequence[uuid.UUID]]:
+        """
+        Fetch the IDs of opportunities to load in batches. The iterator returned
         will give you each individual batch to be processed.
 
         Fetches all opportunities where:
@@ -99,77 +296,217 @@ class LoadOpportunitiesToIndex(Task):
         """
         return (
             self.db_session.execute(
-                select(Opportunity)
+                select(Opportunity.opportunity_id)
                 .join(CurrentOpportunitySummary)
                 .where(
                     Opportunity.is_draft.is_(False),
                     CurrentOpportunitySummary.opportunity_status.isnot(None),
                 )
-                .options(
-                    # Opportunity summary
-                    selectinload(Opportunity.current_opportunity_summary)
-                    .selectinload(CurrentOpportunitySummary.opportunity_summary)
-                    .options(
-                        selectinload(OpportunitySummary.link_funding_instruments),
-                        selectinload(OpportunitySummary.link_funding_categories),
-                        selectinload(OpportunitySummary.link_applicant_types),
-                    ),
-                    # Assistance listing number
-                    selectinload(Opportunity.opportunity_assistance_listings),
-                    # Agency
-                    selectinload(Opportunity.agency_record).selectinload(Agency.top_level_agency),
-                )
-                .execution_options(yield_per=1000)
+                .execution_options(yield_per=self.config.pipeline_batch_size)
             )
             .scalars()
             .partitions()
         )
 
-    @retry(
-        stop=stop_after_attempt(3),  # Retry up to 3 times
-        wait=wait_fixed(2),  # Wait 2 seconds between retries
-        retry=retry_if_exception_type(
-            (TransportError, ConnectionTimeout)
-        ),  # Retry on TransportError (including timeouts)
-    )
-    def load_records(self, records: Sequence[Opportunity], refresh: bool = False) -> set[uuid.UUID]:
-        logger.info("Loading batch of opportunities...")
+    def _build_opportunity_select(self) -> Select[tuple[Opportunity]]:
+        return (
+            select(Opportunity)
+            .join(CurrentOpportunitySummary)
+            .where(
+                Opportunity.is_draft.is_(False),
+                CurrentOpportunitySummary.opportunity_status.isnot(None),
+            )
+            .options(
+                # Opportunity summary
+                selectinload(Opportunity.current_opportunity_summary)
+                .selectinload(CurrentOpportunitySummary.opportunity_summary)
+                .options(
+                    selectinload(OpportunitySummary.link_funding_instruments),
+                    selectinload(OpportunitySummary.link_funding_categories),
+                    selectinload(OpportunitySummary.link_applicant_types),
+                ),
+                # Assistance listing number
+                selectinload(Opportunity.opportunity_assistance_listings),
+                # Agency
+                selectinload(Opportunity.agency_record).selectinload(Agency.top_level_agency),
+            )
+        )
+
+    def load_all_records(self) -> None:
+        """
+        Load every opportunity into the index as a pipeline of three stages:
+
+            1. This thread pages through the IDs of opportunities to load
+            2. A pool of worker threads each fetch a batch of those opportunities
+               with their own DB session and serialize them
+            3. The search client sends the serialized records in parallel bulk requests
+
+        Each stage only reads ahead a bounded number of batches, so the stages
+        overlap without the whole dataset ever being held in memory.
+        """
+        logger.info("Loading all opportunities...")
+
+        response = self.search_client.bulk_upsert(
+            self.index_name,
+            self._serialize_in_parallel(),
+            "opportunity_id",
+            refresh=False,
+        )
+        self.increment(
+            self.Metrics.BULK_REQUEST_DURATION_SEC, round(response.request_duration_sec, 3)
+        )
+
+        if response.has_failures:
+            logger.error(
+                "Failed to load some opportunities to the search index",
+                extra={"index_name": self.index_name, "failure_count": response.failure_count},
+            )
+            self.increment(self.Metrics.RECORDS_FAILED, response.failure_count)
+
+        self._set_throughput_metrics()
+
+    def _serialize_in_parallel(self) -> Iterator[dict]:
+        worker_count = max(self.config.pipeline_worker_count, 1)
+        max_pending = worker_count * 2
+        bind = self.db_session.get_bind()
+
+        with ThreadPoolExecutor(
+            max_workers=worker_count, thread_name_prefix="opportunity-serialize"
+        ) as executor:
+            pending: deque[Future[SerializedOpportunityBatch]] = deque()
+
+            id_batches = self.fetch_opportunity_id_batches()
+            while True:
+                id_fetch_start = time.perf_counter()
+                id_batch = next(id_batches, None)
+                self.increment(
+                    self.Metrics.ID_FETCH_DURATION_SEC,
+                    round(time.perf_counter() - id_fetch_start, 3),
+                )
+                if id_batch is None:
+                    break
+
+                pending.append(executor.submit(self._fetch_and_serialize_batch, bind, id_batch))
+
+                # Hand the oldest batch to the search client before reading
+                # further ahead if enough batches are already waiting
+                if len(pending) >= max_pending:
+                    yield from self._collect_batch(pending.popleft().result())
+
+            while pending:
+                yield from self._collect_batch(pending.popleft().result())
+
+    def _fetch_and_serialize_batch(
+        self, bind: Engine, opportunity_ids: Sequence[uuid.UUID]
+    ) -> SerializedOpportunityBatch:
+        # Runs on a worker thread. Sessions can't be shared across threads, so each batch
+        # is fetched with its own session and is fully serialized before it's closed.
+        with Session(bind=bind) as worker_session:
+            fetch_start = time.perf_counter()
+            opportunities = worker_session.scalars(
+                self._build_opportunity_select().where(
+                    Opportunity.opportunity_id.in_(opportunity_ids)
+                )
+            ).all()
+            fetch_duration = time.perf_counter() - fetch_start
 
+            serialize_start = time.perf_counter()
+            schema = OpportunityV1Schema()
+            records = []
+            test_records_skipped = 0
+            for opportunity in opportunities:
+                json_record = self._prepare_record(schema, opportunity)
+                if json_record is None:
+                    test_records_skipped += 1
+                else:
+                    records.append(json_record)
+
+            return SerializedOpportunityBatch(
+                records=records,
+                test_records_skipped=test_records_skipped,
+                fetch_duration_sec=fetch_duration,
+                serialize_duration_sec=time.perf_counter() - serialize_start,
+            )
+
+    def _collect_batch(self, batch: SerializedOpportunityBatch) -> Iterator[dict]:
+        # Metrics are only ever updated from the main thread
+        self.increment(self.Metrics.RECORDS_LOADED, len(batch.records))
+        self.increment(self.Metrics.TEST_RECORDS_SKIPPED, batch.test_records_skipped)
+        self.increment(self.Metrics.RECORD_FETCH_DURATION_SEC, round(batch.fetch_duration_sec, 3))
+        self.increment(self.Metrics.SERIALIZE_DURATION_SEC, round(batch.serialize_duration_sec, 3))
+
+        yield from batch.records
+
+    def _set_throughput_metrics(self) -> None:
+        records_loaded = self.metrics.get(self.Metrics.RECORDS_LOADED, 0)
+        for metric in [
+            self.Metrics.RECORD_FETCH_DURATION_SEC,
+            self.Metrics.SERIALIZE_DURATION_SEC,
+            self.Metrics.BULK_REQUEST_DURATION_SEC,
+        ]:
+            duration = self.metrics.get(metric, 0)
+            # eg. pipeline_serialize_duration_sec -> pipeline_serialize_records_per_sec
+            throughput_metric = metric.replace("_duration_sec", "_records_per_sec")
+            self.set_metrics(
+                {throughput_metric: round(records_loaded / duration, 1) if duration else 0}
+            )
+
+    def load_records(self, records: Iterable[Opportunity], refresh: bool = False) -> set[uuid.UUID]:
+        logger.info("Loading opportunities...")
+
+        batch_processed_opp_ids: set[uuid.UUID] = set()
+
+        # The records are serialized lazily as the search client reads
+        # them, so they're never all held in memory as JSON at once.
+        # Request errors are retried by the search client itself.
+        response = self.search_client.bulk_upsert(
+            self.index_name,
+            self._serialize_records(records, batch_processed_opp_ids),
+            "opportunity_id",
+            refresh=refresh,
+        )
+
+        if response.has_failures:
+            logger.error(
+                "Failed to load some opportunities to the search index",
+                extra={"index_name": self.index_name, "failure_count": response.failure_count},
+            )
+            self.increment(self.Metrics.RECORDS_FAILED, response.failure_count)
+            batch_processed_opp_ids -= {uuid.UUID(str(f.id)) for f in response.failures}
+
+        return batch_processed_opp_ids
+
+    def _serialize_records(
+        self, records: Iterable[Opportunity], batch_processed_opp_ids: set[uuid.UUID]
+    ) -> Iterator[dict]:
         schema = OpportunityV1Schema()
 
-        batch_json_records = []
-        batch_processed_opp_ids = set()
         for record in records:
-            log_extra = {
-                "opportunity_id": record.opportunity_id,
-                "opportunity_status": record.opportunity_status,
-            }
-            logger.info("Preparing opportunity for upload to search index", extra=log_extra)
-
-            # Skip opportunity if associated with a test agency
-            if record.agency_record and record.agency_record.is_test_agency:
-                logger.info(
-                    "Skipping upload of opportunity as agency is a test agency",
-                    extra=log_extra | {"agency": record.agency_code},
-                )
+            json_record = self._prepare_record(schema, record)
+            # Add the skipped opportunity IDs to batch_processed_opp_ids to ensure they are not re-queued in the next cycle.
+            batch_processed_opp_ids.add(record.opportunity_id)
+
+            if json_record is None:
                 self.increment(self.Metrics.TEST_RECORDS_SKIPPED)
-                # Add the skipped opportunity IDs to batch_processed_opp_ids to ensure they are not re-queued in the next cycle.
-                batch_processed_opp_ids.add(record.opportunity_id)
                 continue
 
-            json_record = schema.dump(record)
-
             self.increment(self.Metrics.RECORDS_LOADED)
-            batch_json_records.append(json_record)
-            batch_processed_opp_ids.add(record.opportunity_id)
+            yield json_record
 
-        # Bulk upsert for the current batch
-        if batch_json_records:
-            self.search_client.bulk_upsert(
-                self.index_name,
-                batch_json_records,
-                "opportunity_id",
-                refresh=refresh,
+    def _prepare_record(self, schema: OpportunityV1Schema, record: Opportunity) -> dict | None:
+        """Serialize an opportunity for the search index, or None if it should be skipped"""
+        log_extra = {
+            "opportunity_id": record.opportunity_id,
+            "opportunity_status": record.opportunity_status,
+        }
+        logger.info("Preparing opportunity for upload to search index", extra=log_extra)
+
+        # Skip opportunity if associated with a test agency
+        if record.agency_record and record.agency_record.is_test_agency:
+            logger.info(
+                "Skipping upload of opportunity as agency is a test agency",
+                extra=log_extra | {"agency": record.agency_code},
             )
+            return None
 
-        return batch_processed_opp_ids
+        return schema.dump(record)
@@ -1,3 +1,4 @@
+import click
 import grants_shared.adapters.db as db
 from grants_shared.adapters.db import flask_db
 from grants_shared.task.ecs_background_task import ecs_background_task
@@ -13,14 +14,20 @@ from src.search.backend.load_search_data_blueprint import load_search_data_bluep
 @load_search_data_blueprint.cli.command(
     "load-opportunity-data", help="Load opportunity data from our database to the search index"
 )
+@click.option(
+    "--full-refresh/--incremental",
+    default=True,
+    help="Whether to rebuild the whole index, or only load opportunities that changed",
+)
 @flask_db.with_db_session()
 @flask_opensearch.with_search_client()
 @ecs_background_task(task_name=JobType.LOAD_OPPORTUNITY_DATA_OPENSEARCH)
 def load_opportunity_data(
     search_client: search.SearchClient,
     db_session: db.Session,
+    full_refresh: bool,
 ) -> None:
-    LoadOpportunitiesToIndex(db_session, search_client).run()
+    LoadOpportunitiesToIndex(db_session, search_client, is_full_refresh=full_refresh).run()
 
 
 @load_search_data_blueprint.cli.command(
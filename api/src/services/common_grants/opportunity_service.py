@@ -16,9 +16,10 @@ from common_grants_sdk.schemas.pydantic import (
 
 import src.adapters.search as search
 from src.services.opportunities_v1.get_opportunity import get_opportunity
-from src.services.opportunities_v1.search_opportunities import search_opportunities
+from src.services.opportunities_v1.search_opportunities import search_opportunities_source
 
 from .transformation import (
+    SEARCH_RESULT_SOURCE_INCLUDES,
     transform_opportunity_to_cg,
     transform_search_request_from_cg,
     transform_search_result_to_cg,
@@ -58,27 +59,7 @@ class CommonGrantsOpportunityService:
         # Convert search request to v1 format (list never has customFilters)
         v1_search_params, _ = transform_search_request_from_cg(filters, sorting, pagination, "")
 
-        # Get response data from v1 service
-        opportunity_data_v1, _aggregations, pagination_data_v1 = search_opportunities(
-            search_client, v1_search_params
-        )
-
-        # Transform response data to CG model
-        opportunity_data_cg: list[OpportunityBase] = []
-        for item in opportunity_data_v1:
-            opportunity = transform_search_result_to_cg(item)
-            if opportunity:
-                opportunity_data_cg.append(opportunity)
-
-        # Transform pagination data to CG model
-        paginated_results_info_cg = PaginatedResultsInfo(
-            page=pagination_data_v1.page_offset,
-            page_size=pagination_data_v1.page_size,
-            totalItems=pagination_data_v1.total_records,
-            totalPages=pagination_data_v1.total_pages,
-        )
-
-        return opportunity_data_cg, paginated_results_info_cg
+        return _search_opportunities_cg(search_client, v1_search_params)
 
     @staticmethod
     def search_opportunities(
@@ -97,24 +78,40 @@ class CommonGrantsOpportunityService:
             filters, sorting, pagination, search_request.search
         )
 
-        # Get response data from v1 service
-        opportunity_data_v1, _aggregations, pagination_data_v1 = search_opportunities(
+        opportunity_data_cg, paginated_results_info_cg = _search_opportunities_cg(
             search_client, v1_search_params
         )
 
-        # Transform response data to CG model
-        opportunity_data_cg: list[OpportunityBase] = []
-        for item in opportunity_data_v1:
-            opportunity = transform_search_result_to_cg(item)
-            if opportunity:
-                opportunity_data_cg.append(opportunity)
-
-        # Transform pagination data to CG model
-        paginated_results_info_cg = PaginatedResultsInfo(
-            page=pagination_data_v1.page_offset,
-            page_size=pagination_data_v1.page_size,
-            totalItems=pagination_data_v1.total_records,
-            totalPages=pagination_data_v1.total_pages,
-        )
-
         return opportunity_data_cg, paginated_results_info_cg, custom_filter_errors
+
+
+def _search_opportunities_cg(
+    search_client: search.SearchClient, v1_search_params: dict
+) -> tuple[list[OpportunityBase], PaginatedResultsInfo]:
+    """
+    Search for opportunities with v1 search params, returning CG models.
+
+    Only the fields the CG model needs are fetched from the search index, and
+    each result is transformed straight from its source, skipping the facet
+    counts and v1 schema load that the v1 search endpoint needs.
+    """
+    records, pagination_data_v1 = search_opportunities_source(
+        search_client, v1_search_params, SEARCH_RESULT_SOURCE_INCLUDES
+    )
+
+    # Transform response data to CG model
+    opportunity_data_cg: list[OpportunityBase] = []
+    for item in records:
+        opportunity = transform_search_result_to_cg(item)
+        if opportunity:
+            opportunity_data_cg.append(opportunity)
+
+    # Transform pagination data to CG model
+    paginated_results_info_cg = PaginatedResultsInfo(
+        page=pagination_data_v1.page_offset,
+        page_size=pagination_data_v1.page_size,
+        totalItems=pagination_data_v1.total_records,
+        totalPages=pagination_data_v1.total_pages,
+    )
+
+    return opportunity_data_cg, paginated_results_info_cg
@@ -365,6 +365,38 @@ def transform_opportunity_to_cg(v1_opportunity: Opportunity) -> OpportunityBase
     return transform_search_result_to_cg(opp_data)
 
 
+# The fields of an opportunity in the search index that
+# transform_search_result_to_cg uses, so searches can skip the rest
+SEARCH_RESULT_SOURCE_INCLUDES = [
+    "opportunity_id",
+    "opportunity_title",
+    "opportunity_status",
+    "legacy_opportunity_id",
+    "opportunity_number",
+    "category",
+    "agency_code",
+    "agency_name",
+    "top_level_agency_name",
+    "top_level_agency_code",
+    "opportunity_assistance_listings.assistance_listing_number",
+    "opportunity_assistance_listings.program_title",
+    "summary.summary_description",
+    "summary.post_date",
+    "summary.close_date",
+    "summary.estimated_total_program_funding",
+    "summary.award_ceiling",
+    "summary.award_floor",
+    "summary.additional_info_url",
+    "summary.additional_info_url_description",
+    "summary.agency_contact_description",
+    "summary.agency_email_address",
+    "summary.fiscal_year",
+    "summary.is_cost_sharing",
+    "summary.created_at",
+    "summary.updated_at",
+]
+
+
 def transform_search_result_to_cg(opp_data: dict) -> OpportunityBase | None:
     """
     Transform a search result dictionary to CommonGrants OpportunityBase format.
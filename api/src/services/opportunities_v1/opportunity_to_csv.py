@@ -2,7 +2,7 @@ import csv
 import io
 import os
 from collections.abc import Sequence
-from typing import cast
+from typing import TextIO, cast
 
 from grants_shared.util.dict_util import flatten_dict
 
@@ -50,6 +50,7 @@ CSV_FIELDS = [
     # which can help improve readability of other fields
     "summary_description",
 ]
+CSV_FIELDS_SET = set(CSV_FIELDS)
 
 
 def _process_assistance_listing(assistance_listings: list[dict]) -> str:
@@ -65,38 +66,46 @@ def _build_opportunity_url(opportunity_id: str, base_url: str) -> str:
     return f"{base_url}/opportunity/{opportunity_id}"
 
 
+def build_opportunity_csv_writer(output: TextIO) -> csv.DictWriter:
+    return csv.DictWriter(output, fieldnames=CSV_FIELDS, quoting=csv.QUOTE_ALL)
+
+
+def opportunity_to_csv_row(opportunity: dict, base_url: str | None) -> dict:
+    opp = flatten_dict(opportunity)
+
+    out_opportunity = {}
+    for k, v in opp.items():
+        # Remove prefixes from nested data structures
+        k = k.removeprefix("summary.")
+        k = k.removeprefix("assistance_listings.")
+
+        # Remove fields we haven't configured
+        if k not in CSV_FIELDS_SET:
+            continue
+
+        if k == "opportunity_assistance_listings":
+            v = _process_assistance_listing(v)
+
+        if k in ["funding_instruments", "funding_categories", "applicant_types"]:
+            v = ";".join(v)
+
+        out_opportunity[k] = v
+
+    if base_url:
+        out_opportunity["url"] = _build_opportunity_url(
+            cast(str, opp.get("opportunity_id")), base_url
+        )
+
+    return out_opportunity
+
+
 def opportunities_to_csv(
     opportunities: Sequence[dict],
     output: io.StringIO,
 ) -> None:
-    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, quoting=csv.QUOTE_ALL)
+    writer = build_opportunity_csv_writer(output)
     writer.writeheader()
 
-    csv_fields_set = set(CSV_FIELDS)
     base_url = os.getenv("FRONTEND_BASE_URL")
     for opportunity in opportunities:
-        opp = flatten_dict(opportunity)
-
-        out_opportunity = {}
-        for k, v in opp.items():
-            # Remove prefixes from nested data structures
-            k = k.removeprefix("summary.")
-            k = k.removeprefix("assistance_listings.")
-
-            # Remove fields we haven't configured
-            if k not in csv_fields_set:
-                continue
-
-            if k == "opportunity_assistance_listings":
-                v = _process_assistance_listing(v)
-
-            if k in ["funding_instruments", "funding_categories", "applicant_types"]:
-                v = ";".join(v)
-
-            out_opportunity[k] = v
-
-        if base_url:
-            out_opportunity["url"] = _build_opportunity_url(
-                cast(str, opp.get("opportunity_id")), base_url
-            )
-        writer.writerow(out_opportunity)
+        writer.writerow(opportunity_to_csv_row(opportunity, base_url))
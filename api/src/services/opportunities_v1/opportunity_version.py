@@ -1,8 +1,13 @@
+import hashlib
+import json
 import logging
-from operator import attrgetter
+import uuid
+from collections.abc import Sequence
 
 from grants_shared.adapters import db
 from grants_shared.util.dict_util import diff_nested_dicts
+from sqlalchemy import select
+from sqlalchemy.orm import defer
 
 from src.api.opportunities_v1.opportunity_schemas import OpportunityVersionSchema
 from src.db.models.opportunity_models import Opportunity, OpportunityVersion
@@ -12,6 +17,36 @@ logger = logging.getLogger(__name__)
 SCHEMA = OpportunityVersionSchema()
 
 
+def get_opportunity_data_hash(opportunity_data: dict) -> str:
+    """Get a hash of a serialized opportunity that is stable across key ordering"""
+    canonical_data = json.dumps(
+        opportunity_data, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical_data.encode("utf-8")).hexdigest()
+
+
+def get_latest_opportunity_versions(
+    db_session: db.Session, opportunity_ids: Sequence[uuid.UUID]
+) -> dict[uuid.UUID, OpportunityVersion]:
+    """
+    Fetch the most recent OpportunityVersion for each of the given opportunities.
+
+    The opportunity_data of each version is deferred, and only loaded if accessed.
+    """
+    if not opportunity_ids:
+        return {}
+
+    latest_versions = db_session.scalars(
+        select(OpportunityVersion)
+        .where(OpportunityVersion.opportunity_id.in_(opportunity_ids))
+        .distinct(OpportunityVersion.opportunity_id)
+        .order_by(OpportunityVersion.opportunity_id, OpportunityVersion.created_at.desc())
+        .options(defer(OpportunityVersion.opportunity_data))
+    ).all()
+
+    return {version.opportunity_id: version for version in latest_versions}
+
+
 def save_opportunity_version(db_session: db.Session, opportunity: Opportunity) -> bool:
     """
     Saves a new version of an Opportunity record in the OpportunityVersion table if there are changes and the opportunity is not in draft status.
@@ -28,28 +63,52 @@ def save_opportunity_version(db_session: db.Session, opportunity: Opportunity) -
     if opportunity.is_draft:
         return False
 
-    # Get the latest version
-    latest_opp_version: OpportunityVersion | None = None
-    if len(opportunity.versions) > 0:
-        latest_opp_version = max(opportunity.versions, key=attrgetter("created_at"))
+    latest_opp_version = get_latest_opportunity_versions(
+        db_session, [opportunity.opportunity_id]
+    ).get(opportunity.opportunity_id)
 
-    # Extracts the opportunity data as JSON object
-    opportunity_new = SCHEMA.dump(opportunity)
+    return save_opportunity_version_if_changed(db_session, opportunity, latest_opp_version)
 
-    diffs = []
 
-    if latest_opp_version:
-        diffs = diff_nested_dicts(opportunity_new, latest_opp_version.opportunity_data)
+def save_opportunity_version_if_changed(
+    db_session: db.Session,
+    opportunity: Opportunity,
+    latest_opp_version: OpportunityVersion | None,
+) -> bool:
+    """
+    Saves a new version of an Opportunity record if it differs from the
+    passed in latest version, see save_opportunity_version.
+
+    If the latest version has a hash, and it matches the hash of the current
+    opportunity, we know nothing has changed without needing to load and
+    diff the data of the latest version.
+    """
 
-    if diffs or latest_opp_version is None:
-        # Add new OpportunityVersion instance to the database session
-        opportunity_version = OpportunityVersion(
-            opportunity_id=opportunity.opportunity_id,
-            opportunity_data=opportunity_new,
-        )
+    if opportunity.is_draft:
+        return False
 
-        db_session.add(opportunity_version)
+    # Extracts the opportunity data as JSON object
+    opportunity_new = SCHEMA.dump(opportunity)
+    opportunity_new_hash = get_opportunity_data_hash(opportunity_new)
 
-        return True
+    if latest_opp_version is not None:
+        if latest_opp_version.opportunity_data_hash == opportunity_new_hash:
+            return False
 
-    return False
+        diffs = diff_nested_dicts(opportunity_new, latest_opp_version.opportunity_data)
+        if not diffs:
+            # The latest version predates hashing, store the hash so
+            # we don't need to load its data the next time around.
+            latest_opp_version.opportunity_data_hash = opportunity_new_hash
+            return False
+
+    # Add new OpportunityVersion instance to the database session
+    opportunity_version = OpportunityVersion(
+        opportunity_id=opportunity.opportunity_id,
+        opportunity_data=opportunity_new,
+        opportunity_data_hash=opportunity_new_hash,
+    )
+
+    db_session.add(opportunity_version)
+
+    return True
@@ -1,4 +1,7 @@
+import hashlib
+import json
 import logging
+import typing
 import uuid
 from collections.abc import Sequence
 
@@ -407,6 +410,35 @@ def search_opportunities_csv(
     return SCHEMA.load(response.records, many=True)
 
 
+def search_opportunities_source(
+    search_client: search.SearchClient, raw_search_params: dict, includes: list[str]
+) -> tuple[Sequence[dict], PaginationInfo]:
+    """
+    Run a search and return only the given source fields of each result.
+
+    This is a leaner version of search_opportunities for callers that transform
+    the results into their own models, like the CommonGrants API. No aggregations
+    or scores are requested, and the records are returned as they are in the
+    search index rather than being loaded through the v1 schema.
+    """
+    search_params = SearchOpportunityParams.model_validate(raw_search_params)
+
+    response = _search_opportunities(
+        search_client,
+        search_params,
+        includes=includes,
+        aggregation=False,
+        include_scores=False,
+        track_scores=False,
+    )
+
+    pagination_info = PaginationInfo.from_search_response(
+        search_params.pagination, response.total_records
+    )
+
+    return response.records, pagination_info
+
+
 def search_opportunities_id(
     search_client: search.SearchClient, search_query: dict
 ) -> list[uuid.UUID]:
@@ -417,3 +449,69 @@ def search_opportunities_id(
     response = _search_opportunities(search_client, search_params, includes=["opportunity_id"])
 
     return [uuid.UUID(opp["opportunity_id"]) for opp in response.records]
+
+
+def search_opportunities_id_batch(
+    search_client: search.SearchClient, search_queries: Sequence[dict]
+) -> list[list[uuid.UUID] | None]:
+    """
+    Fetch the opportunity IDs for several searches in one multi-search request.
+
+    This is a leaner version of search_opportunities_id for backend processes that only
+    need the IDs. Each search returns the same window of IDs, but no aggregations, total
+    hit counts, scores, or document source are requested.
+
+    Returns the IDs for each query in the order given, or None for a query that failed.
+    """
+    search_requests = []
+    for search_query in search_queries:
+        search_params = SearchOpportunityParams.model_validate(search_query | STATIC_PAGINATION)
+
+        search_request = _get_search_request(
+            search_params, aggregation=False, track_total_hits=False, track_scores=False
+        )
+        # The opportunity ID is the document ID, so we don't need any of the source
+        search_request["_source"] = False
+        search_requests.append(search_request)
+
+    index_alias = get_search_config().opportunity_search_index_alias
+    responses = search_client.msearch(index_alias, search_requests, include_scores=False)
+
+    return [
+        ([uuid.UUID(hit["_id"]) for hit in response.raw_hits] if response is not None else None)
+        for response in responses
+    ]
+
+
+def _canonicalize_search_value(value: typing.Any) -> typing.Any:
+    """Sort filter value lists and drop empty values so equivalent queries match"""
+    if isinstance(value, dict):
+        canonical = {key: _canonicalize_search_value(val) for key, val in value.items()}
+        return {key: val for key, val in canonical.items() if val not in (None, {}, [])}
+
+    if isinstance(value, list):
+        return sorted({str(item) for item in value})
+
+    if isinstance(value, str):
+        return value.strip()
+
+    return value
+
+
+def get_search_query_fingerprint(search_query: dict) -> str:
+    """
+    Build a fingerprint of a saved search query that is the same for any
+    queries that would return the same results.
+
+    Pagination is ignored, defaults are applied, ALN casing is normalized, and
+    filter values are sorted so key and list order don't matter.
+    """
+    search_params = SearchOpportunityParams.model_validate(search_query | STATIC_PAGINATION)
+    _normalize_aln(search_params.filters)
+
+    canonical_query = _canonicalize_search_value(
+        search_params.model_dump(mode="json", exclude={"pagination"})
+    )
+    serialized_query = json.dumps(canonical_query, sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(serialized_query.encode("utf-8")).hexdigest()
@@ -5,7 +5,10 @@ from grants_shared.adapters import db
 
 from src.adapters import search
 from src.db.models.user_models import UserSavedSearch
-from src.services.opportunities_v1.search_opportunities import search_opportunities_id
+from src.services.opportunities_v1.search_opportunities import (
+    get_search_query_fingerprint,
+    search_opportunities_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,7 @@ def create_saved_search(
         user_id=user_id,
         name=json_data["name"],
         search_query=json_data["search_query"],
+        search_query_fingerprint=get_search_query_fingerprint(json_data["search_query"]),
         searched_opportunity_ids=opportunity_ids,
     )
 
@@ -6,6 +6,7 @@ from pydantic import BaseModel
 from sqlalchemy import select
 
 from src.db.models.user_models import UserSavedSearch
+from src.services.opportunities_v1.search_opportunities import get_search_query_fingerprint
 
 
 class UpdateSavedSearchInput(BaseModel):
@@ -29,5 +30,10 @@ def update_saved_search(
 
     # Update
     saved_search.name = update_input.name
+    # Searches saved before fingerprints existed get theirs filled in when touched
+    if saved_search.search_query_fingerprint is None:
+        saved_search.search_query_fingerprint = get_search_query_fingerprint(
+            saved_search.search_query
+        )
 
     return saved_search
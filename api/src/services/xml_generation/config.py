@@ -1,9 +1,17 @@
 """Configuration management for XML generation service."""
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.form_schema.forms import get_active_forms, init_form_registry
+from src.form_schema.registry.form_template_registry import FormTemplateKey, form_template_registry
+from src.services.xml_generation.generation_plan import (
+    XMLGenerationPlan,
+    compile_xml_generation_plan,
+)
+
+if TYPE_CHECKING:
+    from src.db.models.competition_models import Form
 
 logger = logging.getLogger(__name__)
 
@@ -35,22 +43,61 @@ def _build_xml_form_xsd_url_map() -> dict[str, str]:
     return xsd_urls
 
 
-def load_xml_transform_config(form_name: str) -> dict[str, Any]:
-    """Load XML transformation rules for a given form."""
+# Generation plans of the forms loaded so far, keyed by form name (uppercase),
+# along with the form the plan was compiled for
+_xml_generation_plans: dict[str, tuple[Form, XMLGenerationPlan]] = {}
+
+
+def _is_registered_plan(form: Form, plan: XMLGenerationPlan) -> bool:
+    """Check that a cached plan was compiled from the currently registered version of the form."""
+    try:
+        registered_form = form_template_registry.get_by_id_and_major_version(
+            FormTemplateKey(form.form_id, 1)
+        )
+    except ValueError:
+        return False
+
+    return registered_form is form and form.json_to_xml_schema is plan.transform_config
+
+
+def load_xml_generation_plan(form_name: str) -> XMLGenerationPlan | None:
+    """Load the compiled XML generation plan for a given form.
+
+    The plan is compiled the first time a form is loaded and reused for as long as
+    that form stays registered with the same transformation rules. Returns None if
+    the form has no transformation rules.
+    """
+    form_name_upper = form_name.upper()
+
+    cached = _xml_generation_plans.get(form_name_upper)
+    if cached is not None and _is_registered_plan(*cached):
+        return cached[1]
+
     try:
         init_form_registry()
-        xml_form_map = _build_xml_form_map()
-        form_name_upper = form_name.upper()
+        for form in get_active_forms():
+            if (
+                form.json_to_xml_schema is not None
+                and form.short_form_name.upper() == form_name_upper
+            ):
+                plan = compile_xml_generation_plan(form.json_to_xml_schema)
+                _xml_generation_plans[form_name_upper] = (form, plan)
+                logger.info(f"Loaded transformation config for {form_name}")
+                return plan
 
-        if form_name_upper in xml_form_map:
-            logger.info(f"Loaded transformation config for {form_name}")
-            return xml_form_map[form_name_upper]
-        else:
-            logger.warning(f"No transformation config found for {form_name}")
-            return {}
+        logger.warning(f"No transformation config found for {form_name}")
     except Exception as e:
         logger.error(f"Failed to load transformation config for {form_name}: {e}")
+
+    return None
+
+
+def load_xml_transform_config(form_name: str) -> dict[str, Any]:
+    """Load XML transformation rules for a given form."""
+    plan = load_xml_generation_plan(form_name)
+    if plan is None:
         return {}
+    return plan.transform_config
 
 
 def is_form_xml_supported(form_name: str) -> bool:
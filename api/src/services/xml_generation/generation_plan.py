@@ -0,0 +1,182 @@
+"""Compiled plans for generating XML from a form's transform configuration."""
+
+from dataclasses import dataclass
+from typing import Any
+
+GLOBAL_LIBRARY_NAMESPACE = "http://apply.grants.gov/system/GlobalLibrary-V2.0"
+
+
+@dataclass(frozen=True)
+class XMLGenerationPlan:
+    """Everything the XML generation needs from a transform configuration.
+
+    None of this depends on the application data, so it is worked out once
+    per transform configuration rather than on every XML generation. A plan
+    is never modified after it's compiled, so it can be shared across threads.
+    """
+
+    transform_config: dict[str, Any]
+
+    root_element_name: str
+    # The prefix the root element's namespace is mapped to in the nsmap
+    root_namespace_prefix: str
+    default_namespace: str
+    form_version: str | None
+
+    nsmap: dict[str, str]
+    # Maps target element names to the namespace prefix they are in
+    namespace_fields: dict[str, str]
+
+    # Target element names in the order the XSD sequence expects them
+    element_order: list[str]
+    applicant_element_order: list[str]
+
+    attachment_field_config: dict[str, Any]
+    attachment_field_names: frozenset[str]
+
+    @property
+    def uses_namespaces(self) -> bool:
+        return bool(self.namespace_fields or self.default_namespace)
+
+    @property
+    def default_namespace_uri(self) -> str:
+        """The namespace of elements that aren't in a specific namespace"""
+        return self.nsmap.get(self.root_namespace_prefix, "")
+
+
+def compile_xml_generation_plan(transform_config: dict[str, Any]) -> XMLGenerationPlan:
+    """Compile a transform configuration into a plan for generating XML."""
+    xml_config = transform_config.get("_xml_config", {})
+    xml_structure = xml_config.get("xml_structure", {})
+    root_element_name = xml_structure.get("root_element", "SF424_4_0")
+    root_namespace_prefix = xml_structure.get("root_namespace_prefix", root_element_name)
+
+    namespace_config = xml_config.get("namespaces", {})
+    default_namespace = namespace_config.get("default", "")
+    namespace_fields = extract_namespace_fields(transform_config)
+
+    # Create namespace map for lxml with all required namespaces
+    # Use configured namespace prefix for root element (or fall back to root element name)
+    nsmap = {root_namespace_prefix: default_namespace}
+
+    # Add additional namespaces
+    for prefix, uri in namespace_config.items():
+        if prefix != "default":
+            nsmap[prefix] = uri
+
+    # Add globLib namespace if any fields use it
+    if any(ns == "globLib" for ns in namespace_fields.values()):
+        nsmap["globLib"] = GLOBAL_LIBRARY_NAMESPACE
+
+    attachment_field_config = xml_config.get("attachment_fields", {})
+
+    return XMLGenerationPlan(
+        transform_config=transform_config,
+        root_element_name=root_element_name,
+        root_namespace_prefix=root_namespace_prefix,
+        default_namespace=default_namespace,
+        # Version is optional (SF-424 uses it, SF-424A does not)
+        form_version=xml_structure.get("version"),
+        nsmap=nsmap,
+        namespace_fields=namespace_fields,
+        element_order=get_element_order_from_config(transform_config),
+        applicant_element_order=get_element_order_from_config(
+            transform_config, nested_path="applicant"
+        ),
+        attachment_field_config=attachment_field_config,
+        attachment_field_names=frozenset(attachment_field_config.keys()),
+    )
+
+
+def extract_namespace_fields(transform_config: dict) -> dict[str, str]:
+    """Extract namespace configuration from transform rules.
+
+    Args:
+        transform_config: The transformation configuration dictionary
+
+    Returns:
+        Dictionary mapping field names to their namespace prefixes
+    """
+    namespace_fields = {}
+
+    def extract_from_rules(rules: dict, path: str = "") -> None:
+        """Recursively extract namespace information from rules."""
+        for key, value in rules.items():
+            if key.startswith("_"):  # Skip metadata keys
+                continue
+
+            if isinstance(value, dict):
+                # Check if this field has XML transform with namespace
+                if "xml_transform" in value:
+                    xml_transform = value["xml_transform"]
+                    if "namespace" in xml_transform and "target" in xml_transform:
+                        target_name = xml_transform["target"]
+                        namespace = xml_transform["namespace"]
+                        namespace_fields[target_name] = namespace
+
+                # Recursively check nested fields
+                extract_from_rules(value, f"{path}.{key}" if path else key)
+
+    extract_from_rules(transform_config)
+    return namespace_fields
+
+
+def get_element_order_from_config(
+    transform_config: dict, nested_path: str | None = None
+) -> list[str]:
+    """Extract element order from transformation config based on rule definition order.
+
+    Args:
+        transform_config: The transformation configuration dictionary
+        nested_path: Optional path to nested object (e.g., "applicant_address")
+
+    Returns:
+        List of target element names in the order they're defined in config
+    """
+    element_order = []
+
+    # Navigate to nested config if path is provided
+    config_to_process = transform_config
+    if nested_path:
+        # Split path and navigate (e.g., "applicant_address" -> nested rules)
+        if nested_path in transform_config:
+            config_to_process = transform_config[nested_path]
+
+    # Extract target element names from xml_transform rules in order
+    for key, value in config_to_process.items():
+        # Skip metadata and non-transform fields
+        if key.startswith("_") or not isinstance(value, dict):
+            continue
+
+        xml_transform = value.get("xml_transform")
+        if xml_transform and isinstance(xml_transform, dict):
+            # Handle conditional transforms (e.g., one-to-many)
+            if xml_transform.get("type") == "conditional":
+                conditional_transform = xml_transform.get("conditional_transform", {})
+                conditional_type = conditional_transform.get("type")
+
+                if conditional_type == "one_to_many":
+                    # Expand one-to-many pattern into actual field names
+                    target_pattern = conditional_transform.get("target_pattern")
+                    max_count = conditional_transform.get("max_count", 10)
+                    if target_pattern:
+                        for i in range(1, max_count + 1):
+                            field_name = target_pattern.format(index=i)
+                            element_order.append(field_name)
+                elif conditional_type == "array_decomposition" and not xml_transform.get("target"):
+                    # Array decomposition without target spreads fields - add output field names
+                    field_mappings = conditional_transform.get("field_mappings", {})
+                    for output_field_name in field_mappings.keys():
+                        element_order.append(output_field_name)
+                else:
+                    # Other conditional types - use target if available
+                    target = xml_transform.get("target")
+                    if target:
+                        element_order.append(target)
+            else:
+                # Regular transform - use target
+                target = xml_transform.get("target")
+                if target:
+                    element_order.append(target)
+
+    return element_order
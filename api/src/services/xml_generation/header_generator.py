@@ -47,6 +47,9 @@ class SubmissionXMLGenerator:
         return xml_bytes.decode("utf-8").strip()
 
     def generate_header_xml(self, pretty_print: bool = True) -> str:
+        return self._generate_xml_string(self.build_header_element(), pretty_print)
+
+    def build_header_element(self) -> lxml_etree.Element:
         nsmap = {
             "header": HEADER_NAMESPACES["header"],
             "glob": HEADER_NAMESPACES["glob"],
@@ -76,11 +79,18 @@ class SubmissionXMLGenerator:
         self._add_field(root, "SubmissionTitle", self.application.application_name, header_ns)
         self._add_field(root, "CFDANumber", self._get_cfda_number(), header_ns)
 
-        return self._generate_xml_string(root, pretty_print)
+        return root
 
     def generate_footer_xml(
         self, application_submission: ApplicationSubmission, pretty_print: bool = True
     ) -> str:
+        return self._generate_xml_string(
+            self.build_footer_element(application_submission), pretty_print
+        )
+
+    def build_footer_element(
+        self, application_submission: ApplicationSubmission
+    ) -> lxml_etree.Element:
         nsmap = {
             None: FOOTER_NAMESPACES["footer"],
             "ns1": FOOTER_NAMESPACES["glob"],
@@ -106,7 +116,7 @@ class SubmissionXMLGenerator:
         self._add_field(root, "SubmitterName", submitter_name, footer_ns)
         self._add_field(root, "Grants_govTrackingNumber", tracking_number, footer_ns)
 
-        return self._generate_xml_string(root, pretty_print)
+        return root
 
     def _add_field(
         self, parent: lxml_etree.Element, field_name: str, value: str | None, namespace: str
@@ -199,3 +209,13 @@ def generate_application_footer_xml(
     return generator.generate_footer_xml(
         application_submission=application_submission, pretty_print=pretty_print
     )
+
+
+def generate_application_header_element(application: Application) -> lxml_etree.Element:
+    return SubmissionXMLGenerator(application).build_header_element()
+
+
+def generate_application_footer_element(
+    application: Application, application_submission: ApplicationSubmission
+) -> lxml_etree.Element:
+    return SubmissionXMLGenerator(application).build_footer_element(application_submission)
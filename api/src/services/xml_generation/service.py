@@ -1,11 +1,11 @@
 """Core XML generation service."""
 
 import logging
-import xml.etree.ElementTree as ET
 from typing import Any
 
 from lxml import etree as lxml_etree
 
+from .generation_plan import XMLGenerationPlan, compile_xml_generation_plan
 from .models import XMLGenerationRequest, XMLGenerationResponse
 from .transformers.attachment_transformer import AttachmentTransformer
 from .transformers.base_transformer import RecursiveXMLTransformer
@@ -28,34 +28,24 @@ def _is_attribute_metadata_key(field_name: str) -> bool:
 class XMLGenerationService:
     """Service for generating XML from JSON application data."""
 
-    def generate_xml(self, request: XMLGenerationRequest) -> XMLGenerationResponse:
+    def generate_xml(
+        self,
+        request: XMLGenerationRequest,
+        generation_plan: XMLGenerationPlan | None = None,
+    ) -> XMLGenerationResponse:
         """Generate XML from application data.
 
         Args:
             request: XML generation request containing application data and transform config
+            generation_plan: Plan compiled from the request's transform config, if one
+                is already cached (see load_xml_generation_plan). Compiled when not passed.
 
         Returns:
             XML generation response with generated XML or error information
         """
         try:
-            # An empty application_data dict is valid (a form with only optional elements)
-            # and is intentionally not rejected here.
-            transformer = RecursiveXMLTransformer(request.transform_config)
-            transformed_data = transformer.transform(request.application_data)
-
-            # Generate XML
-            xml_string = self._generate_xml_string(
-                transformed_data,
-                request.transform_config,
-                request.pretty_print,
-                request.attachment_mapping,
-                request.application_data,
-            )
-
-            # Log transformation results for development
-            logger.info(
-                f"XML generation successful: {len(transformed_data)} fields transformed from {len(request.application_data)} input fields"
-            )
+            root = self.generate_xml_element(request, generation_plan)
+            xml_string = self._generate_xml_string(root, request.pretty_print)
 
             return XMLGenerationResponse(success=True, xml_data=xml_string)
 
@@ -63,101 +53,82 @@ class XMLGenerationService:
             logger.exception("XML generation failed")
             return XMLGenerationResponse(success=False, error_message=str(e))
 
-    def _generate_xml_string(
+    def generate_xml_element(
         self,
-        data: dict,
-        transform_config: dict,
-        pretty_print: bool = True,
-        attachment_mapping: dict[str, AttachmentInfo] | None = None,
-        original_data: dict | None = None,
-    ) -> str:
-        """Generate XML string from transformed data.
+        request: XMLGenerationRequest,
+        generation_plan: XMLGenerationPlan | None = None,
+    ) -> lxml_etree.Element:
+        """Generate XML from application data as an lxml element.
+
+        Lets the XML be added to a larger document, like the complete submission
+        XML, without serializing it and parsing it back in. Unlike generate_xml,
+        any error is raised rather than returned, and pretty_print is ignored
+        as nothing is serialized.
 
         Args:
-            data: Transformed data dictionary
-            transform_config: Transform configuration rules
-            pretty_print: Whether to format XML with indentation
-            attachment_mapping: Mapping of UUIDs to attachment metadata
-            original_data: Original untransformed application data (used for attachments)
+            request: XML generation request containing application data and transform config
+            generation_plan: Plan compiled from the request's transform config, if one
+                is already cached (see load_xml_generation_plan). Compiled when not passed.
 
         Returns:
-            XML string representation of the data
+            The root element of the generated XML
         """
-        # Get XML configuration from the config metadata
-        xml_config = transform_config.get("_xml_config", {})
-        xml_structure = xml_config.get("xml_structure", {})
-        root_element_name = xml_structure.get("root_element", "SF424_4_0")
-
-        # Version is optional (SF-424 uses it, SF-424A does not)
-
-        # Get namespace configuration
-        namespace_config = xml_config.get("namespaces", {})
-        default_namespace = namespace_config.get("default", "")
-
-        # Extract namespace field mappings
-        namespace_fields = self._extract_namespace_fields(transform_config)
-
-        # Use lxml for proper namespace handling if namespaces are configured
-        if namespace_fields or default_namespace:
-            return self._generate_xml_with_namespaces(
-                data,
-                root_element_name,
-                namespace_config,
-                namespace_fields,
-                pretty_print,
-                transform_config,
-                attachment_mapping,
-                original_data,
+        if generation_plan is None:
+            generation_plan = compile_xml_generation_plan(request.transform_config)
+
+        # An empty application_data dict is valid (a form with only optional elements)
+        # and is intentionally not rejected here.
+        transformer = RecursiveXMLTransformer(request.transform_config)
+        transformed_data = transformer.transform(request.application_data)
+
+        if generation_plan.uses_namespaces:
+            root = self._build_xml_with_namespaces(
+                transformed_data,
+                generation_plan,
+                request.attachment_mapping,
+                request.application_data,
             )
         else:
-            # Fallback to simple ElementTree for backward compatibility
-            return self._generate_simple_xml(data, root_element_name, pretty_print)
+            root = self._build_simple_xml(transformed_data, generation_plan.root_element_name)
 
-    def _generate_xml_with_namespaces(
+        logger.info(
+            f"XML generation successful: {len(transformed_data)} fields transformed from {len(request.application_data)} input fields"
+        )
+
+        return root
+
+    def _generate_xml_string(self, root: lxml_etree.Element, pretty_print: bool) -> str:
+        """Generate XML string from root element."""
+        if pretty_print:
+            xml_bytes = lxml_etree.tostring(
+                root, encoding="utf-8", xml_declaration=True, pretty_print=True
+            )
+        else:
+            xml_bytes = lxml_etree.tostring(root, encoding="utf-8", xml_declaration=True)
+
+        return xml_bytes.decode("utf-8").strip()
+
+    def _build_xml_with_namespaces(
         self,
         data: dict,
-        root_element_name: str,
-        namespace_config: dict,
-        namespace_fields: dict,
-        pretty_print: bool = True,
-        transform_config: dict | None = None,
+        plan: XMLGenerationPlan,
         attachment_mapping: dict[str, AttachmentInfo] | None = None,
         original_data: dict | None = None,
-    ) -> str:
-        """Generate XML with namespace support using lxml."""
-        default_namespace = namespace_config.get("default", "")
-
-        # Get version and namespace prefix from config
-        xml_config = (transform_config or {}).get("_xml_config", {})
-        xml_structure = xml_config.get("xml_structure", {})
-        form_version = xml_structure.get("version")
-        root_namespace_prefix = xml_structure.get("root_namespace_prefix", root_element_name)
-
-        # Create namespace map for lxml with all required namespaces
-        # Use configured namespace prefix for root element (or fall back to root element name)
-        nsmap = {
-            root_namespace_prefix: default_namespace,
-        }
-
-        # Add additional namespaces
-        for prefix, uri in namespace_config.items():
-            if prefix != "default":
-                nsmap[prefix] = uri
-
-        # Add globLib namespace if any fields use it
-        if any(ns == "globLib" for ns in namespace_fields.values()):
-            nsmap["globLib"] = "http://apply.grants.gov/system/GlobalLibrary-V2.0"
+    ) -> lxml_etree.Element:
+        """Build the XML element tree with namespace support using lxml."""
+        default_namespace = plan.default_namespace
+        nsmap = plan.nsmap
 
         # Create root element with proper namespace prefix
         if default_namespace:
-            root_element_with_namespace = f"{{{default_namespace}}}{root_element_name}"
+            root_element_with_namespace = f"{{{default_namespace}}}{plan.root_element_name}"
             root = lxml_etree.Element(root_element_with_namespace, nsmap=nsmap)
 
             # Add FormVersion attribute if present (SF-424 uses this, SF-424A does not)
-            if form_version:
-                root.set(f"{{{default_namespace}}}FormVersion", form_version)
+            if plan.form_version:
+                root.set(f"{{{default_namespace}}}FormVersion", plan.form_version)
         else:
-            root = lxml_etree.Element(root_element_name, nsmap=nsmap)
+            root = lxml_etree.Element(plan.root_element_name, nsmap=nsmap)
 
         # Add root attributes from transformed data (preserved by transformer)
         # Root attributes are stored in a special key by the transformer
@@ -179,35 +150,20 @@ class XMLGenerationService:
                 if attr_value is not None:
                     root.set(attr_qualified_name, str(attr_value))
 
-        # Add data elements with namespace support in correct order
-        # Get XSD URL from config for dynamic ordering
-        xml_config = (transform_config or {}).get("_xml_config", {})
-        xsd_url = xml_config.get(
-            "xsd_url", "https://apply07.grants.gov/apply/forms/schemas/SF424_4_0-V4.0.xsd"
-        )
-
-        # Get attachment field configuration
-        attachment_field_config = xml_config.get("attachment_fields", {})
-        attachment_field_names = set(attachment_field_config.keys())
-
         # Built up front so attachments can be placed in XSD sequence position while the
         # ordered elements are emitted. Attachments use UUIDs from original_data.
         attachment_transformer = None
         if original_data is not None:
             attachment_transformer = AttachmentTransformer(
                 attachment_mapping=attachment_mapping or {},
-                attachment_field_config=attachment_field_config,
+                attachment_field_config=plan.attachment_field_config,
             )
 
+        # Add data elements with namespace support in correct order
         self._add_ordered_form_elements(
             root,
             data,
-            nsmap,
-            namespace_fields,
-            transform_config or {},
-            xsd_url,
-            attachment_field_names,
-            root_namespace_prefix,  # Use namespace prefix for lookups in nsmap
+            plan,
             attachment_transformer,
             original_data,
         )
@@ -216,140 +172,31 @@ class XMLGenerationService:
         if attachment_transformer is not None and original_data is not None:
             attachment_transformer.add_attachment_elements(root, original_data, nsmap)
 
-        # Generate XML string
-        if pretty_print:
-            xml_bytes = lxml_etree.tostring(
-                root, encoding="utf-8", xml_declaration=True, pretty_print=True
-            )
-        else:
-            xml_bytes = lxml_etree.tostring(root, encoding="utf-8", xml_declaration=True)
+        return root
 
-        return xml_bytes.decode("utf-8").strip()
-
-    def _generate_simple_xml(
-        self, data: dict, root_element_name: str, pretty_print: bool = True
-    ) -> str:
-        """Generate simple XML without namespace support (backward compatibility)."""
-        root = ET.Element(root_element_name)
+    def _build_simple_xml(self, data: dict, root_element_name: str) -> lxml_etree.Element:
+        """Build the XML element tree without namespace support."""
+        root = lxml_etree.Element(root_element_name)
 
         # Add data elements
         for field_name, value in data.items():
             self._add_element_to_parent(root, field_name, value)
 
-        # Generate XML string
-        if pretty_print:
-            ET.indent(root, space="  ")
-        xml_string = ET.tostring(root, encoding="unicode", xml_declaration=True)
-
-        return xml_string
-
-    def _extract_namespace_fields(self, transform_config: dict) -> dict[str, str]:
-        """Extract namespace configuration from transform rules.
-
-        Args:
-            transform_config: The transformation configuration dictionary
-
-        Returns:
-            Dictionary mapping field names to their namespace prefixes
-        """
-        namespace_fields = {}
-
-        def extract_from_rules(rules: dict, path: str = "") -> None:
-            """Recursively extract namespace information from rules."""
-            for key, value in rules.items():
-                if key.startswith("_"):  # Skip metadata keys
-                    continue
-
-                if isinstance(value, dict):
-                    # Check if this field has XML transform with namespace
-                    if "xml_transform" in value:
-                        xml_transform = value["xml_transform"]
-                        if "namespace" in xml_transform and "target" in xml_transform:
-                            target_name = xml_transform["target"]
-                            namespace = xml_transform["namespace"]
-                            namespace_fields[target_name] = namespace
-
-                    # Recursively check nested fields
-                    extract_from_rules(value, f"{path}.{key}" if path else key)
-
-        extract_from_rules(transform_config)
-        return namespace_fields
-
-    def _get_element_order_from_config(
-        self, transform_config: dict, nested_path: str | None = None
-    ) -> list[str]:
-        """Extract element order from transformation config based on rule definition order.
-
-        Args:
-            transform_config: The transformation configuration dictionary
-            nested_path: Optional path to nested object (e.g., "applicant_address")
-
-        Returns:
-            List of target element names in the order they're defined in config
-        """
-        element_order = []
-
-        # Navigate to nested config if path is provided
-        config_to_process = transform_config
-        if nested_path:
-            # Split path and navigate (e.g., "applicant_address" -> nested rules)
-            if nested_path in transform_config:
-                config_to_process = transform_config[nested_path]
-
-        # Extract target element names from xml_transform rules in order
-        for key, value in config_to_process.items():
-            # Skip metadata and non-transform fields
-            if key.startswith("_") or not isinstance(value, dict):
-                continue
-
-            xml_transform = value.get("xml_transform")
-            if xml_transform and isinstance(xml_transform, dict):
-                # Handle conditional transforms (e.g., one-to-many)
-                if xml_transform.get("type") == "conditional":
-                    conditional_transform = xml_transform.get("conditional_transform", {})
-                    conditional_type = conditional_transform.get("type")
-
-                    if conditional_type == "one_to_many":
-                        # Expand one-to-many pattern into actual field names
-                        target_pattern = conditional_transform.get("target_pattern")
-                        max_count = conditional_transform.get("max_count", 10)
-                        if target_pattern:
-                            for i in range(1, max_count + 1):
-                                field_name = target_pattern.format(index=i)
-                                element_order.append(field_name)
-                    elif conditional_type == "array_decomposition" and not xml_transform.get(
-                        "target"
-                    ):
-                        # Array decomposition without target spreads fields - add output field names
-                        field_mappings = conditional_transform.get("field_mappings", {})
-                        for output_field_name in field_mappings.keys():
-                            element_order.append(output_field_name)
-                    else:
-                        # Other conditional types - use target if available
-                        target = xml_transform.get("target")
-                        if target:
-                            element_order.append(target)
-                else:
-                    # Regular transform - use target
-                    target = xml_transform.get("target")
-                    if target:
-                        element_order.append(target)
-
-        return element_order
+        return root
 
     def _add_lxml_element_to_parent(
         self,
         parent: Any,
         field_name: str,
         value: Any,
-        nsmap: dict,
-        namespace_fields: dict,
-        xsd_url: str | None = None,
-        transform_config: dict | None = None,
-        root_element_name: str | None = None,
+        plan: XMLGenerationPlan,
         attributes: dict[str, str] | None = None,
     ) -> None:
         """Add an element to a parent using lxml with proper namespace handling."""
+        nsmap = plan.nsmap
+        namespace_fields = plan.namespace_fields
+        root_namespace_prefix = plan.root_namespace_prefix
+
         if isinstance(value, list):
             # Items with __wrapper: field_name is an outer container (BudgetSummary > SummaryLineItem).
             # Items without __wrapper: each item is emitted as field_name (multiple OtherSite siblings).
@@ -362,7 +209,7 @@ class XMLGenerationService:
                     ns_prefix = namespace_fields[el_name]
                     ns_uri = nsmap.get(ns_prefix, "")
                     return lxml_etree.SubElement(parent_el, f"{{{ns_uri}}}{el_name}")
-                default_ns = nsmap.get(root_element_name or "", "") if root_element_name else ""
+                default_ns = plan.default_namespace_uri
                 if default_ns:
                     return lxml_etree.SubElement(parent_el, f"{{{default_ns}}}{el_name}")
                 return lxml_etree.SubElement(parent_el, el_name)
@@ -397,8 +244,8 @@ class XMLGenerationService:
                                     item_element.set(attr_name, str(attr_value))
                             else:
                                 # For non-namespaced attributes, add namespace prefix
-                                if root_element_name and root_element_name in nsmap:
-                                    attr_qname = f"{{{nsmap[root_element_name]}}}{attr_name}"
+                                if root_namespace_prefix in nsmap:
+                                    attr_qname = f"{{{nsmap[root_namespace_prefix]}}}{attr_name}"
                                     item_element.set(attr_qname, str(attr_value))
                                 else:
                                     item_element.set(attr_name, str(attr_value))
@@ -407,14 +254,7 @@ class XMLGenerationService:
                     for data_field, data_value in item_data.items():
                         if data_value is not None:
                             self._add_lxml_element_to_parent(
-                                item_element,
-                                data_field,
-                                data_value,
-                                nsmap,
-                                namespace_fields,
-                                xsd_url,
-                                transform_config,
-                                root_element_name,
+                                item_element, data_field, data_value, plan
                             )
                 else:
                     # Simple value in array
@@ -441,9 +281,7 @@ class XMLGenerationService:
             explicit_ns = value.get("__namespace__")
             if explicit_ns is not None:
                 if explicit_ns == "default":
-                    namespace_uri = (
-                        nsmap.get(root_element_name or "", "") if root_element_name else ""
-                    )
+                    namespace_uri = plan.default_namespace_uri
                 else:
                     namespace_uri = nsmap.get(explicit_ns, "")
                 element_name = f"{{{namespace_uri}}}{field_name}" if namespace_uri else field_name
@@ -453,18 +291,14 @@ class XMLGenerationService:
                 # __namespace__ (simple values, legacy nested objects without a namespace key)
                 namespace_prefix = namespace_fields[field_name]
                 if namespace_prefix == "default":
-                    namespace_uri = (
-                        nsmap.get(root_element_name or "", "") if root_element_name else ""
-                    )
+                    namespace_uri = plan.default_namespace_uri
                 else:
                     namespace_uri = nsmap.get(namespace_prefix, "")
                 element_name = f"{{{namespace_uri}}}{field_name}" if namespace_uri else field_name
                 nested_element = lxml_etree.SubElement(parent, element_name)
             else:
                 # Use default namespace (derived from root element name)
-                default_namespace_uri = (
-                    nsmap.get(root_element_name or "", "") if root_element_name else ""
-                )
+                default_namespace_uri = plan.default_namespace_uri
                 if default_namespace_uri:
                     element_name = f"{{{default_namespace_uri}}}{field_name}"
                     nested_element = lxml_etree.SubElement(parent, element_name)
@@ -496,9 +330,7 @@ class XMLGenerationService:
                                 nested_element.set(attr_name, str(attr_value))
                         else:
                             # Use default namespace if available
-                            default_namespace_uri = (
-                                nsmap.get(root_element_name or "", "") if root_element_name else ""
-                            )
+                            default_namespace_uri = plan.default_namespace_uri
                             if default_namespace_uri:
                                 attr_qname = f"{{{default_namespace_uri}}}{attr_name}"
                                 nested_element.set(attr_qname, str(attr_value))
@@ -507,17 +339,7 @@ class XMLGenerationService:
 
             # Special handling for Applicant address to ensure correct sequence order
             if field_name == "Applicant":
-                if not xsd_url:
-                    raise ValueError("XSD URL is required for address element ordering")
-                self._add_ordered_address_elements(
-                    nested_element,
-                    value,
-                    nsmap,
-                    namespace_fields,
-                    transform_config or {},
-                    xsd_url,
-                    root_element_name,
-                )
+                self._add_ordered_address_elements(nested_element, value, plan)
             else:
                 for nested_field, nested_value in value.items():
                     # Skip special metadata keys (like __wrapper, __attributes, etc.)
@@ -532,11 +354,7 @@ class XMLGenerationService:
                             nested_element,
                             nested_field,
                             nested_value,
-                            nsmap,
-                            namespace_fields,
-                            xsd_url,
-                            transform_config,
-                            root_element_name,
+                            plan,
                             nested_attributes,
                         )
         elif value == "INCLUDE_NULL_MARKER" or value is None:
@@ -549,9 +367,7 @@ class XMLGenerationService:
                     element_name = f"{{{namespace_uri}}}{field_name}"
                     lxml_etree.SubElement(parent, element_name)
                 else:
-                    default_namespace_uri = (
-                        nsmap.get(root_element_name or "", "") if root_element_name else ""
-                    )
+                    default_namespace_uri = plan.default_namespace_uri
                     if default_namespace_uri:
                         element_name = f"{{{default_namespace_uri}}}{field_name}"
                         lxml_etree.SubElement(parent, element_name)
@@ -566,9 +382,7 @@ class XMLGenerationService:
                 element_name = f"{{{namespace_uri}}}{field_name}"
                 element = lxml_etree.SubElement(parent, element_name)
             else:
-                default_namespace_uri = (
-                    nsmap.get(root_element_name or "", "") if root_element_name else ""
-                )
+                default_namespace_uri = plan.default_namespace_uri
                 if default_namespace_uri:
                     element_name = f"{{{default_namespace_uri}}}{field_name}"
                     element = lxml_etree.SubElement(parent, element_name)
@@ -595,24 +409,15 @@ class XMLGenerationService:
         self,
         parent: Any,
         address_data: dict,
-        nsmap: dict,
-        namespace_fields: dict,
-        transform_config: dict,
-        xsd_url: str,
-        root_element_name: str | None,
+        plan: XMLGenerationPlan,
     ) -> None:
         """Add address elements in the correct sequence order.
 
         Uses config-based ordering from transform rules. Element order is derived from
         the order fields are defined in the transform configuration.
         """
-        # Get element order from config
-        address_order = self._get_element_order_from_config(
-            transform_config, nested_path="applicant"
-        )
-
         # Add elements in the correct order
-        for field_name in address_order:
+        for field_name in plan.applicant_element_order:
             if field_name in address_data:
                 field_value = address_data[field_name]
                 if field_value is not None:
@@ -620,27 +425,14 @@ class XMLGenerationService:
                     attr_key = f"__{field_name}__attributes"
                     attributes = address_data.get(attr_key, None)
                     self._add_lxml_element_to_parent(
-                        parent,
-                        field_name,
-                        field_value,
-                        nsmap,
-                        namespace_fields,
-                        xsd_url,
-                        transform_config,
-                        root_element_name,
-                        attributes,
+                        parent, field_name, field_value, plan, attributes
                     )
 
     def _add_ordered_form_elements(
         self,
         root: Any,
         data: dict,
-        nsmap: dict,
-        namespace_fields: dict,
-        transform_config: dict,
-        xsd_url: str,
-        attachment_fields: set[str] | None = None,
-        root_element_name: str | None = None,
+        plan: XMLGenerationPlan,
         attachment_transformer: AttachmentTransformer | None = None,
         original_data: dict | None = None,
     ) -> None:
@@ -652,22 +444,14 @@ class XMLGenerationService:
         Args:
             root: Root XML element
             data: Data dictionary
-            nsmap: Namespace map
-            namespace_fields: Field to namespace mapping
-            transform_config: Transformation configuration dictionary
-            xsd_url: URL to XSD schema (kept for backward compatibility, not used)
-            attachment_fields: Set of field names that are attachments (handled separately)
-            root_element_name: Root element name (used as default namespace key)
+            plan: Generation plan holding the element order, namespaces and
+                attachment fields of the form
             attachment_transformer: Transformer used to emit attachment elements in
                 their sequence position; when None, attachments are handled by the caller.
             original_data: Untransformed application data holding attachment UUIDs.
         """
-        # Default attachment fields if not provided (for backward compatibility)
-        if attachment_fields is None:
-            attachment_fields = set()
-
-        # Get element order from transform configuration
-        sf424_order = self._get_element_order_from_config(transform_config)
+        attachment_fields = plan.attachment_field_names
+        sf424_order = plan.element_order
 
         # Add elements in the correct order (skip attachment fields and special keys)
         for field_name in sf424_order:
@@ -679,7 +463,7 @@ class XMLGenerationService:
             if field_name in attachment_fields:
                 if attachment_transformer is not None and original_data is not None:
                     attachment_transformer.add_attachment_field(
-                        root, field_name, original_data, nsmap
+                        root, field_name, original_data, plan.nsmap
                     )
                 continue
 
@@ -690,15 +474,7 @@ class XMLGenerationService:
                     attr_key = f"__{field_name}__attributes"
                     attributes = data.get(attr_key, None)
                     self._add_lxml_element_to_parent(
-                        root,
-                        field_name,
-                        field_value,
-                        nsmap,
-                        namespace_fields,
-                        xsd_url,
-                        transform_config,
-                        root_element_name,
-                        attributes,
+                        root, field_name, field_value, plan, attributes
                     )
 
         # Add any remaining fields that weren't in the predefined order (skip attachment and attribute metadata)
@@ -712,30 +488,22 @@ class XMLGenerationService:
                 # Check for attributes stored with special key
                 attr_key = f"__{field_name}__attributes"
                 attributes = data.get(attr_key, None)
-                self._add_lxml_element_to_parent(
-                    root,
-                    field_name,
-                    field_value,
-                    nsmap,
-                    namespace_fields,
-                    xsd_url,
-                    transform_config,
-                    root_element_name,
-                    attributes,
-                )
-
-    def _add_element_to_parent(self, parent: ET.Element, field_name: str, value: Any) -> None:
+                self._add_lxml_element_to_parent(root, field_name, field_value, plan, attributes)
+
+    def _add_element_to_parent(
+        self, parent: lxml_etree.Element, field_name: str, value: Any
+    ) -> None:
         """Add an element to a parent, handling both simple values and nested dictionaries."""
         if isinstance(value, dict):
             # Create nested element for dictionary values
-            nested_element = ET.SubElement(parent, field_name)
+            nested_element = lxml_etree.SubElement(parent, field_name)
             for nested_field, nested_value in value.items():
                 if nested_value is not None:
                     self._add_element_to_parent(nested_element, nested_field, nested_value)
         elif value is None:
             # Create empty element for None values (when include_null is configured)
-            ET.SubElement(parent, field_name)
+            lxml_etree.SubElement(parent, field_name)
         else:
             # Simple value - create element with text content
-            element = ET.SubElement(parent, field_name)
+            element = lxml_etree.SubElement(parent, field_name)
             element.text = str(value)
@@ -8,15 +8,15 @@ from lxml import etree as lxml_etree
 from src.db.models.competition_models import Application, ApplicationForm, ApplicationSubmission
 from src.form_schema.forms import init_form_registry
 from src.services.applications.application_validation import is_form_required
-from src.services.xml_generation.config import load_xml_transform_config
+from src.services.xml_generation.config import load_xml_generation_plan
 from src.services.xml_generation.constants import (
     GRANTS_GOV_NAMESPACES,
     SCHEMA_LOCATION_BASE_URL,
     Namespace,
 )
 from src.services.xml_generation.header_generator import (
-    generate_application_footer_xml,
-    generate_application_header_xml,
+    generate_application_footer_element,
+    generate_application_header_element,
 )
 from src.services.xml_generation.models import XMLGenerationRequest
 from src.services.xml_generation.service import XMLGenerationService
@@ -89,10 +89,9 @@ class SubmissionXMLAssembler:
             )
             return None
 
-        # Generate header XML
-        header_xml_str = generate_application_header_xml(
-            self.application, pretty_print=pretty_print
-        )
+        # The header, forms and footer are built as elements of a single tree, which
+        # is only serialized once it's complete
+        header_element = generate_application_header_element(self.application)
 
         # Generate form XMLs
         form_xml_elements = []
@@ -107,8 +106,7 @@ class SubmissionXMLAssembler:
             )
 
             try:
-                form_xml = self._generate_form_xml(app_form, pretty_print)
-                form_xml_elements.append(form_xml)
+                form_xml_elements.append(self._generate_form_element(app_form))
             except Exception:
                 logger.exception(
                     f"Failed to generate XML for form {form_name}",
@@ -127,14 +125,13 @@ class SubmissionXMLAssembler:
             )
             return None
 
-        # Generate footer XML
-        footer_xml_str = generate_application_footer_xml(
-            self.application, self.application_submission, pretty_print=pretty_print
+        footer_element = generate_application_footer_element(
+            self.application, self.application_submission
         )
 
         # Assemble complete XML
         complete_xml = self._assemble_xml_components(
-            header_xml_str, form_xml_elements, footer_xml_str, pretty_print
+            header_element, form_xml_elements, footer_element, pretty_print
         )
 
         logger.info(
@@ -147,45 +144,38 @@ class SubmissionXMLAssembler:
 
         return complete_xml
 
-    def _generate_form_xml(self, app_form: Any, pretty_print: bool = False) -> str:
-        """Generate XML for a single application form."""
+    def _generate_form_element(self, app_form: Any) -> lxml_etree.Element:
+        """Generate the XML element of a single application form."""
         form_name = app_form.form.short_form_name
         attachment_mapping = self.attachment_mapping
+        generation_plan = load_xml_generation_plan(form_name)
 
         request = XMLGenerationRequest(
             application_data=app_form.application_response,
-            transform_config=load_xml_transform_config(form_name),
-            pretty_print=pretty_print,
+            transform_config=generation_plan.transform_config if generation_plan else {},
             attachment_mapping=attachment_mapping,
         )
 
-        response = self.xml_service.generate_xml(request)
-
-        if not response.success or response.xml_data is None:
+        try:
+            return self.xml_service.generate_xml_element(request, generation_plan)
+        except Exception as e:
             logger.error(
-                f"Failed to generate XML for form {form_name}: {response.error_message}",
+                f"Failed to generate XML for form {form_name}: {e}",
                 extra={
                     "application_id": self.application.application_id,
                     "form_name": form_name,
                 },
             )
-            raise Exception(f"XML generation failed for form {form_name}: {response.error_message}")
-
-        return response.xml_data
+            raise Exception(f"XML generation failed for form {form_name}: {e}") from e
 
     def _assemble_xml_components(
         self,
-        header_xml: str,
-        form_xmls: list[str],
-        footer_xml: str,
+        header_element: lxml_etree.Element,
+        form_elements: list[lxml_etree.Element],
+        footer_element: lxml_etree.Element,
         pretty_print: bool,
     ) -> str:
         """Assemble header, forms, and footer into complete XML structure."""
-        # Parse individual XML components
-        header_element = self._parse_xml_string(header_xml)
-        footer_element = self._parse_xml_string(footer_xml)
-        form_elements = [self._parse_xml_string(xml) for xml in form_xmls]
-
         # Create root element with namespaces
         # Add all required namespaces per Grants.gov specification
         grant_ns = Namespace.GRANT
@@ -204,7 +194,7 @@ class SubmissionXMLAssembler:
                 schema_location,
             )
 
-        # Add header (must strip XML declaration and use just the element)
+        # Add header
         root.append(header_element)
 
         # Add Forms wrapper with grant: namespace prefix for consistency with legacy
@@ -277,15 +267,3 @@ class SubmissionXMLAssembler:
         # Construct XSD filename with 'opp' prefix + opportunity number + optional CFDA suffix
         xsd_filename = f"opp{opportunity_number}{cfda_suffix}.xsd"
         return f"{SCHEMA_LOCATION_BASE_URL}/{xsd_filename}"
-
-    def _parse_xml_string(self, xml_string: str) -> lxml_etree.Element:
-        """Parse XML string into element tree."""
-        try:
-            # Parse the XML string
-            parser = lxml_etree.XMLParser(remove_blank_text=True)
-            root = lxml_etree.fromstring(xml_string.encode("utf-8"), parser=parser)
-            return root
-        except Exception:
-            # Don't log exception details as they may contain PII from the XML
-            logger.error("Failed to parse XML string")
-            raise ValueError("Invalid XML string - parsing failed") from None
@@ -1,6 +1,10 @@
 """XSD validation utilities for XML generation testing."""
 
+import hashlib
 import logging
+import pickle
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +14,22 @@ from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# Written to the XSD directory by the precompile-xsds task
+COMPILED_SCHEMAS_FILENAME = "compiled_schemas.pickle"
+
+# Compiling an XSD schema takes far longer than validating against it, so compiled
+# schemas are shared by every validator in the process. Schemas are keyed by the
+# resolved XSD directory their imports are resolved from and the resolved path of
+# their XSD file, import locations by the resolved XSD directory.
+# Compiled schemas are never modified, so they can be used across threads.
+_compiled_schemas: dict[tuple[str, str], xmlschema.XMLSchema] = {}
+_local_locations: dict[str, dict[str, str]] = {}
+_loaded_precompiled_dirs: set[str] = set()
+# A lock per XSD directory and per schema, so compiling one schema doesn't
+# hold up any other. The global lock only guards creating those locks.
+_schema_locks: dict[str | tuple[str, str], threading.Lock] = {}
+_schema_cache_lock = threading.Lock()
+
 
 class XSDValidationError(Exception):
     """Exception raised when XSD validation fails."""
@@ -17,6 +37,128 @@ class XSDValidationError(Exception):
     pass
 
 
+def _build_local_locations(xsd_dir: Path) -> dict[str, str]:
+    """Build a namespace-to-local-path map from XSD files in xsd_dir.
+
+    This lets xmlschema resolve imports from local files instead of fetching
+    remote URLs, making validation faster and offline-capable.
+    """
+    locations: dict[str, str] = {}
+    for xsd_file in xsd_dir.glob("*.xsd"):
+        try:
+            tree = ET.parse(str(xsd_file))
+            root = tree.getroot()
+            ns = root.get("targetNamespace")
+            if ns:
+                locations[ns] = str(xsd_file)
+        except Exception as e:
+            logger.warning("Failed to parse XSD file for locations map: %s (%s)", xsd_file, e)
+    return locations
+
+
+def _get_schema_lock(key: str | tuple[str, str]) -> threading.Lock:
+    with _schema_cache_lock:
+        return _schema_locks.setdefault(key, threading.Lock())
+
+
+def _get_xsd_dir_fingerprint(xsd_dir: Path) -> str:
+    """Hash the XSD files in xsd_dir, to tell whether precompiled schemas are out of date.
+
+    The xmlschema version is included, as schemas pickled by another version may not
+    be compatible with the one installed.
+    """
+    digest = hashlib.sha256()
+    digest.update(xmlschema.__version__.encode("utf-8"))
+    for xsd_file in sorted(xsd_dir.glob("*.xsd")):
+        digest.update(xsd_file.name.encode("utf-8"))
+        digest.update(xsd_file.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_precompiled_schemas(xsd_dir: Path) -> None:
+    """Add the schemas written by precompile_schemas to the cache.
+
+    The precompiled schemas are skipped if the XSD files or the xmlschema version
+    changed after they were written, in which case schemas are compiled as they are needed.
+    """
+    compiled_schemas_path = xsd_dir / COMPILED_SCHEMAS_FILENAME
+    if not compiled_schemas_path.exists():
+        return
+
+    try:
+        # The file is only ever written by the precompile-xsds task at build time
+        with compiled_schemas_path.open("rb") as compiled_schemas_file:
+            fingerprint, schemas = pickle.load(compiled_schemas_file)
+    except Exception as e:
+        logger.warning("Failed to load precompiled XSD schemas: %s (%s)", compiled_schemas_path, e)
+        return
+
+    if fingerprint != _get_xsd_dir_fingerprint(xsd_dir):
+        logger.warning("Precompiled XSD schemas are out of date: %s", compiled_schemas_path)
+        return
+
+    for xsd_filename, schema in schemas.items():
+        _compiled_schemas.setdefault((str(xsd_dir), str(xsd_dir / xsd_filename)), schema)
+
+    logger.info(f"Loaded {len(schemas)} precompiled XSD schemas from: {compiled_schemas_path}")
+
+
+def get_compiled_schema(xsd_path: Path, xsd_dir: Path) -> xmlschema.XMLSchema:
+    """Get the compiled schema of an XSD file, compiling it if it isn't cached.
+
+    Imports are resolved from the XSD files in xsd_dir. Schemas precompiled for
+    xsd_dir are loaded the first time a schema is needed from it.
+    """
+    xsd_dir = xsd_dir.resolve()
+    cache_key = (str(xsd_dir), str(xsd_path.resolve()))
+    schema = _compiled_schemas.get(cache_key)
+    if schema is not None:
+        return schema
+
+    with _get_schema_lock(str(xsd_dir)):
+        if str(xsd_dir) not in _loaded_precompiled_dirs:
+            _loaded_precompiled_dirs.add(str(xsd_dir))
+            _load_precompiled_schemas(xsd_dir)
+
+        locations = _local_locations.get(str(xsd_dir))
+        if locations is None:
+            locations = _build_local_locations(xsd_dir)
+            _local_locations[str(xsd_dir)] = locations
+
+    with _get_schema_lock(cache_key):
+        schema = _compiled_schemas.get(cache_key)
+        if schema is not None:
+            return schema
+
+        logger.info(f"Loading XSD schema from: {xsd_path}")
+        schema = xmlschema.XMLSchema(str(xsd_path), locations=locations)
+        _compiled_schemas[cache_key] = schema
+        return schema
+
+
+def precompile_schemas(xsd_dir: Path, xsd_filenames: Iterable[str]) -> Path:
+    """Compile XSD schemas and write them to the XSD directory.
+
+    Validators load the written schemas rather than compiling them, as long as
+    the XSD files haven't changed since. Run at build time so processes start
+    with the schemas already compiled.
+
+    Returns:
+        Path of the written file of compiled schemas
+    """
+    xsd_dir = xsd_dir.resolve()
+    schemas = {
+        xsd_filename: get_compiled_schema(xsd_dir / xsd_filename, xsd_dir)
+        for xsd_filename in sorted(set(xsd_filenames))
+    }
+
+    compiled_schemas_path = xsd_dir / COMPILED_SCHEMAS_FILENAME
+    with compiled_schemas_path.open("wb") as compiled_schemas_file:
+        pickle.dump((_get_xsd_dir_fingerprint(xsd_dir), schemas), compiled_schemas_file)
+
+    return compiled_schemas_path
+
+
 class XSDValidator:
     """Validates XML against XSD schemas.
 
@@ -42,26 +184,6 @@ class XSDValidator:
                 "Run 'flask task fetch-xsds' to download XSD files first."
             )
 
-        self._schemas: dict[str, xmlschema.XMLSchema] = {}
-
-    def _build_local_locations(self) -> dict[str, str]:
-        """Build a namespace-to-local-path map from XSD files in xsd_dir.
-
-        This lets xmlschema resolve imports from local files instead of fetching
-        remote URLs, making validation faster and offline-capable.
-        """
-        locations: dict[str, str] = {}
-        for xsd_file in self.xsd_dir.glob("*.xsd"):
-            try:
-                tree = ET.parse(str(xsd_file))
-                root = tree.getroot()
-                ns = root.get("targetNamespace")
-                if ns:
-                    locations[ns] = str(xsd_file)
-            except Exception as e:
-                logger.warning("Failed to parse XSD file for locations map: %s (%s)", xsd_file, e)
-        return locations
-
     def get_xsd_path(self, form_name: str) -> Path:
         """Get the path to a stored XSD file.
 
@@ -88,6 +210,8 @@ class XSDValidator:
     def load_schema(self, xsd_path: str | Path) -> xmlschema.XMLSchema:
         """Load an XSD schema from a file path.
 
+        Schemas are compiled once per process, see get_compiled_schema.
+
         Args:
             xsd_path: Path to the XSD file
 
@@ -99,20 +223,11 @@ class XSDValidator:
         """
         xsd_path = Path(xsd_path)
 
-        # Check cache first
-        cache_key = str(xsd_path)
-        if cache_key in self._schemas:
-            return self._schemas[cache_key]
-
         if not xsd_path.exists():
             raise XSDValidationError(f"XSD file not found: {xsd_path}")
 
         try:
-            logger.info(f"Loading XSD schema from: {xsd_path}")
-            locations = self._build_local_locations()
-            schema = xmlschema.XMLSchema(str(xsd_path), locations=locations)
-            self._schemas[cache_key] = schema
-            return schema
+            return get_compiled_schema(xsd_path, self.xsd_dir)
 
         except Exception as e:
             raise XSDValidationError(f"Failed to load XSD schema from {xsd_path}: {e}") from e
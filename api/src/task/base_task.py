@@ -1,7 +1,9 @@
 import abc
+import contextlib
 import itertools
 import logging
 import time
+from collections.abc import Generator
 from enum import StrEnum
 from typing import Any
 
@@ -87,6 +89,22 @@ class BaseTask(abc.ABC, metaclass=abc.ABCMeta):
             # Rather than re-implement the above, just re-use the function without a prefix
             self.increment(f"{prefix}.{name}", value, prefix=None)
 
+    @contextlib.contextmanager
+    def record_duration(self, name: str) -> Generator[None]:
+        """
+        Time the wrapped block and add it to a {name}_duration_sec metric.
+
+        Usage:
+            with self.record_duration("load_records"):
+                self.load_records()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = round(time.perf_counter() - start, 3)
+            self.increment(f"{name}_duration_sec", duration)
+
     def _log_metrics(self, duration: float) -> None:
         """Log metrics out, handling metrics if they exceed the maximum number of reportable metrics."""
 
@@ -1,15 +1,18 @@
+import itertools
 import logging
 import uuid
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from grants_shared.adapters import db
 
-from src.adapters.aws.local_email_adapter import send_email_to_address
+from src.adapters.aws.local_email_adapter import LocalEmailConfig, send_email_to_address
 from src.db.models.user_models import UserNotificationLog
 from src.task.notifications import constants
 from src.task.notifications.config import EmailNotificationConfig, get_email_config
 from src.task.notifications.constants import Metrics, UserEmailNotification
 from src.task.task import Task
+from src.util.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -39,27 +42,65 @@ class BaseNotificationTask(Task):
 
     @abstractmethod
     def post_notifications_process(self, notifications: list[UserEmailNotification]) -> None:
-        """Fetch collected notifications and prepare email data."""
+        """Record the results of a batch of sent notifications, called once per committed batch"""
         pass
 
     def send_notifications(self, notifications: list[UserEmailNotification]) -> None:
-        """Send collected notifications to users"""
+        """
+        Send collected notifications to users
+
+        Emails are sent from a pool of threads, limited to the configured send rate.
+        Each batch of notifications has its logs and then its post-processing committed
+        once sent, so a failure partway through doesn't re-send or roll back earlier
+        batches, and a post-processing failure doesn't lose the record of what was sent.
+        """
+        rate_limiter = TokenBucket(self.notification_config.notification_send_rate_per_sec)
+        email_config = LocalEmailConfig()
+
+        with ThreadPoolExecutor(
+            max_workers=self.notification_config.notification_send_thread_count
+        ) as executor:
+            for notification_batch in itertools.batched(
+                notifications, self.notification_config.notification_commit_batch_size, strict=False
+            ):
+                self._send_notification_batch(
+                    list(notification_batch), executor, rate_limiter, email_config
+                )
+
+    def _send_notification_batch(
+        self,
+        notifications: list[UserEmailNotification],
+        executor: ThreadPoolExecutor,
+        rate_limiter: TokenBucket,
+        email_config: LocalEmailConfig,
+    ) -> None:
+        # Start all of the sends before waiting on any of them
+        pending_sends: list[tuple[UserEmailNotification, str, Future[str] | None]] = []
         for user_notification in notifications:
             trace_id = str(uuid.uuid4())
             logger.info(
                 "Sending notification to user",
                 extra={"user_id": user_notification.user_id, "ses_trace_id": trace_id},
             )
-            notification_log = UserNotificationLog(
-                user_notification_log_id=uuid.uuid4(),
-                user_id=user_notification.user_id,
-                notification_reason=user_notification.notification_reason,
-                notification_sent=False,  # Default to False, update on success
-            )
-            self.db_session.add(notification_log)
 
-            try:
-                if self.notification_config.reset_emails_without_sending:
+            future = None
+            if not self.notification_config.reset_emails_without_sending:
+                future = executor.submit(
+                    self._send_email, user_notification, trace_id, rate_limiter, email_config
+                )
+            pending_sends.append((user_notification, trace_id, future))
+
+        with self.db_session.begin():
+            for user_notification, trace_id, future in pending_sends:
+                notification_log = UserNotificationLog(
+                    user_notification_log_id=uuid.uuid4(),
+                    user_id=user_notification.user_id,
+                    notification_reason=user_notification.notification_reason,
+                    notification_sent=False,  # Default to False, update on success
+                )
+                self.db_session.add(notification_log)
+
+                if future is None:
                     self.increment(Metrics.NOTIFICATIONS_RESET)
                     logger.info(
                         "Skipping notification to user due to reset flag",
@@ -74,15 +115,22 @@ class BaseNotificationTask(Task):
                     # that opportunity version change notifications check
                     notification_log.notification_sent = True
                     user_notification.is_notified = True
-
-                    return
-
-                message_id = send_email_to_address(
-                    to_address=user_notification.user_email,
-                    subject=user_notification.subject,
-                    message=user_notification.content,
-                    trace_id=trace_id,
-                )
+                    continue
+
+                try:
+                    message_id = future.result()
+                except Exception:
+                    # Notification log will be updated in the post notification process
+                    logger.exception(
+                        "Failed to send notification email",
+                        extra={
+                            "user_id": user_notification.user_id,
+                            "notification_reason": user_notification.notification_reason,
+                            "ses_trace_id": trace_id,
+                        },
+                    )
+                    self.increment(Metrics.FAILED_TO_SEND)
+                    continue
 
                 logger.info(
                     "Successfully delivered notification to user",
@@ -99,21 +147,61 @@ class BaseNotificationTask(Task):
 
                 self.increment(Metrics.USERS_NOTIFIED)
 
+        with self.db_session.begin():
+            self._post_process_batch(notifications)
+
+    def _post_process_batch(self, notifications: list[UserEmailNotification]) -> None:
+        """
+        Post-process a batch of sent notifications, falling back to one notification
+        at a time if the batch fails so only the notifications that can't be
+        post-processed are left to be collected (and sent) again on the next run.
+        """
+        try:
+            with self.db_session.begin_nested():
+                self.post_notifications_process(notifications)
+            return
+        except Exception:
+            logger.exception(
+                "Failed to post-process notification batch, retrying each notification",
+                extra={"notification_count": len(notifications)},
+            )
+
+        for user_notification in notifications:
+            try:
+                with self.db_session.begin_nested():
+                    self.post_notifications_process([user_notification])
             except Exception:
-                # Notification log will be updated in the post notification process
                 logger.exception(
-                    "Failed to send notification email",
+                    "Failed to post-process notification",
                     extra={
                         "user_id": user_notification.user_id,
                         "notification_reason": user_notification.notification_reason,
-                        "ses_trace_id": trace_id,
+                        "is_notified": user_notification.is_notified,
                     },
                 )
-                self.increment(Metrics.FAILED_TO_SEND)
+                self.increment(Metrics.FAILED_TO_POST_PROCESS)
+
+    def _send_email(
+        self,
+        user_notification: UserEmailNotification,
+        trace_id: str,
+        rate_limiter: TokenBucket,
+        email_config: LocalEmailConfig,
+    ) -> str:
+        """Send a single email, runs in a worker thread so must not touch the DB session"""
+        rate_limiter.acquire()
+        return send_email_to_address(
+            to_address=user_notification.user_email,
+            subject=user_notification.subject,
+            message=user_notification.content,
+            trace_id=trace_id,
+            config=email_config,
+        )
 
     def run_task(self) -> None:
         """Override to define the task logic"""
+        # Commit what was collected before sending so a crash mid-send doesn't retry and duplicate emails
         with self.db_session.begin():
             notifications = self.collect_email_notifications()
-            self.send_notifications(notifications)
-            self.post_notifications_process(notifications)
+
+        self.send_notifications(notifications)
@@ -17,6 +17,22 @@ class EmailNotificationConfig(PydanticBaseEnvConfig):
     enable_search_notifications: bool = Field(default=True, alias="ENABLE_SEARCH_NOTIFICATIONS")
     reset_emails_without_sending: bool = Field(default=True, alias="RESET_EMAILS_WITHOUT_SENDING")
     sync_suppressed_emails: bool = Field(default=True, alias="SYNC_SUPPRESSED_EMAILS")
+    # Emails are sent in parallel, limited to the SES send rate, and the results
+    # are committed to the DB after each batch of notifications is sent
+    notification_send_thread_count: int = Field(default=8, alias="NOTIFICATION_SEND_THREAD_COUNT")
+    notification_send_rate_per_sec: float = Field(
+        default=14, alias="NOTIFICATION_SEND_RATE_PER_SEC"
+    )
+    notification_commit_batch_size: int = Field(default=100, alias="NOTIFICATION_COMMIT_BATCH_SIZE")
+    # How many distinct saved search queries to send to OpenSearch in a single multi-search
+    search_notification_msearch_batch_size: int = Field(
+        default=50, alias="SEARCH_NOTIFICATION_MSEARCH_BATCH_SIZE"
+    )
+    # How many of the newest opportunity IDs per saved search to check for new opportunities,
+    # the full search results are still stored to compare against on the next run
+    search_notification_result_size: int = Field(
+        default=25, alias="SEARCH_NOTIFICATION_RESULT_SIZE"
+    )
 
 
 # Singleton instance to avoid refetching env vars on every request
@@ -20,6 +20,7 @@ class Metrics(StrEnum):
     ORG_SAVED_OPPORTUNITIES_TRACKED = "org_saved_opportunities_tracked"
     USERS_NOTIFIED = "users_notified"
     FAILED_TO_SEND = "failed_to_send"
+    FAILED_TO_POST_PROCESS = "failed_to_post_process"
     NOTIFICATIONS_RESET = "notifications_reset"
     SUPPRESSED_DESTINATION_COUNT = "suppressed_destination_count"
     NOTIFICATIONS_SKIPPED_EMAIL_DISABLED = "notifications_skipped_email_disabled"
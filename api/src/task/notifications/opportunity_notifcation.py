@@ -9,7 +9,8 @@ from grants_shared.adapters import db
 from grants_shared.util import datetime_util
 from grants_shared.util.dict_util import diff_nested_dicts
 from grants_shared.util.string_utils import truncate_html_inline
-from sqlalchemy import and_, desc, exists, func, select, tuple_, update
+from sqlalchemy import and_, bindparam, column, desc, exists, func, select, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import aliased, selectinload
 
 from src.api.opportunities_v1.opportunity_schemas import OpportunityVersionV1Schema
@@ -97,6 +98,9 @@ UTM_TAG = "?utm_source=notification&utm_medium=email&utm_campaign=opportunity_up
 class OpportunityNotificationTask(BaseNotificationTask):
     def __init__(self, db_session: db.Session, notification_config: EmailNotificationConfig):
         super().__init__(db_session, notification_config)
+        # The sections built for an opportunity only depend on the two versions being
+        # compared, so they're built once and shared by every user following it
+        self._sections_cache: dict[tuple[UUID, UUID], str] = {}
 
     def collect_email_notifications(self) -> list[UserEmailNotification]:
         """Collect notifications for changed opportunities that users are tracking"""
@@ -106,8 +110,9 @@ class OpportunityNotificationTask(BaseNotificationTask):
             logger.info("No user-opportunity tracking records found.")
             return []
 
-        changed_saved_opportunities: list[ChangedSavedOpportunity] = []
-        user_opportunity_pairs: list = []
+        # Group the changed opportunities by user
+        changed_opportunities_by_user: dict[UUID, ChangedSavedOpportunity] = {}
+        user_opportunity_pairs: list[tuple[UUID, UUID]] = []
         versionless_opportunities: set = set()
 
         logger.info("Processing opportunity versions to determine notifications")
@@ -128,28 +133,19 @@ class OpportunityNotificationTask(BaseNotificationTask):
                     opportunity_id=opp_id, latest=latest_opp_ver, previous=None  # will update later
                 )
 
-                saved_opp_exists = False
-                for entry in changed_saved_opportunities:
-                    if entry.user_id == user_id:
-                        entry.opportunities.append(version_change)
-                        saved_opp_exists = True
-                        break
-
-                if not saved_opp_exists:
-                    changed_saved_opportunities.append(
-                        ChangedSavedOpportunity(
-                            user_id=user_id,
-                            email=user_saved_opp.user.email,
-                            opportunities=[version_change],
-                        )
+                if user_id not in changed_opportunities_by_user:
+                    changed_opportunities_by_user[user_id] = ChangedSavedOpportunity(
+                        user_id=user_id,
+                        email=user_saved_opp.user.email,
+                        opportunities=[],
                     )
+                changed_opportunities_by_user[user_id].opportunities.append(version_change)
 
                 user_opportunity_pairs.append((user_id, opp_id))
 
-        self.increment(self.Metrics.VERSIONLESS_OPPORTUNITY_COUNT, len(versionless_opportunities))
+        changed_saved_opportunities = list(changed_opportunities_by_user.values())
 
-        # Reset the tracking dict for users whose email is disabled (used in post_notifications_process)
-        self._email_disabled_opportunities: dict[UUID, list[UUID]] = {}
+        self.increment(self.Metrics.VERSIONLESS_OPPORTUNITY_COUNT, len(versionless_opportunities))
 
         if not changed_saved_opportunities:
             return []
@@ -159,16 +155,23 @@ class OpportunityNotificationTask(BaseNotificationTask):
         all_user_ids = [cso.user_id for cso in changed_saved_opportunities]
         email_disabled_user_ids = self._get_users_with_email_disabled(all_user_ids)
 
-        # Track disabled users' pending opportunity IDs so post_notifications_process can
-        # advance their last_notified_at, preventing a backlog if they re-enable later.
+        # Advance last_notified_at for users with email disabled so they don't receive a
+        # backlog of notifications if they re-enable in the future. This is committed
+        # with the rest of the collection, before any notifications are sent.
         for cso in changed_saved_opportunities:
             if cso.user_id in email_disabled_user_ids:
-                self._email_disabled_opportunities[cso.user_id] = [
-                    opp.opportunity_id for opp in cso.opportunities
-                ]
+                opportunity_ids = [opp.opportunity_id for opp in cso.opportunities]
+                self.db_session.execute(
+                    update(UserSavedOpportunity)
+                    .where(
+                        UserSavedOpportunity.user_id == cso.user_id,
+                        UserSavedOpportunity.opportunity_id.in_(opportunity_ids),
+                    )
+                    .values(last_notified_at=datetime_util.utcnow())
+                )
                 logger.info(
                     "Skipping email notification for user with email disabled",
-                    extra={"user_id": cso.user_id},
+                    extra={"user_id": cso.user_id, "opportunity_ids": opportunity_ids},
                 )
                 self.increment(self.Metrics.NOTIFICATIONS_SKIPPED_EMAIL_DISABLED)
 
@@ -178,17 +181,8 @@ class OpportunityNotificationTask(BaseNotificationTask):
         ]
 
         # Get last notified versions.
-        # Batch this into chunks to avoid the query
-        # being incredibly large in the worst case scenario
-        # as it can hit the 65k Postgres limit on fields in a query
-        prior_notified_versions: dict[tuple[UUID, UUID], OpportunityVersion] = {}
         logger.info("Getting when users were last notified about an opportunity")
-        for enabled_user_opportunity_pairs_batch in itertools.batched(
-            enabled_user_opportunity_pairs, n=BATCH_QUERY_SIZE, strict=False
-        ):
-            prior_notified_versions |= self._get_last_notified_versions(
-                enabled_user_opportunity_pairs_batch
-            )
+        prior_notified_versions = self._get_last_notified_versions(enabled_user_opportunity_pairs)
 
         users_email_notifications: list[UserEmailNotification] = []
         for user_changed_opp in changed_saved_opportunities:
@@ -331,53 +325,97 @@ class OpportunityNotificationTask(BaseNotificationTask):
         return results
 
     def _get_last_notified_versions(
-        self, user_opportunity_pairs: Iterable
+        self, user_opportunity_pairs: Iterable[tuple[UUID, UUID]]
     ) -> dict[tuple[UUID, UUID], OpportunityVersion]:
         """
         Given (user_id, opportunity_id) pairs, return the most recent
         OpportunityVersion for each that was created before the user's
         last_notified_at timestamp.
         """
+        user_opportunity_pairs = list(user_opportunity_pairs)
+        if not user_opportunity_pairs:
+            return {}
+
+        # Pass the pairs in as two arrays and unnest them, rather than a
+        # tuple IN clause, so that any number of pairs fit in a single query
+        # without hitting the 65k Postgres limit on parameters in a query
+        user_ids, opportunity_ids = zip(*user_opportunity_pairs, strict=True)
+        pairs = (
+            func.unnest(
+                bindparam("user_ids", list(user_ids), type_=postgresql.ARRAY(postgresql.UUID)),
+                bindparam(
+                    "opportunity_ids",
+                    list(opportunity_ids),
+                    type_=postgresql.ARRAY(postgresql.UUID),
+                ),
+            )
+            .table_valued(
+                column("user_id", postgresql.UUID), column("opportunity_id", postgresql.UUID)
+            )
+            .render_derived()
+        )
+
         # Rank all versions per (user, opportunity_id) by created_at desc
         row_number = (
             func.row_number()
             .over(
-                partition_by=(UserSavedOpportunity.user_id, OpportunityVersion.opportunity_id),
+                partition_by=(pairs.c.user_id, pairs.c.opportunity_id),
                 order_by=desc(OpportunityVersion.created_at),
             )
             .label("rn")
         )
-        # Subquery selecting all OpportunityVersions joined with UserSavedOpportunity,
-        # filtered by the given user-opportunity pairs, and versions created before last_notified_at
+        # Subquery selecting the versions of each pair created before the user's last notification
         subq = (
-            select(OpportunityVersion, UserSavedOpportunity.user_id.label("user_id"), row_number)
+            select(
+                pairs.c.user_id,
+                pairs.c.opportunity_id,
+                OpportunityVersion.opportunity_version_id,
+                row_number,
+            )
+            .select_from(pairs)
             .join(
                 UserSavedOpportunity,
-                UserSavedOpportunity.opportunity_id == OpportunityVersion.opportunity_id,
+                and_(
+                    UserSavedOpportunity.user_id == pairs.c.user_id,
+                    UserSavedOpportunity.opportunity_id == pairs.c.opportunity_id,
+                ),
             )
-            .where(
-                tuple_(UserSavedOpportunity.user_id, UserSavedOpportunity.opportunity_id).in_(
-                    user_opportunity_pairs
-                ),  # Filter for the given pairs
-                OpportunityVersion.created_at
-                < UserSavedOpportunity.last_notified_at,  # Grabs the versions created before the users last notification
+            .join(
+                OpportunityVersion,
+                and_(
+                    OpportunityVersion.opportunity_id == pairs.c.opportunity_id,
+                    # Grabs the versions created before the users last notification
+                    OpportunityVersion.created_at < UserSavedOpportunity.last_notified_at,
+                ),
             )
             .subquery()
         )
 
-        # Map cols in the subquery back to OpportunityVersion model
-        opp_version_from_subq = aliased(OpportunityVersion, subq)
-
-        # Grabs latest version per (user, opportunity_id) pairs
-        stmt = select(
-            subq.c.user_id,
-            subq.c.opportunity_id,
-            opp_version_from_subq,  # OpportunityVersion object
-        ).where(subq.c.rn == 1)
-
-        results = self.db_session.execute(stmt).all()
+        # Grabs latest version ID per (user, opportunity_id) pairs
+        results = self.db_session.execute(
+            select(subq.c.user_id, subq.c.opportunity_id, subq.c.opportunity_version_id).where(
+                subq.c.rn == 1
+            )
+        ).all()
+
+        # Many users are usually on the same version of an opportunity, so
+        # only load the data of each distinct version once
+        version_ids = {row.opportunity_version_id for row in results}
+        versions: dict[UUID, OpportunityVersion] = {}
+        for version_ids_batch in itertools.batched(version_ids, n=BATCH_QUERY_SIZE, strict=False):
+            versions |= {
+                version.opportunity_version_id: version
+                for version in self.db_session.execute(
+                    select(OpportunityVersion).where(
+                        OpportunityVersion.opportunity_version_id.in_(version_ids_batch)
+                    )
+                ).scalars()
+            }
 
-        return {(row.user_id, row.opportunity_id): row[2] for row in results}
+        return {
+            (row.user_id, row.opportunity_id): versions[row.opportunity_version_id]
+            for row in results
+        }
 
     def _build_description_fields_content(self, description_change: dict, opp_id: UUID) -> str:
         after = description_change["after"]
@@ -598,6 +636,14 @@ class OpportunityNotificationTask(BaseNotificationTask):
             for diff in diffs
         }
 
+    def _get_sections(self, opp_change: OpportunityVersionChange) -> str:
+        """Build the sections for a version change, reusing them if already built for another user"""
+        previous = cast(OpportunityVersion, opp_change.previous)
+        cache_key = (previous.opportunity_version_id, opp_change.latest.opportunity_version_id)
+        if cache_key not in self._sections_cache:
+            self._sections_cache[cache_key] = self._build_sections(opp_change)
+        return self._sections_cache[cache_key]
+
     def _build_sections(self, opp_change: OpportunityVersionChange) -> str:
         # Get diff between latest and previous version
         previous = cast(OpportunityVersion, opp_change.previous)
@@ -674,7 +720,7 @@ class OpportunityNotificationTask(BaseNotificationTask):
 
         # Get sections statement
         for opp in updated_opportunities:
-            sections = self._build_sections(opp)
+            sections = self._get_sections(opp)
             if not sections:
                 continue
 
@@ -747,19 +793,3 @@ class OpportunityNotificationTask(BaseNotificationTask):
                 self.increment(
                     self.Metrics.OPPORTUNITIES_TRACKED, len(user_notification.notified_object_ids)
                 )
-
-        # Advance last_notified_at for users with email disabled so they don't receive a
-        # backlog of notifications if they re-enable in the future.
-        for user_id, opportunity_ids in getattr(self, "_email_disabled_opportunities", {}).items():
-            self.db_session.execute(
-                update(UserSavedOpportunity)
-                .where(
-                    UserSavedOpportunity.user_id == user_id,
-                    UserSavedOpportunity.opportunity_id.in_(opportunity_ids),
-                )
-                .values(last_notified_at=datetime_util.utcnow())
-            )
-            logger.info(
-                "Marked opportunities as processed for user with email notifications disabled",
-                extra={"user_id": user_id, "opportunity_ids": opportunity_ids},
-            )
@@ -1,10 +1,11 @@
+import itertools
 import logging
 from collections.abc import Sequence
 from uuid import UUID
 
 import grants_shared.adapters.db as db
 from grants_shared.util import datetime_util
-from sqlalchemy import and_, exists, select, update
+from sqlalchemy import and_, exists, func, select, update
 from sqlalchemy.orm import selectinload
 
 import src.adapters.search as search
@@ -14,7 +15,10 @@ from src.db.models.opportunity_models import (
     OpportunitySummary,
 )
 from src.db.models.user_models import LinkExternalUser, SuppressedEmail, UserSavedSearch
-from src.services.opportunities_v1.search_opportunities import search_opportunities_id
+from src.services.opportunities_v1.search_opportunities import (
+    get_search_query_fingerprint,
+    search_opportunities_id_batch,
+)
 from src.task.notifications.base_notification import BaseNotificationTask
 from src.task.notifications.config import EmailNotificationConfig
 from src.task.notifications.constants import NotificationReason, UserEmailNotification
@@ -24,13 +28,6 @@ logger = logging.getLogger(__name__)
 UTM_TAG = "?utm_source=notification&utm_medium=email&utm_campaign=search"
 
 
-def _strip_pagination_params(search_query: dict) -> dict:
-    """Remove pagination parameters from a search query"""
-    search_query = search_query.copy()
-    search_query.pop("pagination", None)
-    return search_query
-
-
 class SearchNotificationTask(BaseNotificationTask):
 
     def __init__(
@@ -44,9 +41,11 @@ class SearchNotificationTask(BaseNotificationTask):
 
     def collect_email_notifications(self) -> list[UserEmailNotification]:
         """Collect notifications for changed saved searches"""
-        stmt = (
-            select(UserSavedSearch)
-            .options(selectinload(UserSavedSearch.user))
+        self._backfill_search_query_fingerprints()
+
+        # Group equivalent searches by their fingerprint so each query is only run once
+        grouped_stmt = (
+            select(func.array_agg(UserSavedSearch.saved_search_id))
             .where(UserSavedSearch.last_notified_at < datetime_util.utcnow())
             .where(
                 UserSavedSearch.is_deleted.isnot(True),
@@ -57,40 +56,71 @@ class SearchNotificationTask(BaseNotificationTask):
                     )
                 ),
             )
+            .group_by(UserSavedSearch.search_query_fingerprint)
+            .order_by(UserSavedSearch.search_query_fingerprint)
+        )
+        saved_search_id_groups: list[list[UUID]] = list(
+            self.db_session.execute(grouped_stmt).scalars().all()
         )
 
-        saved_searches = self.db_session.execute(stmt).scalars().all()
-        query_map: dict[str, list[UserSavedSearch]] = {}
-        for saved_search in saved_searches:
-            search_query = _strip_pagination_params(saved_search.search_query)
-            query_key = str(search_query)
-
-            if query_key not in query_map:
-                query_map[query_key] = []
-            query_map[query_key].append(saved_search)
+        saved_searches = self.db_session.execute(
+            select(UserSavedSearch)
+            .options(selectinload(UserSavedSearch.user))
+            .where(
+                UserSavedSearch.saved_search_id.in_(
+                    list(itertools.chain.from_iterable(saved_search_id_groups))
+                )
+            )
+        ).scalars()
+        saved_searches_by_id = {
+            saved_search.saved_search_id: saved_search for saved_search in saved_searches
+        }
+        query_groups: list[list[UserSavedSearch]] = [
+            [saved_searches_by_id[saved_search_id] for saved_search_id in saved_search_ids]
+            for saved_search_ids in saved_search_id_groups
+        ]
 
         # Track new opportunities per user
         user_new_opportunities: dict[UUID, set[UUID]] = {}
         # Track which saved searches have updates
         updated_saved_searches: dict[UUID, list[UserSavedSearch]] = {}
 
-        for searches in query_map.values():
-            current_results = search_opportunities_id(self.search_client, searches[0].search_query)
+        result_size = self.notification_config.search_notification_result_size
+        batch_size = self.notification_config.search_notification_msearch_batch_size
 
-            for saved_search in searches:
-                previous_results = set(saved_search.searched_opportunity_ids or [])
-                # Find NEW opportunities (in current but not in previous)
-                top_new_opportunities = set(current_results[:25]) - previous_results
-
-                # Only add searches that have new opportunities
-                if top_new_opportunities:
-                    user_id = saved_search.user_id
-                    updated_saved_searches.setdefault(user_id, []).append(saved_search)
-                    # Add top new opportunities for this user
-                    user_new_opportunities.setdefault(user_id, set()).update(top_new_opportunities)
+        # Send the distinct queries to OpenSearch in batches rather than one request per query
+        for query_batch in itertools.batched(query_groups, batch_size, strict=False):
+            batch_results = search_opportunities_id_batch(
+                self.search_client, [searches[0].search_query for searches in query_batch]
+            )
 
-                # Always update the saved search with current results
-                saved_search.searched_opportunity_ids = current_results
+            for searches, current_results in zip(query_batch, batch_results, strict=True):
+                if current_results is None:
+                    # Leave the saved searches as-is so the query is retried on the next run
+                    logger.warning(
+                        "Failed to run saved search query, skipping",
+                        extra={"saved_search_count": len(searches)},
+                    )
+                    continue
+
+                for saved_search in searches:
+                    previous_results = set(saved_search.searched_opportunity_ids or [])
+                    # Find NEW opportunities (in the top current results but not in previous).
+                    # The whole window is compared against so an opportunity that moves up
+                    # into the top results isn't treated as new.
+                    top_new_opportunities = set(current_results[:result_size]) - previous_results
+
+                    # Only add searches that have new opportunities
+                    if top_new_opportunities:
+                        user_id = saved_search.user_id
+                        updated_saved_searches.setdefault(user_id, []).append(saved_search)
+                        # Add top new opportunities for this user
+                        user_new_opportunities.setdefault(user_id, set()).update(
+                            top_new_opportunities
+                        )
+
+                    # Always update the saved search with current results
+                    saved_search.searched_opportunity_ids = current_results
 
         users_email_notifications: list[UserEmailNotification] = []
 
@@ -178,6 +208,30 @@ class SearchNotificationTask(BaseNotificationTask):
 
         return users_email_notifications
 
+    def _backfill_search_query_fingerprints(self) -> None:
+        """Fill in the fingerprint for any saved searches created before it existed"""
+        saved_searches = (
+            self.db_session.execute(
+                select(UserSavedSearch).where(
+                    UserSavedSearch.search_query_fingerprint.is_(None),
+                    UserSavedSearch.is_deleted.isnot(True),
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        for saved_search in saved_searches:
+            saved_search.search_query_fingerprint = get_search_query_fingerprint(
+                saved_search.search_query
+            )
+
+        if saved_searches:
+            logger.info(
+                "Backfilled saved search query fingerprints",
+                extra={"saved_search_count": len(saved_searches)},
+            )
+
     def _build_notification_message(self, opportunities: Sequence[Opportunity]) -> str:
 
         # Build message intro based on number of opportunities
@@ -1,8 +1,15 @@
+import contextlib
+import gzip
+import io
 import json
 import logging
 import os
-from collections.abc import Iterator, Sequence
+import textwrap
+from collections.abc import Buffer, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import StrEnum
+from typing import IO, Any, TextIO
 
 import grants_shared.adapters.db as db
 import grants_shared.adapters.db.flask_db as flask_db
@@ -22,7 +29,10 @@ from src.db.models.opportunity_models import (
     Opportunity,
     OpportunitySummary,
 )
-from src.services.opportunities_v1.opportunity_to_csv import opportunities_to_csv
+from src.services.opportunities_v1.opportunity_to_csv import (
+    build_opportunity_csv_writer,
+    opportunity_to_csv_row,
+)
 from src.task.task import Task
 from src.task.task_blueprint import task_blueprint
 from src.util.env_config import PydanticBaseEnvConfig
@@ -42,6 +52,79 @@ def export_opportunity_data(db_session: db.Session) -> None:
 
 class ExportOpportunityDataConfig(PydanticBaseEnvConfig):
     file_path: str = Field(..., alias="PUBLIC_FILES_OPPORTUNITY_DATA_EXTRACTS_PATH")
+    # Also write gzipped copies of each extract
+    gzip_enabled: bool = Field(default=False, alias="EXPORT_OPPORTUNITY_DATA_GZIP_ENABLED")
+
+
+class ByteCountingWriter(io.RawIOBase):
+    """Pass writes through to a binary stream, counting the bytes written"""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Buffer) -> int:  # type: ignore[override]
+        size = memoryview(data).nbytes
+        self.stream.write(data)  # type: ignore[arg-type]
+        self.bytes_written += size
+        return size
+
+
+@dataclass
+class ExtractFile:
+    extract_type: ExtractType
+    file_name: str
+    file_path: str
+    is_gzip: bool = False
+
+    bytes_written: int = 0
+
+
+class ExtractWriter:
+    """Write text to each of a set of extract files as it is generated
+
+    Files are opened as binary streams so that we can record the size of
+    what was actually written, after gzipping if relevant.
+    """
+
+    def __init__(self, extract_files: list[ExtractFile]):
+        self.extract_files = extract_files
+        self._exit_stack = contextlib.ExitStack()
+        self._outputs: list[tuple[ExtractFile, ByteCountingWriter, TextIO]] = []
+
+    def __enter__(self) -> ExtractWriter:
+        for extract_file in self.extract_files:
+            stream = self._exit_stack.enter_context(
+                file_util.open_stream(extract_file.file_path, "wb")
+            )
+            counter = ByteCountingWriter(stream)
+
+            binary_output: IO[bytes] = counter  # type: ignore[assignment]
+            if extract_file.is_gzip:
+                binary_output = self._exit_stack.enter_context(
+                    gzip.GzipFile(fileobj=counter, mode="wb")
+                )
+
+            text_output = self._exit_stack.enter_context(
+                io.TextIOWrapper(binary_output, encoding="utf-8", newline="")
+            )
+            self._outputs.append((extract_file, counter, text_output))
+
+        return self
+
+    def write(self, text: str) -> None:
+        for _, _, text_output in self._outputs:
+            text_output.write(text)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._exit_stack.__exit__(*exc_info)
+
+        # Everything is only flushed through to the file once the streams are closed
+        for extract_file, counter, _ in self._outputs:
+            extract_file.bytes_written = counter.bytes_written
 
 
 class ExportOpportunityDataTask(Task):
@@ -68,50 +151,115 @@ class ExportOpportunityDataTask(Task):
             config.file_path, f"opportunity_data-{self.current_timestamp}.csv"
         )
 
-        self.set_metrics({"csv_file": self.csv_file, "json_file": self.json_file})
+        self.json_extract_files = [
+            ExtractFile(
+                extract_type=ExtractType.OPPORTUNITIES_JSON,
+                file_name=f"opportunity_data-{self.current_timestamp}.json",
+                file_path=self.json_file,
+            )
+        ]
+        self.csv_extract_files = [
+            ExtractFile(
+                extract_type=ExtractType.OPPORTUNITIES_CSV,
+                file_name=f"opportunity_data-{self.current_timestamp}.csv",
+                file_path=self.csv_file,
+            )
+        ]
+
+        metrics = {"csv_file": self.csv_file, "json_file": self.json_file}
+
+        if config.gzip_enabled:
+            self.json_gzip_file = self.json_file + ".gz"
+            self.csv_gzip_file = self.csv_file + ".gz"
+
+            self.json_extract_files.append(
+                ExtractFile(
+                    extract_type=ExtractType.OPPORTUNITIES_JSON_GZIP,
+                    file_name=f"opportunity_data-{self.current_timestamp}.json.gz",
+                    file_path=self.json_gzip_file,
+                    is_gzip=True,
+                )
+            )
+            self.csv_extract_files.append(
+                ExtractFile(
+                    extract_type=ExtractType.OPPORTUNITIES_CSV_GZIP,
+                    file_name=f"opportunity_data-{self.current_timestamp}.csv.gz",
+                    file_path=self.csv_gzip_file,
+                    is_gzip=True,
+                )
+            )
+            metrics |= {"csv_gzip_file": self.csv_gzip_file, "json_gzip_file": self.json_gzip_file}
+
+        self.set_metrics(metrics)
 
     def run_task(self) -> None:
-        # Load records
+        logger.info(
+            "Creating Opportunity extracts",
+            extra={"json_extract_path": self.json_file, "csv_extract_path": self.csv_file},
+        )
+
+        self.export_opportunities()
+
+        # Create metadata entries
+        for extract_file in self.json_extract_files + self.csv_extract_files:
+            self.db_session.add(
+                ExtractMetadata(
+                    extract_type=extract_file.extract_type,
+                    file_name=extract_file.file_name,
+                    file_path=extract_file.file_path,
+                    file_size_bytes=extract_file.bytes_written,
+                )
+            )
+
+        self.db_session.commit()
+
+    def export_opportunities(self) -> None:
+        """Write the JSON and CSV extracts in a single pass over the opportunities
+
+        Each batch of opportunities is dumped once, then formatted and written
+        to the JSON and CSV files in parallel while the next batch is fetched. Only a couple
+        of batches are ever held in memory.
+        """
         schema = OpportunityV1Schema()
+        base_url = os.getenv("FRONTEND_BASE_URL")
 
-        opportunities = []
-        for opp_batch in self.fetch_opportunities():
-            for record in opp_batch:
-                self.increment(self.Metrics.RECORDS_EXPORTED)
-                opportunities.append(schema.dump(record))
+        with (
+            ExtractWriter(self.json_extract_files) as json_writer,
+            ExtractWriter(self.csv_extract_files) as csv_writer,
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="opportunity-export") as executor,
+        ):
+            json_writer.write(self._build_json_header())
+            csv_writer.write(build_csv_text(base_url, [], include_header=True))
 
-        # Format data
-        data_to_export: dict = {
-            "metadata": {"file_generated_at": self.current_timestamp},
-            "opportunities": opportunities,
-        }
+            pending_writes: list[Future] = []
+            is_first_batch = True
+            for opp_batch in self.fetch_opportunities():
+                records = [schema.dump(record) for record in opp_batch]
+                self.increment(self.Metrics.RECORDS_EXPORTED, len(records))
 
-        # Export data
-        self.export_data_to_json(data_to_export)
-        self.export_opportunities_to_csv(opportunities)
+                # Wait on the prior batch so the files are written in order
+                for future in pending_writes:
+                    future.result()
 
-        # Export data and create metadata entries
-        json_size = self.export_data_to_json(data_to_export)
-        csv_size = self.export_opportunities_to_csv(opportunities)
+                pending_writes = [
+                    executor.submit(write_json_batch, json_writer, records, is_first_batch),
+                    executor.submit(write_csv_batch, csv_writer, base_url, records),
+                ]
+                is_first_batch = is_first_batch and not records
 
-        # Create metadata entries
-        json_metadata = ExtractMetadata(
-            extract_type=ExtractType.OPPORTUNITIES_JSON,
-            file_name=f"opportunity_data-{self.current_timestamp}.json",
-            file_path=self.json_file,
-            file_size_bytes=json_size,
-        )
+            for future in pending_writes:
+                future.result()
 
-        csv_metadata = ExtractMetadata(
-            extract_type=ExtractType.OPPORTUNITIES_CSV,
-            file_name=f"opportunity_data-{self.current_timestamp}.csv",
-            file_path=self.csv_file,
-            file_size_bytes=csv_size,
-        )
+            # The opening bracket is only written with the first record
+            json_writer.write(EMPTY_JSON_FOOTER if is_first_batch else JSON_FOOTER)
 
-        self.db_session.add(json_metadata)
-        self.db_session.add(csv_metadata)
-        self.db_session.commit()
+    def _build_json_header(self) -> str:
+        metadata = json.dumps({"file_generated_at": self.current_timestamp}, indent=4)
+        return (
+            "{\n"
+            f'    "metadata": {textwrap.indent(metadata, "    ").lstrip()},\n'
+            '    "opportunities": '
+        )
 
     def fetch_opportunities(self) -> Iterator[Sequence[Opportunity]]:
         """
@@ -150,23 +298,39 @@ class ExportOpportunityDataTask(Task):
             .partitions()
         )
 
-    def export_data_to_json(self, data_to_export: dict) -> int:
-        # create the json file
-        logger.info(
-            "Creating Opportunity JSON extract", extra={"json_extract_path": self.json_file}
-        )
-        json_object = json.dumps(data_to_export, indent=4)
-        with file_util.open_stream(self.json_file, "w") as outfile:
-            outfile.write(json_object)
 
-        return len(json_object.encode("utf-8"))
+# The extract is formatted the same as json.dumps(..., indent=4) of the
+# full extract would, with each opportunity nested two levels deep.
+JSON_RECORD_INDENT = " " * 8
+JSON_FOOTER = "\n    ]\n}"
+EMPTY_JSON_FOOTER = "[]\n}"
+
+
+def build_json_text(records: Sequence[dict], is_first_batch: bool) -> str:
+    if not records:
+        return ""
+
+    text = ",\n".join(
+        textwrap.indent(json.dumps(record, indent=4), JSON_RECORD_INDENT) for record in records
+    )
+    return "[\n" + text if is_first_batch else ",\n" + text
+
+
+def build_csv_text(
+    base_url: str | None, records: Sequence[dict], include_header: bool = False
+) -> str:
+    output = io.StringIO()
+    writer = build_opportunity_csv_writer(output)
+    if include_header:
+        writer.writeheader()
+
+    writer.writerows(opportunity_to_csv_row(record, base_url) for record in records)
+    return output.getvalue()
+
 
-    def export_opportunities_to_csv(self, opportunities: Sequence[dict]) -> int:
-        # create the csv file
-        logger.info("Creating Opportunity CSV extract", extra={"csv_extract_path": self.csv_file})
+def write_json_batch(writer: ExtractWriter, records: Sequence[dict], is_first_batch: bool) -> None:
+    writer.write(build_json_text(records, is_first_batch))
 
-        with file_util.open_stream(self.csv_file, "w") as outfile:
-            opportunities_to_csv(opportunities, outfile)
 
-        csv_size = file_util.get_file_length_bytes(self.csv_file)
-        return csv_size
+def write_csv_batch(writer: ExtractWriter, base_url: str | None, records: Sequence[dict]) -> None:
+    writer.write(build_csv_text(base_url, records))
@@ -13,7 +13,10 @@ from src.db.models.opportunity_models import (
     OpportunityChangeAudit,
     OpportunitySummary,
 )
-from src.services.opportunities_v1.opportunity_version import save_opportunity_version
+from src.services.opportunities_v1.opportunity_version import (
+    get_latest_opportunity_versions,
+    save_opportunity_version_if_changed,
+)
 from src.task.task import Task
 from src.util.env_config import PydanticBaseEnvConfig
 
@@ -100,6 +103,13 @@ class StoreOpportunityVersionTask(Task):
             .limit(self.config.store_opportunity_version_batch_size)
         ).all()
 
+        # Only the latest version of each opportunity is needed to determine
+        # whether it changed, so fetch those up front for the whole batch.
+        latest_opp_versions = get_latest_opportunity_versions(
+            self.db_session,
+            [opp_change_audit.opportunity_id for opp_change_audit in opportunity_change_audits],
+        )
+
         for opp_change_audit in opportunity_change_audits:
             log_extra = {
                 "opportunity_id": opp_change_audit.opportunity_id,
@@ -107,7 +117,11 @@ class StoreOpportunityVersionTask(Task):
             logger.info("Preparing opportunity for versioning", extra=log_extra)
 
             # Store to OpportunityVersion table
-            if save_opportunity_version(self.db_session, opp_change_audit.opportunity):
+            if save_opportunity_version_if_changed(
+                self.db_session,
+                opp_change_audit.opportunity,
+                latest_opp_versions.get(opp_change_audit.opportunity_id),
+            ):
                 logger.info("Opportunity has a new version", extra=log_extra)
                 self.increment(self.Metrics.OPPORTUNITIES_VERSIONED)
 
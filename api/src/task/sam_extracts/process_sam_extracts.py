@@ -1,16 +1,19 @@
+import contextlib
 import itertools
 import logging
 import time
+import uuid
 import zipfile
-from collections.abc import Sequence
+from collections.abc import Generator, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import StrEnum
-from typing import IO
+from typing import IO, NamedTuple
 
 import grants_shared.adapters.db as db
 from grants_shared.util import file_util
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql
 
 from src.constants.lookup_constants import (
     SamGovExtractType,
@@ -44,17 +47,53 @@ class ExtractIndex:
     LAST_UPDATE_DATE = 10
 
 
+class SamGovEntityRow(NamedTuple):
+    """The values we parse out of a single sam.gov extract row
+
+    Kept as a plain tuple rather than a DB model so that the
+    streaming mode can hold a batch of these cheaply.
+    """
+
+    uei: str
+    legal_business_name: str
+    expiration_date: date
+    initial_registration_date: date
+    last_update_date: date
+    ebiz_poc_email: str
+    ebiz_poc_first_name: str
+    ebiz_poc_last_name: str
+    has_debt_subject_to_offset: bool
+    has_exclusion_status: bool
+    eft_indicator: str | None
+
+
 @dataclass
 class SamGovEntityContainer:
     processed_entities: list[SamGovEntity] = field(default_factory=list)
     ueis_skipped: set[str] = field(default_factory=set)
+    # UEIs that had a row to load in the extract, used to check the skipped UEIs
+    ueis_with_row: set[str] = field(default_factory=set)
 
     deactivated_ueis: list[str] = field(default_factory=list)
     expired_ueis: list[str] = field(default_factory=list)
 
 
+# The columns written when upserting a sam.gov entity that already exists
+UPSERT_COLUMNS = [
+    *SamGovEntityRow._fields,
+    "is_inactive",
+    "inactivated_at",
+]
+
+
 class ProcessSamExtractsConfig(PydanticBaseEnvConfig):
     process_sam_extracts_upsert_batch_size: int = 10000
+    # When enabled, the extract is parsed and written to the DB a batch at a time
+    # rather than parsing the entire file into memory before loading it.
+    process_sam_extracts_streaming_enabled: bool = False
+    # Number of rows written by each INSERT ... ON CONFLICT statement in streaming mode,
+    # kept low enough to stay under Postgres' limit on parameters in a query.
+    process_sam_extracts_upsert_statement_size: int = 1000
 
 
 class ProcessSamExtractsTask(Task):
@@ -133,11 +172,16 @@ class ProcessSamExtractsTask(Task):
 
     def process_extract(self, sam_extract_file: SamExtractFile, extract_log_extra: dict) -> None:
         """Process a sam.gov FOUO entity extract file, parsing and loading the file to our sam.gov entity table"""
-        sam_gov_entity_container = self.parse_extract_file(sam_extract_file, extract_log_extra)
+        if self.config.process_sam_extracts_streaming_enabled:
+            sam_gov_entity_container = self.stream_extract_file_to_db(
+                sam_extract_file, extract_log_extra
+            )
+        else:
+            sam_gov_entity_container = self.parse_extract_file(sam_extract_file, extract_log_extra)
 
-        self.load_sam_gov_entities_to_db(
-            sam_gov_entity_container, sam_extract_file, extract_log_extra
-        )
+            self.load_sam_gov_entities_to_db(
+                sam_gov_entity_container, sam_extract_file, extract_log_extra
+            )
 
         # Process all of the deactivations/expired in one transaction as they're usually fairly small.
         with self.db_session.begin():
@@ -178,6 +222,43 @@ class ProcessSamExtractsTask(Task):
         self, sam_extract_file: SamExtractFile, extract_log_extra: dict
     ) -> SamGovEntityContainer:
         """Process an extract file from sam.gov, pulling all entities out of it"""
+        with self.open_dat_file(sam_extract_file, extract_log_extra) as dat_file:
+            return self.process_dat(dat_file, extract_log_extra)
+
+    def stream_extract_file_to_db(
+        self, sam_extract_file: SamExtractFile, extract_log_extra: dict
+    ) -> SamGovEntityContainer:
+        """Process an extract file from sam.gov, loading entities to the DB as the file is read
+
+        Only a single batch of rows is held in memory at a time, and each batch
+        is committed separately.
+        """
+        container = SamGovEntityContainer()
+        import_type = get_import_type(sam_extract_file.extract_type)
+        total_processed = 0
+
+        with self.open_dat_file(sam_extract_file, extract_log_extra) as dat_file:
+            for batch in itertools.batched(
+                self.iter_dat_rows(dat_file, container, extract_log_extra),
+                n=self.config.process_sam_extracts_upsert_batch_size,
+                strict=False,
+            ):
+                with self.db_session.begin():
+                    logger.info(
+                        f"Processing a batch, processed {total_processed}",
+                        extra=extract_log_extra,
+                    )
+                    self.upsert_sam_gov_entity_batch(batch, import_type)
+
+                total_processed += len(batch)
+
+        return container
+
+    @contextlib.contextmanager
+    def open_dat_file(
+        self, sam_extract_file: SamExtractFile, extract_log_extra: dict
+    ) -> Generator[IO[bytes]]:
+        """Open the dat file within a sam.gov extract zip for reading"""
         logger.info("Processing sam.gov extract file", extra=extract_log_extra)
         self.increment(self.Metrics.EXTRACTS_PROCESSED_COUNT)
         if sam_extract_file.extract_type == SamGovExtractType.MONTHLY:
@@ -195,12 +276,23 @@ class ProcessSamExtractsTask(Task):
                     )
 
                 with extract_zip.open(files_in_zip[0]) as dat_file:
-                    return self.process_dat(dat_file, extract_log_extra)
+                    yield dat_file
 
     def process_dat(self, dat_file: IO[bytes], extract_log_extra: dict) -> SamGovEntityContainer:
         """Process the dat file from the sam.gov extract"""
         container = SamGovEntityContainer()
 
+        for sam_gov_entity_row in self.iter_dat_rows(dat_file, container, extract_log_extra):
+            container.processed_entities.append(build_sam_gov_entity_from_row(sam_gov_entity_row))
+
+        return container
+
+    def iter_dat_rows(
+        self, dat_file: IO[bytes], container: SamGovEntityContainer, extract_log_extra: dict
+    ) -> Iterator[SamGovEntityRow]:
+        """Read the dat file from the sam.gov extract line by line, yielding each entity
+        row to load. Skipped, deactivated and expired UEIs are tracked on the container.
+        """
         for raw_line in dat_file:
             line = raw_line.decode("utf-8")
             # The header and footer are formatted as
@@ -293,16 +385,17 @@ class ProcessSamExtractsTask(Task):
 
             try:
                 logger.info("Processing sam.gov entity record", extra=log_extra)
-                sam_gov_entity = build_sam_gov_entity(tokens)
-                self.increment(self.Metrics.ROWS_CONVERTED_COUNT)
-                container.processed_entities.append(sam_gov_entity)
+                sam_gov_entity_row = build_sam_gov_entity_row(tokens)
             except ValueError:
                 logger.exception(
                     "Failed to convert sam.gov entity record into DB model", extra=log_extra
                 )
                 self.increment(self.Metrics.ENTITY_ERROR_COUNT)
+                continue
 
-        return container
+            self.increment(self.Metrics.ROWS_CONVERTED_COUNT)
+            container.ueis_with_row.add(uei)
+            yield sam_gov_entity_row
 
     def get_existing_entities(self, ueis: list[str]) -> dict[str, SamGovEntity]:
         """Fetch all passed in sam.gov entities by UEI"""
@@ -367,11 +460,7 @@ class ProcessSamExtractsTask(Task):
             ),
         } | extract_log_extra
 
-        import_type = (
-            SamGovImportType.MONTHLY_EXTRACT
-            if extract_file_type == SamGovExtractType.MONTHLY
-            else SamGovImportType.DAILY_EXTRACT
-        )
+        import_type = get_import_type(extract_file_type)
 
         # If the sam.gov entity is new, just add it
         # If it's not new, we'll only update it if
@@ -408,6 +497,82 @@ class ProcessSamExtractsTask(Task):
             logger.info("No update necessary for sam.gov entity", extra=log_extra)
             self.increment(self.Metrics.ENTITY_NO_OP_COUNT)
 
+    def upsert_sam_gov_entity_batch(
+        self, batch: Sequence[SamGovEntityRow], import_type: SamGovImportType
+    ) -> None:
+        """Insert or update a batch of sam.gov entity rows with INSERT ... ON CONFLICT
+
+        Follows the same rules as load_sam_gov_entity_to_db, an existing entity
+        is only updated if the row has a more recent last_update_date.
+        """
+        # If a UEI appears more than once in a batch, only the most recent
+        # can be written as Postgres won't upsert the same row twice in a statement
+        latest_rows: dict[str, SamGovEntityRow] = {}
+        for row in batch:
+            existing_row = latest_rows.get(row.uei)
+            if existing_row is None or row.last_update_date > existing_row.last_update_date:
+                latest_rows[row.uei] = row
+
+        # Only fetch the columns needed to decide what to do with each row
+        existing_update_dates: dict[str, date] = {
+            uei: last_update_date
+            for uei, last_update_date in self.db_session.execute(
+                select(SamGovEntity.uei, SamGovEntity.last_update_date).where(
+                    SamGovEntity.uei.in_(latest_rows.keys())
+                )
+            )
+        }
+
+        rows_to_write = []
+        for row in latest_rows.values():
+            existing_update_date = existing_update_dates.get(row.uei)
+            if existing_update_date is None:
+                self.increment(self.Metrics.ENTITY_INSERTED_COUNT)
+            elif row.last_update_date > existing_update_date:
+                self.increment(self.Metrics.ENTITY_UPDATED_COUNT)
+            else:
+                self.increment(self.Metrics.ENTITY_NO_OP_COUNT)
+                continue
+
+            rows_to_write.append(row)
+
+        self.increment(self.Metrics.ENTITY_NO_OP_COUNT, len(batch) - len(latest_rows))
+
+        for statement_rows in itertools.batched(
+            rows_to_write, n=self.config.process_sam_extracts_upsert_statement_size, strict=False
+        ):
+            insert_stmt = postgresql.insert(SamGovEntity).values(
+                [
+                    row._asdict()
+                    | {
+                        "sam_gov_entity_id": uuid.uuid4(),
+                        # If something is inactive in our system
+                        # we want to set it back to active when we merge this record in.
+                        "is_inactive": False,
+                        "inactivated_at": None,
+                    }
+                    for row in statement_rows
+                ]
+            )
+            upsert_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=[SamGovEntity.uei],
+                set_={column: insert_stmt.excluded[column] for column in UPSERT_COLUMNS}
+                | {"updated_at": func.now()},
+                # Guard against the row having changed since we fetched it
+                where=SamGovEntity.last_update_date < insert_stmt.excluded.last_update_date,
+            ).returning(SamGovEntity.sam_gov_entity_id)
+
+            written_entity_ids = self.db_session.execute(upsert_stmt).scalars().all()
+
+            if written_entity_ids:
+                self.db_session.execute(
+                    insert(SamGovEntityImportType),
+                    [
+                        {"sam_gov_entity_id": entity_id, "sam_gov_import_type": import_type}
+                        for entity_id in written_entity_ids
+                    ],
+                )
+
     def handle_deactivated_entity(
         self,
         uei: str,
@@ -440,11 +605,7 @@ class ProcessSamExtractsTask(Task):
         existing_sam_gov_entity.is_inactive = True
         existing_sam_gov_entity.inactivated_at = sam_extract_file.extract_date
 
-        import_type = (
-            SamGovImportType.MONTHLY_EXTRACT
-            if sam_extract_file.extract_type == SamGovExtractType.MONTHLY
-            else SamGovImportType.DAILY_EXTRACT
-        )
+        import_type = get_import_type(sam_extract_file.extract_type)
 
         import_log_record = SamGovEntityImportType(
             sam_gov_entity=existing_sam_gov_entity,
@@ -498,13 +659,18 @@ class ProcessSamExtractsTask(Task):
         This is just validating an assumption that we have in the data
         that if an entity receives an update and has multiple EFT indicators,
         we'll always receive all of the different EFT indicators, including an "empty" one.
+
+        Only the UEIs of the rows are kept rather than the rows themselves, and a
+        UEI already in the DB doesn't count, the extract itself must have had a row for it.
         """
         logger.info("Validating that skipped UEIs were processed", extra=extract_log_extra)
-        ueis_processed = {entity.uei for entity in sam_gov_entity_container.processed_entities}
-        ueis_processed.update(sam_gov_entity_container.deactivated_ueis)
-        ueis_processed.update(sam_gov_entity_container.expired_ueis)
-
-        unprocessed_ueis = sam_gov_entity_container.ueis_skipped.difference(ueis_processed)
+        unprocessed_ueis = sorted(
+            sam_gov_entity_container.ueis_skipped.difference(
+                sam_gov_entity_container.ueis_with_row,
+                sam_gov_entity_container.deactivated_ueis,
+                sam_gov_entity_container.expired_ueis,
+            )
+        )
         for unprocessed_uei in unprocessed_ueis:
             logger.error(
                 "A UEI we skipped did not have a non-empty EFT indicator in extract file",
@@ -519,6 +685,20 @@ class ProcessSamExtractsTask(Task):
 
 
 def build_sam_gov_entity(tokens: list[str]) -> SamGovEntity:
+    return build_sam_gov_entity_from_row(build_sam_gov_entity_row(tokens))
+
+
+def build_sam_gov_entity_from_row(sam_gov_entity_row: SamGovEntityRow) -> SamGovEntity:
+    return SamGovEntity(
+        **sam_gov_entity_row._asdict(),
+        # Not sure if it's possible, but if something is inactive in our system
+        # we want to set it back to active when we merge this record in.
+        is_inactive=False,
+        inactivated_at=None,
+    )
+
+
+def build_sam_gov_entity_row(tokens: list[str]) -> SamGovEntityRow:
     uei = get_token_value(tokens, ExtractIndex.UEI, can_be_blank=False)
     legal_business_name = get_token_value(
         tokens, ExtractIndex.LEGAL_BUSINESS_NAME, can_be_blank=False
@@ -540,7 +720,7 @@ def build_sam_gov_entity(tokens: list[str]) -> SamGovEntity:
     )
     last_update_date = get_token_value(tokens, ExtractIndex.LAST_UPDATE_DATE, can_be_blank=False)
 
-    sam_gov_entity = SamGovEntity(
+    return SamGovEntityRow(
         uei=uei,
         legal_business_name=legal_business_name,
         expiration_date=convert_date(registration_expiration_date),
@@ -552,13 +732,15 @@ def build_sam_gov_entity(tokens: list[str]) -> SamGovEntity:
         has_debt_subject_to_offset=convert_debt_subject_to_offset(debt_subject_to_offset),
         has_exclusion_status=convert_exclusion_status_flag(exclusion_status_flag),
         eft_indicator=entity_eft_indicator if entity_eft_indicator else None,
-        # Not sure if it's possible, but if something is inactive in our system
-        # we want to set it back to active when we merge this record in.
-        is_inactive=False,
-        inactivated_at=None,
     )
 
-    return sam_gov_entity
+
+def get_import_type(extract_file_type: SamGovExtractType) -> SamGovImportType:
+    return (
+        SamGovImportType.MONTHLY_EXTRACT
+        if extract_file_type == SamGovExtractType.MONTHLY
+        else SamGovImportType.DAILY_EXTRACT
+    )
 
 
 def get_token_value(tokens: list[str], index: int, can_be_blank: bool = True) -> str:
@@ -0,0 +1,53 @@
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at rate_per_sec up to capacity, and each
+    call to acquire() takes one token, blocking until one is available.
+    Callers that have to wait reserve their token up front, so waiting
+    threads are let through in the order they arrived rather than all
+    at once when a token frees up.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be greater than 0")
+
+        self.rate_per_sec = rate_per_sec
+        # Default to allowing up to a second's worth of burst
+        self.capacity = capacity if capacity is not None else max(rate_per_sec, 1)
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._tokens = self.capacity
+        self._last_refill = clock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting until one is available"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate_per_sec
+            )
+            self._last_refill = now
+
+            # Tokens can go negative, which represents callers already
+            # waiting on a token, we wait until our token would exist
+            self._tokens -= 1
+            wait_sec = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0
+
+        if wait_sec > 0:
+            self._sleep(wait_sec)
@@ -208,12 +208,22 @@ class OpportunityPublishStateMachine(BaseStateMachine):
         try:
             # We upsert against the alias of the index
             # as we change the index name hourly.
-            search_client.bulk_upsert(
+            response = search_client.bulk_upsert(
                 index_name=config.opportunity_search_index_alias,
                 records=records,
                 primary_key_field="opportunity_id",
                 refresh=True,
             )
+            if response.has_failures:
+                logger.warning(
+                    "Search index rejected the opportunity",
+                    extra=log_extra | {"error": str(response.failures[0].error)},
+                )
+                state_machine_event.increment(
+                    self.Metrics.OPP_PUBLISH_ERROR_WRITING_TO_SEARCH_INDEX
+                )
+                return
+
             state_machine_event.increment(self.Metrics.OPP_PUBLISH_WRITTEN_TO_SEARCH_INDEX)
 
         except TransportError, ConnectionTimeout:
@@ -156,6 +156,111 @@ def test_bulk_upsert(search_client, generic_index):
         assert search_client._client.get(generic_index, record["id"])["_source"] == record
 
 
+def test_bulk_upsert_streams_in_chunks(generic_index):
+    # Use small limits so the records get split across several requests
+    config = get_opensearch_config()
+    config.search_bulk_chunk_size = 3
+    config.search_bulk_thread_count = 2
+    search_client = SearchClient(config)
+
+    def record_generator():
+        for i in range(10):
+            yield {"id": i, "title": f"record {i}"}
+
+    response = search_client.bulk_upsert(generic_index, record_generator(), primary_key_field="id")
+
+    assert response.success_count == 10
+    assert response.request_count == 4
+    assert response.request_duration_sec > 0
+    assert response.has_failures is False
+
+    resp = search_client.search(generic_index, {"size": 20}, include_scores=False)
+    assert resp.total_records == 10
+
+
+def test_bulk_upsert_splits_on_chunk_bytes(generic_index):
+    config = get_opensearch_config()
+    config.search_bulk_max_chunk_bytes = 200
+    search_client = SearchClient(config)
+
+    records = [{"id": i, "notes": "x" * 100} for i in range(3)]
+    response = search_client.bulk_upsert(generic_index, records, primary_key_field="id")
+
+    # Each record is too big to share a request with another
+    assert response.success_count == 3
+    assert response.request_count == 3
+
+
+def test_bulk_upsert_returns_item_failures(search_client, generic_index):
+    search_client.bulk_upsert(generic_index, [{"id": 1, "count": 5}], primary_key_field="id")
+
+    # count was mapped as a number, so a non-numeric value is rejected for that one item
+    response = search_client.bulk_upsert(
+        generic_index,
+        [{"id": 2, "count": "not-a-number"}, {"id": 3, "count": 7}],
+        primary_key_field="id",
+    )
+
+    assert response.success_count == 1
+    assert response.failure_count == 1
+    assert response.failures[0].id == 2
+    assert response.failures[0].status == 400
+    assert response.failures[0].error["type"] == "mapper_parsing_exception"
+
+
+def test_bulk_upsert_retries_rejected_items(search_client, generic_index, monkeypatch):
+    monkeypatch.setattr(search_client._config, "search_bulk_initial_backoff_sec", 0)
+
+    real_bulk = search_client._client.bulk
+    call_bodies = []
+
+    def rejecting_bulk(index, body):
+        call_bodies.append(body)
+        response = real_bulk(index=index, body=body)
+        if len(call_bodies) == 1:
+            # Pretend the cluster rejected the first item of the first request
+            response["items"][0]["index"] = {
+                "_id": response["items"][0]["index"]["_id"],
+                "status": 429,
+                "error": {"type": "es_rejected_execution_exception", "reason": "queue full"},
+            }
+        return response
+
+    monkeypatch.setattr(search_client._client, "bulk", rejecting_bulk)
+
+    records = [{"id": 1, "title": "first"}, {"id": 2, "title": "second"}]
+    response = search_client.bulk_upsert(generic_index, records, primary_key_field="id")
+
+    assert response.success_count == 2
+    assert response.retried_item_count == 1
+    assert response.request_count == 2
+    # Only the rejected item was resent
+    assert call_bodies[1].count(b"\n") == 2
+
+
+def test_bulk_upsert_gives_up_on_rejected_items(search_client, generic_index, monkeypatch):
+    monkeypatch.setattr(search_client._config, "search_bulk_initial_backoff_sec", 0)
+    monkeypatch.setattr(search_client._config, "search_bulk_max_retries", 2)
+
+    def always_rejecting_bulk(index, body):
+        return {
+            "errors": True,
+            "items": [
+                {"index": {"_id": 1, "status": 429, "error": {"type": "rejected"}}},
+            ],
+        }
+
+    monkeypatch.setattr(search_client._client, "bulk", always_rejecting_bulk)
+
+    response = search_client.bulk_upsert(
+        generic_index, [{"id": 1, "title": "first"}], primary_key_field="id"
+    )
+
+    assert response.success_count == 0
+    assert response.request_count == 3
+    assert response.failures[0].status == 429
+
+
 def test_bulk_delete(search_client, generic_index):
     records = [
         {"id": 1, "title": "Green Eggs & Ham", "notes": "why are the eggs green?"},
@@ -214,6 +319,36 @@ def test_swap_alias_index(search_client, generic_index):
     assert search_client._client.indices.exists(tmp_index) is False
 
 
+def test_swap_alias_index_finalizes_index_build(search_client):
+    index_name = f"test-build-index-{uuid.uuid4().int}"
+    alias_name = f"tmp-alias-{uuid.uuid4().int}"
+
+    search_client.create_index(index_name, replica_count=1, index_build_mode=True)
+
+    settings = search_client._client.indices.get_settings(index=index_name)[index_name]["settings"][
+        "index"
+    ]
+    assert settings["number_of_replicas"] == "0"
+    assert settings["refresh_interval"] == "-1"
+
+    records = [{"id": 1, "data": "abc123"}, {"id": 2, "data": "xyz789"}]
+    search_client.bulk_upsert(index_name, records, primary_key_field="id", refresh=False)
+
+    search_client.swap_alias_index(index_name, alias_name, index_build_replica_count=1)
+
+    settings = search_client._client.indices.get_settings(index=index_name)[index_name]["settings"][
+        "index"
+    ]
+    assert settings["number_of_replicas"] == "1"
+    assert "refresh_interval" not in settings
+
+    # The records are searchable through the alias
+    resp = search_client.search(alias_name, {}, include_scores=False)
+    assert resp.records == records
+
+    search_client.delete_index(index_name)
+
+
 def test_index_or_alias_exists(search_client, generic_index):
     # Create a few aliased indexes
     index_a = f"test-index-a-{uuid.uuid4().int}"
@@ -287,6 +422,36 @@ def test_scroll(search_client, generic_index):
     assert len(results[2].records) == 2
 
 
+def test_msearch(search_client, generic_index):
+    records = [
+        {"id": 1, "title": "Green Eggs & Ham", "notes": "why are the eggs green?"},
+        {"id": 2, "title": "The Cat in the Hat", "notes": "silly cat wears a hat"},
+        {"id": 3, "title": "Fox in Socks", "notes": "why he wearing socks?"},
+    ]
+
+    search_client.bulk_upsert(generic_index, records, primary_key_field="id")
+
+    responses = search_client.msearch(
+        generic_index,
+        [
+            {"query": {"match": {"notes": "why"}}, "sort": [{"id": "asc"}]},
+            {"query": {"match": {"title": "cat"}}},
+            {"query": {"match": {"title": "nothing matches"}}},
+            # Sorting on a field that doesn't exist errors for just this search
+            {"sort": [{"not_a_field": "asc"}]},
+        ],
+        include_scores=False,
+    )
+
+    assert len(responses) == 4
+    assert [record["id"] for record in responses[0].records] == [1, 3]
+    assert [record["id"] for record in responses[1].records] == [2]
+    assert responses[2].records == []
+    assert responses[3] is None
+
+    assert search_client.msearch(generic_index, []) == []
+
+
 def test_get_connection_parameters():
     # Just validating this builds as expected for local mode
     config = get_opensearch_config()
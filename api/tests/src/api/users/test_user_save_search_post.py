@@ -11,6 +11,7 @@ from src.constants.lookup_constants import (
     OpportunityStatus,
 )
 from src.db.models.user_models import UserSavedSearch
+from src.services.opportunities_v1.search_opportunities import get_search_query_fingerprint
 from tests.src.api.opportunities_v1.conftest import get_search_request
 from tests.src.api.opportunities_v1.test_opportunity_route_search import build_opp
 from tests.src.db.models.factories import UserFactory
@@ -193,6 +194,9 @@ def test_user_save_search_post(
             ],
         },
     }
+    assert saved_search.search_query_fingerprint == get_search_query_fingerprint(
+        saved_search.search_query
+    )
     # Verify pagination for the query was over-written. searched_opportunity_ids should be ordered by "post_date"
     assert saved_search.searched_opportunity_ids == [
         MEDICAL_LABORATORY.opportunity_id,
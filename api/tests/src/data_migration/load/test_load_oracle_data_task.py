@@ -4,6 +4,7 @@
 
 import datetime
 import logging
+import threading
 
 import freezegun
 import pytest
@@ -66,7 +67,10 @@ class TestLoadOracleData(BaseTestClass):
     def staging_tables(self):
         return {t.name: t for t in src.db.models.staging.metadata.tables.values()}
 
-    def test_load_data(self, db_session, foreign_tables, staging_tables, enable_factory_create):
+    @pytest.mark.parametrize("keyset_enabled", [False, True])
+    def test_load_data(
+        self, db_session, foreign_tables, staging_tables, enable_factory_create, keyset_enabled
+    ):
         time1 = datetime.datetime(2024, 1, 20, 7, 15, 0)
         time2 = datetime.datetime(2024, 1, 20, 7, 15, 1)
         time3 = datetime.datetime(2024, 4, 10, 22, 0, 1)
@@ -120,7 +124,13 @@ class TestLoadOracleData(BaseTestClass):
         )
 
         task = load_oracle_data_task.LoadOracleDataTask(
-            db_session, foreign_tables, staging_tables, ["topportunity"]
+            db_session,
+            foreign_tables,
+            staging_tables,
+            ["topportunity"],
+            keyset_enabled=keyset_enabled,
+            # Small enough that the keyset load spans several key ranges
+            key_range_size=2,
         )
         task.run()
 
@@ -214,6 +224,23 @@ class TestLoadOracleData(BaseTestClass):
                 db_session, foreign_tables, {}, ["topportunity"]
             )
 
+    def test_increment_with_prefix(self, db_session, foreign_tables, staging_tables):
+        task = load_oracle_data_task.LoadOracleDataTask(
+            db_session, foreign_tables, staging_tables, ["topportunity"]
+        )
+
+        # Run in another thread so a deadlock fails the test rather than hanging it
+        thread = threading.Thread(
+            target=task.increment, args=("count.insert",), kwargs={"prefix": "topportunity"}
+        )
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert task.metrics["count.insert"] == 1
+        assert task.metrics["topportunity.count.insert"] == 1
+
     @freezegun.freeze_time()
     def test_load_data_chunked(
         self, db_session, foreign_tables, staging_tables, enable_factory_create, caplog
@@ -278,6 +305,63 @@ class TestLoadOracleData(BaseTestClass):
         assert task.metrics["count.insert.total"] == 100
         assert task.metrics["count.update.total"] == 0
 
+    def test_load_data_keyset_ranges(
+        self, db_session, foreign_tables, staging_tables, enable_factory_create, caplog
+    ):
+        caplog.set_level(logging.INFO)
+
+        time1 = datetime.datetime(2024, 1, 20, 7, 15, 0)
+        time2 = datetime.datetime(2024, 1, 21, 7, 15, 0)
+
+        source_table = foreign_tables["topportunity"]
+        destination_table = staging_tables["topportunity"]
+
+        db_session.execute(sqlalchemy.delete(source_table))
+        db_session.execute(sqlalchemy.delete(destination_table))
+
+        source_records = ForeignTopportunityFactory.create_batch(
+            size=100, last_upd_date=time2, cfdas=[]
+        )
+        # Every tenth record already exists and is out of date
+        for source_record in source_records[::10]:
+            StagingTopportunityFactory.create(
+                opportunity_id=source_record.opportunity_id, cfdas=[], last_upd_date=time1
+            )
+
+        task = load_oracle_data_task.LoadOracleDataTask(
+            db_session,
+            foreign_tables,
+            staging_tables,
+            ["topportunity"],
+            keyset_enabled=True,
+            key_range_size=30,
+        )
+        task.run()
+
+        assert set(
+            db_session.scalars(sqlalchemy.select(destination_table.c.opportunity_id))
+        ) == set([record.opportunity_id for record in source_records])
+
+        insert_log_record = next(
+            record
+            for record in caplog.records
+            if record.message == "Processed records to be inserted"
+        )
+        update_log_record = next(
+            record
+            for record in caplog.records
+            if record.message == "Processed records to be updated"
+        )
+
+        assert getattr(insert_log_record, "count.insert.topportunity") == 90
+        assert getattr(insert_log_record, "count.insert.ranges.topportunity") == 4
+        assert getattr(update_log_record, "count.update.topportunity") == 10
+        assert getattr(update_log_record, "count.update.ranges.topportunity") == 4
+
+        assert task.metrics["count.delete.total"] == 0
+        assert task.metrics["count.insert.total"] == 90
+        assert task.metrics["count.update.total"] == 10
+
     def test_load_data_with_excluded_columns(
         self, db_session, foreign_tables, staging_tables, enable_factory_create
     ):
@@ -124,3 +124,70 @@ def test_build_mark_deleted_sql(source_table, destination_table):
         "NOT IN (SELECT test_source_table.id1, test_source_table.id2 \n"
         "FROM test_source_table))"
     )
+
+
+def test_build_select_key_range_end_sql(source_table):
+    select = sql.build_select_key_range_end_sql(source_table, None, 100)
+    sql_str = str(select)
+    assert "ORDER BY test_source_table.id1, test_source_table.id2\n LIMIT :param_1" in sql_str
+    assert "ORDER BY anon_1.id1 DESC, anon_1.id2 DESC" in sql_str
+    assert "WHERE" not in sql_str
+
+    select = sql.build_select_key_range_end_sql(source_table, (1, 2), 100)
+    assert "WHERE (test_source_table.id1, test_source_table.id2) > (:param_1, :param_2)" in str(
+        select
+    )
+
+
+def test_build_insert_new_rows_in_range_sql(source_table, destination_table):
+    insert = sql.build_insert_new_rows_in_range_sql(source_table, destination_table, (1, 2), (3, 4))
+    sql_str = str(insert)
+    assert sql_str.startswith(
+        "INSERT INTO test_destination_table (id1, id2, x, last_upd_date, created_date, is_deleted) "
+        "SELECT test_source_table.id1, test_source_table.id2, test_source_table.x, "
+        "test_source_table.last_upd_date, test_source_table.created_date, FALSE AS is_deleted \n"
+        "FROM test_source_table \n"
+    )
+    assert "(test_source_table.id1, test_source_table.id2) > (:param_1, :param_2)" in sql_str
+    assert "(test_source_table.id1, test_source_table.id2) <= (:param_3, :param_4)" in sql_str
+    assert (
+        "NOT (EXISTS (SELECT * \n"
+        "FROM test_destination_table \n"
+        "WHERE (test_destination_table.id1, test_destination_table.id2) = "
+        "(test_source_table.id1, test_source_table.id2)))"
+    ) in sql_str
+    assert "NOT IN" not in sql_str
+
+
+def test_build_update_rows_in_range_sql(source_table, destination_table):
+    cutoff = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+    update = sql.build_update_rows_in_range_sql(
+        source_table, destination_table, None, (3, 4), cutoff=cutoff
+    )
+    sql_str = str(update)
+    assert sql_str.startswith(
+        "UPDATE test_destination_table "
+        "SET id1=test_source_table.id1, id2=test_source_table.id2, x=test_source_table.x, "
+        "last_upd_date=test_source_table.last_upd_date, created_date=test_source_table.created_date "
+        "FROM test_source_table WHERE (test_destination_table.id1, test_destination_table.id2) = "
+        "(test_source_table.id1, test_source_table.id2) AND "
+        "(test_source_table.id1, test_source_table.id2) <= (:param_1, :param_2)"
+    )
+    assert (
+        "coalesce(test_destination_table.last_upd_date, test_destination_table.created_date) < test_source_table.last_upd_date"
+        in sql_str
+    )
+    assert "test_source_table.last_upd_date <= :last_upd_date_1" in sql_str
+
+
+def test_build_mark_deleted_not_exists_sql(source_table, destination_table):
+    update = sql.build_mark_deleted_not_exists_sql(source_table, destination_table)
+    assert str(update) == (
+        "UPDATE test_destination_table "
+        "SET is_deleted=:is_deleted "
+        "WHERE test_destination_table.is_deleted = false "
+        "AND NOT (EXISTS (SELECT * \n"
+        "FROM test_source_table \n"
+        "WHERE (test_source_table.id1, test_source_table.id2) = "
+        "(test_destination_table.id1, test_destination_table.id2)))"
+    )
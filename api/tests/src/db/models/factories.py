@@ -87,6 +87,7 @@ from src.db.models import agency_models
 from src.db.models.agency_models import Agency
 from src.db.models.lookup_models import LkCompetitionOpenToApplicant
 from src.form_schema.forms import SF424_v4_0, init_form_registry
+from src.services.opportunities_v1.opportunity_version import get_opportunity_data_hash
 from src.workflow.registry.workflow_registry import WorkflowRegistry
 
 # Needed for generating Opportunity Json Blob for OpportunityVersion
@@ -534,6 +535,9 @@ class OpportunityVersionFactory(BaseFactory):
     opportunity_id = factory.LazyAttribute(lambda o: o.opportunity.opportunity_id)
 
     opportunity_data = factory.LazyAttribute(lambda o: SCHEMA.dump(o.opportunity))
+    opportunity_data_hash = factory.LazyAttribute(
+        lambda o: get_opportunity_data_hash(o.opportunity_data)
+    )
 
 
 class ReferencedOpportunityFactory(BaseFactory):
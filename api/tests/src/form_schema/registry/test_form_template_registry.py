@@ -1,6 +1,7 @@
 import uuid
 
 import jsonref
+import jsonschema
 import pytest
 
 from src.db.models.competition_models import Form
@@ -122,6 +123,48 @@ def test_instances_are_isolated():
     assert registry_b.get_all() == []
 
 
+def test_register_builds_validator_once():
+    registry = FormTemplateRegistry()
+    form = _make_form(
+        json_schema={
+            "type": "object",
+            "properties": {"field": {"type": "string"}},
+            "required": ["field"],
+        }
+    )
+
+    registry.register(form, major_version=1)
+
+    validator = registry.get_validator(form)
+    assert registry.get_validator(form) is validator
+    assert validator.schema is form.form_json_schema
+    assert validator.is_valid({"field": "value"})
+    assert not validator.is_valid({})
+
+
+def test_get_validator_for_unregistered_form():
+    registry = FormTemplateRegistry()
+    form = _make_form(json_schema={"type": "object", "required": ["field"]})
+
+    validator = registry.get_validator(form)
+
+    assert validator is not registry.get_validator(form)
+    assert not validator.is_valid({})
+
+
+def test_get_validator_after_schema_replaced():
+    registry = FormTemplateRegistry()
+    form = _make_form()
+    registry.register(form, major_version=1)
+    registered_validator = registry.get_validator(form)
+
+    form.form_json_schema = {"type": "object", "required": ["field"]}
+
+    validator = registry.get_validator(form)
+    assert validator is not registered_validator
+    assert not validator.is_valid({})
+
+
 # ---------------------------------------------------------------------------
 # register() raise cases
 # ---------------------------------------------------------------------------
@@ -194,6 +237,14 @@ def test_register_raises_for_unresolvable_ref():
         registry.register(form, major_version=1)
 
 
+def test_register_raises_for_invalid_schema():
+    registry = FormTemplateRegistry()
+    form = _make_form(json_schema={"type": "not-a-type"})
+
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        registry.register(form, major_version=1)
+
+
 # ---------------------------------------------------------------------------
 # get_by_id_and_major_version() raise case
 # ---------------------------------------------------------------------------
@@ -1,10 +1,20 @@
 import logging
+import uuid
+from unittest import mock
 
 import freezegun
 import pytest
 from grants_shared.api.response import ValidationErrorDetail
 
-from src.form_schema.rule_processing.json_rule_processor import process_rule_schema_for_context
+import src.form_schema.rule_processing.json_rule_processor as json_rule_processor
+from src.form_schema.rule_processing.json_rule_context import JsonRuleConfig, JsonRuleContext
+from src.form_schema.rule_processing.json_rule_processor import (
+    ArrayPlanStep,
+    RulePlanStep,
+    get_rule_plan,
+    handlers,
+    process_rule_schema_for_context,
+)
 from src.validation.validation_constants import ValidationErrorType
 from tests.src.form_schema.rule_processing.conftest import setup_context
 
@@ -474,3 +484,56 @@ def test_bad_rule_schema_at_top_level_validation(enable_factory_create, caplog):
 
     # Verify we logged a message for an unexpected type
     assert "Unexpected type found when validating attachment ID: dict" in caplog.messages
+
+
+def test_get_rule_plan():
+    rule_plan = get_rule_plan(uuid.uuid4(), ARRAY_RULE_SCHEMA)
+
+    # The array field's rules are compiled relative to each item of the array
+    assert rule_plan[0] == ArrayPlanStep(
+        path=["my_array_field"],
+        steps=[
+            RulePlanStep(
+                handler="gg_pre_population",
+                handle=handlers["gg_pre_population"],
+                rule=ARRAY_RULE_SCHEMA["my_array_field"]["nested_field"]["gg_pre_population"],
+                path=["nested_field"],
+                order=1,
+            )
+        ],
+    )
+    assert [(step.path, step.order) for step in rule_plan[1:]] == [
+        (["x"], 1),
+        (["y"], 1),
+        (["z"], 1),
+        (["total_field"], 2),
+    ]
+
+
+def test_get_rule_plan_is_cached_per_form():
+    form_id = uuid.uuid4()
+    rule_schema = {"my_field": {"gg_validation": {"rule": "attachment"}}}
+
+    rule_plan = get_rule_plan(form_id, rule_schema)
+
+    assert get_rule_plan(form_id, rule_schema) is rule_plan
+    # A replaced rule schema gets compiled again
+    assert get_rule_plan(form_id, rule_schema.copy()) is not rule_plan
+
+
+def test_process_rule_schema_reuses_rule_plan(enable_factory_create):
+    json_data = {"my_array_field": [{"x": "1.00", "y": "2.00"}, {"z": "3.00"}]}
+    context = setup_context(json_data, rule_schema=ARRAY_RULE_SCHEMA)
+    process_rule_schema_for_context(context)
+
+    # Running again for the same form shouldn't walk the rule schema again
+    with mock.patch.object(
+        json_rule_processor,
+        "_compile_rule_plan",
+        side_effect=AssertionError("Rule plan should not be recompiled"),
+    ):
+        second_context = JsonRuleContext(context.application_form, JsonRuleConfig())
+        process_rule_schema_for_context(second_context)
+
+    assert second_context.json_data == context.json_data
+    assert second_context.json_data["total_field"] == "6.00"
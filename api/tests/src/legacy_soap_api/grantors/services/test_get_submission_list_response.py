@@ -1,5 +1,6 @@
 import io
 import logging
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -11,6 +12,7 @@ from src.legacy_soap_api.legacy_soap_api_config import (
     GRANTOR_SOAP_ACTION_PATH,
     SimplerSoapAPI,
     SOAPOperationConfig,
+    get_soap_config,
 )
 from src.legacy_soap_api.legacy_soap_api_schemas import (
     SOAPRequest,
@@ -84,10 +86,11 @@ def _make_operation_config():
     )
 
 
-def _setup_submission(agency, application_status=ApplicationStatus.ACCEPTED):
+def _setup_submission(agency, application_status=ApplicationStatus.ACCEPTED, **kwargs):
     return ApplicationSubmissionFactory.create(
         application__competition__opportunity__agency_code=agency.agency_code,
         application__application_status=application_status,
+        **kwargs,
     )
 
 
@@ -308,3 +311,80 @@ class TestGetSubmissionListResponseStatusFilter(BaseTestClass):
         )["Envelope"]["Body"]["GetSubmissionListResponse"]
         assert result.success is True
         assert "GrantsGovApplicationStatus" not in get_submission_list_response_dict.keys()
+
+
+class TestGetSubmissionListPaging(BaseTestClass):
+    @pytest.fixture(scope="class")
+    def setup_data(self, db_session, enable_factory_create):
+        agency = AgencyFactory.create()
+        # Each submission is a day apart, created in a shuffled order
+        now = datetime.now(UTC)
+        submissions = [
+            _setup_submission(agency, created_at=now - timedelta(days=days_ago))
+            for days_ago in [3, 0, 4, 1, 2]
+        ]
+        _, _, soap_client_certificate, _ = setup_cert_user(agency, {Privilege.LEGACY_AGENCY_VIEWER})
+        return {
+            "submissions": submissions,
+            "soap_client_certificate": soap_client_certificate,
+        }
+
+    @pytest.fixture(autouse=True)
+    def clear_soap_config(self):
+        get_soap_config.cache_clear()
+        yield
+        get_soap_config.cache_clear()
+
+    def _get_submission_list(self, db_session, setup_data):
+        soap_request = _make_soap_request(setup_data["soap_client_certificate"])
+        return get_submission_list(
+            db_session=db_session,
+            request=grantor_schemas.GetSubmissionListRequest(),
+            soap_request=soap_request,
+            soap_config=_make_operation_config(),
+        )
+
+    def test_get_submission_list_pages_through_every_submission(
+        self, db_session, enable_factory_create, setup_data, monkeypatch
+    ):
+        monkeypatch.setenv("SOAP_SUBMISSION_LIST_PAGE_SIZE", "2")
+
+        result = self._get_submission_list(db_session, setup_data)
+
+        assert len(result) == 5
+        assert {r.grants_gov_tracking_number for r in result} == {
+            f"GRANT{s.legacy_tracking_number}" for s in setup_data["submissions"]
+        }
+
+    def test_get_submission_list_stops_at_max_rows(
+        self, db_session, enable_factory_create, setup_data, monkeypatch, caplog
+    ):
+        caplog.set_level(logging.WARNING)
+        monkeypatch.setenv("SOAP_SUBMISSION_LIST_PAGE_SIZE", "2")
+        monkeypatch.setenv("SOAP_SUBMISSION_LIST_MAX_ROWS", "3")
+
+        result = self._get_submission_list(db_session, setup_data)
+
+        # The most recent submissions are the ones kept
+        newest_submissions = sorted(
+            setup_data["submissions"], key=lambda s: s.created_at, reverse=True
+        )[:3]
+        assert [r.grants_gov_tracking_number for r in result] == [
+            f"GRANT{s.legacy_tracking_number}" for s in newest_submissions
+        ]
+        assert "GetSubmissionList reached the max number of submissions to return" in caplog.text
+
+    def test_get_submission_list_exactly_max_rows_does_not_warn(
+        self, db_session, enable_factory_create, setup_data, monkeypatch, caplog
+    ):
+        caplog.set_level(logging.WARNING)
+        monkeypatch.setenv("SOAP_SUBMISSION_LIST_PAGE_SIZE", "2")
+        monkeypatch.setenv("SOAP_SUBMISSION_LIST_MAX_ROWS", "5")
+
+        result = self._get_submission_list(db_session, setup_data)
+
+        # Every submission fits under the max, so none were left out
+        assert len(result) == 5
+        assert (
+            "GetSubmissionList reached the max number of submissions to return" not in caplog.text
+        )
@@ -31,10 +31,12 @@ from src.legacy_soap_api.legacy_soap_api_config import (
     GRANTOR_SOAP_ACTION_PATH,
     SimplerSoapAPI,
     SOAPOperationConfig,
+    get_soap_config,
 )
 from src.legacy_soap_api.legacy_soap_api_schemas import SOAPResponse
 from src.legacy_soap_api.legacy_soap_api_schemas.base import SOAPRequest, SoapRequestStreamer
 from src.legacy_soap_api.legacy_soap_api_utils import SOAPFaultException
+from src.legacy_soap_api.soap_diff_worker import get_soap_diff_worker
 from tests.lib.data_factories import setup_cert_user
 from tests.lib.db_testing import cascade_delete_from_db_table
 from tests.src.db.models.factories import (
@@ -421,6 +423,46 @@ class TestSimplerBaseSOAPClient:
                     client.get_simpler_soap_response(proxy_response)
                     assert len(caplog.records) == 0
 
+    def test_get_simpler_soap_response_compares_responses_in_background_when_shadow_concurrency_enabled(
+        self, db_session, caplog, monkeypatch
+    ):
+        get_soap_config.cache_clear()
+        monkeypatch.setenv("SOAP_SHADOW_CONCURRENCY_ENABLED", "true")
+        soap_request = SOAPRequest(
+            data=SoapRequestStreamer(
+                stream=io.BytesIO(
+                    b"<soap:Envelope><Body><GetOpportunityListRequest></GetOpportunityListRequest></Body></soap:Envelope>"
+                )
+            ),
+            full_path="x",
+            headers={},
+            method="POST",
+            api_name=SimplerSoapAPI.APPLICANTS,
+            operation_name="GetOpportunityListRequest",
+        )
+        client = BaseSOAPClient(soap_request, db_session)
+        proxy_response = SOAPResponse(data=self.xml_streamer(), status_code=200, headers={})
+        with (
+            patch(
+                "src.legacy_soap_api.legacy_soap_api_client.BaseSOAPClient.get_soap_response_dict"
+            ) as mock_soap_response_dict,
+            patch(
+                "src.legacy_soap_api.legacy_soap_api_client.BaseSOAPClient.get_proxy_soap_response_dict"
+            ) as mock_get_proxy_soap_response_dict,
+        ):
+            caplog.set_level(logging.INFO)
+            mock_soap_response_dict.return_value = {}
+            mock_get_proxy_soap_response_dict.return_value = {}
+            client.get_simpler_soap_response(proxy_response)
+            get_soap_diff_worker().wait()
+
+        get_soap_config.cache_clear()
+        mock_get_proxy_soap_response_dict.assert_called_once_with(proxy_response)
+        assert caplog.records[-1].message == "soap_api_diff responses match"
+        assert caplog.records[-1].threadName == "soap-diff-worker"
+        # The proxy response was read in for the diff, but can still be returned
+        assert b"".join(proxy_response.stream()) == b"".join(self.xml_streamer())
+
 
 class TestSimplerSOAPGetApplicationZip:
     def test_get_simpler_soap_response_returns_mtom_xml(
@@ -795,6 +837,51 @@ class TestSimplerSOAPGetApplicationZip:
 
 
 class TestSimplerSOAPGetSubmissionListExpanded:
+    def get_soap_request(self):
+        request_xml_bytes = (
+            '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:agen="http://apply.grants.gov/services/AgencyWebServices-V2.0">'
+            "<soapenv:Body>"
+            "<agen:GetSubmissionListExpandedRequest>"
+            "</agen:GetSubmissionListExpandedRequest>"
+            "</soapenv:Body>"
+            "</soapenv:Envelope>"
+        ).encode("utf-8")
+        return SOAPRequest(
+            data=SoapRequestStreamer(stream=io.BytesIO(request_xml_bytes)),
+            full_path="x",
+            headers={},
+            method="POST",
+            api_name=SimplerSoapAPI.GRANTORS,
+            operation_name="GetSubmissionListExpandedRequest",
+        )
+
+    def test_prefetch_simpler_data_fetches_submissions_once(self, db_session):
+        client = SimplerGrantorsS2SClient(self.get_soap_request(), db_session)
+        proxy_response = SOAPResponse(data=b"", status_code=200, headers={})
+        with patch(
+            "src.legacy_soap_api.legacy_soap_api_client.get_submission_list"
+        ) as mock_get_submission_list:
+            mock_get_submission_list.return_value = []
+            client.prefetch_simpler_data()
+            mock_get_submission_list.assert_called_once()
+            assert mock_get_submission_list.call_args.kwargs["is_expanded"] is True
+
+            response = client.get_submission_list_expanded_request(proxy_response)
+            mock_get_submission_list.assert_called_once()
+            assert response.available_application_number == 0
+
+    def test_prefetch_simpler_data_raises_errors_when_building_response(self, db_session):
+        client = SimplerGrantorsS2SClient(self.get_soap_request(), db_session)
+        proxy_response = SOAPResponse(data=b"", status_code=200, headers={})
+        with patch(
+            "src.legacy_soap_api.legacy_soap_api_client.get_submission_list"
+        ) as mock_get_submission_list:
+            mock_get_submission_list.side_effect = SOAPClientUserDoesNotHavePermission()
+            # Prefetching holds on to the error until the response is built
+            client.prefetch_simpler_data()
+            with pytest.raises(SOAPClientUserDoesNotHavePermission):
+                client.get_submission_list_expanded_request(proxy_response)
+
     def setup_application_submission(
         self,
         agency,
@@ -18,9 +18,12 @@ from src.legacy_soap_api.legacy_soap_api_config import (
     get_soap_config,
 )
 from src.legacy_soap_api.legacy_soap_api_proxy import (
+    SOAP_JWT_CACHE,
+    SoapProxyAdapterPool,
     get_proxy_headers,
     get_proxy_response,
     get_soap_jwt_auth_jwt,
+    get_soap_proxy_adapter_pool,
 )
 from tests.lib.data_factories import create_soap_request
 
@@ -38,6 +41,12 @@ SOAP_PAYLOAD = (
 ).encode("utf-8")
 
 
+@pytest.fixture(autouse=True)
+def clear_soap_proxy_caches():
+    SOAP_JWT_CACHE.clear()
+    get_soap_proxy_adapter_pool().clear()
+
+
 def test_get_proxy_response(enable_factory_create, monkeypatch, db_session):
     soap_request = create_soap_request(SOAP_PAYLOAD)
     legacy_certificate = soap_request.auth.certificate.legacy_certificate
@@ -92,6 +101,35 @@ def test_get_soap_jwt_auth_jwt(enable_factory_create, caplog):
     assert "soap_client_certificate: created SOAP JWT" in caplog.messages
 
 
+def test_get_soap_jwt_auth_jwt_is_cached(enable_factory_create, caplog):
+    caplog.set_level(logging.INFO)
+    config = get_soap_config()
+    legacy_certificate = factories.LegacyAgencyCertificateFactory.create()
+    soap_client_certificate = SOAPClientCertificate(
+        cert="x",
+        fingerprint="1234",
+        issuer="issuer_string",
+        serial_number=legacy_certificate.serial_number,
+        legacy_certificate=legacy_certificate,
+        cert_id=legacy_certificate.cert_id,
+    )
+
+    with freeze_time("2024-04-03 12:00:00", tz_offset=0) as frozen_time:
+        first_jwt = get_soap_jwt_auth_jwt(config, soap_client_certificate)
+
+        # Reused while it has a while left before expiring
+        frozen_time.tick(30)
+        assert get_soap_jwt_auth_jwt(config, soap_client_certificate) == first_jwt
+        assert "soap_client_certificate: reused cached SOAP JWT" in caplog.messages
+
+        # But not when it's about to expire
+        frozen_time.tick(20)
+        second_jwt = get_soap_jwt_auth_jwt(config, soap_client_certificate)
+        assert second_jwt != first_jwt
+
+    assert caplog.messages.count("soap_client_certificate: created SOAP JWT") == 2
+
+
 @freeze_time("2024-04-03 12:00:00", tz_offset=0)
 def test_get_soap_jwt_auth_jwt_throws_exception_when_no_cert_id(enable_factory_create, caplog):
     caplog.set_level(logging.INFO)
@@ -201,3 +239,39 @@ def test_request_logs_locally(enable_factory_create, caplog):
         mock_get_response.return_value.to_bytes.return_value = response_bytes
         get_proxy_response(soap_request)
         assert f"\nsoap jwt proxy response:\n{response_bytes.decode('utf-8')}" in caplog.messages
+
+
+def test_soap_proxy_adapter_pool():
+    adapter_pool = SoapProxyAdapterPool(pool_maxsize=5)
+
+    adapter, pool_hit = adapter_pool.get_adapter("https://example.com/grantsws/services", None)
+    assert pool_hit is False
+    assert adapter._pool_maxsize == 5
+
+    # Same host and cert reuses the adapter
+    assert adapter_pool.get_adapter("https://example.com/other/path", None) == (adapter, True)
+
+    # A different cert or host gets a separate adapter
+    cert_adapter, pool_hit = adapter_pool.get_adapter("https://example.com/grantsws", "cert.pem")
+    assert pool_hit is False
+    assert cert_adapter is not adapter
+
+    host_adapter, pool_hit = adapter_pool.get_adapter("https://example.org/grantsws", None)
+    assert pool_hit is False
+    assert host_adapter is not adapter
+
+
+def test_get_proxy_response_reuses_adapter(enable_factory_create, caplog):
+    caplog.set_level(logging.INFO)
+    soap_request = create_soap_request(SOAP_PAYLOAD)
+
+    with patch("src.legacy_soap_api.legacy_soap_api_proxy.Session.send"):
+        get_proxy_response(soap_request)
+        get_proxy_response(soap_request)
+
+    pool_hits = [
+        record.soap_proxy_pool_hit
+        for record in caplog.records
+        if record.message == "soap_client: proxy request complete"
+    ]
+    assert pool_hits == [False, True]
@@ -1,12 +1,17 @@
 import io
+import threading
 from unittest.mock import patch
 
 from src.legacy_soap_api import legacy_soap_api_config as soap_api_config
 from src.legacy_soap_api.legacy_soap_api_auth import USE_SIMPLER_OVERRIDE_KEY
+from src.legacy_soap_api.legacy_soap_api_client import SimplerGrantorsS2SClient
 from src.legacy_soap_api.legacy_soap_api_config import SimplerSoapAPI
 from src.legacy_soap_api.legacy_soap_api_schemas import SOAPResponse
 from src.legacy_soap_api.legacy_soap_api_schemas.base import SOAPRequest, SoapRequestStreamer
-from src.legacy_soap_api.simpler_soap_api import get_simpler_soap_response
+from src.legacy_soap_api.simpler_soap_api import (
+    get_legacy_response_with_simpler_prefetch,
+    get_simpler_soap_response,
+)
 
 
 class TestSimplerSoapApi:
@@ -224,3 +229,79 @@ class TestSimplerSoapApi:
         ) as mock_get_simpler_soap_response:
             get_simpler_soap_response(soap_request, soap_proxy_response, db_session)
             mock_get_simpler_soap_response.assert_not_called()
+
+
+class TestGetLegacyResponseWithSimplerPrefetch:
+    def get_soap_request(self) -> SOAPRequest:
+        envelope = """
+            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:agen="http://apply.grants.gov/services/AgencyWebServices-V2.0">
+                <soapenv:Header/>
+                <soapenv:Body>
+                    <agen:GetSubmissionListExpandedRequest>
+                    </agen:GetSubmissionListExpandedRequest>
+                </soapenv:Body>
+            </soapenv:Envelope>
+        """.encode("utf-8")
+        return SOAPRequest(
+            data=SoapRequestStreamer(stream=io.BytesIO(envelope)),
+            full_path="x",
+            headers={},
+            method="POST",
+            api_name=SimplerSoapAPI.GRANTORS,
+            operation_name="GetSubmissionListExpandedRequest",
+        )
+
+    def test_calls_legacy_in_background_while_prefetching_simpler_data(
+        self, monkeypatch, db_session
+    ):
+        soap_api_config.get_soap_config.cache_clear()
+        monkeypatch.setenv("USE_SIMPLER", "true")
+        soap_proxy_response = SOAPResponse(data=b"proxy", status_code=200, headers={})
+        legacy_thread_names = []
+
+        def mock_legacy_response(soap_request):
+            legacy_thread_names.append(threading.current_thread().name)
+            return soap_proxy_response
+
+        with (
+            patch(
+                "src.legacy_soap_api.simpler_soap_api.get_legacy_response",
+                side_effect=mock_legacy_response,
+            ),
+            patch(
+                "src.legacy_soap_api.legacy_soap_api_client.SimplerGrantorsS2SClient.prefetch_simpler_data"
+            ) as mock_prefetch_simpler_data,
+        ):
+            legacy_response, simpler_soap_client = get_legacy_response_with_simpler_prefetch(
+                self.get_soap_request(), db_session
+            )
+
+        soap_api_config.get_soap_config.cache_clear()
+        assert legacy_response is soap_proxy_response
+        assert isinstance(simpler_soap_client, SimplerGrantorsS2SClient)
+        mock_prefetch_simpler_data.assert_called_once()
+        assert legacy_thread_names[0].startswith("soap-shadow")
+
+    def test_does_not_prefetch_simpler_data_when_use_simpler_is_false(
+        self, monkeypatch, db_session
+    ):
+        soap_api_config.get_soap_config.cache_clear()
+        monkeypatch.setenv("USE_SIMPLER", "false")
+        soap_proxy_response = SOAPResponse(data=b"proxy", status_code=200, headers={})
+        with (
+            patch(
+                "src.legacy_soap_api.simpler_soap_api.get_legacy_response",
+                return_value=soap_proxy_response,
+            ),
+            patch(
+                "src.legacy_soap_api.legacy_soap_api_client.SimplerGrantorsS2SClient.prefetch_simpler_data"
+            ) as mock_prefetch_simpler_data,
+        ):
+            legacy_response, simpler_soap_client = get_legacy_response_with_simpler_prefetch(
+                self.get_soap_request(), db_session
+            )
+
+        soap_api_config.get_soap_config.cache_clear()
+        assert legacy_response is soap_proxy_response
+        assert simpler_soap_client is None
+        mock_prefetch_simpler_data.assert_not_called()
@@ -0,0 +1,91 @@
+import logging
+import threading
+
+import flask
+
+from src.legacy_soap_api.legacy_soap_api_constants import LegacySoapApiEvent
+from src.legacy_soap_api.soap_diff_worker import SoapDiffWorker
+
+
+def test_soap_diff_worker_runs_diffs_off_the_calling_thread():
+    worker = SoapDiffWorker(max_queue_size=5)
+    thread_names = []
+
+    assert worker.submit(lambda: thread_names.append(threading.current_thread().name))
+    worker.wait()
+
+    assert thread_names == ["soap-diff-worker"]
+
+
+def test_soap_diff_worker_drops_diffs_when_queue_is_full(caplog):
+    caplog.set_level(logging.INFO)
+    worker = SoapDiffWorker(max_queue_size=1)
+    started, release = threading.Event(), threading.Event()
+    ran = []
+
+    def blocking_diff():
+        started.set()
+        release.wait(timeout=5)
+        ran.append("blocking")
+
+    # The first diff is picked up by the worker, the second waits in the queue
+    assert worker.submit(blocking_diff)
+    started.wait(timeout=5)
+    assert worker.submit(lambda: ran.append("queued"))
+    assert worker.submit(lambda: ran.append("dropped")) is False
+
+    release.set()
+    worker.wait()
+
+    assert ran == ["blocking", "queued"]
+    dropped_logs = [r for r in caplog.records if r.message.startswith("soap_api_diff dropped")]
+    assert len(dropped_logs) == 1
+    assert dropped_logs[0].soap_api_event == LegacySoapApiEvent.SOAP_DIFF_DROPPED
+
+
+def test_soap_diff_worker_keeps_running_after_a_failed_diff(caplog):
+    worker = SoapDiffWorker(max_queue_size=5)
+    ran = []
+
+    def failing_diff():
+        raise ValueError("bad diff")
+
+    worker.submit(failing_diff)
+    worker.submit(lambda: ran.append("after"))
+    worker.wait()
+
+    assert ran == ["after"]
+    assert any(r.message == "soap_api_diff incomplete" for r in caplog.records)
+
+
+class RequestPathFilter(logging.Filter):
+    """Adds the current request's path to log records, the way the request logging does"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if flask.has_request_context():
+            record.request_path = flask.request.path
+        return True
+
+
+def test_soap_diff_worker_keeps_the_request_log_context(caplog):
+    caplog.set_level(logging.INFO)
+    diff_logger = logging.getLogger("test_soap_diff_worker.diff")
+    request_path_filter = RequestPathFilter()
+    diff_logger.addFilter(request_path_filter)
+
+    worker = SoapDiffWorker(max_queue_size=5)
+    app = flask.Flask(__name__)
+
+    try:
+        # The request has finished by the time the diff runs
+        with app.test_request_context(
+            "/grantsws-applicant/services/v2/ApplicantWebServicesSoapPort"
+        ):
+            assert worker.submit(lambda: diff_logger.info("soap_api_diff complete"))
+        worker.wait()
+    finally:
+        diff_logger.removeFilter(request_path_filter)
+
+    diff_log = next(r for r in caplog.records if r.message == "soap_api_diff complete")
+    assert diff_log.threadName == "soap-diff-worker"
+    assert diff_log.request_path == "/grantsws-applicant/services/v2/ApplicantWebServicesSoapPort"
@@ -10,6 +10,7 @@ from src.legacy_soap_api.soap_payload_handler import (
     extract_soap_xml,
     get_envelope_dict,
     get_soap_envelope_from_payload,
+    get_soap_operation_dict,
     get_soap_operation_name,
 )
 from tests.util.minifiers import minify_xml
@@ -369,3 +370,70 @@ class TestExtractSoapXML(unittest.TestCase):
         xml_bytes = extract_soap_xml(soap_bytes)
         result = get_gov_grants_tracking_number(xml_bytes)
         assert result == "GRANT80000038"
+
+
+class TestGetSoapOperationDict:
+    def test_matches_soap_payload_dict(self):
+        soap_payload = SOAPPayload(
+            MOCK_SOAP_RESPONSE, force_list_attributes=("OpportunityDetails",)
+        )
+        expected = get_envelope_dict(soap_payload.to_dict(), MOCK_SOAP_OPERATION_NAME)
+
+        given = get_soap_operation_dict(
+            MOCK_SOAP_RESPONSE.encode("utf-8"),
+            MOCK_SOAP_OPERATION_NAME,
+            force_list_attributes=("OpportunityDetails",),
+        )
+        assert given == expected
+
+    def test_handles_envelope_tag_split_across_chunks(self):
+        soap_bytes = (ALMOST_ONE_CHUNK + MOCK_SOAP_RESPONSE).encode("utf-8")
+        chunks = (soap_bytes[i : i + 1000] for i in range(0, len(soap_bytes), 1000))
+
+        given = get_soap_operation_dict(chunks, MOCK_SOAP_OPERATION_NAME)
+        assert given == get_soap_operation_dict(MOCK_SOAP_ENVELOPE, MOCK_SOAP_OPERATION_NAME)
+        assert given["OpportunityDetails"] == {
+            "OpeningDate": "2025-03-20-04:00",
+            "ClosingDate": "2025-07-26-04:00",
+        }
+
+    def test_stops_reading_at_end_of_operation(self):
+        read_chunks = []
+
+        def chunks():
+            for chunk in [
+                MOCK_SOAP_REQUEST_HEADER,
+                MOCK_SOAP_REQUEST_ENVELOPE,
+                MOCK_SOAP_REQUEST_ATTACHMENT,
+            ]:
+                read_chunks.append(chunk)
+                yield chunk
+
+        given = get_soap_operation_dict(chunks(), MOCK_SOAP_OPERATION_NAME)
+        assert given["Attachment"]["FileContentId"] == "Dummy.pdf"
+        assert given["Attachment"]["FileDataHandler"]["Include"] == {
+            "@href": "cid:0000",
+            "@xmlns:inc": "http://www.w3.org/2004/08/xop/include",
+        }
+        # The attachment after the envelope is never read
+        assert MOCK_SOAP_REQUEST_ATTACHMENT not in read_chunks
+
+    def test_empty_operation_is_none(self):
+        soap_xml = (
+            '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:agen="http://apply.grants.gov/services/AgencyWebServices-V2.0">'
+            "<soapenv:Body><agen:GetSubmissionListRequest></agen:GetSubmissionListRequest></soapenv:Body>"
+            "</soapenv:Envelope>"
+        )
+        assert get_soap_operation_dict(soap_xml, "GetSubmissionListRequest") is None
+
+    @pytest.mark.parametrize(
+        "soap_xml",
+        [
+            "",
+            "randomdata939023",
+            MOCK_SOAP_REQUEST_NO_TAG_ENVELOPE,
+            MOCK_SOAP_ENVELOPE.replace(MOCK_SOAP_OPERATION_NAME, "OtherOperation"),
+        ],
+    )
+    def test_returns_empty_dict_when_operation_not_found(self, soap_xml):
+        assert get_soap_operation_dict(soap_xml, MOCK_SOAP_OPERATION_NAME) == {}
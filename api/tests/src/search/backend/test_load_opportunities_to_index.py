@@ -1,14 +1,18 @@
 import pytest
+from sqlalchemy import select
 
+from src.db.models.opportunity_models import OpportunityIndexDeleteQueue
 from src.search.backend.load_opportunities_to_index import (
     LoadOpportunitiesToIndex,
     LoadOpportunitiesToIndexConfig,
 )
+from src.task.opportunities.set_current_opportunities_task import SetCurrentOpportunitiesTask
 from tests.conftest import BaseTestClass
 from tests.src.db.models.factories import (
     AgencyFactory,
     OpportunityChangeAuditFactory,
     OpportunityFactory,
+    OpportunityIndexDeleteQueueFactory,
 )
 
 
@@ -129,6 +133,10 @@ class TestLoadOpportunitiesToIndexFullRefresh(BaseTestClass):
             == 3
         )
 
+        # Each phase of the build is timed
+        for phase in ["create_index", "load_records", "swap_alias", "cleanup_old_indices"]:
+            assert f"{phase}_duration_sec" in load_opportunities_to_index.metrics
+
         # Rerunning but first add a few more opportunities to show up
         opportunities.extend(OpportunityFactory.create_batch(size=3, opportunity_attachments=[]))
         load_opportunities_to_index.index_name = (
@@ -178,3 +186,216 @@ class TestLoadOpportunitiesToIndexFullRefresh(BaseTestClass):
         assert (
             not missing_included
         ), f"Expected opportunities missing from index: {missing_included}"
+
+    def test_load_opportunities_to_index_pipeline_batches(
+        self,
+        enable_factory_create,
+        db_session,
+        search_client,
+        opportunity_index_alias,
+    ):
+        opportunities = OpportunityFactory.create_batch(
+            size=7, is_posted_summary=True, opportunity_attachments=[]
+        )
+
+        # Small batches so the records get spread across several workers
+        config = LoadOpportunitiesToIndexConfig(
+            alias_name=opportunity_index_alias,
+            index_prefix="test-load-opps-pipeline",
+            pipeline_batch_size=2,
+            pipeline_worker_count=3,
+        )
+        load_opportunities_to_index = LoadOpportunitiesToIndex(db_session, search_client, config)
+        load_opportunities_to_index.run()
+
+        resp = search_client.search(opportunity_index_alias, {"size": 100})
+        indexed_ids = set([record["opportunity_id"] for record in resp.records])
+        assert set([str(opp.opportunity_id) for opp in opportunities]) <= indexed_ids
+        assert (
+            load_opportunities_to_index.metrics[load_opportunities_to_index.Metrics.RECORDS_LOADED]
+            == resp.total_records
+        )
+
+        metrics = load_opportunities_to_index.metrics
+        for stage in ["record_fetch", "serialize", "bulk_request"]:
+            assert f"pipeline_{stage}_duration_sec" in metrics
+            assert metrics[f"pipeline_{stage}_records_per_sec"] >= 0
+        # The time spent on bulk requests is measured
+        assert metrics["pipeline_bulk_request_duration_sec"] > 0
+        assert metrics["pipeline_bulk_request_records_per_sec"] > 0
+
+
+class TestLoadOpportunitiesToIndexIncremental(BaseTestClass):
+    @pytest.fixture(scope="class")
+    def load_config(self, opportunity_index_alias):
+        return LoadOpportunitiesToIndexConfig(
+            alias_name=opportunity_index_alias,
+            index_prefix="test-load-opps-incremental",
+        )
+
+    def _get_indexed_ids(self, search_client, opportunity_index_alias) -> set[str]:
+        # Incremental loads don't force a refresh, so do it before querying
+        search_client._client.indices.refresh(index=opportunity_index_alias)
+        resp = search_client.search(opportunity_index_alias, {"size": 100})
+        return set([record["opportunity_id"] for record in resp.records])
+
+    def test_incremental_updates_and_deletes(
+        self,
+        truncate_opportunities,
+        enable_factory_create,
+        db_session,
+        search_client,
+        opportunity_index_alias,
+        load_config,
+    ):
+        existing_opportunities = OpportunityFactory.create_batch(
+            size=5, is_posted_summary=True, opportunity_attachments=[]
+        )
+        # Build the index that the incremental load will then update
+        LoadOpportunitiesToIndex(db_session, search_client, load_config).run()
+        assert self._get_indexed_ids(search_client, opportunity_index_alias) == set(
+            [str(opp.opportunity_id) for opp in existing_opportunities]
+        )
+
+        # New opportunities that were queued
+        new_opportunities = OpportunityFactory.create_batch(
+            size=3, is_forecasted_summary=True, opportunity_attachments=[]
+        )
+        new_audits = [
+            OpportunityChangeAuditFactory.create(opportunity=opp) for opp in new_opportunities
+        ]
+
+        # An existing opportunity that was changed back to a draft
+        draft_opportunity = existing_opportunities[0]
+        draft_opportunity.is_draft = True
+        draft_audit = OpportunityChangeAuditFactory.create(opportunity=draft_opportunity)
+
+        # An existing opportunity that was deleted
+        deleted_opportunity = existing_opportunities[1]
+        db_session.delete(deleted_opportunity)
+
+        # A queued opportunity that was already loaded isn't picked up again
+        already_loaded = OpportunityFactory.create(opportunity_attachments=[])
+        OpportunityChangeAuditFactory.create(opportunity=already_loaded, is_loaded_to_search=True)
+        db_session.commit()
+
+        incremental_load = LoadOpportunitiesToIndex(
+            db_session, search_client, load_config, is_full_refresh=False
+        )
+        assert incremental_load.index_name == opportunity_index_alias
+        incremental_load.run()
+
+        expected_ids = set(
+            [str(opp.opportunity_id) for opp in existing_opportunities[2:] + new_opportunities]
+        )
+        assert self._get_indexed_ids(search_client, opportunity_index_alias) == expected_ids
+
+        assert incremental_load.metrics[incremental_load.Metrics.RECORDS_LOADED] == len(
+            new_opportunities
+        )
+        assert incremental_load.metrics[incremental_load.Metrics.RECORDS_DELETED] == 2
+
+        # The queues are drained
+        for audit in new_audits + [draft_audit]:
+            db_session.refresh(audit)
+            assert audit.is_loaded_to_search is True
+        assert db_session.scalars(select(OpportunityIndexDeleteQueue)).all() == []
+
+        # Running again with nothing queued doesn't change anything
+        incremental_load = LoadOpportunitiesToIndex(
+            db_session, search_client, load_config, is_full_refresh=False
+        )
+        incremental_load.run()
+        assert incremental_load.metrics[incremental_load.Metrics.RECORDS_LOADED] == 0
+        assert self._get_indexed_ids(search_client, opportunity_index_alias) == expected_ids
+
+    def test_incremental_removes_opportunity_without_current_summary(
+        self,
+        truncate_opportunities,
+        enable_factory_create,
+        db_session,
+        search_client,
+        opportunity_index_alias,
+        load_config,
+    ):
+        opportunities = OpportunityFactory.create_batch(
+            size=2, is_posted_summary=True, opportunity_attachments=[]
+        )
+        LoadOpportunitiesToIndex(db_session, search_client, load_config).run()
+
+        # Making the opportunity a draft has the set current opportunities
+        # task delete its current opportunity summary
+        removed_opportunity = opportunities[0]
+        removed_opportunity.is_draft = True
+        SetCurrentOpportunitiesTask(db_session)._process_opportunity(removed_opportunity)
+        db_session.commit()
+
+        assert db_session.scalars(select(OpportunityIndexDeleteQueue.opportunity_id)).all() == [
+            removed_opportunity.opportunity_id
+        ]
+
+        incremental_load = LoadOpportunitiesToIndex(
+            db_session, search_client, load_config, is_full_refresh=False
+        )
+        incremental_load.run()
+
+        assert self._get_indexed_ids(search_client, opportunity_index_alias) == {
+            str(opportunities[1].opportunity_id)
+        }
+        assert incremental_load.metrics[incremental_load.Metrics.RECORDS_DELETED] == 1
+        assert db_session.scalars(select(OpportunityIndexDeleteQueue)).all() == []
+
+    def test_incremental_reloads_opportunity_with_deleted_link_record(
+        self,
+        truncate_opportunities,
+        enable_factory_create,
+        db_session,
+        search_client,
+        opportunity_index_alias,
+        load_config,
+    ):
+        opportunity = OpportunityFactory.create(is_posted_summary=True, opportunity_attachments=[])
+        LoadOpportunitiesToIndex(db_session, search_client, load_config).run()
+
+        # Removing an applicant type queues the opportunity, but it's still
+        # loadable so it's reloaded rather than removed from the index
+        summary = opportunity.current_opportunity_summary.opportunity_summary
+        summary.link_applicant_types = summary.link_applicant_types[1:]
+        db_session.commit()
+
+        incremental_load = LoadOpportunitiesToIndex(
+            db_session, search_client, load_config, is_full_refresh=False
+        )
+        incremental_load.run()
+
+        assert self._get_indexed_ids(search_client, opportunity_index_alias) == {
+            str(opportunity.opportunity_id)
+        }
+        assert incremental_load.metrics[incremental_load.Metrics.RECORDS_LOADED] == 1
+        assert incremental_load.metrics[incremental_load.Metrics.RECORDS_DELETED] == 0
+        assert db_session.scalars(select(OpportunityIndexDeleteQueue)).all() == []
+
+    def test_full_refresh_clears_queues(
+        self,
+        truncate_opportunities,
+        enable_factory_create,
+        db_session,
+        search_client,
+        load_config,
+    ):
+        opportunity = OpportunityFactory.create(opportunity_attachments=[])
+        audit = OpportunityChangeAuditFactory.create(opportunity=opportunity)
+        OpportunityIndexDeleteQueueFactory.create()
+        db_session.commit()
+
+        load_opportunities_to_index = LoadOpportunitiesToIndex(
+            db_session, search_client, load_config
+        )
+        load_opportunities_to_index.index_name = (
+            load_opportunities_to_index.index_name + "-clear-queues"
+        )
+        load_opportunities_to_index.run()
+
+        db_session.refresh(audit)
+        assert audit.is_loaded_to_search is True
+        assert db_session.scalars(select(OpportunityIndexDeleteQueue)).all() == []
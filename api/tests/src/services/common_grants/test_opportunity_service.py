@@ -19,6 +19,7 @@ from common_grants_sdk.schemas.pydantic import (
 
 from src.constants.lookup_constants import OpportunityStatus
 from src.services.common_grants.opportunity_service import CommonGrantsOpportunityService
+from src.services.common_grants.transformation import SEARCH_RESULT_SOURCE_INCLUDES
 
 
 class TestCommonGrantsOpportunityService:
@@ -107,7 +108,7 @@ class TestCommonGrantsOpportunityService:
         """Test searching opportunities with default parameters."""
         # Mock the search_opportunities function from opportunities_v1
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             # Mock the return values
             mock_pagination = Mock()
@@ -115,7 +116,7 @@ class TestCommonGrantsOpportunityService:
             mock_pagination.page_size = 10
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             search_request = OpportunitySearchRequest()
             opportunities, pagination_info, _filter_errors = (
@@ -132,14 +133,14 @@ class TestCommonGrantsOpportunityService:
         """Test searching opportunities with custom pagination."""
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 2
             mock_pagination.page_size = 5
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             pagination = PaginatedBodyParams(page=2, page_size=5)
             search_request = OpportunitySearchRequest(pagination=pagination)
@@ -157,14 +158,14 @@ class TestCommonGrantsOpportunityService:
         """Test searching opportunities with custom sorting."""
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
             mock_pagination.page_size = 10
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             sorting = OppSorting(sort_by=OppSortBy.TITLE, sort_order=SortOrder.ASC)
             search_request = OpportunitySearchRequest(sorting=sorting)
@@ -181,14 +182,14 @@ class TestCommonGrantsOpportunityService:
         """Test searching opportunities with status filter."""
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
             mock_pagination.page_size = 10
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             # Fix the status filter format to match the schema requirements
             status_filter = StringArrayFilter(
@@ -208,14 +209,14 @@ class TestCommonGrantsOpportunityService:
     def test_search_opportunities_surfaces_custom_filter_errors(self, mock_search_client):
         """Custom-filter errors derived in the transform surface through the service."""
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
             mock_pagination.page_size = 10
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             filters = OppFilters.model_validate(
                 {"customFilters": {"bogus": {"operator": "in", "value": ["x"]}}}
@@ -232,14 +233,14 @@ class TestCommonGrantsOpportunityService:
     def test_search_opportunities_with_text_search(self, mock_search_client):
         """Test searching opportunities with text search."""
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
             mock_pagination.page_size = 10
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             search_request = OpportunitySearchRequest(search="test")
             opportunities, pagination_info, _filter_errors = (
@@ -255,14 +256,14 @@ class TestCommonGrantsOpportunityService:
         """Test searching opportunities with all parameters specified."""
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 2
             mock_pagination.page_size = 5
             mock_pagination.total_records = 0
             mock_pagination.total_pages = 0
-            mock_search.return_value = ([], {}, mock_pagination)
+            mock_search.return_value = ([], mock_pagination)
 
             # Fix the status filter format to match the schema requirements
             status_filter = StringArrayFilter(
@@ -351,7 +352,7 @@ class TestCommonGrantsOpportunityService:
         }
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
@@ -362,7 +363,6 @@ class TestCommonGrantsOpportunityService:
             # Return mix of valid and invalid data
             mock_search.return_value = (
                 [valid_opp_1, invalid_opp, valid_opp_2],
-                {},
                 mock_pagination,
             )
 
@@ -419,7 +419,7 @@ class TestCommonGrantsOpportunityService:
         }
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
@@ -428,7 +428,7 @@ class TestCommonGrantsOpportunityService:
             mock_pagination.total_pages = 1
 
             # Return mix of valid and invalid data
-            mock_search.return_value = ([valid_opp, invalid_opp], {}, mock_pagination)
+            mock_search.return_value = ([valid_opp, invalid_opp], mock_pagination)
 
             pagination = PaginatedBodyParams(page=1, page_size=10)
             opportunities, pagination_info = CommonGrantsOpportunityService.list_opportunities(
@@ -457,7 +457,7 @@ class TestCommonGrantsOpportunityService:
         invalid_opp_2 = {"opportunity_id": "not-a-uuid-2", "invalid_field": "invalid_value"}
 
         with patch(
-            "src.services.common_grants.opportunity_service.search_opportunities"
+            "src.services.common_grants.opportunity_service.search_opportunities_source"
         ) as mock_search:
             mock_pagination = Mock()
             mock_pagination.page_offset = 1
@@ -466,7 +466,7 @@ class TestCommonGrantsOpportunityService:
             mock_pagination.total_pages = 1
 
             # Return only invalid data
-            mock_search.return_value = ([invalid_opp_1, invalid_opp_2], {}, mock_pagination)
+            mock_search.return_value = ([invalid_opp_1, invalid_opp_2], mock_pagination)
 
             search_request = OpportunitySearchRequest()
             opportunities, pagination_info, _filter_errors = (
@@ -489,3 +489,52 @@ class TestCommonGrantsOpportunityService:
                 and "Failed to transform search result to CommonGrants format:" in record.message
             ]
             assert len(warning_logs) == 2
+
+    def test_search_opportunities_requests_only_cg_fields(self, mock_search_client):
+        """Test that searches skip aggregations and only fetch the fields the CG model needs."""
+        CommonGrantsOpportunityService.search_opportunities(
+            mock_search_client, OpportunitySearchRequest(search="test")
+        )
+
+        search_call = mock_search_client.search.call_args
+        search_request = search_call.args[1]
+        assert "aggs" not in search_request
+        assert search_request["track_total_hits"] is True
+        assert search_call.kwargs["includes"] == SEARCH_RESULT_SOURCE_INCLUDES
+        assert search_call.kwargs["include_scores"] is False
+
+    def test_search_opportunities_transforms_search_index_records(self, mock_search_client):
+        """Test that records are transformed as they are stored in the search index."""
+        opportunity_id = uuid4()
+        mock_search_client.search.return_value.total_records = 1
+        mock_search_client.search.return_value.records = [
+            {
+                "opportunity_id": str(opportunity_id),
+                "opportunity_title": "Search Index Opportunity",
+                "opportunity_status": "posted",
+                "category": "discretionary",
+                "summary": {
+                    "summary_description": "A description",
+                    "post_date": "2024-01-15",
+                    "close_date": "2024-03-15",
+                    "award_ceiling": 5000,
+                    "created_at": "2024-01-01T12:00:00+00:00",
+                    "updated_at": "2024-01-02T12:00:00+00:00",
+                },
+            }
+        ]
+
+        opportunities, pagination_info = CommonGrantsOpportunityService.list_opportunities(
+            mock_search_client, PaginatedBodyParams(page=1, page_size=10)
+        )
+
+        assert len(opportunities) == 1
+        opportunity = opportunities[0]
+        assert opportunity.id == opportunity_id
+        assert opportunity.title == "Search Index Opportunity"
+        assert opportunity.status.value == OppStatusOptions.OPEN
+        assert opportunity.key_dates.post_date.date.isoformat() == "2024-01-15"
+        assert opportunity.funding.max_award_amount.amount == "5000"
+        assert opportunity.custom_fields["federalFundingSource"].value == "discretionary"
+        assert opportunity.created_at == datetime.fromisoformat("2024-01-01T12:00:00+00:00")
+        assert pagination_info.total_items == 1
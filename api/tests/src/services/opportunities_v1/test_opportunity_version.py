@@ -1,11 +1,19 @@
+from datetime import datetime
+
+import src.services.opportunities_v1.opportunity_version as opportunity_version
 from src.constants.lookup_constants import OpportunityCategory
 from src.db.models.opportunity_models import OpportunityVersion
-from src.services.opportunities_v1.opportunity_version import save_opportunity_version
+from src.services.opportunities_v1.opportunity_version import (
+    get_latest_opportunity_versions,
+    get_opportunity_data_hash,
+    save_opportunity_version,
+)
 from tests.src.db.models.factories import (
     AgencyFactory,
     OpportunityAssistanceListingFactory,
     OpportunityAttachmentFactory,
     OpportunityFactory,
+    OpportunityVersionFactory,
 )
 
 
@@ -63,6 +71,7 @@ def test_save_opportunity_version(db_session, enable_factory_create):
     assert len(saved_opp_version) == 1
     assert saved_opp_version[0].opportunity_id == opp.opportunity_id
     assert saved_opp_version[0].opportunity_data == expected
+    assert saved_opp_version[0].opportunity_data_hash == get_opportunity_data_hash(expected)
 
 
 def test_save_opportunity_version_with_attachments(db_session, enable_factory_create):
@@ -125,3 +134,69 @@ def test_save_opportunity_version_with_prior_versions(db_session, enable_factory
     save_opportunity_version(db_session, opp)
     db_session.refresh(opp)
     assert len(opp.versions) == 3
+
+
+def test_get_opportunity_data_hash_ignores_key_order():
+    assert get_opportunity_data_hash({"a": 1, "b": {"c": 2, "d": 3}}) == get_opportunity_data_hash(
+        {"b": {"d": 3, "c": 2}, "a": 1}
+    )
+    assert get_opportunity_data_hash({"a": 1}) != get_opportunity_data_hash({"a": 2})
+
+
+def test_get_latest_opportunity_versions(db_session, enable_factory_create):
+    opp1 = OpportunityFactory.create()
+    OpportunityVersionFactory.create(opportunity=opp1, created_at=datetime(2024, 1, 1))
+    latest_opp1_version = OpportunityVersionFactory.create(
+        opportunity=opp1, created_at=datetime(2024, 3, 1)
+    )
+    OpportunityVersionFactory.create(opportunity=opp1, created_at=datetime(2024, 2, 1))
+
+    opp2 = OpportunityFactory.create()
+    latest_opp2_version = OpportunityVersionFactory.create(opportunity=opp2)
+
+    # No versions at all
+    opp3 = OpportunityFactory.create()
+
+    latest_versions = get_latest_opportunity_versions(
+        db_session, [opp1.opportunity_id, opp2.opportunity_id, opp3.opportunity_id]
+    )
+    assert latest_versions == {
+        opp1.opportunity_id: latest_opp1_version,
+        opp2.opportunity_id: latest_opp2_version,
+    }
+
+
+def test_save_opportunity_version_matching_hash_skips_diff(
+    db_session, enable_factory_create, monkeypatch
+):
+    opp = OpportunityFactory.create()
+    save_opportunity_version(db_session, opp)
+
+    def fail_diff(*args, **kwargs):
+        raise AssertionError("The diff should not run when the hash matches")
+
+    monkeypatch.setattr(opportunity_version, "diff_nested_dicts", fail_diff)
+
+    assert save_opportunity_version(db_session, opp) is False
+    db_session.refresh(opp)
+    assert len(opp.versions) == 1
+
+
+def test_save_opportunity_version_without_hash(db_session, enable_factory_create):
+    # Versions created before we stored a hash are diffed as before
+    opp = OpportunityFactory.create()
+    prior_version = OpportunityVersionFactory.create(opportunity=opp, opportunity_data_hash=None)
+
+    assert save_opportunity_version(db_session, opp) is False
+    db_session.refresh(opp)
+    assert len(opp.versions) == 1
+
+    # and pick up a hash when found to be unchanged
+    assert prior_version.opportunity_data_hash == get_opportunity_data_hash(
+        prior_version.opportunity_data
+    )
+
+    opp.opportunity_title = "A new opportunity title"
+    assert save_opportunity_version(db_session, opp) is True
+    db_session.refresh(opp)
+    assert len(opp.versions) == 2
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 from src.adapters.search.opensearch_response import SearchResponse
 from src.services.opportunities_v1.search_opportunities import (
     CSV_SOURCE_INCLUDES,
+    get_search_query_fingerprint,
     search_opportunities,
     search_opportunities_csv,
 )
@@ -176,3 +177,65 @@ class TestSearchOpportunitiesCsv:
         assert search_request["size"] == 7
         assert search_request["from"] == 14
         assert search_request["sort"] == [{"opportunity_id.keyword": {"order": "asc"}}]
+
+
+class TestSearchQueryFingerprint:
+    def test_equivalent_queries_match(self):
+        fingerprint = get_search_query_fingerprint(
+            {
+                "query": "research",
+                "filters": {
+                    "agency": {"one_of": ["HHS", "DOD"]},
+                    "assistance_listing_number": {"one_of": ["10.abc"]},
+                },
+            }
+        )
+
+        equivalent_queries = [
+            # Different key order
+            {
+                "filters": {
+                    "assistance_listing_number": {"one_of": ["10.abc"]},
+                    "agency": {"one_of": ["HHS", "DOD"]},
+                },
+                "query": "research",
+            },
+            # Different filter value order and ALN casing
+            {
+                "query": "research",
+                "filters": {
+                    "agency": {"one_of": ["DOD", "HHS"]},
+                    "assistance_listing_number": {"one_of": ["10.ABC"]},
+                },
+            },
+            # Defaults set explicitly, pagination and empty filters ignored
+            {
+                "query": "research ",
+                "query_operator": "AND",
+                "experimental": {"scoring_rule": "default"},
+                "pagination": {"page_offset": 2, "page_size": 10},
+                "filters": {
+                    "agency": {"one_of": ["HHS", "DOD"]},
+                    "assistance_listing_number": {"one_of": ["10.abc"]},
+                    "funding_instrument": {"one_of": None},
+                    "post_date": {},
+                },
+            },
+        ]
+
+        for search_query in equivalent_queries:
+            assert get_search_query_fingerprint(search_query) == fingerprint
+
+    def test_different_queries_do_not_match(self):
+        base_query = {"query": "research", "filters": {"agency": {"one_of": ["HHS"]}}}
+        fingerprint = get_search_query_fingerprint(base_query)
+
+        different_queries = [
+            base_query | {"query": "education"},
+            base_query | {"query_operator": "OR"},
+            base_query | {"filters": {"agency": {"one_of": ["HHS", "DOD"]}}},
+            base_query | {"filters": {"award_floor": {"min": 0}}},
+        ]
+
+        for search_query in different_queries:
+            assert get_search_query_fingerprint(search_query) != fingerprint
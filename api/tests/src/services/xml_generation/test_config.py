@@ -1,6 +1,11 @@
 """Tests for XML generation configuration."""
 
-from src.services.xml_generation.config import is_form_xml_supported, load_xml_transform_config
+from src.form_schema.forms.sf424 import SF424_v4_0
+from src.services.xml_generation.config import (
+    is_form_xml_supported,
+    load_xml_generation_plan,
+    load_xml_transform_config,
+)
 
 
 class TestXMLTransformConfig:
@@ -140,3 +145,28 @@ class TestXMLTransformConfig:
 
         # Unsupported form
         assert is_form_xml_supported("UNKNOWN_FORM") is False
+
+
+class TestXMLGenerationPlanLoading:
+    """Test cases for loading the compiled XML generation plan of a form."""
+
+    def test_plan_is_compiled_once(self):
+        plan = load_xml_generation_plan("SF424_4_0")
+
+        assert plan is not None
+        assert plan.root_element_name == "SF424_4_0"
+        assert plan.element_order[0] == "SubmissionType"
+        assert load_xml_generation_plan("sf424_4_0") is plan
+        assert load_xml_transform_config("SF424_4_0") is plan.transform_config
+
+    def test_plan_is_recompiled_when_rules_change(self, monkeypatch):
+        plan = load_xml_generation_plan("SF424_4_0")
+
+        monkeypatch.setattr(SF424_v4_0, "json_to_xml_schema", dict(plan.transform_config))
+
+        new_plan = load_xml_generation_plan("SF424_4_0")
+        assert new_plan is not plan
+        assert new_plan.transform_config is SF424_v4_0.json_to_xml_schema
+
+    def test_unknown_form_has_no_plan(self):
+        assert load_xml_generation_plan("UNKNOWN_FORM") is None
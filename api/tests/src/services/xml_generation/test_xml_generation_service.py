@@ -1,17 +1,108 @@
 """Tests for XML generation service."""
 
 import pytest
+from lxml import etree as lxml_etree
 from pydantic import ValidationError
 
 from src.form_schema.forms.sf424 import FORM_XML_TRANSFORM_RULES
 from src.services.xml_generation.constants import NO_VALUE, YES_VALUE
+from src.services.xml_generation.generation_plan import compile_xml_generation_plan
 from src.services.xml_generation.models import XMLGenerationRequest
 from src.services.xml_generation.service import XMLGenerationService
+from src.services.xml_generation.value_transformers import ValueTransformationError
 
 
 class TestXMLGenerationService:
     """Test cases for XMLGenerationService."""
 
+    def test_generate_xml_with_compiled_plan(self):
+        """Test that a precompiled generation plan produces the same XML."""
+        application_data = {
+            "submission_type": "Application",
+            "organization_name": "Test University",
+            "project_title": "Research Project",
+            "applicant": {"street1": "123 Main St", "city": "Washington", "country": "USA"},
+        }
+
+        service = XMLGenerationService()
+        request = XMLGenerationRequest(
+            application_data=application_data, transform_config=FORM_XML_TRANSFORM_RULES
+        )
+        plan = compile_xml_generation_plan(FORM_XML_TRANSFORM_RULES)
+
+        response = service.generate_xml(request)
+        plan_response = service.generate_xml(request, plan)
+
+        assert plan_response.success is True
+        assert plan_response.xml_data == response.xml_data
+        assert "<globLib:Street1>123 Main St</globLib:Street1>" in plan_response.xml_data
+
+    def test_generate_xml_element(self):
+        """Test that the generated element serializes to the same XML as generate_xml."""
+        application_data = {
+            "submission_type": "Application",
+            "organization_name": "Test University",
+            "project_title": "Research Project",
+        }
+
+        service = XMLGenerationService()
+        request = XMLGenerationRequest(
+            application_data=application_data,
+            transform_config=FORM_XML_TRANSFORM_RULES,
+            pretty_print=False,
+        )
+
+        element = service.generate_xml_element(request)
+        response = service.generate_xml(request)
+
+        assert lxml_etree.QName(element).localname == "SF424_4_0"
+        assert (
+            lxml_etree.tostring(element, encoding="utf-8", xml_declaration=True).decode("utf-8")
+            == response.xml_data
+        )
+
+    def test_generate_xml_element_without_namespaces(self):
+        """Test that a form without namespaces is built as an lxml element too."""
+        transform_config = {
+            "_xml_config": {"xml_structure": {"root_element": "SimpleForm"}},
+            "organization_name": {"xml_transform": {"target": "OrganizationName"}},
+            "project_title": {"xml_transform": {"target": "ProjectTitle"}},
+        }
+        request = XMLGenerationRequest(
+            application_data={
+                "organization_name": "Test University",
+                "project_title": "Research Project",
+            },
+            transform_config=transform_config,
+            pretty_print=False,
+        )
+
+        service = XMLGenerationService()
+        element = service.generate_xml_element(request)
+
+        assert isinstance(element, lxml_etree._Element)
+        assert element.tag == "SimpleForm"
+        assert [(child.tag, child.text) for child in element] == [
+            ("OrganizationName", "Test University"),
+            ("ProjectTitle", "Research Project"),
+        ]
+        assert service.generate_xml(request).xml_data == (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            "<SimpleForm><OrganizationName>Test University</OrganizationName>"
+            "<ProjectTitle>Research Project</ProjectTitle></SimpleForm>"
+        )
+
+    def test_generate_xml_element_raises_on_failure(self):
+        """Test that errors are raised rather than returned when generating an element."""
+        # Currency values must be strings
+        request = XMLGenerationRequest(
+            application_data={"federal_estimated_funding": 50000},
+            transform_config=FORM_XML_TRANSFORM_RULES,
+        )
+
+        with pytest.raises(ValueTransformationError):
+            XMLGenerationService().generate_xml_element(request)
+
     def test_generate_xml_basic_success(self):
         """Test basic XML generation with simple data."""
         # Test data
@@ -0,0 +1,159 @@
+"""Tests for compiling and caching XSD schemas."""
+
+import threading
+
+import pytest
+import xmlschema
+
+import src.services.xml_generation.validation.xsd_validator as xsd_validator
+from src.services.xml_generation.validation.xsd_validator import (
+    COMPILED_SCHEMAS_FILENAME,
+    XSDValidator,
+    precompile_schemas,
+)
+
+XSD_NS = "http://www.w3.org/2001/XMLSchema"
+
+
+def _xsd() -> str:
+    return f"""<?xml version="1.0"?>
+<xs:schema xmlns:xs="{XSD_NS}" xmlns:lib="urn:lib" targetNamespace="urn:form"
+    elementFormDefault="qualified">
+  <xs:import namespace="urn:lib" schemaLocation="schemas/Library.xsd"/>
+  <xs:element name="Form" type="lib:NameType"/>
+</xs:schema>
+"""
+
+
+def _library_xsd(max_length: int = 10) -> str:
+    return f"""<?xml version="1.0"?>
+<xs:schema xmlns:xs="{XSD_NS}" targetNamespace="urn:lib">
+  <xs:simpleType name="NameType">
+    <xs:restriction base="xs:string"><xs:maxLength value="{max_length}"/></xs:restriction>
+  </xs:simpleType>
+</xs:schema>
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_schema_cache(monkeypatch):
+    monkeypatch.setattr(xsd_validator, "_compiled_schemas", {})
+    monkeypatch.setattr(xsd_validator, "_local_locations", {})
+    monkeypatch.setattr(xsd_validator, "_loaded_precompiled_dirs", set())
+    monkeypatch.setattr(xsd_validator, "_schema_locks", {})
+
+
+@pytest.fixture
+def xsd_dir(tmp_path):
+    (tmp_path / "Form.xsd").write_text(_xsd())
+    (tmp_path / "Library.xsd").write_text(_library_xsd())
+    return tmp_path
+
+
+def _fail_compile(*args, **kwargs):
+    raise AssertionError("Schema should not have been compiled")
+
+
+def test_schema_is_compiled_once_per_process(xsd_dir, monkeypatch):
+    schema = XSDValidator(xsd_dir).load_schema(xsd_dir / "Form.xsd")
+
+    # Imports are resolved from the local XSD files
+    assert schema.is_valid('<Form xmlns="urn:form">Name</Form>')
+    assert not schema.is_valid('<Form xmlns="urn:form">A much longer name</Form>')
+
+    monkeypatch.setattr(xmlschema, "XMLSchema", _fail_compile)
+    assert XSDValidator(xsd_dir).load_schema(xsd_dir / "Form.xsd") is schema
+
+
+def test_precompiled_schemas_are_loaded(xsd_dir, monkeypatch):
+    compiled_schemas_path = precompile_schemas(xsd_dir, ["Form.xsd"])
+    assert compiled_schemas_path == xsd_dir.resolve() / COMPILED_SCHEMAS_FILENAME
+
+    # A new process starts with nothing compiled
+    monkeypatch.setattr(xsd_validator, "_compiled_schemas", {})
+    monkeypatch.setattr(xsd_validator, "_loaded_precompiled_dirs", set())
+    monkeypatch.setattr(xmlschema, "XMLSchema", _fail_compile)
+
+    validator = XSDValidator(xsd_dir)
+    result = validator.validate_xml('<Form xmlns="urn:form">Name</Form>', xsd_dir / "Form.xsd")
+    assert result["valid"] is True
+
+
+def test_out_of_date_precompiled_schemas_are_ignored(xsd_dir, monkeypatch):
+    precompile_schemas(xsd_dir, ["Form.xsd"])
+
+    monkeypatch.setattr(xsd_validator, "_compiled_schemas", {})
+    monkeypatch.setattr(xsd_validator, "_local_locations", {})
+    monkeypatch.setattr(xsd_validator, "_loaded_precompiled_dirs", set())
+    (xsd_dir / "Library.xsd").write_text(_library_xsd(max_length=100))
+
+    schema = XSDValidator(xsd_dir).load_schema(xsd_dir / "Form.xsd")
+    assert schema.is_valid('<Form xmlns="urn:form">A much longer name</Form>')
+
+
+def test_precompiled_schemas_from_another_xmlschema_version_are_ignored(xsd_dir, monkeypatch):
+    precompile_schemas(xsd_dir, ["Form.xsd"])
+
+    monkeypatch.setattr(xsd_validator, "_compiled_schemas", {})
+    monkeypatch.setattr(xsd_validator, "_loaded_precompiled_dirs", set())
+    monkeypatch.setattr(xmlschema, "__version__", "0.0.0")
+
+    compiled = []
+    compile_schema = xmlschema.XMLSchema
+
+    def _compile(*args, **kwargs):
+        compiled.append(args[0])
+        return compile_schema(*args, **kwargs)
+
+    monkeypatch.setattr(xmlschema, "XMLSchema", _compile)
+
+    schema = XSDValidator(xsd_dir).load_schema(xsd_dir / "Form.xsd")
+    assert compiled == [str(xsd_dir / "Form.xsd")]
+    assert schema.is_valid('<Form xmlns="urn:form">Name</Form>')
+
+
+def test_schemas_are_cached_per_xsd_dir(xsd_dir, tmp_path_factory):
+    # Imports of the same XSD file are resolved from each validator's own directory
+    other_xsd_dir = tmp_path_factory.mktemp("other_xsds")
+    (other_xsd_dir / "Library.xsd").write_text(_library_xsd(max_length=100))
+
+    schema = XSDValidator(xsd_dir).load_schema(xsd_dir / "Form.xsd")
+    other_schema = XSDValidator(other_xsd_dir).load_schema(xsd_dir / "Form.xsd")
+
+    assert other_schema is not schema
+    assert not schema.is_valid('<Form xmlns="urn:form">A much longer name</Form>')
+    assert other_schema.is_valid('<Form xmlns="urn:form">A much longer name</Form>')
+
+
+def test_compiling_a_schema_does_not_block_other_schemas(xsd_dir, monkeypatch):
+    (xsd_dir / "Slow.xsd").write_text(_xsd())
+
+    slow_compile_started = threading.Event()
+    release_slow_compile = threading.Event()
+    slow_compile_done = threading.Event()
+    compile_schema = xmlschema.XMLSchema
+
+    def _compile(source, **kwargs):
+        if source.endswith("Slow.xsd"):
+            slow_compile_started.set()
+            release_slow_compile.wait(timeout=5)
+            schema = compile_schema(source, **kwargs)
+            slow_compile_done.set()
+            return schema
+        return compile_schema(source, **kwargs)
+
+    monkeypatch.setattr(xmlschema, "XMLSchema", _compile)
+
+    validator = XSDValidator(xsd_dir)
+    slow_thread = threading.Thread(
+        target=validator.load_schema, args=(xsd_dir / "Slow.xsd",), daemon=True
+    )
+    slow_thread.start()
+    assert slow_compile_started.wait(timeout=5)
+
+    validator.load_schema(xsd_dir / "Form.xsd")
+    assert not slow_compile_done.is_set()
+
+    release_slow_compile.set()
+    slow_thread.join(timeout=5)
+    assert slow_compile_done.is_set()
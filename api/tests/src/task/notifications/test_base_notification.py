@@ -0,0 +1,152 @@
+import pytest
+from sqlalchemy import select
+
+import tests.src.db.models.factories as factories
+from src.db.models.user_models import UserNotificationLog
+from src.task.notifications.base_notification import BaseNotificationTask
+from src.task.notifications.config import EmailNotificationConfig
+from src.task.notifications.constants import Metrics, NotificationReason, UserEmailNotification
+from tests.lib.db_testing import cascade_delete_from_db_table
+
+
+class StaticNotificationTask(BaseNotificationTask):
+    """Notification task that sends a fixed set of notifications"""
+
+    def __init__(self, db_session, notification_config, notifications):
+        super().__init__(db_session, notification_config)
+        self.notifications = notifications
+        self.processed_batches: list[list[UserEmailNotification]] = []
+
+    def collect_email_notifications(self) -> list[UserEmailNotification]:
+        return self.notifications
+
+    def post_notifications_process(self, notifications: list[UserEmailNotification]) -> None:
+        self.processed_batches.append(notifications)
+
+
+@pytest.fixture(autouse=True)
+def clear_data(db_session):
+    cascade_delete_from_db_table(db_session, UserNotificationLog)
+
+
+@pytest.fixture
+def notification_config():
+    notification_config = EmailNotificationConfig()
+    notification_config.reset_emails_without_sending = False
+    notification_config.notification_commit_batch_size = 2
+    notification_config.notification_send_thread_count = 3
+    notification_config.notification_send_rate_per_sec = 1000
+    return notification_config
+
+
+def build_notifications(count: int) -> list[UserEmailNotification]:
+    notifications = []
+    for i in range(count):
+        user = factories.UserFactory.create()
+        notifications.append(
+            UserEmailNotification(
+                user_id=user.user_id,
+                user_email=f"user{i}@example.com",
+                notification_reason=NotificationReason.SEARCH_UPDATES,
+                subject="Test subject",
+                content="Test content",
+                notified_object_ids=[],
+                is_notified=False,
+            )
+        )
+    return notifications
+
+
+def test_send_notifications_in_batches(
+    db_session, enable_factory_create, notification_config, ses_client, get_sent_emails
+):
+    notifications = build_notifications(5)
+    task = StaticNotificationTask(db_session, notification_config, notifications)
+    task.run()
+
+    # Post-processing happens once per committed batch
+    assert [len(batch) for batch in task.processed_batches] == [2, 2, 1]
+    assert all(notification.is_notified for notification in notifications)
+    assert task.metrics[Metrics.USERS_NOTIFIED] == 5
+
+    assert len(get_sent_emails()) == 5
+
+    notification_logs = db_session.execute(select(UserNotificationLog)).scalars().all()
+    assert len(notification_logs) == 5
+    assert all(notification_log.notification_sent for notification_log in notification_logs)
+
+
+def test_send_notifications_failure(
+    db_session, enable_factory_create, notification_config, monkeypatch
+):
+    notifications = build_notifications(3)
+    failing_email = notifications[1].user_email
+
+    def send_email_to_address(to_address, **kwargs):
+        if to_address == failing_email:
+            raise Exception("Failed to send")
+        return "fake-message-id"
+
+    monkeypatch.setattr(
+        "src.task.notifications.base_notification.send_email_to_address", send_email_to_address
+    )
+
+    task = StaticNotificationTask(db_session, notification_config, notifications)
+    task.run()
+
+    assert [notification.is_notified for notification in notifications] == [True, False, True]
+    assert task.metrics[Metrics.USERS_NOTIFIED] == 2
+    assert task.metrics[Metrics.FAILED_TO_SEND] == 1
+
+    notification_logs = {
+        notification_log.user_id: notification_log
+        for notification_log in db_session.execute(select(UserNotificationLog)).scalars()
+    }
+    assert len(notification_logs) == 3
+    assert notification_logs[notifications[1].user_id].notification_sent is False
+
+
+def test_send_notifications_post_process_failure(
+    db_session, enable_factory_create, notification_config, ses_client, get_sent_emails
+):
+    notifications = build_notifications(3)
+    failing_user_id = notifications[0].user_id
+
+    class FailingPostProcessTask(StaticNotificationTask):
+        def post_notifications_process(self, notifications):
+            if any(notification.user_id == failing_user_id for notification in notifications):
+                raise Exception("Failed to post-process")
+            super().post_notifications_process(notifications)
+
+    task = FailingPostProcessTask(db_session, notification_config, notifications)
+    task.run()
+
+    # The rest of the failing batch is still post-processed
+    assert task.processed_batches == [[notifications[1]], [notifications[2]]]
+    assert task.metrics[Metrics.FAILED_TO_POST_PROCESS] == 1
+    assert len(get_sent_emails()) == 3
+
+    # The sent emails are recorded even though post-processing failed
+    notification_logs = db_session.execute(select(UserNotificationLog)).scalars().all()
+    assert len(notification_logs) == 3
+    assert all(notification_log.notification_sent for notification_log in notification_logs)
+
+
+def test_send_notifications_reset_without_sending(
+    db_session, enable_factory_create, notification_config, monkeypatch
+):
+    notification_config.reset_emails_without_sending = True
+    notifications = build_notifications(3)
+
+    def send_email_to_address(**kwargs):
+        raise Exception("Should not send")
+
+    monkeypatch.setattr(
+        "src.task.notifications.base_notification.send_email_to_address", send_email_to_address
+    )
+
+    task = StaticNotificationTask(db_session, notification_config, notifications)
+    task.run()
+
+    assert all(notification.is_notified for notification in notifications)
+    assert task.metrics[Metrics.NOTIFICATIONS_RESET] == 3
@@ -362,6 +362,47 @@ class TestOpportunityNotification:
             == 2
         )
 
+    def test_sections_built_once_per_version_change(
+        self,
+        db_session,
+        user,
+        set_env_var_for_email_notification_config,
+        notification_task,
+        monkeypatch,
+    ):
+        """Users following the same opportunity share the diff of the same two versions"""
+        opp = factories.OpportunityFactory.create(is_posted_summary=True)
+        v_1 = factories.OpportunityVersionFactory.create(opportunity=opp)
+
+        users = [user] + [factories.LinkExternalUserFactory.create().user for _ in range(3)]
+        for saved_user in users:
+            factories.UserSavedOpportunityFactory.create(
+                user=saved_user,
+                opportunity=opp,
+                last_notified_at=v_1.created_at + timedelta(minutes=1),
+            )
+
+        opp.current_opportunity_summary.opportunity_status = OpportunityStatus.CLOSED
+        factories.OpportunityVersionFactory.create(
+            opportunity=opp, created_at=v_1.created_at + timedelta(minutes=60)
+        )
+
+        build_sections_calls = []
+        real_build_sections = notification_task._build_sections
+
+        def build_sections_spy(opp_change):
+            build_sections_calls.append(opp_change)
+            return real_build_sections(opp_change)
+
+        monkeypatch.setattr(notification_task, "_build_sections", build_sections_spy)
+
+        results = notification_task.collect_email_notifications()
+
+        assert len(results) == 4
+        assert {result.user_id for result in results} == {u.user_id for u in users}
+        assert len({result.content for result in results}) == 1
+        assert len(build_sections_calls) == 1
+
     def test_get_latest_opportunity_versions_deleted(
         self,
         db_session,
@@ -10,14 +10,11 @@ from src.api.opportunities_v1.opportunity_schemas import OpportunityV1Schema
 from src.constants.lookup_constants import OpportunityStatus
 from src.db.models.opportunity_models import Opportunity
 from src.db.models.user_models import SuppressedEmail, UserNotificationLog, UserSavedSearch
+from src.services.opportunities_v1.search_opportunities import search_opportunities_id
 from src.task.notifications.config import EmailNotificationConfig, _reset_email_config
 from src.task.notifications.constants import NotificationReason
 from src.task.notifications.email_notification import EmailNotificationTask
-from src.task.notifications.search_notification import (
-    UTM_TAG,
-    SearchNotificationTask,
-    _strip_pagination_params,
-)
+from src.task.notifications.search_notification import UTM_TAG, SearchNotificationTask
 from tests.lib.db_testing import cascade_delete_from_db_table
 from tests.src.api.opportunities_v1.test_opportunity_route_search import OPPORTUNITIES
 
@@ -324,23 +321,153 @@ def test_search_notifications_on_index_change(
     assert len(notification_logs) == 1  # Should still only be one notification
 
 
-def test_pagination_params_are_stripped_from_search_query(
-    cli_runner, db_session, enable_factory_create, user
+def test_search_notifications_batches_distinct_queries(
+    db_session,
+    enable_factory_create,
+    user_with_email,
+    setup_opensearch_data,
+    notification_task,
+    monkeypatch,
+):
+    """Test that distinct queries are split across multi-search requests and results stored"""
+    notification_task.notification_config.search_notification_msearch_batch_size = 2
+    notification_task.notification_config.search_notification_result_size = 3
+
+    saved_searches = [
+        factories.UserSavedSearchFactory.create(
+            user=user_with_email,
+            search_query={"query": query},
+            last_notified_at=datetime_util.utcnow() - timedelta(days=1),
+            searched_opportunity_ids=[],
+        )
+        for query in ["test", "opportunity", "grant"]
+    ]
+
+    msearch_sizes = []
+    real_msearch = notification_task.search_client.msearch
+
+    def msearch_spy(index_name, search_queries, include_scores=True):
+        msearch_sizes.append(len(search_queries))
+        return real_msearch(index_name, search_queries, include_scores=include_scores)
+
+    monkeypatch.setattr(notification_task.search_client, "msearch", msearch_spy)
+
+    notification_task.collect_email_notifications()
+
+    # 3 distinct queries in batches of 2
+    assert msearch_sizes == [2, 1]
+    # The full search results are stored, not just the top results checked for new opportunities
+    for saved_search in saved_searches:
+        assert set(saved_search.searched_opportunity_ids) == set(
+            search_opportunities_id(notification_task.search_client, saved_search.search_query)
+        )
+
+
+def test_search_notifications_previous_results_outside_top_results_are_not_new(
+    db_session,
+    enable_factory_create,
+    user_with_email,
+    setup_opensearch_data,
+    notification_task,
 ):
-    """Test that pagination parameters are stripped from search queries"""
+    """Test that an opportunity moving up into the top results doesn't trigger a notification"""
+    notification_task.notification_config.search_notification_result_size = 1
+
+    search_query = {"query": "test"}
+    current_results = search_opportunities_id(notification_task.search_client, search_query)
+    assert len(current_results) > 1
+
+    # The previous top result has since left the search, so the
+    # current top result was further down the previous results
     saved_search = factories.UserSavedSearchFactory.create(
-        user=user,
-        search_query={
-            "query": "test",
-            "pagination": {"page": 1, "per_page": 10},
-        },
-        name="Test Search",
+        user=user_with_email,
+        search_query=search_query,
+        last_notified_at=datetime_util.utcnow() - timedelta(days=1),
+        searched_opportunity_ids=[uuid.uuid4()] + current_results,
+    )
+
+    assert notification_task.collect_email_notifications() == []
+    assert saved_search.searched_opportunity_ids == current_results
+
+
+def test_search_notifications_failed_query_is_skipped(
+    db_session,
+    enable_factory_create,
+    user_with_email,
+    notification_task,
+    monkeypatch,
+):
+    """Test that saved searches are left as-is when their query fails"""
+    previous_results = [OPPORTUNITIES[0].opportunity_id]
+    saved_search = factories.UserSavedSearchFactory.create(
+        user=user_with_email,
+        search_query={"query": "test"},
         last_notified_at=datetime_util.utcnow() - timedelta(days=1),
-        searched_opportunity_ids=[OPPORTUNITIES[0].opportunity_id, OPPORTUNITIES[1].opportunity_id],
+        searched_opportunity_ids=previous_results,
     )
 
-    params = _strip_pagination_params(saved_search.search_query)
-    assert params.keys() == {"query"}
+    monkeypatch.setattr(
+        notification_task.search_client,
+        "msearch",
+        lambda index_name, search_queries, include_scores=True: [None] * len(search_queries),
+    )
+
+    assert notification_task.collect_email_notifications() == []
+    assert saved_search.searched_opportunity_ids == previous_results
+
+
+def test_equivalent_search_queries_are_grouped(
+    db_session,
+    enable_factory_create,
+    user_with_email,
+    setup_opensearch_data,
+    notification_task,
+    monkeypatch,
+):
+    """Test that equivalent queries are only searched once and fingerprints are backfilled"""
+    search_queries = [
+        {"query": "test", "filters": {"agency": {"one_of": ["USAID", "DOC"]}}},
+        {
+            "filters": {"agency": {"one_of": ["DOC", "USAID"]}},
+            "query": "test",
+            "pagination": {"page_offset": 2, "page_size": 10},
+        },
+        {"query": "test", "filters": {"agency": {"one_of": ["USAID", "DOC"]}}},
+        {"query": "different"},
+    ]
+    saved_searches = [
+        factories.UserSavedSearchFactory.create(
+            user=user_with_email,
+            search_query=search_query,
+            last_notified_at=datetime_util.utcnow() - timedelta(days=1),
+            searched_opportunity_ids=[],
+        )
+        for search_query in search_queries
+    ]
+
+    msearch_queries = []
+    real_msearch = notification_task.search_client.msearch
+
+    def msearch_spy(index_name, search_queries, include_scores=True):
+        msearch_queries.extend(search_queries)
+        return real_msearch(index_name, search_queries, include_scores=include_scores)
+
+    monkeypatch.setattr(notification_task.search_client, "msearch", msearch_spy)
+
+    notification_task.collect_email_notifications()
+
+    assert len(msearch_queries) == 2
+    assert (
+        saved_searches[0].search_query_fingerprint
+        == saved_searches[1].search_query_fingerprint
+        == saved_searches[2].search_query_fingerprint
+    )
+    assert saved_searches[3].search_query_fingerprint != saved_searches[0].search_query_fingerprint
+    assert (
+        saved_searches[0].searched_opportunity_ids
+        == saved_searches[1].searched_opportunity_ids
+        == saved_searches[2].searched_opportunity_ids
+    )
 
 
 def test_search_notification_email_format_single_opportunity(
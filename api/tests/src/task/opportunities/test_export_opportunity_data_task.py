@@ -1,4 +1,6 @@
 import csv
+import gzip
+import io
 import json
 
 import grants_shared.util.file_util as file_util
@@ -92,7 +94,9 @@ class TestExportOpportunityDataTask(BaseTestClass):
         assert json_metadata.file_name.endswith(".json")
         assert json_metadata.file_name.startswith("opportunity_data-")
         assert json_metadata.file_path == export_opportunity_data_task.json_file
-        assert json_metadata.file_size_bytes > 0
+        assert json_metadata.file_size_bytes == file_util.get_file_length_bytes(
+            export_opportunity_data_task.json_file
+        )
 
         # Verify CSV metadata
         csv_metadata = next(
@@ -101,4 +105,75 @@ class TestExportOpportunityDataTask(BaseTestClass):
         assert csv_metadata.file_name.endswith(".csv")
         assert csv_metadata.file_name.startswith("opportunity_data-")
         assert csv_metadata.file_path == export_opportunity_data_task.csv_file
-        assert csv_metadata.file_size_bytes > 0
+        assert csv_metadata.file_size_bytes == file_util.get_file_length_bytes(
+            export_opportunity_data_task.csv_file
+        )
+
+    def test_export_opportunity_data_task_no_opportunities(
+        self, db_session, truncate_opportunities, export_opportunity_data_task
+    ):
+        export_opportunity_data_task.run()
+
+        # An empty extract is formatted the same as json.dumps would
+        with file_util.open_stream(export_opportunity_data_task.json_file, "r") as infile:
+            assert infile.read() == json.dumps(
+                {
+                    "metadata": {
+                        "file_generated_at": export_opportunity_data_task.current_timestamp
+                    },
+                    "opportunities": [],
+                },
+                indent=4,
+            )
+
+        with file_util.open_stream(export_opportunity_data_task.csv_file, "r") as infile:
+            assert list(csv.DictReader(infile)) == []
+
+    def test_export_opportunity_data_task_gzip(
+        self, db_session, truncate_opportunities, enable_factory_create, mock_s3_bucket
+    ):
+        db_session.query(ExtractMetadata).delete()
+        db_session.commit()
+
+        opportunities = OpportunityFactory.create_batch(size=5, is_posted_summary=True)
+        expected_opportunity_ids = set([str(opp.opportunity_id) for opp in opportunities])
+
+        config = ExportOpportunityDataConfig(
+            PUBLIC_FILES_OPPORTUNITY_DATA_EXTRACTS_PATH=f"s3://{mock_s3_bucket}/",
+            EXPORT_OPPORTUNITY_DATA_GZIP_ENABLED=True,
+        )
+        task = ExportOpportunityDataTask(db_session, config)
+        task.run()
+
+        # The gzipped files have the same contents as the regular ones
+        with file_util.open_stream(task.json_gzip_file, "rb") as infile:
+            json_contents = gzip.decompress(infile.read()).decode("utf-8")
+        with file_util.open_stream(task.json_file, "r") as infile:
+            assert json_contents == infile.read()
+
+        json_opportunities = json.loads(json_contents)
+        assert expected_opportunity_ids == set(
+            [record["opportunity_id"] for record in json_opportunities["opportunities"]]
+        )
+
+        with file_util.open_stream(task.csv_gzip_file, "rb") as infile:
+            csv_contents = gzip.decompress(infile.read()).decode("utf-8")
+        reader = csv.DictReader(io.StringIO(csv_contents))
+        assert expected_opportunity_ids == set([record["opportunity_id"] for record in reader])
+
+        metadata_entries = {m.extract_type: m for m in db_session.query(ExtractMetadata).all()}
+        assert metadata_entries.keys() == {
+            ExtractType.OPPORTUNITIES_JSON,
+            ExtractType.OPPORTUNITIES_CSV,
+            ExtractType.OPPORTUNITIES_JSON_GZIP,
+            ExtractType.OPPORTUNITIES_CSV_GZIP,
+        }
+
+        for file_path, extract_type in [
+            (task.json_gzip_file, ExtractType.OPPORTUNITIES_JSON_GZIP),
+            (task.csv_gzip_file, ExtractType.OPPORTUNITIES_CSV_GZIP),
+        ]:
+            metadata = metadata_entries[extract_type]
+            assert metadata.file_path == file_path
+            assert metadata.file_name.endswith(".gz")
+            assert metadata.file_size_bytes == file_util.get_file_length_bytes(file_path)
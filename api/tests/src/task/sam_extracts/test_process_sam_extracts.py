@@ -494,6 +494,47 @@ class TestProcessSamExtracts:
 
         assert metrics[task.Metrics.SKIPPED_UEI_NOT_PROCESSED_COUNT] == 1
 
+    def test_run_task_skipped_records_already_in_db(
+        self, db_session, enable_factory_create, mock_s3_bucket, caplog
+    ):
+        # Both entities were loaded by an earlier extract
+        SamGovEntityFactory.create(uei="AAA111", last_update_date=date(2025, 1, 1))
+        SamGovEntityFactory.create(uei="BBB222", last_update_date=date(2025, 1, 1))
+
+        # The empty EFT indicator row doesn't change the entity, but was in the extract
+        row1 = build_sam_extract_row(
+            uei="AAA111", entity_eft_indicator="", last_update_date="20241225"
+        )
+        row1_dupe = build_sam_extract_row(
+            uei="AAA111", entity_eft_indicator="0001", last_update_date="20241225"
+        )
+        # Only a row with an EFT indicator is in the extract, so this
+        # is flagged even though the entity is already in the DB
+        row2_dupe = build_sam_extract_row(
+            uei="BBB222", entity_eft_indicator="0001", last_update_date="20241225"
+        )
+
+        s3_path = f"s3://{mock_s3_bucket}/extracts/SAM_FOUO_MONTHLY_1234.zip"
+        make_zip_on_s3(s3_path, build_sam_extract_contents([row1, row1_dupe, row2_dupe]))
+
+        SamExtractFileFactory.create(s3_path=s3_path, extract_date=date(2025, 1, 1))
+
+        task = ProcessSamExtractsTask(db_session)
+        task.run()
+
+        flagged_ueis = [
+            record.uei
+            for record in caplog.records
+            if record.message
+            == "A UEI we skipped did not have a non-empty EFT indicator in extract file"
+        ]
+        assert flagged_ueis == ["BBB222"]
+
+        metrics = task.metrics
+        assert metrics[task.Metrics.ENTITY_NO_OP_COUNT] == 1
+        assert metrics[task.Metrics.ROWS_SKIPPED_COUNT] == 2
+        assert metrics[task.Metrics.SKIPPED_UEI_NOT_PROCESSED_COUNT] == 1
+
     def test_run_task_deactivated_records(
         self, db_session, enable_factory_create, mock_s3_bucket, caplog
     ):
@@ -655,6 +696,43 @@ class TestProcessSamExtracts:
             task.run()
 
 
+class TestProcessSamExtractsStreaming(TestProcessSamExtracts):
+    """Rerun all of the above tests with streaming mode enabled"""
+
+    @pytest.fixture(autouse=True)
+    def enable_streaming(self, monkeypatch):
+        monkeypatch.setenv("PROCESS_SAM_EXTRACTS_STREAMING_ENABLED", "true")
+
+    def test_run_task_duplicate_uei_in_batch(
+        self, db_session, enable_factory_create, mock_s3_bucket
+    ):
+        older_row = build_sam_extract_row(
+            uei="DUP123", legal_business_name="Old Name", last_update_date="20250101"
+        )
+        newer_row = build_sam_extract_row(
+            uei="DUP123", legal_business_name="New Name", last_update_date="20250201"
+        )
+
+        s3_path = f"s3://{mock_s3_bucket}/extracts/SAM_FOUO_MONTHLY_12345678.zip"
+        make_zip_on_s3(s3_path, build_sam_extract_contents([newer_row, older_row]))
+        SamExtractFileFactory.create(s3_path=s3_path)
+
+        task = ProcessSamExtractsTask(db_session)
+        task.run()
+
+        db_session.expire_all()
+        sam_gov_entity = db_session.scalars(
+            select(SamGovEntity).where(SamGovEntity.uei == "DUP123")
+        ).one()
+        assert sam_gov_entity.legal_business_name == "New Name"
+        assert sam_gov_entity.last_update_date == date(2025, 2, 1)
+        assert len(sam_gov_entity.import_records) == 1
+
+        metrics = task.metrics
+        assert metrics[task.Metrics.ENTITY_INSERTED_COUNT] == 1
+        assert metrics[task.Metrics.ENTITY_NO_OP_COUNT] == 1
+
+
 @pytest.mark.parametrize(
     "params,expected_error_msg",
     [
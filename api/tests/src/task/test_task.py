@@ -102,6 +102,19 @@ def test_base_task_finish_job_reports_failure(db_session):
     assert task.finish_succeeded is False
 
 
+def test_base_task_record_duration_accumulates(db_session):
+    task = InMemoryTask(db_session)
+
+    with task.record_duration("phase"):
+        pass
+    first_duration = task.metrics["phase_duration_sec"]
+
+    with task.record_duration("phase"):
+        pass
+
+    assert task.metrics["phase_duration_sec"] >= first_duration
+
+
 def test_task_handles_general_error(db_session):
     """Test that task properly handles non-DB errors and rolls back session"""
     task = FailingTask(db_session)
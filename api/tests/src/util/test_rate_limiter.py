@@ -0,0 +1,52 @@
+import pytest
+
+from src.util.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_up_to_capacity():
+    fake_clock = FakeClock()
+    bucket = TokenBucket(10, capacity=3, clock=fake_clock.clock, sleep=fake_clock.sleep)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert fake_clock.sleeps == []
+
+    # The next token refills after 1/10th of a second
+    bucket.acquire()
+    assert fake_clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_token_bucket_refills_over_time():
+    fake_clock = FakeClock()
+    bucket = TokenBucket(2, capacity=2, clock=fake_clock.clock, sleep=fake_clock.sleep)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    # Enough time passes for the bucket to refill, but not beyond capacity
+    fake_clock.now += 10
+    bucket.acquire()
+    bucket.acquire()
+    assert fake_clock.sleeps == []
+
+    bucket.acquire()
+    assert fake_clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_requires_positive_rate():
+    with pytest.raises(ValueError, match="rate_per_sec must be greater than 0"):
+        TokenBucket(0)
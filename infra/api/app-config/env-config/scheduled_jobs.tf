@@ -274,7 +274,7 @@ locals {
       environment_vars    = try(local.scheduled_jobs_config[var.environment].environment_vars, null)
     }
     load-search-opportunity-data = {
-      task_command = ["flask", "load-search-data", "load-opportunity-data"]
+      task_command = ["flask", "load-search-data", "load-opportunity-data", "--incremental"]
       # Every hour at the half hour
       schedule_expression = "cron(30 * * * ? *)"
       state               = "ENABLED"
@@ -283,6 +283,16 @@ locals {
       environment_vars    = try(local.scheduled_jobs_config[var.environment].environment_vars, null)
       role_override       = "opensearch-write"
     }
+    load-search-opportunity-data-full-refresh = {
+      task_command = ["flask", "load-search-data", "load-opportunity-data", "--full-refresh"]
+      # Every day at 3:45am Eastern Time during DST. 4:45am during non-DST.
+      schedule_expression = "cron(45 7 * * ? *)"
+      state               = "ENABLED"
+      cpu                 = try(local.scheduled_jobs_config[var.environment].cpu, null)
+      mem                 = try(local.scheduled_jobs_config[var.environment].mem, null)
+      environment_vars    = try(local.scheduled_jobs_config[var.environment].environment_vars, null)
+      role_override       = "opensearch-write"
+    }
     export-opportunity-data = {
       task_command = ["flask", "task", "export-opportunity-data"]
       # Every day at 4am Eastern Time during DST. 5am during non-DST.